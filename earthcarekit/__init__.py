@@ -25,50 +25,178 @@
 __email__ = "koenig@tropos.de"
 __title__ = "earthcarekit"
 
-import sys
-
-from . import (
-    calval,
-    color,
-    colormap,
-    constants,
-    data,
-    filter,
-    geo,
-    overpass,
-    plot,
-    read,
-    site,
-    stats,
-    typing,
-    utils,
-    workflow,
-)
-from .calval import compare_bsc_ext_lr_depol, compute_anom_depol_statistics
-from .color import Color
-from .colormap import Cmap, cmaps, combine_cmaps, get_cmap, shift_cmap
-from .data import Profile, Swath
-from .download import ecdownload
-from .filter import filter_frame, filter_index, filter_latitude, filter_radius, filter_time
-from .geo import geodesic, get_coord_between, get_coords, haversine
-from .overpass import get_overpass_info
-from .plot import *
-from .plot import FigureType, ecquicklook, ecswath
-from .read import *
-from .site import Site, get_site
-from .utils import (
-    create_example_config,
-    get_config,
-    get_default_config_filepath,
-    get_maap_access_token,
-    search_files_by_regex,
-    set_config,
-    set_config_maap_token,
-    set_config_to_maap,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .utils._config import _warn_user_if_not_default_config_exists
 from .utils.logging import set as _setup_logger
-from .workflow import eclazy, ecload
+
+if TYPE_CHECKING:
+    from . import (
+        calval,
+        color,
+        colormap,
+        constants,
+        data,
+        download,
+        filter,
+        geo,
+        overpass,
+        plot,
+        read,
+        site,
+        stats,
+        typing,
+        utils,
+        workflow,
+    )
+    from .calval import compare_bsc_ext_lr_depol, compute_anom_depol_statistics
+    from .color import Color
+    from .colormap import Cmap, cmaps, combine_cmaps, get_cmap, shift_cmap
+    from .data import Profile, ProfileAccumulator, Swath
+    from .download import ecdownload
+    from .filter import filter_frame, filter_index, filter_latitude, filter_radius, filter_time
+    from .geo import geodesic, get_coord_between, get_coords, haversine
+    from .overpass import get_overpass_info, get_overpass_infos
+    from .plot import *
+    from .plot import FigureType, ecquicklook, ecswath
+    from .read import *
+    from .site import Site, get_site
+    from .utils import (
+        create_example_config,
+        get_config,
+        get_default_config_filepath,
+        get_maap_access_token,
+        search_files_by_regex,
+        set_config,
+        set_config_maap_token,
+        set_config_to_maap,
+    )
+    from .workflow import eclazy, ecload
+
+# Submodules and their public names are only imported on first access (PEP 562), so that
+# e.g. `from earthcarekit import eclazy` does not load the plotting and download stacks.
+_SUBMODULES: frozenset[str] = frozenset(
+    [
+        "calval",
+        "color",
+        "colormap",
+        "constants",
+        "data",
+        "download",
+        "filter",
+        "geo",
+        "overpass",
+        "plot",
+        "read",
+        "site",
+        "stats",
+        "typing",
+        "utils",
+        "workflow",
+    ]
+)
+
+_LAZY_ATTRS: dict[str, str] = {
+    # calval
+    "compare_bsc_ext_lr_depol": "calval",
+    "compute_anom_depol_statistics": "calval",
+    # color, colormap
+    "Color": "color",
+    "ColorLike": "plot",
+    "Cmap": "colormap",
+    "cmaps": "colormap",
+    "combine_cmaps": "colormap",
+    "get_cmap": "colormap",
+    "shift_cmap": "colormap",
+    # data
+    "Profile": "data",
+    "ProfileAccumulator": "data",
+    "Swath": "data",
+    # download
+    "ecdownload": "download",
+    # filter
+    "filter_frame": "filter",
+    "filter_index": "filter",
+    "filter_latitude": "filter",
+    "filter_radius": "filter",
+    "filter_time": "filter",
+    # geo
+    "geodesic": "geo",
+    "get_coord_between": "geo",
+    "get_coords": "geo",
+    "haversine": "geo",
+    # overpass
+    "get_overpass_info": "overpass",
+    "get_overpass_infos": "overpass",
+    # plot
+    "CurtainFigure": "plot",
+    "FigureType": "plot",
+    "Hist2DFigure": "plot",
+    "HistFigure": "plot",
+    "LineFigure": "plot",
+    "MapFigure": "plot",
+    "ProfileFigure": "plot",
+    "SwathFigure": "plot",
+    "create_column_figure_layout": "plot",
+    "create_multi_figure_layout": "plot",
+    "ecquicklook": "plot",
+    "ecquicklook_deep_convection": "plot",
+    "ecquicklook_psc": "plot",
+    "ecswath": "plot",
+    "plot_line_between_figures": "plot",
+    "save_plot": "plot",
+    # read
+    "FileAgency": "read",
+    "FileLatency": "read",
+    "FileMissionID": "read",
+    "FileType": "read",
+    "KDTreeRegridder": "read",
+    "LazyDataset": "read",
+    "LazyVariable": "read",
+    "ProductCatalog": "read",
+    "ProductInfo": "read",
+    "VariableCache": "read",
+    "VariableCacheStats": "read",
+    "add_depol_ratio": "read",
+    "add_isccp_cloud_type": "read",
+    "add_potential_temperature": "read",
+    "add_scattering_ratio": "read",
+    "get_file_type": "read",
+    "get_product_info": "read",
+    "get_product_infos": "read",
+    "get_variable_cache": "read",
+    "is_earthcare_product": "read",
+    "map_products": "read",
+    "map_reduce_products": "read",
+    "read_any": "read",
+    "read_hdr_fixed_header": "read",
+    "read_header_data": "read",
+    "read_nc": "read",
+    "read_polly": "read",
+    "read_product": "read",
+    "read_products": "read",
+    "read_science_data": "read",
+    "rebin_msi_to_jsg": "read",
+    "rebin_xmet_to_vertical_track": "read",
+    "search_product": "read",
+    "update_rgb": "read",
+    # site
+    "Site": "site",
+    "get_site": "site",
+    # utils
+    "create_example_config": "utils",
+    "get_config": "utils",
+    "get_default_config_filepath": "utils",
+    "get_maap_access_token": "utils",
+    "search_files_by_regex": "utils",
+    "set_config": "utils",
+    "set_config_maap_token": "utils",
+    "set_config_to_maap": "utils",
+    # workflow
+    "eclazy": "workflow",
+    "ecload": "workflow",
+}
 
 __all__ = [
     "read",
@@ -92,10 +220,12 @@
     "eclazy",
     "ecload",
     "Profile",
+    "ProfileAccumulator",
     "Swath",
     "Site",
     "get_site",
     "get_overpass_info",
+    "get_overpass_infos",
     "geodesic",
     "haversine",
     "get_coords",
@@ -126,28 +256,43 @@
     "compute_anom_depol_statistics",
 ]
 
-_DEPRECATED = {
-    "ProfileData": Profile,
-    "SwathData": Swath,
-    "get_ground_site": get_site,
-    "trim_to_latitude_frame_bounds": filter_frame,
-    "GroundSite": Site,
-    "perform_anom_depol_statistics": compute_anom_depol_statistics,
+_DEPRECATED: dict[str, tuple[str, str]] = {
+    "ProfileData": ("data", "Profile"),
+    "SwathData": ("data", "Swath"),
+    "get_ground_site": ("site", "get_site"),
+    "trim_to_latitude_frame_bounds": ("filter", "filter_frame"),
+    "GroundSite": ("site", "Site"),
+    "perform_anom_depol_statistics": ("calval", "compute_anom_depol_statistics"),
 }
 
 
-def __getattr__(name):
-    import warnings
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    if name in _LAZY_ATTRS:
+        value = getattr(__getattr__(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
 
     if name in _DEPRECATED:
+        import warnings
+
+        module_name, new_name = _DEPRECATED[name]
         warnings.warn(
-            f"'{name}' is deprecated; use '{_DEPRECATED[name].__name__}' instead.",
+            f"'{name}' is deprecated; use '{new_name}' instead.",
             DeprecationWarning,
             stacklevel=2,
         )
-        return _DEPRECATED[name]
+        return getattr(__getattr__(module_name), new_name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
-    raise AttributeError(name)
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRS))
 
 
 _setup_logger()
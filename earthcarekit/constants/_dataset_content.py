@@ -32,6 +32,7 @@
 ACROSS_TRACK_DISTANCE: Final[str] = "across_track_distance"
 FROM_TRACK_DISTANCE: Final[str] = "from_track_distance"
 TRIM_INDEX_OFFSET_VAR: Final[str] = "trim_index_offset"
+FRAME_INDEX_OFFSET_VAR: Final[str] = "frame_index_offset"
 
 # Dataset variable labels (i.e. long_name attributes)
 BSC_LABEL: Final[str] = "Bsc. coeff."
@@ -16,7 +16,7 @@
 ---
 """
 
-from .profile import Profile
+from .profile import Profile, ProfileAccumulator
 from .swath import Swath
 
 _DEPRECATED = {
@@ -15,6 +15,7 @@
 ---
 """
 
+from ._accumulator import ProfileAccumulator
 from ._profile_data import Profile, ProfileValidationState
 from ._validate_dimensions import (
     ensure_along_track_2d,
@@ -0,0 +1,242 @@
+from typing import Literal, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ...typing import DistanceRangeLike
+from ...utils.numpy import savez_atomic
+from ._profile_data import Profile, ProfileStatResults
+
+
+def _batch_moments(values: NDArray) -> tuple[NDArray, NDArray, NDArray]:
+    """Returns the number of valid values, the mean and the sum of squared deviations from the
+    mean (M2) per height bin of a 2D (time/height) array, ignoring NaNs."""
+    is_valid = np.isfinite(values)
+    count = np.count_nonzero(is_valid, axis=0)
+    _values = np.where(is_valid, values, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.sum(_values, axis=0) / count
+    deviations = np.where(is_valid, values - mean, 0.0)
+    m2 = np.sum(deviations * deviations, axis=0)
+    return count, np.nan_to_num(mean), m2
+
+
+class ProfileAccumulator:
+    """Streaming mean and standard deviation per height bin over any number of profiles.
+
+    Profiles (e.g., one overpass or frame at a time) are rebinned to a fixed height grid and
+    their valid values are added to a running count, mean and sum of squared deviations (M2)
+    per height bin, using the parallel variant of Welford's algorithm. Memory use is therefore
+    constant, no matter how many profiles are added. Accumulators on the same height grid can
+    be merged, e.g., after filling them in separate processes, and saved to and loaded from
+    `.npz` files.
+
+    Attributes:
+        height: Ascending height bin centers of the common height grid.
+        method: Method used to rebin added profiles to `height` ("interpolate" or "mean").
+        count: Number of valid values per height bin.
+        num_profiles: Number of profiles added.
+        label: Variable label for plots, optional; taken from the first added profile if None.
+        units: Units string for plots, optional; taken from the first added profile if None.
+        platform: Platform identifier (e.g., "EarthCARE"), optional.
+        color: Default plot color, optional.
+    """
+
+    def __init__(
+        self: Self,
+        height: ArrayLike,
+        method: Literal["interpolate", "mean"] = "mean",
+        label: str | None = None,
+        units: str | None = None,
+        platform: str | None = None,
+        color: str | None = None,
+    ) -> None:
+        height = np.asarray(height, dtype=np.float64)
+        if height.ndim != 1 or height.size == 0 or not np.all(np.diff(height) > 0):
+            raise ValueError("'height' must be a non-empty 1D sequence of ascending bin centers")
+        self.height: NDArray = height
+        self.method: Literal["interpolate", "mean"] = method
+        self.label = label
+        self.units = units
+        self.platform = platform
+        self.color = color
+        self.count: NDArray = np.zeros(height.size, dtype=np.int64)
+        self.num_profiles: int = 0
+        self._mean: NDArray = np.zeros(height.size)
+        self._m2: NDArray = np.zeros(height.size)
+        self._reference_time: np.datetime64 | None = None
+        self._time_sum: float = 0.0
+        self._coord_sum: NDArray = np.zeros(2)
+        self._coord_count: NDArray = np.zeros(2, dtype=np.int64)
+
+    def _update(self: Self, count: NDArray, mean: NDArray, m2: NDArray) -> None:
+        """Combines the running moments with the moments of another set of values."""
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self._mean
+            weight = np.where(total > 0, count / total, 0.0)
+            self._mean = self._mean + delta * weight
+            self._m2 = self._m2 + m2 + delta * delta * self.count * weight
+        self.count = total
+
+    def _update_coords(
+        self: Self,
+        time_sum: float,
+        reference_time: np.datetime64 | None,
+        num_profiles: int,
+        coord_sum: NDArray,
+        coord_count: NDArray,
+    ) -> None:
+        if reference_time is not None:
+            if self._reference_time is None:
+                self._reference_time = reference_time
+            offset = (reference_time - self._reference_time) / np.timedelta64(1, "s")
+            self._time_sum += time_sum + num_profiles * float(offset)
+        self.num_profiles += num_profiles
+        self._coord_sum += coord_sum
+        self._coord_count += coord_count
+
+    def add(self: Self, profile: Profile) -> Self:
+        """Adds all profiles of a `Profile` to the running statistics.
+
+        Args:
+            profile: Profile(s) with 1D or 2D heights, rebinned to the accumulator's heights.
+
+        Returns:
+            The accumulator itself.
+        """
+        if self.label is None:
+            self.label = profile.label
+        if self.units is None:
+            self.units = profile.units
+        if self.platform is None:
+            self.platform = profile.platform
+
+        profile = profile.rebin_height(self.height, method=self.method)
+        values = np.asarray(profile.values, dtype=np.float64)
+        self._update(*_batch_moments(values))
+
+        time = np.asarray(profile.time, dtype="datetime64[ns]")
+        reference_time = time[0]
+        time_sum = float(np.sum((time - reference_time) / np.timedelta64(1, "s")))
+        coord_sum = np.zeros(2)
+        coord_count = np.zeros(2, dtype=np.int64)
+        for i, coords in enumerate((profile.latitude, profile.longitude)):
+            if isinstance(coords, np.ndarray):
+                is_valid = np.isfinite(coords)
+                coord_sum[i] = np.sum(coords[is_valid])
+                coord_count[i] = np.count_nonzero(is_valid)
+        self._update_coords(time_sum, reference_time, time.size, coord_sum, coord_count)
+        return self
+
+    def merge(self: Self, other: "ProfileAccumulator") -> Self:
+        """Adds the running statistics of another accumulator with identical heights to this one."""
+        if not np.array_equal(self.height, other.height):
+            raise ValueError("cannot merge profile accumulators with different heights")
+        self._update(other.count, other._mean, other._m2)
+        self._update_coords(
+            other._time_sum,
+            other._reference_time,
+            other.num_profiles,
+            other._coord_sum,
+            other._coord_count,
+        )
+        return self
+
+    def __add__(self: Self, other: "ProfileAccumulator") -> "ProfileAccumulator":
+        new = ProfileAccumulator(
+            self.height,
+            method=self.method,
+            label=self.label,
+            units=self.units,
+            platform=self.platform,
+            color=self.color,
+        )
+        return new.merge(self).merge(other)
+
+    def _get_mean_values(self: Self) -> NDArray:
+        return np.where(self.count > 0, self._mean, np.nan)
+
+    def _get_std_values(self: Self) -> NDArray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, np.sqrt(self._m2 / self.count), np.nan)
+
+    def _to_profile(self: Self, values: NDArray, error: NDArray | None = None) -> Profile:
+        time = np.datetime64("NaT", "ns")
+        if self._reference_time is not None and self.num_profiles > 0:
+            mean_offset = np.timedelta64(round(1e9 * self._time_sum / self.num_profiles), "ns")
+            time = self._reference_time + mean_offset
+        with np.errstate(invalid="ignore", divide="ignore"):
+            coords = self._coord_sum / self._coord_count
+        return Profile(
+            values=values,
+            height=self.height,
+            time=np.atleast_1d(time),
+            latitude=None if self._coord_count[0] == 0 else coords[:1],
+            longitude=None if self._coord_count[1] == 0 else coords[1:],
+            color=self.color,
+            label=self.label,
+            units=self.units,
+            platform=self.platform,
+            error=error,
+        )
+
+    def mean(self: Self) -> Profile:
+        """Returns the mean profile, with the standard error of the mean as `error`."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sem = self._get_std_values() / np.sqrt(self.count)
+        return self._to_profile(self._get_mean_values(), error=sem)
+
+    def std(self: Self) -> Profile:
+        """Returns the (population) standard deviation profile."""
+        return self._to_profile(self._get_std_values())
+
+    def stats(self: Self, height_range: DistanceRangeLike | None = None) -> ProfileStatResults:
+        """Computes statistics of the mean profile within a height range (see `Profile.stats`)."""
+        return self.mean().stats(height_range)
+
+    def save(self: Self, filepath: str) -> None:
+        """Saves the running statistics to a `.npz` file."""
+        attrs = (self.label, self.units, self.platform, self.color)
+        savez_atomic(
+            filepath,
+            height=self.height,
+            method=np.str_(self.method),
+            count=self.count,
+            mean=self._mean,
+            m2=self._m2,
+            num_profiles=np.int64(self.num_profiles),
+            reference_time=np.datetime64(self._reference_time, "ns"),
+            time_sum=np.float64(self._time_sum),
+            coord_sum=self._coord_sum,
+            coord_count=self._coord_count,
+            attrs=np.array(["" if a is None else a for a in attrs], dtype=np.str_),
+            attrs_is_none=np.array([a is None for a in attrs]),
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> "ProfileAccumulator":
+        """Loads an accumulator saved with `ProfileAccumulator.save`."""
+        with np.load(filepath) as data:
+            label, units, platform, color = (
+                None if is_none else str(a)
+                for a, is_none in zip(data["attrs"], data["attrs_is_none"])
+            )
+            acc = cls(
+                data["height"],
+                method=str(data["method"]),  # type: ignore
+                label=label,
+                units=units,
+                platform=platform,
+                color=color,
+            )
+            acc.count[:] = data["count"]
+            acc._mean[:] = data["mean"]
+            acc._m2[:] = data["m2"]
+            acc.num_profiles = int(data["num_profiles"])
+            reference_time = data["reference_time"][()]
+            acc._reference_time = None if np.isnat(reference_time) else reference_time
+            acc._time_sum = float(data["time_sum"])
+            acc._coord_sum[:] = data["coord_sum"]
+            acc._coord_count[:] = data["coord_count"]
+        return acc
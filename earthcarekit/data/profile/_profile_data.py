@@ -1,5 +1,5 @@
 import warnings
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from typing import Any, Iterable, Literal
 
 import numpy as np
@@ -156,7 +156,35 @@ def to_dataframe(self) -> pd.DataFrame:
         return df
 
 
+# Time resolutions kept as they are by `pandas.to_datetime`
+_PANDAS_DATETIME64_DTYPES = tuple(np.dtype(f"datetime64[{u}]") for u in ("s", "ms", "us", "ns"))
+
+
+def _to_datetime64(time: ArrayLike) -> NDArray[np.datetime64]:
+    time = np.asarray(time)
+    if time.dtype in _PANDAS_DATETIME64_DTYPES:
+        return np.atleast_1d(time)
+    return np.atleast_1d(pd.to_datetime(time).to_numpy())
+
+
+def _as_float(a: NDArray) -> NDArray:
+    if not np.issubdtype(a.dtype, np.floating):
+        return a.astype(float)
+    return a
+
+
+def _mask_to_index(mask: NDArray[np.bool_]) -> slice | NDArray:
+    """Returns a slice if the True values of a 1D mask are contiguous, so that indexing returns
+    a view instead of a copy, or the indices of the True values otherwise."""
+    idxs = np.flatnonzero(mask)
+    if idxs.size > 0 and idxs[-1] - idxs[0] + 1 == idxs.size:
+        return slice(int(idxs[0]), int(idxs[-1]) + 1)
+    return idxs
+
+
 def _apply_nan_height_mask(a: NDArray, mask: NDArray) -> NDArray:
+    if np.all(mask):
+        return a
     if np.asarray(a).ndim == 1:
         a = a[mask]
     elif np.asarray(a).ndim == 2:
@@ -190,6 +218,12 @@ class Profile:
     The object supports NumPy-style indexing based on its `values` attribute
     following the convention: `profile[time_index, height_index]`.
 
+    Like NumPy views, profiles share arrays with the arrays they were created from
+    and with profiles derived from them (e.g., by selecting a height range) where
+    possible. In-place operators (e.g., `profile += 1`) never modify shared arrays: they only
+    write into `values` if the profile owns them (after `copy()` or a previous in-place
+    operation that did not share them since), and otherwise replace `values` by a new array.
+
     Attributes:
         values: Profile data (1D vertical or 2D time/height).
         height: Height bin centers, ascending; fixed or time-varying.
@@ -220,7 +254,7 @@ class Profile:
     def __post_init__(self: "Profile") -> None:
         self.values = np.atleast_2d(self.values)
         self.height = np.atleast_1d(self.height)
-        self.time = np.atleast_1d(pd.to_datetime(np.asarray(self.time)).to_numpy())
+        self.time = _to_datetime64(self.time)
         if self.latitude is not None:
             self.latitude = np.atleast_1d(self.latitude)
         if self.longitude is not None:
@@ -234,6 +268,9 @@ def __post_init__(self: "Profile") -> None:
         if isinstance(self.units, str):
             self.units = parse_units(self.units)
 
+        # Values given to the constructor may be shared with the caller
+        self._owns_values: bool = False
+
         if isinstance(self._validation, ProfileValidationState):
             self._apply_validation_state()
         else:
@@ -291,6 +328,47 @@ def _apply_validation_state(self):
             if isinstance(self.error, np.ndarray) and self.error.ndim == 2:
                 self.error = self.error[:, ::-1]
 
+    def _replace(self: "Profile", validate: bool = False, **changes: Any) -> "Profile":
+        """Returns a new profile derived from this one, sharing all arrays that are not changed.
+
+        Unlike the constructor, the already validated state is trusted unless `validate` is True:
+        heights are not checked again, so changed arrays must have consistent shapes and
+        ascending height bins.
+        """
+        if validate or self.keepdims:
+            # NaN height bins kept by this profile are removed from derived profiles
+            kwargs = {f.name: getattr(self, f.name) for f in fields(self)}
+            kwargs.update(changes, keepdims=False, _validation=None)
+            return self._share_values(Profile(**kwargs))
+
+        new = object.__new__(Profile)
+        new.__dict__.update(self.__dict__)
+        new.__dict__.update(changes)
+        new.values = np.atleast_2d(new.values)
+        new.height = np.atleast_1d(new.height)
+        if "time" in changes:
+            new.time = _to_datetime64(new.time)
+        if new.latitude is not None:
+            new.latitude = np.atleast_1d(new.latitude)
+        if new.longitude is not None:
+            new.longitude = np.atleast_1d(new.longitude)
+        if new.error is not None:
+            new.error = np.atleast_2d(new.error)
+        if isinstance(new.units, str) and "units" in changes:
+            new.units = parse_units(new.units)
+        new._validation = ProfileValidationState(
+            mask_height_nan_rows=np.full(new.height.shape[-1], True, dtype=np.bool_),
+            is_height_increasing=True,
+        )
+        return self._share_values(new)
+
+    def _share_values(self: "Profile", new: "Profile") -> "Profile":
+        """Marks the values of a profile derived from this one as shared (copy on write)."""
+        new._owns_values = False
+        if self._owns_values and np.may_share_memory(self.values, new.values):
+            self._owns_values = False
+        return new
+
     def __getitem__(self: "Profile", idx: Any) -> "Profile":
 
         if not isinstance(idx, tuple):
@@ -326,7 +404,7 @@ def __getitem__(self: "Profile", idx: Any) -> "Profile":
         new_units = self.units
         new_platform = self.platform
 
-        return Profile(
+        new = Profile(
             values=new_values,
             height=new_height,
             time=new_time,
@@ -338,6 +416,7 @@ def __getitem__(self: "Profile", idx: Any) -> "Profile":
             platform=new_platform,
             error=new_error,
         )
+        return self._share_values(new)
 
     @property
     def shape(self):
@@ -354,79 +433,82 @@ def __pos__(self):
         return self.copy()
 
     def __neg__(self):
-        result = self.copy()
-        result.values = -result.values
-        return result
+        return self._replace(values=-self.values)
 
     def __abs__(self):
-        result = self.copy()
-        result.values = np.abs(result.values)
-        return result
+        return self._replace(values=np.abs(self.values))
 
     def __add__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = result.values + other.values
-        else:
-            result.values = result.values + other
-        return result
+            return self._replace(values=self.values + other.values)
+        return self._replace(values=self.values + other)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = result.values - other.values
-        else:
-            result.values = result.values - other
-        return result
+            return self._replace(values=self.values - other.values)
+        return self._replace(values=self.values - other)
 
     def __rsub__(self, other):
         return (self * -1).__add__(other * -1)
 
     def __mul__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = result.values * other.values
-        else:
-            result.values = result.values * other
-        return result
+            return self._replace(values=self.values * other.values)
+        return self._replace(values=self.values * other)
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = result.values / other.values
-        else:
-            result.values = result.values / other
-        return result
+            return self._replace(values=self.values / other.values)
+        return self._replace(values=self.values / other)
 
     def __rtruediv__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = other.values / result.values
-        else:
-            result.values = other / result.values
-        return result
+            return self._replace(values=other.values / self.values)
+        return self._replace(values=other / self.values)
 
     def __pow__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = result.values**other.values
-        else:
-            result.values = result.values**other
-        return result
+            return self._replace(values=self.values**other.values)
+        return self._replace(values=self.values**other)
 
     def __rpow__(self, other):
-        result = self.copy()
         if isinstance(other, Profile):
-            result.values = other.values**result.values
-        else:
-            result.values = other**result.values
-        return result
+            return self._replace(values=other.values**self.values)
+        return self._replace(values=other**self.values)
+
+    def _apply_inplace(self, ufunc: np.ufunc, other: Any) -> "Profile":
+        other_values = other.values if isinstance(other, Profile) else other
+        if self._owns_values and self.values.flags.writeable:
+            try:
+                ufunc(self.values, other_values, out=self.values)
+                return self
+            except TypeError:
+                pass  # result can not be cast to the dtype of values (e.g., int / int)
+        # Shared values are replaced instead of modified (copy on write)
+        self.values = ufunc(self.values, other_values)
+        self._owns_values = True
+        return self
+
+    def __iadd__(self, other):
+        return self._apply_inplace(np.add, other)
+
+    def __isub__(self, other):
+        return self._apply_inplace(np.subtract, other)
+
+    def __imul__(self, other):
+        return self._apply_inplace(np.multiply, other)
+
+    def __itruediv__(self, other):
+        return self._apply_inplace(np.true_divide, other)
+
+    def __ipow__(self, other):
+        return self._apply_inplace(np.power, other)
 
     def __eq__(self, other):
         if isinstance(other, (np.ndarray, Number)):
@@ -571,21 +653,12 @@ def mean(self, **kwargs) -> "Profile":
         else:
             new_longitude = None
 
-        new_color = self.color
-        new_label = self.label
-        new_units = self.units
-        new_platform = self.platform
-
-        return Profile(
+        return self._replace(
             values=new_values,
             height=new_height,
             time=new_time,
             latitude=new_latitude,
             longitude=new_longitude,
-            color=new_color,
-            label=new_label,
-            units=new_units,
-            platform=new_platform,
             error=new_error,
         )
 
@@ -615,21 +688,12 @@ def std(self, **kwargs) -> "Profile":
         else:
             new_longitude = None
 
-        new_color = self.color
-        new_label = self.label
-        new_units = self.units
-        new_platform = self.platform
-
-        return Profile(
+        return self._replace(
             values=new_values,
             height=new_height,
             time=new_time,
             latitude=new_latitude,
             longitude=new_longitude,
-            color=new_color,
-            label=new_label,
-            units=new_units,
-            platform=new_platform,
             error=new_error,
         )
 
@@ -640,16 +704,8 @@ def rolling_mean(self, window_size: int, axis: Literal[0, 1] = 0) -> "Profile":
             new_error: NDArray | None = None
             if isinstance(self.error, np.ndarray):
                 new_error = self.error
-            return Profile(
+            return self._replace(
                 values=new_values,
-                height=self.height,
-                time=self.time,
-                latitude=self.latitude,
-                longitude=self.longitude,
-                color=self.color,
-                label=self.label,
-                units=self.units,
-                platform=self.platform,
                 error=new_error,
             )
 
@@ -660,10 +716,7 @@ def rolling_mean(self, window_size: int, axis: Literal[0, 1] = 0) -> "Profile":
     def layer_mean(self, hmin: float, hmax: float) -> NDArray:
         """Returns layer mean values."""
         layer_mask = np.logical_and(hmin <= self.height, self.height <= hmax)
-        layer_mean_values = self.values
-        if not np.issubdtype(layer_mean_values.dtype, np.floating):
-            layer_mean_values = layer_mean_values.astype(float)
-        layer_mean_values[~layer_mask] = np.nan
+        layer_mean_values = np.where(layer_mask, _as_float(self.values), np.nan)
         if layer_mean_values.ndim == 2:
             layer_mean_values = _mean_2d(layer_mean_values, axis=1)
         else:
@@ -687,18 +740,7 @@ def rebin_height(
         if self.height.shape == np.asarray(height_bin_centers).shape and np.all(
             np.asarray(self.height) == np.asarray(height_bin_centers)
         ):
-            return Profile(
-                values=self.values,
-                height=self.height,
-                time=self.time,
-                latitude=self.latitude,
-                longitude=self.longitude,
-                color=self.color,
-                label=self.label,
-                units=self.units,
-                platform=self.platform,
-                error=self.error,
-            )
+            return self._replace()
 
         new_values = rebin_height(
             self.values,
@@ -719,16 +761,10 @@ def rebin_height(
                 height_bin_centers,
                 method=method,
             )
-        return Profile(
+        return self._replace(
+            validate=not np.all(np.diff(new_height, axis=-1) > 0),
             values=new_values,
             height=new_height,
-            time=self.time,
-            latitude=self.latitude,
-            longitude=self.longitude,
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
             error=new_error,
         )
 
@@ -769,16 +805,12 @@ def rebin_time(
         else:
             new_latitude = None
             new_longitude = None
-        return Profile(
+        return self._replace(
             values=new_values,
             height=new_height,
             time=pd.to_datetime(to_timestamps(time_bin_centers)).to_numpy(),
             latitude=new_latitude,
             longitude=new_longitude,
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
             error=new_error,
         )
 
@@ -885,16 +917,12 @@ def rebin_along_track(
         else:
             new_height = self.height
 
-        return Profile(
+        return self._replace(
             values=new_values,
             height=new_height,
             time=new_times,
             latitude=np.asarray(latitude_bin_centers),
             longitude=np.asarray(longitude_bin_centers),
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
             error=new_error,
         )
 
@@ -918,55 +946,29 @@ def select_height_range(
         """
         height_range = validate_height_range(height_range)
 
-        if self.height.ndim == 2:
-            ref_height = self.height.copy()
-        else:
-            ref_height = np.repeat(
-                np.atleast_2d(self.height.copy()),
-                self.values.shape[0],
-                axis=0,
-            )
-
-        mask = np.logical_and(
-            height_range[0] <= ref_height,
-            ref_height <= height_range[1],
-        )
-        mask = pad_true_sequence_2d(mask, pad_idx)
-
-        sel_height = ref_height.copy()
-        if not np.issubdtype(sel_height.dtype, np.floating):
-            sel_height = sel_height.astype(float)
-        sel_height[~mask] = np.nan
-        mask_height = ~np.isnan(np.atleast_2d(sel_height)).all(axis=0)
-        sel_height = sel_height[:, mask_height]
-
-        sel_values = self.values.copy()
-        if not np.issubdtype(sel_values.dtype, np.floating):
-            sel_values = sel_values.astype(float)
-        sel_values[~mask] = np.nan
-        sel_values = sel_values[:, mask_height]
-
         sel_error: NDArray | None = None
-        if isinstance(self.error, np.ndarray):
-            sel_error = self.error.copy()
-            if not np.issubdtype(sel_error.dtype, np.floating):
-                sel_error = sel_error.astype(float)
-            sel_error[~mask] = np.nan
-            sel_error = sel_error[:, mask_height]
-
         if self.height.ndim == 1:
-            sel_height = sel_height[0]
+            # Same bins in every profile, so contiguous ranges are selected as views
+            mask = np.logical_and(height_range[0] <= self.height, self.height <= height_range[1])
+            mask = pad_true_sequence(mask, pad_idx) & ~np.isnan(self.height)
+            idx = _mask_to_index(mask)
+            sel_height = _as_float(self.height[idx])
+            sel_values = _as_float(self.values[:, idx])
+            if isinstance(self.error, np.ndarray):
+                sel_error = _as_float(self.error[:, idx])
+        else:
+            mask = np.logical_and(height_range[0] <= self.height, self.height <= height_range[1])
+            mask = pad_true_sequence_2d(mask, pad_idx)
+            idx = _mask_to_index(np.any(mask & ~np.isnan(self.height), axis=0))
+            mask = mask[:, idx]
+            sel_height = np.where(mask, _as_float(self.height[:, idx]), np.nan)
+            sel_values = np.where(mask, _as_float(self.values[:, idx]), np.nan)
+            if isinstance(self.error, np.ndarray):
+                sel_error = np.where(mask, _as_float(self.error[:, idx]), np.nan)
 
-        return Profile(
+        return self._replace(
             values=sel_values,
             height=sel_height,
-            time=self.time,
-            latitude=self.latitude,
-            longitude=self.longitude,
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
             error=sel_error,
         )
 
@@ -993,41 +995,39 @@ def select_time_range(
 
         time_range = validate_time_range(time_range)
 
-        times = to_timestamps(self.time)
+        times = pd.DatetimeIndex(self.time)
         mask = np.logical_and(time_range[0] <= times, times <= time_range[1])
         mask = pad_true_sequence(mask, pad_idxs)
 
-        sel_values = self.values[mask]
+        idx = _mask_to_index(mask)
+
+        sel_values = self.values[idx]
         sel_error: NDArray | None = None
         if isinstance(self.error, np.ndarray):
-            sel_error = self.error[:, mask]
-        sel_time = self.time[mask]
+            sel_error = self.error[idx]
+        sel_time = self.time[idx]
 
         if self.height.ndim == 2:
-            sel_height = self.height[mask]
+            sel_height = self.height[idx]
         else:
             sel_height = self.height
 
         if isinstance(self.latitude, np.ndarray):
-            sel_latitude = self.latitude[mask]
+            sel_latitude = self.latitude[idx]
         else:
             sel_latitude = None
 
         if isinstance(self.longitude, np.ndarray):
-            sel_longitude = self.longitude[mask]
+            sel_longitude = self.longitude[idx]
         else:
             sel_longitude = None
 
-        return Profile(
+        return self._replace(
             values=sel_values,
             height=sel_height,
             time=sel_time,
             latitude=sel_latitude,
             longitude=sel_longitude,
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
             error=sel_error,
         )
 
@@ -1067,16 +1067,12 @@ def coarsen_mean(self, n: int, is_bin: bool = False) -> "Profile":
             else:
                 new_longitude = None
 
-            return Profile(
+            return self._replace(
                 values=new_values,
                 height=new_height,
                 time=new_time,
                 latitude=new_latitude,
                 longitude=new_longitude,
-                color=self.color,
-                label=self.label,
-                units=self.units,
-                platform=self.platform,
                 error=new_error,
             )
 
@@ -1186,16 +1182,9 @@ def to_mega(self) -> "Profile":
 
         if isinstance(self.units, str):
             if self.units in ["m-1 sr-1", "m-1"]:
-                return Profile(
+                return self._replace(
                     values=self.values * 1e6,
-                    height=self.height,
-                    time=self.time,
-                    latitude=self.latitude,
-                    longitude=self.longitude,
-                    color=self.color,
-                    label=self.label,
                     units=f"M{self.units}",
-                    platform=self.platform,
                     error=(None if not isinstance(self.error, np.ndarray) else self.error * 1e6),
                 )
             elif self.units in ["Mm-1 sr-1", "Mm-1"]:
@@ -1214,15 +1203,13 @@ def to_mega(self) -> "Profile":
 
     def copy(self) -> "Profile":
         """Returns a deep copy of the profile."""
-        return Profile(
-            values=self.values,
-            height=self.height,
-            time=self.time,
-            latitude=self.latitude,
-            longitude=self.longitude,
-            color=self.color,
-            label=self.label,
-            units=self.units,
-            platform=self.platform,
-            error=self.error,
+        new = self._replace(
+            values=self.values.copy(),
+            height=self.height.copy(),
+            time=self.time.copy(),
+            latitude=None if self.latitude is None else self.latitude.copy(),
+            longitude=None if self.longitude is None else self.longitude.copy(),
+            error=None if self.error is None else self.error.copy(),
         )
+        new._owns_values = True
+        return new
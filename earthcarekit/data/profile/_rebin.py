@@ -3,8 +3,10 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
-from ...geo import haversine, interpgeo
+from ...geo import get_coords_between, haversine
+from ...utils.kernels import get_kernel, register_kernel
 from ...utils.numpy import centers_to_bins
+from ...utils.numpy._rebin._rebin import _bincount_cells, _digitize_rows, _searchsorted_rows
 from ...utils.numpy._rebin._rebin_lerp import _get_lerp_params, _rebin_lerp_1d, _rebin_lerp_2d
 from ...utils.numpy._rebin._rebin_mean import _rebin_mean_1d, _rebin_mean_2d
 from ...utils.time import TimestampLike, num_to_time, time_to_num
@@ -69,18 +71,7 @@ def _rebin_time_lerp_2d(
         v0 = v[idx - 1, :]
         v1 = v[idx, :]
 
-        rebinned = np.full((w.shape[0], 2), np.nan)
-        for i in range(w.shape[0]):
-            lon0, lat0 = v0[i]
-            lon1, lat1 = v1[i]
-            lon, lat = interpgeo(lon0, lat0, lon1, lat1, w[i])
-            rebinned[i] = np.array(
-                [
-                    lat,
-                    lon,
-                ]
-            )
-        return rebinned
+        return get_coords_between(v0, v1, w)
     else:
         return _rebin_lerp_2d(idx, w, v)
 
@@ -103,11 +94,11 @@ def _rebin_time_lerp(
         )
 
 
+@register_kernel("rebin_height_lerp")
 def _rebin_height_lerp(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
-    n = h.shape[0]
     m = h.shape[1]
 
-    idx = np.array([np.searchsorted(h[i], h_new[i], side="left") for i in range(n)])
+    idx = _searchsorted_rows(h, h_new, side="left")
     idx = np.clip(idx, 1, m - 1)
 
     h0 = np.take_along_axis(h, idx - 1, axis=1)
@@ -123,24 +114,20 @@ def _rebin_height_lerp(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
     return v0 + w * dv
 
 
+@register_kernel("rebin_height_mean")
 def _rebin_height_mean(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
     n = h.shape[0]
     m_new = h_new.shape[1]
 
-    v_new = np.full((n, m_new), np.nan)
-
-    for i in range(n):
-        edges = centers_to_bins(h_new[i])
-        bins = np.digitize(h[i], edges) - 1
-        bins = np.clip(bins, 0, m_new - 1)
+    bins = _digitize_rows(h, centers_to_bins(h_new)) - 1
+    bins = np.clip(bins, 0, m_new - 1)
 
-        mask = np.isfinite(v[i])
-        sums = np.bincount(bins[mask], weights=v[i, mask], minlength=m_new)
-        counts = np.bincount(bins[mask], minlength=m_new)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            v_new[i] = sums / counts
-
-    return v_new
+    mask = np.isfinite(v)
+    cell_index = (np.arange(n)[:, np.newaxis] * m_new + bins)[mask]
+    sums = _bincount_cells(cell_index, (n, m_new), v[mask])
+    counts = _bincount_cells(cell_index, (n, m_new))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return sums / counts
 
 
 def rebin_height(
@@ -176,8 +163,8 @@ def rebin_height(
     height = ensure_vertical_2d(height, M)
 
     if method == "interpolate":
-        return _rebin_height_lerp(height, new_height, values)
-    return _rebin_height_mean(height, new_height, values)
+        return get_kernel("rebin_height_lerp")(height, new_height, values)
+    return get_kernel("rebin_height_mean")(height, new_height, values)
 
 
 def rebin_time(
@@ -193,7 +180,7 @@ def rebin_time(
         values: Profile values as a 2D array (time/height).
         time: Time values as a 1D array (datetime64).
         new_time: Target time bin centers as a 1D array (datetime64).
-        is_geo: If True, perform geodesic interpolation for lon/lat data.
+        is_geo: If True, perform great-circle interpolation for lat/lon data.
         method: "interpolate" for linear interpolation to bin centers; "mean" for bin-averaging.
 
     Returns:
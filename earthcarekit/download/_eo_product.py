@@ -12,7 +12,8 @@
 from ..read import get_product_info
 from ..utils._cli.ui import console_print, format_counter
 from ..utils._config import ECKConfig
-from ..utils.maap import get_maap_access_token
+from ..utils.maap import _MaapAuth
+from ._stream_unzip import StreamUnzipError, stream_unzip
 from ._unzip import unzip_file
 
 SUBDIR_NAME_AUX_FILES: Final[str] = "auxiliary_files"
@@ -23,6 +24,7 @@
 SUBDIR_NAME_L2A_FILES: Final[str] = "level2a"
 SUBDIR_NAME_L2B_FILES: Final[str] = "level2b"
 MAX_DOWNLOAD_ATTEMPTS_PER_FILE: Final[int] = 3
+PARTIAL_DOWNLOAD_SUFFIX: Final[str] = ".part"
 
 
 def ensure_single_zip_extension(filename):
@@ -112,6 +114,35 @@ def get_local_product_dirpath(
     return product_dirpath_local
 
 
+def create_download_session(
+    num_connections: int = 1,
+    maap_token: str | None = None,
+) -> requests.Session:
+    """Returns a `requests.Session` with a connection pool sized for concurrent downloads.
+
+    Args:
+        num_connections: Maximum number of simultaneous connections kept open per host.
+        maap_token:
+            Optional MAAP offline token used to authorize the requests of the session. The
+            access token is refreshed when it expires or a request is answered with 401.
+
+    Returns:
+        The session, reusing TCP/TLS connections across subsequent product downloads.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=max(1, num_connections),
+        pool_maxsize=max(1, num_connections),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if isinstance(maap_token, str):
+        session.auth = _MaapAuth(maap_token)
+        # Fail early on invalid offline tokens
+        session.auth.get_access_token()
+    return session
+
+
 def validate_request_response(
     response: requests.models.Response,
     logger: Logger | None = None,
@@ -176,13 +207,18 @@ def download(
         chunk_size_bytes: int = 1 * 1024 * 1024,
         config: ECKConfig | None = None,
         logger: Logger | None = None,
+        session: requests.Session | None = None,
+        show_progress: bool = True,
+        defer_unzip: bool = False,
+        is_stream_unzip: bool = False,
     ) -> _DownloadResult:
-        headers_maap: dict[str, str] | None = None
-        if isinstance(maap_token, str):
-            access_token = get_maap_access_token(maap_token)
-            headers_maap = {"Authorization": "Bearer " + access_token}
-        else:
-            raise ValueError("Download failed due to missing maap token")
+        # Sessions from `create_download_session(maap_token=...)` already authorize requests
+        auth_maap: _MaapAuth | None = None
+        if not (isinstance(session, requests.Session) and isinstance(session.auth, _MaapAuth)):
+            if not isinstance(maap_token, str):
+                raise ValueError("Download failed due to missing maap token")
+            auth_maap = _MaapAuth(maap_token)
+            auth_maap.get_access_token()
 
         _downloaded: bool = False
         _unzipped: bool = False
@@ -222,6 +258,8 @@ def download(
                     logger.info(
                         f" {count_msg} Restarting (starting try {attempt + 1} of max. {MAX_DOWNLOAD_ATTEMPTS_PER_FILE})."
                     )
+                # A successful retry must not report the failure of the previous attempt
+                _success = True
             # Check existing files
             zip_file_exists = os.path.exists(zip_file_path)
             file_exists = os.path.exists(file_path)
@@ -248,7 +286,7 @@ def download(
 
             # Decide if file will be downloaded and extracted
             try_download = is_overwrite or (not zip_file_exists and not file_exists)
-            try_unzip = is_unzip and (is_overwrite or not file_exists)
+            try_unzip = is_unzip and not defer_unzip and (is_overwrite or not file_exists)
 
             if not try_download:
                 if is_unzip:
@@ -257,10 +295,12 @@ def download(
                 else:
                     if logger:
                         logger.info(f" {count_msg} Skip file download. (see <{zip_file_path}>)")
-            if not try_unzip:
+            if not try_unzip and not defer_unzip:
                 if logger:
                     logger.info(f" {count_msg} Skip file unzip. (see <{file_path}>)")
             if not try_download and not try_unzip:
+                if zip_file_exists:
+                    _filepath = zip_file_path
                 break
 
             # Delete unnessecary zip files
@@ -276,22 +316,58 @@ def download(
                 shutil.rmtree(file_path)
                 # os.remove(file_path)
                 file_exists = False
+            if is_overwrite and os.path.exists(zip_file_path + PARTIAL_DOWNLOAD_SUFFIX):
+                os.remove(zip_file_path + PARTIAL_DOWNLOAD_SUFFIX)
 
-            # Download zip file
-            if try_download:
+            # Extract archive while downloading (the ZIP file is never written to disk)
+            is_archive_url = file_download_url.split(".")[-1] not in ["h5", "HDR"]
+            if try_download and try_unzip and is_stream_unzip and is_archive_url:
                 try:
-                    # Requesting the product download
                     if logger:
                         logger.debug(f" {count_msg} Requesting: {file_download_url}")
-
-                    file_download_response: requests.Response
-                    file_download_response = requests.get(
+                    start_time = time.time()
+                    with (session or requests).get(
                         file_download_url,
-                        headers=headers_maap,
+                        auth=auth_maap,
                         stream=True,
-                    )
+                    ) as file_download_response:
+                        validate_request_response(file_download_response, logger=logger)
+                        if logger and show_progress:
+                            console_print(f" {count_msg} Downloading and extracting...", end="\r")
+                        _stream_result = stream_unzip(
+                            file_download_response.iter_content(chunk_size=chunk_size_bytes),
+                            dest_dirpath=file_path,
+                        )
+                    elapsed_time = time.time() - start_time
+                    _size_mb = _stream_result.bytes_read / 1024 / 1024
+                    _speed_mbs = _size_mb / elapsed_time if elapsed_time > 0 else 0
+                    _time = pd.Timedelta(seconds=int(elapsed_time))
+                    _success = True
+                    _downloaded = True
+                    _unzipped = True
+                    _filepath = file_path
+                    if logger:
+                        logger.info(
+                            f" {count_msg} Download and extraction completed ({_time} - {_speed_mbs:.2f} MB/s - {_size_mb:.2f} MB) (see <{file_path}>)"
+                        )
+                    break
+                except (requests.exceptions.RequestException, StreamUnzipError) as e:
+                    if logger:
+                        logger.info(
+                            f" {count_msg} STREAMED EXTRACTION FAILED for attempt {attempt + 1} of {MAX_DOWNLOAD_ATTEMPTS_PER_FILE}: {e}"
+                        )
+                    if isinstance(e, StreamUnzipError):
+                        # Fall back to downloading the archive before extracting it
+                        is_stream_unzip = False
+                    _success = False
+                    continue
 
-                    validate_request_response(file_download_response, logger=logger)
+            # Download zip file
+            if try_download:
+                try:
+                    # Requesting the product download
+                    if logger:
+                        logger.debug(f" {count_msg} Requesting: {file_download_url}")
 
                     if file_download_url.split(".")[-1] == "h5":
                         if is_create_subdirs:
@@ -314,16 +390,47 @@ def download(
                         if not os.path.exists(os.path.dirname(zip_file_path)):
                             os.makedirs(os.path.dirname(zip_file_path))
 
-                    with open(zip_file_path, "wb") as f:
+                    # Resume partially downloaded files using HTTP range requests
+                    part_file_path = zip_file_path + PARTIAL_DOWNLOAD_SUFFIX
+                    resume_from = 0
+                    if os.path.exists(part_file_path):
+                        resume_from = os.path.getsize(part_file_path)
+
+                    request_headers: dict[str, str] = {}
+                    if resume_from > 0:
+                        request_headers["Range"] = f"bytes={resume_from}-"
+
+                    file_download_response: requests.Response
+                    file_download_response = (session or requests).get(
+                        file_download_url,
+                        headers=request_headers,
+                        auth=auth_maap,
+                        stream=True,
+                    )
+
+                    if file_download_response.status_code == 416 and resume_from > 0:
+                        # Range not satisfiable: discard partial file and start over
+                        os.remove(part_file_path)
+                    validate_request_response(file_download_response, logger=logger)
+
+                    is_resumed = resume_from > 0 and file_download_response.status_code == 206
+                    if not is_resumed:
+                        resume_from = 0
+                    elif logger:
+                        logger.info(
+                            f" {count_msg} Resuming download at {resume_from / 1024 / 1024:.2f} MB"
+                        )
+
+                    with open(part_file_path, "ab" if is_resumed else "wb") as f:
                         total_length_str = file_download_response.headers.get("content-length")
                         if isinstance(total_length_str, str):
-                            self.size = int(total_length_str)
+                            self.size = resume_from + int(total_length_str)
                         else:
                             total_length_str = file_download_response.headers.get("Content-Length")
                             if isinstance(total_length_str, str):
-                                self.size = int(total_length_str)
+                                self.size = resume_from + int(total_length_str)
 
-                        current_length = 0
+                        current_length = resume_from
                         total_length = self.size
                         start_time = time.time()
                         progress_bar_length: int = 30
@@ -334,7 +441,9 @@ def download(
                             f.write(data)
                             done = int(progress_bar_length * current_length / total_length)
                             time_elapsed = time.time() - start_time
-                            time_estimated = (time_elapsed / current_length) * total_length
+                            time_estimated = (time_elapsed / (current_length - resume_from)) * (
+                                total_length - resume_from
+                            )
                             time_left = time.strftime(
                                 "%H:%M:%S",
                                 time.gmtime(int(time_estimated - time_elapsed)),
@@ -346,8 +455,12 @@ def download(
                             elapsed_time = time.time() - start_time
                             _size_mb = current_length / 1024 / 1024
                             size_total = total_length / 1024 / 1024
-                            _speed_mbs = _size_mb / elapsed_time if elapsed_time > 0 else 0  # MB/s
-                            if logger:
+                            _speed_mbs = (
+                                (current_length - resume_from) / 1024 / 1024 / elapsed_time
+                                if elapsed_time > 0
+                                else 0
+                            )  # MB/s
+                            if logger and show_progress:
                                 if total_length > 0:
                                     console_print(
                                         f"\r {count_msg} {progress_percentage} {progress_bar} {time_left} - {_speed_mbs:.2f} MB/s - {_size_mb:.2f}/{size_total:.2f} MB",
@@ -363,10 +476,12 @@ def download(
                             time.gmtime(int(time.time() - start_time)),
                         )
                         _time = pd.Timedelta(time_taken)
-                        if logger:
-                            logger.info(
-                                f" {count_msg} Download completed ({time_taken} - {_speed_mbs:.2f} MB/s - {_size_mb:.2f}/{size_total:.2f} MB)                   "
-                            )
+                    os.replace(part_file_path, zip_file_path)
+                    _filepath = zip_file_path
+                    if logger:
+                        logger.info(
+                            f" {count_msg} Download completed ({time_taken} - {_speed_mbs:.2f} MB/s - {_size_mb:.2f}/{size_total:.2f} MB)                   "
+                        )
                 except requests.exceptions.RequestException as e:
                     is_error_403_forbidden = False
                     if e.response is not None:  # Ensure response exists
@@ -1,9 +1,44 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger
 
 from ..utils._cli.logger import log_textbox
 from ..utils._cli.ui import console_print, format_counter
 from ..utils._config import ECKConfig
-from ._eo_product import EOProduct, _DownloadResult
+from ._eo_product import EOProduct, _DownloadResult, create_download_session
+from ._unzip import unzip_file
+
+
+def _is_archive(filepath: str) -> bool:
+    return filepath.lower().endswith(".zip")
+
+
+def _unzip_result(
+    result: _DownloadResult,
+    is_overwrite: bool,
+    is_delete: bool,
+    counter: int,
+    total_count: int,
+    logger: Logger | None = None,
+) -> _DownloadResult:
+    """Extracts the archive of a finished download (unzip stage of the download pipeline)."""
+    if not result.success or not _is_archive(result.filepath):
+        return result
+
+    is_extracted = os.path.exists(os.path.splitext(result.filepath)[0])
+    if is_extracted and not is_overwrite:
+        return result
+
+    result.unzipped = unzip_file(
+        result.filepath,
+        delete=is_delete,
+        delete_on_error=True,
+        counter=counter,
+        total_count=total_count,
+        logger=logger,
+    )
+    result.success &= result.unzipped
+    return result
 
 
 def run_downloads(
@@ -17,7 +52,35 @@ def run_downloads(
     log_heading_msg: str = "Download products",
     logger: Logger | None = None,
     is_reversed_order: bool = False,
+    num_workers: int = 1,
+    is_stream_unzip: bool = False,
 ) -> list[_DownloadResult]:
+    """Downloads products, optionally with several concurrent transfers.
+
+    All transfers share one `requests.Session`, so connections to the same host are reused and
+    the MAAP access token is only fetched again when it expires.
+    With `num_workers > 1`, products are downloaded in parallel and archives are extracted in a
+    separate stage while the next transfers are still running.
+
+    Args:
+        products: Products to download.
+        config: Configuration providing the data directory and MAAP token.
+        is_download: Skip download if False.
+        is_overwrite: Overwrite existing files if True.
+        is_unzip: Extract downloaded archives if True.
+        is_delete: Delete archives after extraction if True.
+        is_create_subdirs: Use config-defined subdirectory structure if True.
+        log_heading_msg: Heading of the log section.
+        logger: Logger for progress messages.
+        is_reversed_order: Download latest-first if True.
+        num_workers: Number of concurrent downloads.
+        is_stream_unzip:
+            Extract archives directly from the HTTP stream if True, so that the archives are
+            never written to disk.
+
+    Returns:
+        Download results in the order of the given products.
+    """
     if logger:
         console_print()
         log_textbox(log_heading_msg, logger=logger, show_time=True)
@@ -32,30 +95,70 @@ def run_downloads(
         products.reverse()
 
     _num_products: int = len(products)
-    _download_results: list[_DownloadResult] = []
-    for i, p in enumerate(products):
-        if is_reversed_order:
-            counter = _num_products - i
-        else:
-            counter = i + 1
+    _counters: list[int] = [
+        _num_products - i if is_reversed_order else i + 1 for i in range(_num_products)
+    ]
+    _is_concurrent: bool = num_workers > 1
+
+    # The MAAP access token is shared by all requests of the session and refreshed on expiry
+    session = create_download_session(num_connections=num_workers, maap_token=config.maap_token)
 
+    def _download(p: EOProduct, counter: int) -> _DownloadResult:
         count_msg, _ = format_counter(counter, _num_products)
 
         if logger:
             logger.info(f"*{count_msg} Starting: {p.name}")
 
-        _dlr = p.download(
+        return p.download(
             download_directory=config.path_to_data,
             is_overwrite=is_overwrite,
             is_unzip=is_unzip,
             is_delete=is_delete,
             is_create_subdirs=is_create_subdirs,
-            maap_token=config.maap_token,
             total_count=_num_products,
             counter=counter,
             config=config,
             logger=logger,
+            session=session,
+            show_progress=not _is_concurrent,
+            defer_unzip=_is_concurrent and not is_stream_unzip,
+            is_stream_unzip=is_stream_unzip,
         )
-        _download_results.append(_dlr)
+
+    _download_results: list[_DownloadResult] = []
+    with session:
+        if not _is_concurrent:
+            for p, counter in zip(products, _counters):
+                _download_results.append(_download(p, counter))
+            return _download_results
+
+        # Pipeline: transfers run in a worker pool, extraction in a separate single worker
+        with (
+            ThreadPoolExecutor(max_workers=num_workers) as download_pool,
+            ThreadPoolExecutor(max_workers=1) as unzip_pool,
+        ):
+            download_futures: list[Future[_DownloadResult]] = [
+                download_pool.submit(_download, p, counter)
+                for p, counter in zip(products, _counters)
+            ]
+            unzip_futures: list[Future[_DownloadResult]] = []
+            for future, counter in zip(download_futures, _counters):
+                result = future.result()
+                if is_unzip:
+                    unzip_futures.append(
+                        unzip_pool.submit(
+                            _unzip_result,
+                            result,
+                            is_overwrite,
+                            is_delete,
+                            counter,
+                            _num_products,
+                            logger,
+                        )
+                    )
+                else:
+                    _download_results.append(result)
+
+            _download_results.extend(f.result() for f in unzip_futures)
 
     return _download_results
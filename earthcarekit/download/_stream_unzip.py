@@ -0,0 +1,231 @@
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Final, Iterable, Iterator
+
+LOCAL_FILE_HEADER_SIGNATURE: Final[bytes] = b"PK\x03\x04"
+_LOCAL_FILE_HEADER_FORMAT: Final[str] = "<4sHHHHHIIIHH"
+_LOCAL_FILE_HEADER_SIZE: Final[int] = struct.calcsize(_LOCAL_FILE_HEADER_FORMAT)
+_DATA_DESCRIPTOR_SIGNATURE: Final[bytes] = b"PK\x07\x08"
+_FLAG_ENCRYPTED: Final[int] = 0x1
+_FLAG_DATA_DESCRIPTOR: Final[int] = 0x8
+_METHOD_STORED: Final[int] = 0
+_METHOD_DEFLATED: Final[int] = 8
+_ZIP64_EXTRA_ID: Final[int] = 0x0001
+_WRITE_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+class StreamUnzipError(Exception):
+    """Raised if an archive can not be extracted from a byte stream."""
+
+
+@dataclass
+class StreamUnzipResult:
+    """Summary of a streaming extraction.
+
+    Attributes:
+        filepaths: Paths of the extracted files.
+        bytes_read: Number of (compressed) bytes consumed from the stream.
+        bytes_written: Number of (uncompressed) bytes written to disk.
+    """
+
+    filepaths: list[str] = field(default_factory=list)
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+class _ChunkReader:
+    """Minimal buffered reader on top of an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer: bytearray = bytearray()
+        self._eof: bool = False
+        self.bytes_read: int = 0
+
+    def _fill(self, size: int) -> None:
+        while len(self._buffer) < size and not self._eof:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                self._eof = True
+
+    def read(self, size: int) -> bytes:
+        """Reads up to `size` bytes (less only at the end of the stream)."""
+        self._fill(size)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.bytes_read += len(data)
+        return data
+
+    def read_exact(self, size: int) -> bytes:
+        data = self.read(size)
+        if len(data) != size:
+            raise StreamUnzipError("unexpected end of stream")
+        return data
+
+    def read_some(self, max_size: int) -> bytes:
+        """Reads at most `max_size` bytes, returning whatever is buffered (at least 1 byte)."""
+        self._fill(1)
+        return self.read(min(max_size, max(1, len(self._buffer))))
+
+    def unread(self, data: bytes) -> None:
+        self._buffer[:0] = data
+        self.bytes_read -= len(data)
+
+
+def _parse_zip64_sizes(extra: bytes, comp_size: int, uncomp_size: int) -> tuple[int, int]:
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, data_size = struct.unpack("<HH", extra[i : i + 4])
+        if header_id == _ZIP64_EXTRA_ID:
+            values = extra[i + 4 : i + 4 + data_size]
+            j = 0
+            if uncomp_size == 0xFFFFFFFF:
+                (uncomp_size,) = struct.unpack("<Q", values[j : j + 8])
+                j += 8
+            if comp_size == 0xFFFFFFFF:
+                (comp_size,) = struct.unpack("<Q", values[j : j + 8])
+            break
+        i += 4 + data_size
+    return comp_size, uncomp_size
+
+
+def _read_data_descriptor(reader: _ChunkReader, is_zip64: bool) -> int:
+    """Consumes a data descriptor following the member data and returns its CRC-32."""
+    head = reader.read_exact(4)
+    if head != _DATA_DESCRIPTOR_SIGNATURE:
+        reader.unread(head)
+    (crc,) = struct.unpack("<I", reader.read_exact(4))
+    reader.read_exact(16 if is_zip64 else 8)
+    return crc
+
+
+def _get_target_filepath(dest_dirpath: str, member_name: str) -> str | None:
+    """Flattens archive members into the destination folder (like `remove_redundant_folder`)."""
+    if member_name.endswith("/"):
+        return None
+    basename = os.path.basename(member_name.replace("\\", "/"))
+    if basename in ("", ".", ".."):
+        return None
+    return os.path.join(dest_dirpath, basename)
+
+
+def stream_unzip(
+    chunks: Iterable[bytes],
+    dest_dirpath: str,
+) -> StreamUnzipResult:
+    """Extracts a ZIP archive from a stream of byte chunks without storing the archive.
+
+    Members are decompressed while the archive is being received and written directly into
+    `dest_dirpath`; folders inside the archive are flattened. Each member is first written to a
+    temporary `.part` file which is renamed after its CRC-32 checksum was verified.
+    Stored and deflated members are supported, including ZIP64 sizes and data descriptors.
+
+    Args:
+        chunks: Iterable of byte chunks, e.g. `requests.Response.iter_content()`.
+        dest_dirpath: Folder to extract the files to (created if missing).
+
+    Returns:
+        A `StreamUnzipResult` with the extracted file paths and I/O statistics.
+
+    Raises:
+        StreamUnzipError: If the stream is not a supported ZIP archive or is corrupt.
+    """
+    os.makedirs(dest_dirpath, exist_ok=True)
+    reader = _ChunkReader(chunks)
+    result = StreamUnzipResult()
+
+    while True:
+        signature = reader.read(4)
+        if signature != LOCAL_FILE_HEADER_SIGNATURE:
+            # Central directory (or end of stream) reached: all members have been read
+            if len(result.filepaths) == 0 and signature[:2] != b"PK":
+                raise StreamUnzipError("stream is not a ZIP archive")
+            break
+
+        header = signature + reader.read_exact(_LOCAL_FILE_HEADER_SIZE - 4)
+        (
+            _,
+            _version,
+            flags,
+            method,
+            _mtime,
+            _mdate,
+            crc,
+            comp_size,
+            uncomp_size,
+            name_length,
+            extra_length,
+        ) = struct.unpack(_LOCAL_FILE_HEADER_FORMAT, header)
+        name = reader.read_exact(name_length).decode("utf-8", errors="replace")
+        extra = reader.read_exact(extra_length)
+        is_zip64 = comp_size == 0xFFFFFFFF or uncomp_size == 0xFFFFFFFF
+        comp_size, uncomp_size = _parse_zip64_sizes(extra, comp_size, uncomp_size)
+        has_data_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+
+        if flags & _FLAG_ENCRYPTED:
+            raise StreamUnzipError(f"encrypted archive member not supported: {name}")
+        if method not in (_METHOD_STORED, _METHOD_DEFLATED):
+            raise StreamUnzipError(f"compression method {method} not supported: {name}")
+        if has_data_descriptor and method == _METHOD_STORED:
+            raise StreamUnzipError(f"stored member with unknown size not supported: {name}")
+
+        target = _get_target_filepath(dest_dirpath, name)
+        part = f"{target}.part" if target else None
+        f = open(part, "wb") if part else None
+        running_crc = 0
+        try:
+            if method == _METHOD_STORED:
+                remaining = comp_size
+                while remaining > 0:
+                    data = reader.read_some(min(remaining, _WRITE_CHUNK_SIZE))
+                    if len(data) == 0:
+                        raise StreamUnzipError("unexpected end of stream")
+                    remaining -= len(data)
+                    running_crc = zlib.crc32(data, running_crc)
+                    if f:
+                        f.write(data)
+                        result.bytes_written += len(data)
+            else:
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                remaining = comp_size if not has_data_descriptor else -1
+                while not decompressor.eof:
+                    max_size = (
+                        _WRITE_CHUNK_SIZE if remaining < 0 else min(remaining, _WRITE_CHUNK_SIZE)
+                    )
+                    data = reader.read_some(max_size) if max_size > 0 else b""
+                    if len(data) == 0:
+                        raise StreamUnzipError("unexpected end of stream")
+                    if remaining > 0:
+                        remaining -= len(data)
+                    out = decompressor.decompress(data)
+                    running_crc = zlib.crc32(out, running_crc)
+                    if f:
+                        f.write(out)
+                        result.bytes_written += len(out)
+                if decompressor.unused_data:
+                    reader.unread(decompressor.unused_data)
+        except BaseException:
+            if f:
+                f.close()
+                os.remove(f.name)
+            raise
+        if f:
+            f.close()
+
+        if has_data_descriptor:
+            crc = _read_data_descriptor(reader, is_zip64)
+
+        if running_crc != crc:
+            if part:
+                os.remove(part)
+            raise StreamUnzipError(f"CRC-32 mismatch for archive member: {name}")
+
+        if part and target:
+            os.replace(part, target)
+            result.filepaths.append(target)
+
+    result.bytes_read = reader.bytes_read
+    return result
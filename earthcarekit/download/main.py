@@ -73,6 +73,8 @@ def ecdownload(
     verbose: bool = True,
     clear_cache: bool = False,
     config: ECKConfig | None = None,
+    num_workers: int = 1,
+    is_stream_unzip: bool = False,
     **kwargs,
 ) -> ProductDataFrame | None:
     """Search for and download EarthCARE products from the ESA MAAP platform.
@@ -116,6 +118,12 @@ def ecdownload(
         verbose: Suppress logs to console if False.
         clear_cache: Bypass cache and refresh product metadata if True.
         config: Custom config object.
+        num_workers:
+            Number of concurrent downloads. If greater than 1, archives are extracted in a
+            separate stage while further downloads are running. Defaults to 1.
+        is_stream_unzip:
+            Extract archives while they are downloaded, without writing the ZIP file to disk.
+            Falls back to a regular download if an archive can not be streamed. Defaults to False.
 
     Returns:
         If ``return_results`` is True, returns results table; otherwise None (default).
@@ -196,6 +204,8 @@ def _to_list(input: Any, _type: type[Any] | tuple[type[Any], ...]) -> list | Non
         logger.info(f"- {is_debug=}")
         logger.info(f"- {is_export_results=}")
         logger.info(f"- {idx_selected_input=}")
+        logger.info(f"- {num_workers=}")
+        logger.info(f"- {is_stream_unzip=}")
 
     if not isinstance(config, ECKConfig):
         config = _cli.parse.path_to_config(path_to_config, logger=logger)
@@ -285,6 +295,8 @@ def _to_list(input: Any, _type: type[Any] | tuple[type[Any], ...]) -> list | Non
         is_create_subdirs=is_create_subdirs,
         logger=logger,
         is_reversed_order=is_reversed_order,
+        num_workers=num_workers,
+        is_stream_unzip=is_stream_unzip,
     )
 
     if logger:
@@ -558,6 +570,20 @@ def add_download_agruments(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Downloads data products in reversed order (from the latest to the earliest)",
     )
+    parser.add_argument(
+        "-w",
+        "--num_workers",
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Number of concurrent downloads (default: 1). With more than one worker, archives are extracted while further downloads are running.",
+    )
+    parser.add_argument(
+        "--stream_unzip",
+        "--stream-unzip",
+        action="store_true",
+        help="Extract archives while downloading them, so that ZIP files are never written to disk",
+    )
 
 
 def eval_download_arguments(args: argparse.Namespace) -> None:
@@ -597,6 +623,8 @@ def eval_download_arguments(args: argparse.Namespace) -> None:
     exclude_header: bool = args.exclude_header
     only_header: bool = args.only_header
     reversed_order: bool = args.reversed_order
+    num_workers: int = args.num_workers
+    is_stream_unzip: bool = args.stream_unzip
 
     is_include_header: bool | None = None
     if include_header and exclude_header:
@@ -637,6 +665,8 @@ def eval_download_arguments(args: argparse.Namespace) -> None:
         is_include_header=is_include_header,
         is_reversed_order=reversed_order,
         is_only_header=only_header,
+        num_workers=num_workers,
+        is_stream_unzip=is_stream_unzip,
     )
 
 
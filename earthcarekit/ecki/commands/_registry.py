@@ -1,6 +1,6 @@
 from argparse import _SubParsersAction
 
-from . import unzip, zip
+from . import catalog, unzip, zip
 from ._command import Command
 
 
@@ -18,6 +18,12 @@ def get_commands() -> list[Command]:
             add_arguments=unzip.add_arguments,
             run=unzip.run,
         ),
+        Command(
+            name="catalog",
+            help="update, rebuild or verify the local EarthCARE product catalog",
+            add_arguments=catalog.add_arguments,
+            run=catalog.run,
+        ),
     ]
 
 
@@ -0,0 +1,64 @@
+import argparse
+from pathlib import Path
+
+from ...read.product._catalog import ProductCatalog
+from ...utils._cli.ui import console_print
+from ...utils._config import read_config
+from . import common
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    common.args.version.add(parser)
+    parser.add_argument(
+        "-d",
+        "--directory",
+        type=Path,
+        default=None,
+        help="Root data directory (default: data directory from the configuration file).",
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the existing catalog and index the data directory from scratch.",
+    )
+    group.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare the catalog against a full scan of the data directory without modifying it.",
+    )
+
+
+def run(args: argparse.Namespace) -> None:
+    common.args.version.run(args)
+    directory: Path | None = args.directory
+    if directory is None:
+        directory = Path(read_config().path_to_data)
+
+    with ProductCatalog(str(directory)) as catalog:
+        console_print(f"==> Catalog '{catalog.filepath}'")
+        console_print(f"==> Data directory '{catalog.path_to_data}'")
+
+        if args.verify:
+            result = catalog.verify()
+            common.log.zip_files([Path(f) for f in result.missing], nmax=20)
+            console_print(f"==> {len(result.missing)} files missing from the catalog.")
+            common.log.zip_files([Path(f) for f in result.stale], nmax=20)
+            console_print(f"==> {len(result.stale)} stale catalog entries.")
+            if result.is_valid:
+                console_print("==> Catalog is up to date.")
+            else:
+                console_print("==> Catalog is outdated; run 'ecki catalog' to update it.")
+            return
+
+        if args.rebuild:
+            console_print("==> Rebuilding catalog...")
+            update = catalog.rebuild()
+        else:
+            console_print("==> Updating catalog...")
+            update = catalog.update()
+
+        console_print(f"==> Scanned {update.num_dirs_scanned} directories.")
+        if update.num_dirs_removed > 0:
+            console_print(f"==> Removed {update.num_dirs_removed} missing directories.")
+        console_print(f"==> Catalog contains {update.num_files} files.")
@@ -3,7 +3,6 @@
 import numpy as np
 import xarray as xr
 from numpy.typing import NDArray
-from scipy.signal import find_peaks  # type: ignore
 
 from ..constants import ALONG_TRACK_DIM, TIME_VAR, TRACK_LAT_VAR
 from ..typing import NumberPairNoneLike, validate_numeric_pair
@@ -13,6 +12,8 @@
 
 
 def cosses_pole(lats: NDArray) -> bool:
+    from scipy.signal import find_peaks  # type: ignore  # slow to import, rarely needed
+
     maxima, _ = find_peaks(lats)
     minima, _ = find_peaks(-lats)
     peaks = np.sort(np.concat((maxima, minima)))
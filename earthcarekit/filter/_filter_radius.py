@@ -11,6 +11,47 @@
 from ._handle_trim_index_offset import update_trim_index_offset
 from ._padding import _pad_mask
 
+# Bounds of the deviation of haversine from geodesic distances (WGS 84 vs. mean earth sphere:
+# less than 0.6 %) used to select samples for which the exact distance is calculated
+_PREFILTER_REL_MARGIN = 0.01
+_PREFILTER_ABS_MARGIN_KM = 1.0
+# Vincenty's method may not converge for nearly antipodal points, which breaks the bounds
+_PREFILTER_MAX_KM = 15000.0
+
+
+def _get_geodesic_distances(
+    center_coords: tuple[float, float],
+    satellite_coords: np.ndarray,
+    radius_km: float,
+) -> np.ndarray:
+    """Returns geodesic distances in km, calculated only for samples that can be within the radius.
+
+    Haversine distances select the samples that can be within the radius or closest to the
+    center, and only their geodesic distances are calculated; other samples are set to infinity.
+    Since geodesic distances of each sample do not depend on others, filtering the resulting
+    distances gives identical results to calculating them for all samples.
+    """
+    if satellite_coords.ndim != 2:
+        return np.asarray(geodesic(center_coords, satellite_coords))
+
+    coarse = np.asarray(haversine(center_coords, satellite_coords), dtype=np.float64)
+    finite = np.isfinite(coarse)
+    if not np.any(finite):
+        return np.asarray(geodesic(center_coords, satellite_coords))
+
+    min_coarse = float(np.min(coarse[finite]))
+    threshold_radius = radius_km * (1 + _PREFILTER_REL_MARGIN) + _PREFILTER_ABS_MARGIN_KM
+    threshold_closest = min_coarse * (1 + _PREFILTER_REL_MARGIN) + _PREFILTER_ABS_MARGIN_KM
+    if max(threshold_radius, threshold_closest) > _PREFILTER_MAX_KM:
+        return np.asarray(geodesic(center_coords, satellite_coords))
+
+    candidates = np.flatnonzero(
+        ~finite | (coarse < threshold_radius) | (coarse <= threshold_closest)
+    )
+    distances = np.full(coarse.shape, np.inf)
+    distances[candidates] = geodesic(center_coords, satellite_coords[candidates])
+    return distances
+
 
 def filter_radius(
     ds: xr.Dataset,
@@ -40,7 +81,8 @@ def filter_radius(
         lat_var: Name of the latitude variable.
         lon_var: Name of the longitude variable.
         along_track_dim: Dimension along which to apply filtering.
-        method: Distance calculation method.
+        method: Distance calculation method. With "geodesic", exact distances are only calculated
+            for samples preselected via haversine distances, which yields identical results.
         closest: If True, returns only the single closest sample; otherwise returns all within radius.
         trim_index_offset_var: Variable tracking index offsets from trimming/filtering.
         pad_idxs: Number of additional samples added at both ends.
@@ -94,7 +136,7 @@ def filter_radius(
     center_coords = (_center_lat, _center_lon)
 
     if method == "geodesic":
-        distances = geodesic(center_coords, satellite_coords)
+        distances = _get_geodesic_distances(center_coords, satellite_coords, radius_km)
     else:
         distances = haversine(center_coords, satellite_coords)
 
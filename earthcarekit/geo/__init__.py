@@ -9,6 +9,7 @@
 This module depends on other internal modules:
 
 - [earthcarekit.constants][]
+- [earthcarekit.utils.kernels][]
 - [earthcarekit.utils.numpy][]
 
 ---
@@ -29,7 +30,7 @@
 )
 from .distance import geodesic, get_cumulative_distances, haversine, vincenty
 from .grid import create_spherical_grid
-from .interpolate import get_coord_between, interpgeo
+from .interpolate import get_coord_between, get_coords_between, interpgeo
 
 __all__ = [
     "Shapes",
@@ -46,6 +47,7 @@
     "haversine",
     "vincenty",
     "get_coord_between",
+    "get_coords_between",
     "interpgeo",
     "create_spherical_grid",
 ]
@@ -1,8 +1,8 @@
 import math
-from typing import SupportsFloat
+from typing import Any, Callable, Final, SupportsFloat
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 from ..constants import SEMI_MAJOR_AXIS_METERS, SEMI_MINOR_AXIS_METERS
 
@@ -152,6 +152,103 @@ def ecef_to_geo(
     return math.degrees(lat), math.degrees(lon), alt
 
 
+# Number of points converted at once by the `sequence_*` functions, to bound temporary memory
+DEFAULT_CHUNK_SIZE: Final[int] = 1_000_000
+
+
+def _arrays_geo_to_ecef(
+    lat: NDArray,
+    lon: NDArray,
+    alt: NDArray,
+    target_radius: float,
+    perfect_sphere: bool,
+    semi_major: float,
+    semi_minor: float,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """Vectorized `geo_to_ecef`."""
+    if perfect_sphere:
+        semi_minor = semi_major
+
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+
+    f = 1 - (semi_minor / semi_major)  # Flattening of the ellipsoid
+    N = semi_major / np.sqrt(1 - (f * sin_lat) ** 2)  # Prime vertical radius of curvature
+
+    x = (N + alt) * cos_lat * np.cos(lon)
+    y = (N + alt) * cos_lat * np.sin(lon)
+    z = ((semi_minor**2 / semi_major**2) * N + alt) * sin_lat
+
+    # Scale ECEF coordinates to target radius
+    R = ((semi_major + semi_minor) / 2) / target_radius
+    return -x / R, -y / R, z / R
+
+
+def _arrays_ecef_to_geo(
+    x: NDArray,
+    y: NDArray,
+    z: NDArray,
+    target_radius: float,
+    perfect_sphere: bool,
+    semi_major: float,
+    semi_minor: float,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """Vectorized `ecef_to_geo`."""
+    # Undo scaling
+    R = ((semi_major + (semi_major if perfect_sphere else semi_minor)) / 2) / target_radius
+    x = -x * R
+    y = -y * R
+    z = z * R
+
+    lon = np.arctan2(y, x)
+
+    if perfect_sphere:
+        r = np.sqrt(x**2 + y**2 + z**2)
+        lat = np.arcsin(z / r)
+        alt = r - semi_major
+    else:
+        e2 = 1 - (semi_minor**2 / semi_major**2)
+        p = np.sqrt(x**2 + y**2)
+        # Initial guess
+        lat = np.arctan2(z, p * (1 - e2))
+        # Iterative refienment
+        for _ in range(5):
+            N = semi_major / np.sqrt(1 - e2 * np.sin(lat) ** 2)
+            alt = p / np.cos(lat) - N
+            lat = np.arctan2(z, p * (1 - e2 * (N / (N + alt))))
+        N = semi_major / np.sqrt(1 - e2 * np.sin(lat) ** 2)
+        alt = p / np.cos(lat) - N
+
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def _convert_in_chunks(
+    func: Callable[..., tuple[NDArray, NDArray, NDArray]],
+    a: NDArray,
+    b: NDArray,
+    c: NDArray,
+    dtype: DTypeLike,
+    chunk_size: int | None,
+    **kwargs: Any,
+) -> NDArray:
+    """Applies a coordinate conversion to flattened inputs chunk by chunk, returning shape (N, 3)."""
+    a, b, c = (np.ravel(v) for v in np.broadcast_arrays(a, b, c))
+    n = a.shape[0]
+    out = np.empty((n, 3), dtype=dtype)
+    step = max(1, n if chunk_size is None else int(chunk_size))
+    for start in range(0, n, step):
+        s = slice(start, start + step)
+        out[s, 0], out[s, 1], out[s, 2] = func(
+            a[s].astype(np.float64, copy=False),
+            b[s].astype(np.float64, copy=False),
+            c[s].astype(np.float64, copy=False),
+            **kwargs,
+        )
+    return out
+
+
 def sequence_geo_to_ecef(
     lats: NDArray | list[SupportsFloat],
     lons: NDArray | list[SupportsFloat],
@@ -160,6 +257,8 @@ def sequence_geo_to_ecef(
     perfect_sphere: bool = True,
     semi_major: float = SEMI_MAJOR_AXIS_METERS,
     semi_minor: float = SEMI_MINOR_AXIS_METERS,
+    dtype: DTypeLike = np.float64,
+    chunk_size: int | None = DEFAULT_CHUNK_SIZE,
 ) -> NDArray:
     """Converts sequences of geodetic coordinates to Earth-centered, Earth-fixed (ECEF) coordinates.
 
@@ -171,36 +270,25 @@ def sequence_geo_to_ecef(
         perfect_sphere: If True, assume a spherical Earth; otherwise, use ellipsoidal (WGS 84).
         semi_major: Semi-major axis of the ellipsoid in meters; defaults to WGS 84 (6378137).
         semi_minor: Semi-minor axis of the ellipsoid in meters; defaults to WGS 84 (6356752.314245).
+        dtype: Data type of the output (e.g., `numpy.float32` to halve its memory); computations
+            are done in double precision. Defaults to `numpy.float64`.
+        chunk_size: Number of points converted at once to bound temporary memory; all at once if None.
 
     Returns:
         ECEF coordinates as a 2D array (N, 3), where N is the number of input points.
     """
-    lats = np.asarray(lats)
-    lons = np.asarray(lons)
-    if alts is None:
-        alts = np.zeros(lats.shape)
-    elif isinstance(alts, (float, int)):
-        alts = np.repeat(float(alts), lats.shape)
-    else:
-        alts = np.asarray(alts)
-    coords: NDArray = np.stack((lats, lons, alts)).T
-    xyz = np.array(
-        [
-            list(
-                geo_to_ecef(
-                    c[0],
-                    c[1],
-                    c[2],
-                    target_radius=target_radius,
-                    perfect_sphere=perfect_sphere,
-                    semi_major=semi_major,
-                    semi_minor=semi_minor,
-                )
-            )
-            for c in coords
-        ]
+    return _convert_in_chunks(
+        _arrays_geo_to_ecef,
+        np.asarray(lats),
+        np.asarray(lons),
+        np.asarray(0.0 if alts is None else alts),
+        dtype=dtype,
+        chunk_size=chunk_size,
+        target_radius=target_radius,
+        perfect_sphere=perfect_sphere,
+        semi_major=semi_major,
+        semi_minor=semi_minor,
     )
-    return xyz
 
 
 def sequence_ecef_to_geo(
@@ -211,6 +299,8 @@ def sequence_ecef_to_geo(
     perfect_sphere: bool = True,
     semi_major: float = SEMI_MAJOR_AXIS_METERS,
     semi_minor: float = SEMI_MINOR_AXIS_METERS,
+    dtype: DTypeLike = np.float64,
+    chunk_size: int | None = DEFAULT_CHUNK_SIZE,
 ) -> NDArray:
     """Converts sequences of Earth-centered, Earth-fixed (ECEF) coordinates to geodetic coordinates.
 
@@ -222,29 +312,43 @@ def sequence_ecef_to_geo(
         perfect_sphere: If True, assume a spherical Earth; otherwise, use ellipsoidal (WGS 84).
         semi_major: Semi-major axis of the ellipsoid in meters; defaults to WGS 84 (6378137).
         semi_minor: Semi-minor axis of the ellipsoid in meters; defaults to WGS 84 (6356752.314245).
+        dtype: Data type of the output (e.g., `numpy.float32` to halve its memory); computations
+            are done in double precision. Defaults to `numpy.float64`.
+        chunk_size: Number of points converted at once to bound temporary memory; all at once if None.
 
     Returns:
         Geodetic coordinates as a 2D array (N, 3); (latitude, longitude, altitude) for each input point.
     """
-    x = np.asarray(x)
-    y = np.asarray(y)
-    z = np.asarray(z)
-
-    xyz: NDArray = np.stack((x, y, z)).T
-    coords = np.array(
-        [
-            list(
-                ecef_to_geo(
-                    c[0],
-                    c[1],
-                    c[2],
-                    target_radius=target_radius,
-                    perfect_sphere=perfect_sphere,
-                    semi_major=semi_major,
-                    semi_minor=semi_minor,
-                )
-            )
-            for c in xyz
-        ]
+    return _convert_in_chunks(
+        _arrays_ecef_to_geo,
+        np.asarray(x),
+        np.asarray(y),
+        np.asarray(z),
+        dtype=dtype,
+        chunk_size=chunk_size,
+        target_radius=target_radius,
+        perfect_sphere=perfect_sphere,
+        semi_major=semi_major,
+        semi_minor=semi_minor,
     )
-    return coords
+
+
+def _geo_to_unit_ecef(lat: ArrayLike, lon: ArrayLike) -> NDArray:
+    """Vectorized `geo_to_ecef` on the unit sphere, returning an array of shape (..., 3)."""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    cos_lat = np.cos(lat)
+    return np.stack([-cos_lat * np.cos(lon), -cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _unit_ecef_to_geo(xyz: ArrayLike) -> tuple[NDArray, NDArray]:
+    """Vectorized `ecef_to_geo` on the unit sphere; vectors do not need to be normalized.
+
+    Returns:
+        Latitudes and longitudes in degrees.
+    """
+    xyz = np.asarray(xyz)
+    x, y, z = -xyz[..., 0], -xyz[..., 1], xyz[..., 2]
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lon = np.degrees(np.arctan2(y, x))
+    return lat, lon
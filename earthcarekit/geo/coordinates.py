@@ -41,12 +41,12 @@ def get_central_coords(
     longitude: ArrayLike,
 ) -> tuple[float, float]:
     """Calculates the central lat/lon coordinates."""
-    from .convertsions import ecef_to_geo, geo_to_ecef
+    from .convertsions import ecef_to_geo, sequence_geo_to_ecef
 
     lats: NDArray = flatten_array(latitude)
     lons: NDArray = flatten_array(longitude)
 
-    coords_ecef = np.array([geo_to_ecef(lat=lt, lon=ln) for lt, ln in zip(lats, lons)])
+    coords_ecef = sequence_geo_to_ecef(lats, lons)
     coords_ecef_min = np.nanmin(coords_ecef, axis=0)
     coords_ecef_max = np.nanmax(coords_ecef, axis=0)
     coords_ecef_central = (coords_ecef_min + coords_ecef_max) * 0.5
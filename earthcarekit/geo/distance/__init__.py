@@ -8,6 +8,7 @@
 This module depends on other internal modules:
 
 - [earthcarekit.constants][]
+- [earthcarekit.utils.kernels][]
 
 ---
 """
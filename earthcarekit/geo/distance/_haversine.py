@@ -1,9 +1,26 @@
 from typing import Literal
 
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
 
 from ...constants import MEAN_EARTH_RADIUS_METERS
+from ...utils.kernels import get_kernel, register_kernel
+
+
+@register_kernel("haversine")
+def _haversine(
+    phi_1: NDArray,
+    lambda_1: NDArray,
+    phi_2: NDArray,
+    lambda_2: NDArray,
+    radius: float,
+) -> NDArray:
+    def hav(theta):
+        return (1 - np.cos(theta)) / 2
+
+    h = hav(phi_2 - phi_1) + np.cos(phi_1) * np.cos(phi_2) * hav(lambda_2 - lambda_1)
+
+    return 2 * radius * np.arcsin(np.sqrt(h))
 
 
 def haversine(
@@ -69,15 +86,12 @@ def haversine(
     coord_a = np.radians(coord_a)
     coord_b = np.radians(coord_b)
 
-    phi_1, lambda_1 = coord_a[:, 0], coord_a[:, 1]
-    phi_2, lambda_2 = coord_b[:, 0], coord_b[:, 1]
-
-    def hav(theta):
-        return (1 - np.cos(theta)) / 2
-
-    h = hav(phi_2 - phi_1) + np.cos(phi_1) * np.cos(phi_2) * hav(lambda_2 - lambda_1)
-
-    d = 2 * radius * np.arcsin(np.sqrt(h))
+    # Numba kernels need contiguous arrays that own their data, not broadcast views
+    phi_1, lambda_1, phi_2, lambda_2 = (
+        np.ascontiguousarray(x)
+        for x in np.broadcast_arrays(coord_a[:, 0], coord_a[:, 1], coord_b[:, 0], coord_b[:, 1])
+    )
+    d = get_kernel("haversine")(phi_1, lambda_1, phi_2, lambda_2, radius)
 
     if len(a.shape) == 1 and len(b.shape) == 1:
         return d[0]
@@ -3,6 +3,105 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
+from ...utils.kernels import get_kernel, register_kernel
+
+
+@register_kernel("vincenty")
+def _vincenty(
+    lat_1: NDArray,
+    lon_1: NDArray,
+    lat_2: NDArray,
+    lon_2: NDArray,
+    tolerance: float,
+    max_iterations: int,
+) -> NDArray:
+    # WGS84 ellipsoid constants
+    a = 6378137.0  # semi-major axis (equatorial radius) in meters
+    f = 1 / 298.257223563  # flattening
+    b = (1 - f) * a  # semi-minor axis (polar radius) in meters
+
+    # Reduced latitudes
+    beta_1 = np.arctan((1 - f) * np.tan(lat_1))
+    beta_2 = np.arctan((1 - f) * np.tan(lat_2))
+
+    initial_lon_diff = lon_2 - lon_1
+
+    # Initialize variables for iterative solution
+    lon_diff = np.array(initial_lon_diff, dtype=np.float64)
+    sin_beta_1, cos_beta_1 = np.sin(beta_1), np.cos(beta_1)
+    sin_beta_2, cos_beta_2 = np.sin(beta_2), np.cos(beta_2)
+    sin_sigma, cos_sigma, sigma, cos2_alpha, cos2_sigma_m = (
+        np.zeros_like(lon_diff) for _ in range(5)
+    )
+    # Iterate only point pairs that have not converged yet, so that each distance is
+    # independent of the other pairs passed along with it
+    active = np.arange(lon_diff.size)
+
+    for _ in range(max_iterations):
+        _lon_diff = lon_diff[active]
+        _initial_lon_diff = initial_lon_diff[active]
+        _sin_beta_1, _cos_beta_1 = sin_beta_1[active], cos_beta_1[active]
+        _sin_beta_2, _cos_beta_2 = sin_beta_2[active], cos_beta_2[active]
+        sin_lon_diff, cos_lon_diff = np.sin(_lon_diff), np.cos(_lon_diff)
+
+        _sin_sigma = np.sqrt(
+            (_cos_beta_2 * sin_lon_diff) ** 2
+            + (_cos_beta_1 * _sin_beta_2 - _sin_beta_1 * _cos_beta_2 * cos_lon_diff) ** 2
+        )
+        _cos_sigma = (_sin_beta_1 * _sin_beta_2) + (_cos_beta_1 * _cos_beta_2 * cos_lon_diff)
+        _sigma = np.arctan2(_sin_sigma, _cos_sigma)
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            sin_alpha = _cos_beta_1 * _cos_beta_2 * sin_lon_diff / _sin_sigma
+        sin_alpha = np.nan_to_num(sin_alpha, nan=0.0)
+        _cos2_alpha = 1 - sin_alpha**2
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            _cos2_sigma_m = np.where(
+                _cos2_alpha != 0.0,
+                _cos_sigma - ((2 * _sin_beta_1 * _sin_beta_2) / _cos2_alpha),
+                0.0,
+            )
+        _cos2_sigma_m = np.nan_to_num(_cos2_sigma_m, nan=0.0)
+
+        C = f / 16 * _cos2_alpha * (4 + f * (4 - 3 * _cos2_alpha))
+
+        _lon_diff_new = _initial_lon_diff + (1 - C) * f * sin_alpha * (
+            _sigma + C * _sin_sigma * (_cos2_sigma_m + C * _cos_sigma * (-1 + 2 * _cos2_sigma_m**2))
+        )
+
+        sin_sigma[active], cos_sigma[active], sigma[active] = _sin_sigma, _cos_sigma, _sigma
+        cos2_alpha[active], cos2_sigma_m[active] = _cos2_alpha, _cos2_sigma_m
+        lon_diff[active] = _lon_diff_new
+
+        converged = np.abs(_lon_diff_new - _lon_diff) < tolerance
+        active = active[~converged]
+        if active.size == 0:
+            break
+
+    u2 = cos2_alpha * (a**2 - b**2) / b**2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+
+    delta_sigma = (
+        B
+        * sin_sigma
+        * (
+            cos2_sigma_m
+            + B
+            / 4
+            * (
+                cos_sigma * (-1 + 2 * cos2_sigma_m**2)
+                - B / 6 * cos2_sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos2_sigma_m**2)
+            )
+        )
+    )
+
+    distance = b * A * (sigma - delta_sigma)
+    return distance
+
 
 def vincenty(
     a: ArrayLike,
@@ -28,6 +127,9 @@ def vincenty(
 
     Notes:
         Uses WGS 84 parameters (a=6378137.0 m, f=1/298.257223563). May fail for nearly antipodal points.
+        Each coordinate pair is iterated until it has converged itself, so distances do not depend
+        on the other pairs passed along. Compared to iterating all pairs until every pair has
+        converged (as up to version 0.18.3), distances differ by up to a few 1e-9 km.
 
     Examples:
         >>> import earthcarekit as eck
@@ -62,81 +164,12 @@ def vincenty(
                 f"The shapes of passed arrays dont match (a={_a.shape}, b={_b.shape}). Either both should contain the same number of coordinates or at least one of them should contain a single coordinate."
             )
 
-    lat_1, lon_1 = coord_a[:, 0], coord_a[:, 1]
-    lat_2, lon_2 = coord_b[:, 0], coord_b[:, 1]
-
-    # WGS84 ellipsoid constants
-    a = 6378137.0  # semi-major axis (equatorial radius) in meters
-    f = 1 / 298.257223563  # flattening
-    b = (1 - f) * a  # semi-minor axis (polar radius) in meters
-
-    # Reduced latitudes
-    beta_1 = np.arctan((1 - f) * np.tan(lat_1))
-    beta_2 = np.arctan((1 - f) * np.tan(lat_2))
-
-    initial_lon_diff = lon_2 - lon_1
-
-    # Initialize variables for iterative solution
-    lon_diff = initial_lon_diff
-    sin_beta_1, cos_beta_1 = np.sin(beta_1), np.cos(beta_1)
-    sin_beta_2, cos_beta_2 = np.sin(beta_2), np.cos(beta_2)
-    # Track convergence for each point pair
-    converged = np.full_like(lat_1, False, dtype=bool)
-
-    for _ in range(max_iterations):
-        sin_lon_diff, cos_lon_diff = np.sin(lon_diff), np.cos(lon_diff)
-
-        sin_sigma = np.sqrt(
-            (cos_beta_2 * sin_lon_diff) ** 2
-            + (cos_beta_1 * sin_beta_2 - sin_beta_1 * cos_beta_2 * cos_lon_diff) ** 2
-        )
-        cos_sigma = (sin_beta_1 * sin_beta_2) + (cos_beta_1 * cos_beta_2 * cos_lon_diff)
-        sigma = np.arctan2(sin_sigma, cos_sigma)
-
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore")
-            sin_alpha = cos_beta_1 * cos_beta_2 * sin_lon_diff / sin_sigma
-        sin_alpha = np.nan_to_num(sin_alpha, nan=0.0)
-        cos2_alpha = 1 - sin_alpha**2
-
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore")
-            cos2_sigma_m = np.where(
-                cos2_alpha != 0.0,
-                cos_sigma - ((2 * sin_beta_1 * sin_beta_2) / cos2_alpha),
-                0.0,
-            )
-        cos2_sigma_m = np.nan_to_num(cos2_sigma_m, nan=0.0)
-
-        C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
-
-        previous_lon_diff = lon_diff
-        lon_diff = initial_lon_diff + (1 - C) * f * sin_alpha * (
-            sigma + C * sin_sigma * (cos2_sigma_m + C * cos_sigma * (-1 + 2 * cos2_sigma_m**2))
-        )
-        converged = converged | (np.abs(lon_diff - previous_lon_diff) < tolerance)
-        if np.all(converged):
-            break
-
-    u2 = cos2_alpha * (a**2 - b**2) / b**2
-    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
-    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
-
-    delta_sigma = (
-        B
-        * sin_sigma
-        * (
-            cos2_sigma_m
-            + B
-            / 4
-            * (
-                cos_sigma * (-1 + 2 * cos2_sigma_m**2)
-                - B / 6 * cos2_sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos2_sigma_m**2)
-            )
-        )
+    # Numba kernels need contiguous arrays that own their data, not broadcast views
+    lat_1, lon_1, lat_2, lon_2 = (
+        np.ascontiguousarray(x)
+        for x in np.broadcast_arrays(coord_a[:, 0], coord_a[:, 1], coord_b[:, 0], coord_b[:, 1])
     )
-
-    distance = b * A * (sigma - delta_sigma)
+    distance = get_kernel("vincenty")(lat_1, lon_1, lat_2, lon_2, tolerance, max_iterations)
 
     if units == "km":
         distance = distance / 1000.0
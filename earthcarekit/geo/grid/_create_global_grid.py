@@ -1,14 +1,15 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-import cartopy.crs as ccrs  # type: ignore
-import matplotlib.pyplot as plt
 import numpy as np
 from numpy.polynomial.legendre import leggauss
 from numpy.typing import NDArray
 
 from ...utils.numpy import flatten_array
 
+if TYPE_CHECKING:
+    import cartopy.crs as ccrs  # type: ignore
+
 
 def _get_lon_bounds_per_lat(
     nlon_equator: int,
@@ -142,7 +143,7 @@ def _preview(
         self,
         figsize=(10, 6),
         projection: (
-            ccrs.Projection
+            "ccrs.Projection"
             | Literal[
                 "orthographic",
                 "platecarree",
@@ -151,10 +152,14 @@ def _preview(
                 "eckert4",
                 "equalearth",
             ]
-        ) = ccrs.PlateCarree(),
+        ) = "platecarree",
         color="tab:blue",
         lw=3,
     ):
+        # Plotting libraries are only imported for previews
+        import cartopy.crs as ccrs  # type: ignore
+        import matplotlib.pyplot as plt
+
         if isinstance(projection, str):
             if projection == "orthographic":
                 projection = ccrs.Orthographic(central_latitude=45)
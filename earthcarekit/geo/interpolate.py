@@ -1,7 +1,9 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
+from ..utils.kernels import get_kernel, register_kernel
 from .constants import GEOD
+from .convertsions import _geo_to_unit_ecef, _unit_ecef_to_geo
 
 
 def get_coord_between(
@@ -52,3 +54,99 @@ def interpgeo(
     azi1, azi2, dist = GEOD.inv(lon1, lat1, lon2, lat2)
     lon, lat, _ = GEOD.fwd(lon1, lat1, azi1, f * dist)
     return lon, lat
+
+
+def get_coords_between(
+    coords1: ArrayLike,
+    coords2: ArrayLike,
+    f: ArrayLike = 0.5,
+) -> NDArray:
+    """Interpolates between pairs of coordinates along great circles by fractions f (0 to 1).
+
+    Vectorized counterpart of `get_coord_between`. Interpolation is done with unit vectors in
+    Earth-centered, Earth-fixed (ECEF) space, so paths crossing the antimeridian or a pole are
+    handled correctly. Antipodal points are connected via the poles.
+
+    Args:
+        coords1: First lat/lon point(s) as a 2-element sequence or (N, 2) array.
+        coords2: Second lat/lon point(s), same format as `coords1`.
+        f: Fraction(s) between 0 and 1, as scalar or (N,) array. Defaults to 0.5, i.e., the mid points.
+            With single points, an array of fractions yields points along one path.
+
+    Returns:
+        An (N, 2) `numpy.ndarray` of interpolated lat/lon points, with longitudes in [-180, 180].
+
+    Examples:
+        >>> import earthcarekit as eck
+        >>> eck.geo.get_coords_between([[0, 179], [80, 0]], [[0, -179], [80, 180]], f=0.75)
+        array([[   0. , -179.5],
+               [  85. ,  180. ]])
+    """
+    coords1 = np.atleast_2d(np.asarray(coords1, dtype=float))
+    coords2 = np.atleast_2d(np.asarray(coords2, dtype=float))
+
+    if coords1.shape[-1] != 2 or coords2.shape[-1] != 2:
+        raise ValueError("coords1 and coords2 must be lat/lon pairs of shape (2,) or (N, 2)")
+
+    f = np.asarray(f, dtype=float)
+    if f.ndim > 1:
+        raise ValueError("f must be a scalar or an (N,) array")
+
+    shape = np.broadcast_shapes(coords1.shape[:1], coords2.shape[:1], f.shape)
+    coords1 = np.broadcast_to(coords1, shape + (2,))
+    coords2 = np.broadcast_to(coords2, shape + (2,))
+    f = np.broadcast_to(f, shape)
+
+    # Numba kernels need contiguous arrays that own their data, not broadcast views
+    lat0, lon0, lat1, lon1, f = (
+        np.ascontiguousarray(x)
+        for x in (coords1[:, 0], coords1[:, 1], coords2[:, 0], coords2[:, 1], f)
+    )
+    lat, lon = get_kernel("geo_lerp")(lat0, lon0, lat1, lon1, f)
+    return np.column_stack([lat, lon])
+
+
+@register_kernel("geo_lerp")
+def _geo_lerp(
+    lat0: NDArray,
+    lon0: NDArray,
+    lat1: NDArray,
+    lon1: NDArray,
+    w: NDArray,
+) -> tuple[NDArray, NDArray]:
+    """Spherical linear interpolation (slerp) of ECEF unit vectors by fractions `w`."""
+    p0 = _geo_to_unit_ecef(lat0, lon0)
+    p1 = _geo_to_unit_ecef(lat1, lon1)
+    x0, y0, z0 = p0[..., 0], p0[..., 1], p0[..., 2]
+    x1, y1, z1 = p1[..., 0], p1[..., 1], p1[..., 2]
+
+    cx = y0 * z1 - z0 * y1
+    cy = z0 * x1 - x0 * z1
+    cz = x0 * y1 - y0 * x1
+    omega = np.arctan2(np.sqrt(cx**2 + cy**2 + cz**2), x0 * x1 + y0 * y1 + z0 * z1)
+    sin_omega = np.sin(omega)
+
+    # Fall back to linear weights for (nearly) identical points
+    is_arc = sin_omega > 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s0 = np.where(is_arc, np.sin((1 - w) * omega) / sin_omega, 1 - w)
+        s1 = np.where(is_arc, np.sin(w * omega) / sin_omega, w)
+    xyz = s0[..., np.newaxis] * p0 + s1[..., np.newaxis] * p1
+
+    # Any great circle connects antipodal points: take the one through the poles
+    is_antipodal = ~is_arc & (omega > np.pi / 2)
+    if np.any(is_antipodal):
+        # Unit vector orthogonal to p0 pointing north (or towards lon=0 at the poles; note the
+        # negated x-axis of `_geo_to_unit_ecef`)
+        norm = np.sqrt(np.maximum(1 - z0**2, 0.0))
+        is_pole = norm < 1e-12
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mx = np.where(is_pole, -1.0, -z0 * x0 / norm)
+            my = np.where(is_pole, 0.0, -z0 * y0 / norm)
+            mz = np.where(is_pole, 0.0, norm)
+        m = np.stack([mx, my, mz], axis=-1)
+        angle = (w * omega)[..., np.newaxis]
+        xyz_antipodal = np.cos(angle) * p0 + np.sin(angle) * m
+        xyz = np.where(is_antipodal[..., np.newaxis], xyz_antipodal, xyz)
+
+    return _unit_ecef_to_geo(xyz)
@@ -17,10 +17,19 @@
 ---
 """
 
-from ._overpass_info import OverpassInfo, get_closest_distance, get_overpass_info
+from ._overpass_info import (
+    OverpassInfo,
+    get_closest_distance,
+    get_overpass_info,
+    get_overpass_infos,
+)
+from ._track_index import TrackIndex, read_track
 
 __all__ = [
     "OverpassInfo",
     "get_closest_distance",
     "get_overpass_info",
+    "get_overpass_infos",
+    "TrackIndex",
+    "read_track",
 ]
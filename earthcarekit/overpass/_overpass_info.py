@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 import pandas as pd
@@ -7,7 +8,12 @@
 
 from ..constants import ALONG_TRACK_DIM, TIME_VAR, TRACK_LAT_VAR, TRACK_LON_VAR
 from ..filter import EmptyFilterResultError, filter_radius
-from ..geo import geodesic, get_coords, get_cumulative_distances
+from ..filter._filter_radius import (
+    _PREFILTER_ABS_MARGIN_KM,
+    _PREFILTER_MAX_KM,
+    _PREFILTER_REL_MARGIN,
+)
+from ..geo import geodesic, get_coords, get_cumulative_distances, haversine
 from ..geo.string_formatting import format_coords
 from ..read import read_product
 from ..site import Site, SiteLike, get_site
@@ -131,33 +137,34 @@ def to_dict(self) -> dict:
     def to_dataframe(self) -> pd.DataFrame:
         """Returns overpass info as a `pandas.Dataframe`."""
         df = pd.DataFrame([self.to_dict()])
-        df = df.astype(
-            dict(
-                site_name=str,
-                site_lat_deg_north=float,
-                site_lon_deg_east=float,
-                site_radius_km=float,
-                start_index=int,
-                end_index=int,
-                start_time=pd.Timestamp,
-                end_time=pd.Timestamp,
-                start_lat_deg_north=float,
-                start_lon_deg_east=float,
-                end_lat_deg_north=float,
-                end_lon_deg_east=float,
-                closest_index=int,
-                closest_lat_deg_north=float,
-                closest_lon_deg_east=float,
-                closest_time=pd.Timestamp,
-                closest_distance_km=float,
-                along_track_distance_km=float,
-                frame_crosses_pole=bool,
-                samples=int,
-            )
-        )
+        df = df.astype(_DATAFRAME_DTYPES)
         return df
 
 
+_DATAFRAME_DTYPES: dict = dict(
+    site_name=str,
+    site_lat_deg_north=float,
+    site_lon_deg_east=float,
+    site_radius_km=float,
+    start_index=int,
+    end_index=int,
+    start_time="datetime64[ns]",
+    end_time="datetime64[ns]",
+    start_lat_deg_north=float,
+    start_lon_deg_east=float,
+    end_lat_deg_north=float,
+    end_lon_deg_east=float,
+    closest_index=int,
+    closest_lat_deg_north=float,
+    closest_lon_deg_east=float,
+    closest_time="datetime64[ns]",
+    closest_distance_km=float,
+    along_track_distance_km=float,
+    frame_crosses_pole=bool,
+    samples=int,
+)
+
+
 def get_closest_distance(
     ds: xr.Dataset,
     *,
@@ -286,7 +293,7 @@ def _get_overpass_info(
     closest_time = time[closest_filtered_index]
     closest_index = np.argmin(np.abs(original_time - closest_time))
     closest_lat = lat[closest_filtered_index]
-    closest_lon = lat[closest_filtered_index]
+    closest_lon = lon[closest_filtered_index]
     along_track_distance = get_cumulative_distances(lat, lon, units="km")[-1]
 
     assert start_time <= closest_time
@@ -377,3 +384,159 @@ def get_overpass_info(
         )
 
     return result
+
+
+def _get_distance_matrix(
+    site_coords: np.ndarray,
+    track_coords: np.ndarray,
+    radius_km: float,
+) -> np.ndarray:
+    """Returns geodesic distances (sites x samples) in km, or infinity if outside the radius.
+
+    Haversine distances preselect the pairs that can be within the radius (see
+    `filter_radius`), so that Vincenty's method only runs on those.
+    """
+    num_sites, num_samples = site_coords.shape[0], track_coords.shape[0]
+    a = np.repeat(site_coords, num_samples, axis=0)
+    b = np.tile(track_coords, (num_sites, 1))
+    coarse = np.asarray(haversine(a, b), dtype=np.float64)
+
+    threshold = radius_km * (1 + _PREFILTER_REL_MARGIN) + _PREFILTER_ABS_MARGIN_KM
+    if threshold > _PREFILTER_MAX_KM:
+        candidates = np.arange(len(coarse))
+    else:
+        candidates = np.flatnonzero(coarse < threshold)
+    distances = np.full(coarse.shape, np.inf)
+    if len(candidates) > 0:
+        distances[candidates] = geodesic(b[candidates], a[candidates], units="km")
+    return distances.reshape(num_sites, num_samples)
+
+
+def get_overpass_infos(
+    ds: str | xr.Dataset,
+    sites: Sequence[SiteLike],
+    radius_km: float | int = 100.0,
+    *,
+    time_var: str = TIME_VAR,
+    lat_var: str = TRACK_LAT_VAR,
+    lon_var: str = TRACK_LON_VAR,
+) -> pd.DataFrame:
+    """Extracts overpass details of many sites at once, like `get_overpass_info` for each site.
+
+    Distances between all sites and samples are calculated as one matrix, from which the
+    samples within the radius are located for all sites together. Sites that are not passed
+    within the radius are omitted.
+
+    Args:
+        ds: Dataset or file path with along-track satellite data.
+        sites: Site names or objects.
+        radius_km: Search radius in kilometers; defaults to 100.
+        time_var: Time variable name.
+        lat_var: Latitude variable name.
+        lon_var: Longitude variable name.
+
+    Returns:
+        A `pandas.DataFrame` with one row per overpassed site (in the order of `sites`) and the
+        columns of `OverpassInfo.to_dataframe`.
+
+    Examples:
+        >>> import earthcarekit as eck
+        >>> ds = eck.ecload("ATL_EBD_2A", "01508B", download=True)
+        >>> df = eck.get_overpass_infos(ds, ["dushanbe", "leipzig"], radius_km=100)
+    """
+    if isinstance(ds, str):
+        with read_product(ds) as _ds:
+            return get_overpass_infos(
+                _ds,
+                sites,
+                radius_km,
+                time_var=time_var,
+                lat_var=lat_var,
+                lon_var=lon_var,
+            )
+    elif not isinstance(ds, xr.Dataset):
+        raise TypeError(
+            f"`ds` has invalid type '{type(ds).__name__}', expected 'str' (i.e. filepath) or 'xr.Dataset'"
+        )
+
+    _sites = [get_site(s) if isinstance(s, str) else s for s in sites]
+    for s in _sites:
+        if not isinstance(s, Site):
+            raise TypeError(
+                f"invalid type '{type(s).__name__}' for site, expected type 'Site' or 'str'"
+            )
+
+    df_empty = pd.DataFrame(columns=list(_DATAFRAME_DTYPES)).astype(_DATAFRAME_DTYPES)
+    if len(_sites) == 0:
+        return df_empty
+
+    time = ds[time_var].values
+    lat = ds[lat_var].values
+    lon = ds[lon_var].values
+    site_coords = np.array([(float(s.latitude), float(s.longitude)) for s in _sites])
+    distances = _get_distance_matrix(
+        site_coords, get_coords(ds, lat_var=lat_var, lon_var=lon_var), float(radius_km)
+    )
+
+    # Samples within the radius, grouped by site (rows are sorted)
+    site_ids, sample_ids = np.nonzero(distances < radius_km)
+    bounds = np.searchsorted(site_ids, np.arange(len(_sites) + 1))
+    has_overpass = np.diff(bounds) > 0
+    if not np.any(has_overpass):
+        return df_empty
+
+    first, last = bounds[:-1][has_overpass], bounds[1:][has_overpass] - 1
+    start_index, end_index = sample_ids[first], sample_ids[last]
+    closest_index = np.argmin(distances[has_overpass], axis=1)
+    closest_distance = distances[has_overpass, closest_index]
+
+    # Overpasses span all samples from the first to the last one within the radius (see
+    # `filter_radius`), even if the track leaves the radius in between
+    samples = end_index - start_index + 1
+    segment_distances = np.zeros(0)
+    if len(lat) > 1:
+        segment_distances = np.asarray(
+            geodesic(
+                np.stack([lat[:-1], lon[:-1]], axis=-1),
+                np.stack([lat[1:], lon[1:]], axis=-1),
+            ),
+            dtype=np.float64,
+        ).reshape(-1)
+    # Summed like `get_cumulative_distances`
+    along_track_distance = [
+        np.cumsum(segment_distances[i0:i1])[-1] if i1 > i0 else 0.0
+        for i0, i1 in zip(start_index, end_index)
+    ]
+
+    is_crossing_pole = bool(ismonotonic(lat))
+    overpassed_sites = [s for s, h in zip(_sites, has_overpass) if h]
+    df = pd.DataFrame(
+        dict(
+            site_name=[
+                s.long_name
+                if isinstance(s.long_name, str)
+                else format_coords(lat=float(s.latitude), lon=float(s.longitude))
+                for s in overpassed_sites
+            ],
+            site_lat_deg_north=site_coords[has_overpass, 0],
+            site_lon_deg_east=site_coords[has_overpass, 1],
+            site_radius_km=float(radius_km),
+            start_index=start_index,
+            end_index=end_index,
+            start_time=time[start_index],
+            end_time=time[end_index],
+            start_lat_deg_north=lat[start_index],
+            start_lon_deg_east=lon[start_index],
+            end_lat_deg_north=lat[end_index],
+            end_lon_deg_east=lon[end_index],
+            closest_index=closest_index,
+            closest_lat_deg_north=lat[closest_index],
+            closest_lon_deg_east=lon[closest_index],
+            closest_time=time[closest_index],
+            closest_distance_km=closest_distance,
+            along_track_distance_km=along_track_distance,
+            frame_crosses_pole=is_crossing_pole,
+            samples=samples,
+        )
+    )
+    return df.astype(_DATAFRAME_DTYPES)
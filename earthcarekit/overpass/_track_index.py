@@ -0,0 +1,358 @@
+import os
+from dataclasses import dataclass
+from functools import partial
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+from scipy.spatial import cKDTree  # type: ignore
+
+from ..constants import (
+    MEAN_EARTH_RADIUS_METERS,
+    NADIR_INDEX_VAR,
+    TIME_VAR,
+    TRACK_LAT_VAR,
+    TRACK_LON_VAR,
+)
+from ..geo import geodesic
+from ..geo.convertsions import _geo_to_unit_ecef, _unit_ecef_to_geo
+from ..geo.string_formatting import format_coords
+from ..read import LazyDataset, ProductCatalog, map_products, read_product
+from ..read.product._catalog import CatalogTrack
+from ..site import Site, SiteLike, get_site
+from ..utils import get_file_info_from_str
+
+_EARTH_RADIUS_KM = MEAN_EARTH_RADIUS_METERS / 1000.0
+
+
+def read_track(filepath: str, step: int = 20) -> CatalogTrack:
+    """Reads the decimated along-track coordinates (nadir track for swath products) of a product.
+
+    Products supported by `LazyDataset` are read with it, so that only the track variables are
+    loaded; other product types are opened with `read_product`.
+
+    Args:
+        filepath: Path to the product file.
+        step: Decimation step, i.e., every `step`-th sample (and the last one) is kept.
+
+    Returns:
+        A `CatalogTrack` with indices relative to the frame-trimmed product.
+    """
+    file_type = get_file_info_from_str(filepath)["file_type"]
+    nadir_index: int | None
+    if file_type in LazyDataset.get_supported_file_types():
+        with LazyDataset(filepath, vars=[TRACK_LAT_VAR, TRACK_LON_VAR, TIME_VAR]) as lds:
+            lat = np.asarray(lds[TRACK_LAT_VAR].values, dtype=np.float64)
+            lon = np.asarray(lds[TRACK_LON_VAR].values, dtype=np.float64)
+            time = np.asarray(lds[TIME_VAR].values, dtype="datetime64[ns]")
+            nadir_index = lds.nadir_index
+    else:
+        with read_product(filepath) as ds:
+            lat = np.asarray(ds[TRACK_LAT_VAR].values, dtype=np.float64)
+            lon = np.asarray(ds[TRACK_LON_VAR].values, dtype=np.float64)
+            time = np.asarray(ds[TIME_VAR].values, dtype="datetime64[ns]")
+            nadir_index = int(ds[NADIR_INDEX_VAR].values) if NADIR_INDEX_VAR in ds else None
+    if lat.ndim == 2 and nadir_index is not None:
+        lat, lon = lat[:, nadir_index], lon[:, nadir_index]
+
+    n = lat.shape[0]
+    indices = np.unique(np.append(np.arange(0, n, step), n - 1)).astype(np.int32)
+    return CatalogTrack(
+        h5_mtime_ns=os.stat(filepath).st_mtime_ns,
+        step=step,
+        num_samples=n,
+        indices=indices,
+        latitude=lat[indices],
+        longitude=lon[indices],
+        time=time[indices],
+    )
+
+
+@dataclass
+class _Hit:
+    closest_index: float
+    closest_xyz: NDArray
+    closest_time: np.datetime64
+    segment: int
+
+
+class TrackIndex:
+    """Spatial index of the along-track coordinates of many products for fast overpass discovery.
+
+    The decimated tracks of all products (see `read_track`) are stored as unit vectors in a
+    KD-tree. Queries select track points within the search radius (plus the decimation
+    spacing) and refine the closest approach of each product on its nearest track segments, and
+    the index range within the radius on the segments crossing it, so that overpasses of many
+    sites across an archive are found without opening any product.
+
+    Tracks are cached in a `ProductCatalog`, so that each product is only read once. Product
+    types not supported by `LazyDataset` are read with `read_product`, which loads the whole
+    product; products whose track can not be read are left out with a warning. Results
+    are approximate (segments between decimated points are treated as straight lines): closest
+    indices and index ranges are accurate to about one sample, and distances are geodesic
+    distances to the refined closest point.
+
+    Args:
+        filepaths: Product file paths.
+        tracks: Decimated tracks of all products, in the same order.
+
+    Examples:
+        >>> df = eck.search_product(
+        ...     file_type="ATL_EBD_2A", start_time="2025-01-01", end_time="2025-12-31"
+        ... )
+        >>> with eck.ProductCatalog(path_to_data) as catalog:
+        >>>     index = eck.overpass.TrackIndex.from_products(df, catalog=catalog)
+        >>> overpasses = index.query(["leipzig", "dushanbe"], radius_km=100)
+    """
+
+    def __init__(self, filepaths: Sequence[str], tracks: Sequence[CatalogTrack]) -> None:
+        self.filepaths: list[str] = list(filepaths)
+        self.tracks: list[CatalogTrack] = list(tracks)
+
+        sizes = np.array([len(t.indices) for t in self.tracks], dtype=np.intp)
+        self._offsets: NDArray[np.intp] = np.concatenate([[0], np.cumsum(sizes)])
+        if len(self.tracks) > 0:
+            lat = np.concatenate([t.latitude for t in self.tracks])
+            lon = np.concatenate([t.longitude for t in self.tracks])
+        else:
+            lat = lon = np.empty(0)
+        self._xyz: NDArray = _geo_to_unit_ecef(lat, lon)
+        self._tree = cKDTree(self._xyz if len(self._xyz) > 0 else np.empty((0, 3)))
+
+        # Longest segment between decimated points, used as search margin
+        chords = np.linalg.norm(np.diff(self._xyz, axis=0), axis=1)
+        chords[self._offsets[1:-1] - 1] = 0.0  # segments between products
+        self._max_segment_km: float = float(
+            2 * _EARTH_RADIUS_KM * np.arcsin(min(1.0, np.max(chords, initial=0.0) / 2))
+        )
+
+    def __len__(self) -> int:
+        return len(self.filepaths)
+
+    @classmethod
+    def from_products(
+        cls,
+        products: pd.DataFrame | Sequence[str],
+        catalog: ProductCatalog | None = None,
+        step: int = 20,
+        workers: int | None = None,
+        progress: bool = False,
+    ) -> "TrackIndex":
+        """Builds an index from products, reading only tracks not yet cached in the catalog.
+
+        Args:
+            products: `ProductDataFrame` (or `pandas.DataFrame` with column "filepath"), or file paths.
+            catalog: Catalog used to cache tracks; all tracks are read if None.
+            step: Decimation step of the tracks. Defaults to 20 (i.e., about 20 km for ATLID).
+            workers: Number of threads reading tracks. Defaults to the number of CPUs.
+            progress: Show a progress bar while reading tracks if True.
+
+        Returns:
+            The track index. Unreadable products are skipped with a warning.
+        """
+        if isinstance(products, pd.DataFrame):
+            filepaths = [str(fp) for fp in products["filepath"]]
+        else:
+            filepaths = [str(fp) for fp in products]
+
+        tracks: dict[str, CatalogTrack] = {}
+        if catalog is not None:
+            for fp, track in catalog.get_tracks(filepaths).items():
+                try:
+                    is_current = track.h5_mtime_ns == os.stat(fp).st_mtime_ns
+                except OSError:
+                    is_current = False
+                if is_current and track.step == step:
+                    tracks[fp] = track
+
+        missing = [fp for fp in filepaths if fp not in tracks]
+        if len(missing) > 0:
+            results = map_products(
+                missing,
+                partial(read_track, step=step),
+                workers=workers,
+                backend="thread",
+                open_product=False,
+                on_error="skip",
+                progress=progress,
+            )
+            new_tracks = {fp: t for fp, t in zip(missing, results) if t is not None}
+            if catalog is not None:
+                catalog.set_tracks(new_tracks)
+            tracks.update(new_tracks)
+
+        filepaths = [fp for fp in filepaths if fp in tracks]
+        return cls(filepaths, [tracks[fp] for fp in filepaths])
+
+    def _refine(self, i: int, site_xyz: NDArray, point_ids: NDArray) -> _Hit:
+        """Finds the closest approach of product `i` to a site near the given track points."""
+        track = self.tracks[i]
+        start = self._offsets[i]
+        xyz = self._xyz[start : self._offsets[i + 1]]
+        k = point_ids - start
+
+        # Candidate segments adjacent to the candidate points
+        seg = np.unique(np.clip(np.concatenate([k - 1, k]), 0, max(len(xyz) - 2, 0)))
+        a = xyz[seg]
+        b = xyz[np.minimum(seg + 1, len(xyz) - 1)]
+        ab = b - a
+        ab_norm2 = np.einsum("ij,ij->i", ab, ab)
+        t = np.where(
+            ab_norm2 > 0,
+            np.einsum("ij,ij->i", site_xyz - a, ab) / np.where(ab_norm2 > 0, ab_norm2, 1.0),
+            0.0,
+        )
+        t = np.clip(t, 0.0, 1.0)
+        p = a + t[:, None] * ab
+        p /= np.linalg.norm(p, axis=1, keepdims=True)
+        j = int(np.argmax(p @ site_xyz))
+
+        s = seg[j]
+        s_next = min(s + 1, len(xyz) - 1)
+        idx0, idx1 = float(track.indices[s]), float(track.indices[s_next])
+        t0 = track.time[s].astype(np.int64)
+        t1 = track.time[s_next].astype(np.int64)
+        return _Hit(
+            closest_index=idx0 + t[j] * (idx1 - idx0),
+            closest_xyz=p[j],
+            closest_time=np.datetime64(int(round(t0 + t[j] * (t1 - t0))), "ns"),
+            segment=int(s),
+        )
+
+    def _crossing(
+        self,
+        i: int,
+        s: int,
+        site_xyz: NDArray,
+        radius_km: float,
+        entering: bool,
+    ) -> float:
+        """Returns the (fractional) index where segment `s` of product `i` crosses the radius."""
+        track = self.tracks[i]
+        start = self._offsets[i]
+        s_next = min(s + 1, len(track.indices) - 1)
+        a = self._xyz[start + s] * _EARTH_RADIUS_KM
+        ab = self._xyz[start + s_next] * _EARTH_RADIUS_KM - a
+        ab_norm2 = float(ab @ ab)
+        if ab_norm2 == 0:
+            return float(track.indices[s])
+
+        site = site_xyz * _EARTH_RADIUS_KM
+        t_closest = float((site - a) @ ab) / ab_norm2
+        d_perp = site - (a + t_closest * ab)
+        half_width = np.sqrt(max(radius_km**2 - float(d_perp @ d_perp), 0.0) / ab_norm2)
+        t = np.clip(t_closest - half_width if entering else t_closest + half_width, 0.0, 1.0)
+        idx0, idx1 = float(track.indices[s]), float(track.indices[s_next])
+        return idx0 + t * (idx1 - idx0)
+
+    def _get_index_range(
+        self,
+        i: int,
+        hit: _Hit,
+        site_xyz: NDArray,
+        radius_km: float,
+    ) -> tuple[int, int]:
+        """Returns the first and last index of product `i` within the radius around a site."""
+        xyz = self._xyz[self._offsets[i] : self._offsets[i + 1]]
+        distances = np.linalg.norm(xyz - site_xyz, axis=1) * _EARTH_RADIUS_KM
+        inside = np.flatnonzero(distances <= radius_km)
+        if len(inside) == 0:
+            first = last = hit.segment
+            start = self._crossing(i, first, site_xyz, radius_km, entering=True)
+            end = self._crossing(i, last, site_xyz, radius_km, entering=False)
+        else:
+            first, last = int(inside[0]), int(inside[-1])
+            start = float(self.tracks[i].indices[first])
+            end = float(self.tracks[i].indices[last])
+            if first > 0:
+                start = self._crossing(i, first - 1, site_xyz, radius_km, entering=True)
+            if last < len(xyz) - 1:
+                end = self._crossing(i, last, site_xyz, radius_km, entering=False)
+
+        n = self.tracks[i].num_samples
+        return int(np.clip(np.ceil(start), 0, n - 1)), int(np.clip(np.floor(end), 0, n - 1))
+
+    def query(
+        self,
+        sites: SiteLike | Sequence[SiteLike],
+        radius_km: float | int = 100.0,
+    ) -> pd.DataFrame:
+        """Finds all overpasses of the indexed products within a radius around each site.
+
+        Args:
+            sites: Site names or objects.
+            radius_km: Search radius in kilometers. Defaults to 100.
+
+        Returns:
+            A `pandas.DataFrame` with one row per site and product within the radius, sorted by
+            site (in input order) and time, with columns "site_name", "filepath",
+            "orbit_and_frame", "closest_time", "closest_distance_km", "closest_index",
+            "closest_lat_deg_north", "closest_lon_deg_east", "start_index" and "end_index"
+            (index range of samples within the radius, inclusive).
+        """
+        if isinstance(sites, (str, Site)):
+            sites = [sites]
+        _sites = [get_site(s) if isinstance(s, str) else s for s in sites]
+
+        columns = [
+            "site_name",
+            "filepath",
+            "orbit_and_frame",
+            "closest_time",
+            "closest_distance_km",
+            "closest_index",
+            "closest_lat_deg_north",
+            "closest_lon_deg_east",
+            "start_index",
+            "end_index",
+        ]
+        if len(_sites) == 0 or len(self._xyz) == 0:
+            return pd.DataFrame(columns=columns)
+
+        site_xyz = _geo_to_unit_ecef(
+            [s.latitude for s in _sites],
+            [s.longitude for s in _sites],
+        )
+        search_km = float(radius_km) + self._max_segment_km
+        chord = 2 * np.sin(min(search_km / _EARTH_RADIUS_KM, np.pi) / 2)
+        candidates = self._tree.query_ball_point(site_xyz, r=chord)
+
+        rows: list[dict] = []
+        for site, xyz, point_ids in zip(_sites, site_xyz, candidates):
+            if len(point_ids) == 0:
+                continue
+            point_ids = np.sort(np.asarray(point_ids, dtype=np.intp))
+            product_ids = np.searchsorted(self._offsets, point_ids, side="right") - 1
+            site_name = site.long_name or format_coords(lat=site.latitude, lon=site.longitude)
+
+            site_rows: list[dict] = []
+            for i in np.unique(product_ids):
+                hit = self._refine(int(i), xyz, point_ids[product_ids == i])
+                lat, lon = _unit_ecef_to_geo(hit.closest_xyz)
+                distance = float(
+                    geodesic((site.latitude, site.longitude), (float(lat), float(lon)), units="km")
+                )
+                if distance > radius_km:
+                    continue
+
+                start_index, end_index = self._get_index_range(int(i), hit, xyz, float(radius_km))
+                site_rows.append(
+                    dict(
+                        site_name=site_name,
+                        filepath=self.filepaths[i],
+                        orbit_and_frame=get_file_info_from_str(self.filepaths[i]).get(
+                            "orbit_and_frame"
+                        ),
+                        closest_time=pd.Timestamp(hit.closest_time),
+                        closest_distance_km=distance,
+                        closest_index=int(round(hit.closest_index)),
+                        closest_lat_deg_north=float(lat),
+                        closest_lon_deg_east=float(lon),
+                        start_index=start_index,
+                        end_index=end_index,
+                    )
+                )
+            rows.extend(sorted(site_rows, key=lambda r: r["closest_time"]))
+
+        return pd.DataFrame(rows, columns=columns)
@@ -0,0 +1,194 @@
+from typing import Any, Literal
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.image import AxesImage
+from numpy.typing import NDArray
+
+
+def _get_pixel_indices(coords: NDArray, vmin: float, vmax: float, num_pixels: int) -> NDArray:
+    """Returns the pixel index of each coordinate, or -1 if it lies outside of [vmin, vmax)."""
+    with np.errstate(invalid="ignore"):
+        idxs = np.floor((coords - vmin) / (vmax - vmin) * num_pixels)
+    is_inside = np.isfinite(idxs) & (idxs >= 0) & (idxs < num_pixels)
+    return np.where(is_inside, idxs, -1).astype(np.intp)
+
+
+def _get_pixel_centers(vmin: float, vmax: float, num_pixels: int) -> NDArray:
+    return vmin + (np.arange(num_pixels) + 0.5) * (vmax - vmin) / num_pixels
+
+
+def _rasterize_nearest(
+    values: NDArray,
+    time_edges: NDArray,
+    height_edges: NDArray,
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+    shape: tuple[int, int],
+) -> NDArray:
+    num_rows, num_cols = shape
+    num_profiles, num_bins = values.shape
+    raster = np.full(shape, np.nan)
+
+    # Profile shown at each pixel column center
+    x = _get_pixel_centers(*x_range, num_cols)
+    profile_idxs = np.searchsorted(time_edges, x, side="right") - 1
+    is_valid = (profile_idxs >= 0) & (profile_idxs < num_profiles)
+
+    # Height bin shown at each pixel row center, searched once per visible profile
+    y = _get_pixel_centers(*y_range, num_rows)
+    unique_idxs, inverse = np.unique(profile_idxs[is_valid], return_inverse=True)
+    columns = np.full((num_rows, unique_idxs.size), np.nan)
+    for j, i in enumerate(unique_idxs):
+        edges = height_edges[i]
+        v = values[i]
+        if edges[0] > edges[-1]:
+            edges = edges[::-1]
+            v = v[::-1]
+        bin_idxs = np.searchsorted(edges, y, side="right") - 1
+        is_inside = (bin_idxs >= 0) & (bin_idxs < num_bins)
+        columns[is_inside, j] = v[bin_idxs[is_inside]]
+
+    raster[:, is_valid] = columns[:, inverse]
+    return raster
+
+
+def _rasterize_mean(
+    values: NDArray,
+    time_edges: NDArray,
+    height_edges: NDArray,
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+    shape: tuple[int, int],
+) -> NDArray:
+    num_rows, num_cols = shape
+
+    # Pixel of each data bin center
+    time_centers = (time_edges[:-1] + time_edges[1:]) / 2
+    height_centers = (height_edges[:, :-1] + height_edges[:, 1:]) / 2
+    cols = _get_pixel_indices(time_centers, *x_range, num_cols)[:, None]
+    rows = _get_pixel_indices(height_centers, *y_range, num_rows)
+    is_inside = (cols >= 0) & (rows >= 0)
+    pixel_idxs = (rows * num_cols + cols)[is_inside]
+
+    # Mean of all valid bins per pixel
+    _values = values[is_inside].astype(np.float64)
+    is_finite = np.isfinite(_values)
+    size = num_rows * num_cols
+    counts_all = np.bincount(pixel_idxs, minlength=size)
+    counts = np.bincount(pixel_idxs[is_finite], minlength=size)
+    sums = np.bincount(pixel_idxs[is_finite], weights=_values[is_finite], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        raster = (sums / counts).reshape(shape)
+
+    # Pixels smaller than the data bins contain no bin center and show the nearest bin instead
+    is_empty = (counts_all == 0).reshape(shape)
+    if np.any(is_empty):
+        raster_nearest = _rasterize_nearest(
+            values, time_edges, height_edges, x_range, y_range, shape
+        )
+        raster[is_empty] = raster_nearest[is_empty]
+    return raster
+
+
+def rasterize_curtain(
+    values: NDArray,
+    time_edges: NDArray,
+    height_edges: NDArray,
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+    shape: tuple[int, int],
+    sampling: Literal["nearest", "mean"] = "mean",
+) -> NDArray:
+    """Resamples curtain data onto a regular image raster covering the given axis ranges.
+
+    Args:
+        values: Curtain values, shape (M, N) for M profiles of N height bins.
+        time_edges: Numeric time bin edges (e.g., matplotlib date numbers), shape (M + 1,).
+        height_edges: Height bin edges of each profile, shape (M, N + 1).
+        x_range: Numeric time range (min, max) covered by the raster.
+        y_range: Height range (min, max) covered by the raster.
+        shape: Raster shape (rows, columns); rows are ordered from bottom to top.
+        sampling: "nearest" shows the bin at each pixel center; "mean" averages all bins
+            centered in a pixel and falls back to "nearest" for pixels containing no bin center.
+
+    Returns:
+        The raster as a floating-point array, with NaN for pixels without data.
+    """
+    values = np.asarray(values)
+    time_edges = np.asarray(time_edges, dtype=np.float64)
+    height_edges = np.asarray(height_edges, dtype=np.float64)
+    shape = (max(1, int(shape[0])), max(1, int(shape[1])))
+
+    if sampling == "nearest":
+        return _rasterize_nearest(values, time_edges, height_edges, x_range, y_range, shape)
+    elif sampling == "mean":
+        return _rasterize_mean(values, time_edges, height_edges, x_range, y_range, shape)
+    raise ValueError(f"invalid sampling '{sampling}', expected 'nearest' or 'mean'")
+
+
+class CurtainImage(AxesImage):
+    """Image of curtain data that is resampled to the pixels of the axes whenever it is drawn.
+
+    The raster covers the current view limits at the resolution of the renderer, so that it
+    stays sharp after zooming, resizing the figure or saving it with a different `dpi`.
+
+    Args:
+        ax: Axes the image belongs to; the image is not added to it.
+        values: Curtain values, shape (M, N) for M profiles of N height bins.
+        time_edges: Numeric time bin edges (e.g., matplotlib date numbers), shape (M + 1,).
+        height_edges: Height bin edges of each profile, shape (M, N + 1).
+        sampling: Resampling method (see `rasterize_curtain`).
+        **kwargs: Passed to `matplotlib.image.AxesImage`.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        values: NDArray,
+        time_edges: NDArray,
+        height_edges: NDArray,
+        sampling: Literal["nearest", "mean"] = "mean",
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("origin", "lower")
+        kwargs.setdefault("interpolation", "nearest")
+        super().__init__(ax, **kwargs)
+        self._curtain_values = values
+        self._time_edges = time_edges
+        self._height_edges = height_edges
+        self._sampling: Literal["nearest", "mean"] = sampling
+        self._raster_key: tuple | None = None
+
+    def update_raster(
+        self,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        shape: tuple[int, int],
+    ) -> None:
+        """Resamples the curtain to a raster of `shape` pixels covering the given ranges."""
+        key = (x_range, y_range, shape)
+        if key == self._raster_key:
+            return
+        raster = rasterize_curtain(
+            values=self._curtain_values,
+            time_edges=self._time_edges,
+            height_edges=self._height_edges,
+            x_range=x_range,
+            y_range=y_range,
+            shape=shape,
+            sampling=self._sampling,
+        )
+        self.set_data(raster)
+        self.set_extent((*x_range, *y_range))
+        self._raster_key = key
+
+    def draw(self, renderer: RendererBase) -> None:
+        ax = self.axes
+        bbox = ax.get_window_extent(renderer)
+        x0, x1 = sorted(float(x) for x in ax.get_xlim())
+        y0, y1 = sorted(float(y) for y in ax.get_ylim())
+        shape = (int(np.ceil(bbox.height)), int(np.ceil(bbox.width)))
+        self.update_raster((x0, x1), (y0, y1), shape)
+        super().draw(renderer)
@@ -0,0 +1,126 @@
+from typing import Any
+
+import cartopy.crs as ccrs  # type: ignore
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.collections import LineCollection
+from numpy.typing import NDArray
+
+from ...geo import get_coords_between
+
+
+def _get_track_decimation_indices(
+    ax: Axes,
+    latitude: NDArray,
+    longitude: NDArray,
+    min_segment_length: float,
+    max_segment_degrees: float = 1.0,
+) -> NDArray:
+    """Returns the indices of the track points needed to draw a track at the axes' current extent.
+
+    Consecutive points are merged until they span at least `min_segment_length` points (1/72 inch)
+    on the figure, so the number of kept points depends on the drawn track length rather than the
+    number of samples. Each kept point stands for the points merged into it and is the last of
+    them, i.e., the one that would be drawn on top. Parts outside of the axes are clipped to its
+    border and thus collapse to few points. Merged points never span more than `max_segment_degrees` along the track, so that
+    shortcuts across hidden parts of the map stay short. NaN coordinates are always kept.
+    """
+    xy = ax.projection.transform_points(ccrs.PlateCarree(), longitude, latitude)[:, :2]  # type: ignore
+    xy = ax.transData.transform(xy)
+    margin = min_segment_length
+    xy[:, 0] = np.clip(xy[:, 0], ax.bbox.x0 - margin, ax.bbox.x1 + margin)
+    xy[:, 1] = np.clip(xy[:, 1], ax.bbox.y0 - margin, ax.bbox.y1 + margin)
+    step_points = np.hypot(*np.diff(xy, axis=0).T) * 72.0 / ax.figure.dpi
+    step_points[~np.isfinite(step_points)] = 0.0  # e.g., on the far side of the globe
+
+    dlon = (np.diff(longitude) + 180.0) % 360.0 - 180.0
+    step_degrees = np.hypot(np.diff(latitude), dlon * np.cos(np.radians(latitude[1:])))
+
+    weight = np.fmax(step_points / min_segment_length, step_degrees / max_segment_degrees)
+    weight[np.isnan(step_degrees)] = 1.0
+    groups = np.floor(np.concatenate([[0.0], np.cumsum(weight)]))
+    idxs = np.flatnonzero(np.diff(groups, append=np.inf) > 0)
+    if idxs[0] != 0:
+        idxs = np.insert(idxs, 0, 0)
+    return idxs
+
+
+def _get_track_segments(latitude: NDArray, longitude: NDArray, line_overlap: int) -> NDArray:
+    """Returns one lon/lat polyline per track point, of shape (N, `line_overlap`+2, 2).
+
+    The polyline of a point starts at the mid point to its predecessor and continues over the
+    following `line_overlap`+1 mid points, so that the lines drawn later hide the gaps between
+    the antialiased segments. The polylines are overlapping views of a single array of borders.
+    """
+    coords = np.column_stack([longitude, latitude]).astype(float)
+    # Reverse lon/lat to lat/lon for get_coords_between and back again
+    mid_points = get_coords_between(coords[:-1, ::-1], coords[1:, ::-1])[:, ::-1]
+    borders = np.concatenate(
+        [coords[:1], mid_points.reshape(-1, 2), np.repeat(coords[-1:], line_overlap + 1, axis=0)]
+    )
+    return np.lib.stride_tricks.sliding_window_view(borders, (line_overlap + 2, 2))[:, 0]
+
+
+class TrackCollection(LineCollection):
+    """Track colored by along-track values that is decimated to the axes whenever it is drawn.
+
+    The track is decimated to the current extent and resolution of the map (see
+    `_get_track_decimation_indices`), so that it stays complete after zooming, changing the
+    extent or saving the figure with a different `dpi`.
+
+    Args:
+        ax: Map axes the track belongs to; the collection is not added to it.
+        latitude: Latitudes of the track points in degrees.
+        longitude: Longitudes of the track points in degrees.
+        z: Values of the track points.
+        line_overlap: Number of following segments each drawn polyline extends over.
+        min_segment_length: Minimum length of decimated segments in points (1/72 inch); all
+            track points are drawn if None.
+        **kwargs: Passed to `matplotlib.collections.LineCollection`.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        latitude: NDArray,
+        longitude: NDArray,
+        z: NDArray,
+        line_overlap: int,
+        min_segment_length: float | None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__([], **kwargs)
+        self._track_latitude = latitude
+        self._track_longitude = longitude
+        self._track_z = z
+        self._line_overlap = line_overlap
+        self._min_segment_length = min_segment_length
+        self._segments_key: tuple | None = None
+        # The color scale covers all values, not only the ones that are drawn
+        self.set_array(z)
+        self.autoscale_None()
+        self.update_segments(ax)
+
+    def _get_segments_key(self, ax: Axes) -> tuple:
+        if self._min_segment_length is None or len(self._track_z) <= 2:
+            return ()
+        return (tuple(ax.viewLim.bounds), tuple(ax.bbox.bounds), ax.figure.dpi)
+
+    def update_segments(self, ax: Axes) -> None:
+        """Decimates the track to the current extent and resolution of `ax`."""
+        key = self._get_segments_key(ax)
+        if key == self._segments_key:
+            return
+        latitude, longitude, z = self._track_latitude, self._track_longitude, self._track_z
+        if self._min_segment_length is not None and len(z) > 2:
+            idxs = _get_track_decimation_indices(ax, latitude, longitude, self._min_segment_length)
+            latitude, longitude, z = latitude[idxs], longitude[idxs], z[idxs]
+        line_overlap = min(self._line_overlap, int(len(z) * 0.01))
+        self.set_segments(_get_track_segments(latitude, longitude, line_overlap=line_overlap))
+        self.set_array(z)
+        self._segments_key = key
+
+    def draw(self, renderer: RendererBase) -> None:
+        self.update_segments(self.axes)
+        super().draw(renderer)
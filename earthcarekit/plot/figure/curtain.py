@@ -5,15 +5,17 @@
 import pandas as pd
 import xarray as xr
 from matplotlib.axes import Axes
+from matplotlib.cm import ScalarMappable
 from matplotlib.colors import Colormap, Normalize
 from matplotlib.dates import date2num
 from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
 from matplotlib.offsetbox import AnchoredText
 from matplotlib.patches import Patch
 from numpy.typing import ArrayLike, NDArray
 
 from ...color import Color, ColorLike
-from ...colormap import get_cmap
+from ...colormap import Cmap, get_cmap
 from ...constants import (
     ALONG_TRACK_DIM,
     DEFAULT_COLORBAR_WIDTH,
@@ -39,6 +41,7 @@
 from ..text import add_shade_to_text, format_var_label
 from ._figure import TimeseriesFigure
 from ._overlay_profile import overlay_profile
+from ._rasterize_curtain import CurtainImage
 from .along_track import AlongTrackAxisStyle
 from .default import get_default_cmap, get_default_norm, get_default_rolling_mean
 
@@ -69,7 +72,7 @@ def warn_about_variable_limitations(var: str) -> None:
         warnings.warn(msg)
 
 
-def create_time_grid(time: NDArray, N: int) -> NDArray:
+def create_time_edges(time: NDArray) -> NDArray:
     # Convert time to numeric format for matplotlib
     time_num = date2num(time)
 
@@ -82,6 +85,13 @@ def create_time_grid(time: NDArray, N: int) -> NDArray:
         dt = np.append(dt, dt[-1])
         time_edges = np.concatenate([[time_num[0] - dt[0] / 2], time_num + dt / 2])
 
+    return time_edges
+
+
+def create_time_grid(time: NDArray, N: int) -> NDArray:
+    # Compute time edges (1D -> shape (M+1,))
+    time_edges = create_time_edges(time)
+
     # Expand time_edges to shape (M+1, N+1)
     time_grid = ensure_along_track_2d(time_edges, N + 1)
 
@@ -164,7 +174,7 @@ class CurtainFigure(TimeseriesFigure):
         num_ticks (int, optional): Maximum number of tick marks to be place along the x-axis. Defaults to 10.
         show_height_left (bool, optional): Whether to show height labels on the left y-axis. Defaults to True.
         show_height_right (bool, optional): Whether to show height labels on the right y-axis. Defaults to False.
-        mode (Literal["exact", "fast"], optional): Curtain plotting mode. Use "fast" to speed up plotting by coarsening data to at least `min_num_profiles`; "exact" plots full resolution. Defaults to None.
+        mode (Literal["exact", "fast", "raster"], optional): Curtain plotting mode. Use "fast" to speed up plotting by coarsening data to at least `min_num_profiles`; "exact" plots full resolution; "raster" resamples data to the pixels of the axes and draws it as an image, which is fastest for large curtains; the image is resampled whenever it is drawn, i.e., after zooming, resizing or saving with another `dpi`. Defaults to None.
         min_num_profiles (int, optional): Minimum number of profiles to keep when using "fast" mode. Defaults to 5000.
     """
 
@@ -191,7 +201,7 @@ def __init__(
         # timeseries
         show_height_left: bool = True,
         show_height_right: bool = False,
-        mode: Literal["exact", "fast"] = "fast",
+        mode: Literal["exact", "fast", "raster"] = "fast",
         min_num_profiles: int = _MIN_NUM_PROFILES,
         colorbar_tick_scale: float | None = None,
     ) -> None:
@@ -222,7 +232,7 @@ def __init__(
         self.show_height_left = show_height_left
         self.show_height_right = show_height_right
 
-        if mode in ["exact", "fast"]:
+        if mode in ["exact", "fast", "raster"]:
             self.mode = mode
         else:
             self.mode = "fast"
@@ -269,6 +279,41 @@ def _set_axes(
 
         return self
 
+    def _plot_raster(
+        self: Self,
+        values: NDArray,
+        time: NDArray,
+        height: NDArray,
+        cmap: Cmap,
+        sampling: Literal["nearest", "mean"] | None = None,
+        **kwargs: Any,
+    ) -> AxesImage:
+        """Draws curtain data resampled to one value per pixel of the axes as an image."""
+        if sampling is None:
+            is_discrete = cmap.categorical or np.issubdtype(values.dtype, np.integer)
+            sampling = "nearest" if is_discrete else "mean"
+
+        x_range = (float(date2num(self._tmin)), float(date2num(self._tmax)))
+        y_range = (float(self._ymin), float(self._ymax))
+        bbox = self._ax.get_window_extent()
+        shape = (int(np.ceil(bbox.height)), int(np.ceil(bbox.width)))
+
+        height_edges = create_height_grid(fill_height(np.atleast_2d(height)), values.shape[0])
+        kwargs.setdefault("zorder", 1)
+        image = CurtainImage(
+            self._ax,
+            values=values,
+            time_edges=create_time_edges(time),
+            height_edges=height_edges[:-1],
+            sampling=sampling,
+            cmap=cmap,
+            norm=self._norm,
+            **kwargs,
+        )
+        image.update_raster(x_range, y_range, shape)  # resampled again when drawn
+        self._ax.add_image(image)
+        return image
+
     def plot(
         self: Self,
         profiles: Profile | None = None,
@@ -312,8 +357,9 @@ def plot(
         ax_style_top: AlongTrackAxisStyle | str | None = None,
         ax_style_bottom: AlongTrackAxisStyle | str | None = None,
         show_temperature: bool = False,
-        mode: Literal["exact", "fast"] | None = None,
+        mode: Literal["exact", "fast", "raster"] | None = None,
         min_num_profiles: int = _MIN_NUM_PROFILES,
+        raster_sampling: Literal["nearest", "mean"] | None = None,
         mark_time: TimestampLike | Sequence[TimestampLike] | None = None,
         mark_time_color: (str | Color | Sequence[str | Color | None] | None) = None,
         mark_time_linestyle: str | Sequence[str] = "solid",
@@ -344,7 +390,7 @@ def plot(
             mark_time_linewidth=mark_time_linewidth,
         )
 
-        if mode in ["exact", "fast"]:
+        if mode in ["exact", "fast", "raster"]:
             self.mode = mode
 
         if isinstance(min_num_profiles, int):
@@ -426,22 +472,32 @@ def plot(
             if n > 1:
                 vp = vp.coarsen_mean(n)
 
-        time_grid, height_grid = create_time_height_grids(
-            values=vp.values, time=vp.time, height=vp.height
-        )
-
-        mesh = self._ax.pcolormesh(
-            time_grid,
-            height_grid[:, ::-1],
-            vp.values[:, ::-1],
-            cmap=cmap,
-            norm=self._norm,
-            shading="auto",
-            linewidth=0,
-            rasterized=True,
-            **kwargs,
-        )
-        mesh.set_edgecolor("face")
+        mesh: ScalarMappable
+        if self.mode == "raster":
+            mesh = self._plot_raster(
+                values=vp.values,
+                time=vp.time,
+                height=vp.height,
+                cmap=cmap,
+                sampling=raster_sampling,
+                **kwargs,
+            )
+        else:
+            time_grid, height_grid = create_time_height_grids(
+                values=vp.values, time=vp.time, height=vp.height
+            )
+            mesh = self._ax.pcolormesh(
+                time_grid,
+                height_grid[:, ::-1],
+                vp.values[:, ::-1],
+                cmap=cmap,
+                norm=self._norm,
+                shading="auto",
+                linewidth=0,
+                rasterized=True,
+                **kwargs,
+            )
+            mesh.set_edgecolor("face")
 
         if colorbar:
             cb_kwargs = dict(
@@ -569,8 +625,9 @@ def ecplot(
         ax_style_top: AlongTrackAxisStyle | str | None = None,
         ax_style_bottom: AlongTrackAxisStyle | str | None = None,
         show_temperature: bool = False,
-        mode: Literal["exact", "fast"] | None = None,
+        mode: Literal["exact", "fast", "raster"] | None = None,
         min_num_profiles: int = _MIN_NUM_PROFILES,
+        raster_sampling: Literal["nearest", "mean"] | None = None,
         mark_time: TimestampLike | Sequence[TimestampLike] | None = None,
         mark_time_color: (str | Color | Sequence[str | Color | None] | None) = None,
         mark_time_linestyle: str | Sequence[str] = "solid",
@@ -642,8 +699,9 @@ def ecplot(
             ax_style_top: Top axis style (e.g., "geo", "lat", "lon", "distance", "time", "utc", "lst", "none").
             ax_style_bottom: Bottom axis style (e.g., "geo", "lat", "lon", "distance", "time", "utc", "lst", "none").
             show_temperature: Overlay temperature contours if True; requires `values_temperature` or `temperature_var`.
-            mode: Plotting mode ("exact" or "fast"); defaults to config.
+            mode: Plotting mode ("exact", "fast" or "raster"); defaults to config.
             min_num_profiles: Min profiles for "fast" mode; defaults to 5000.
+            raster_sampling: Resampling in "raster" mode; "nearest" shows the bin at each pixel center, "mean" averages all bins within a pixel. Defaults to "nearest" for categorical or integer data and "mean" otherwise.
             mark_time: Timestamps to mark vertical profiles; ignored if None.
             mark_time_color: Mark line color(s); auto if None.
             mark_time_linestyle: Mark line style(s); defaults to "solid".
@@ -651,7 +709,7 @@ def ecplot(
             label_length: Max length for auto-generated labels.
             blend: Colormap blending factor (0-1); no blending if None.
             blend_color: Color to blend with colormap; defaults to "white".
-            **kwargs: Passed to `matplotlib.axes.Axes.pcolormesh`.
+            **kwargs: Passed to `matplotlib.axes.Axes.pcolormesh` (or `matplotlib.image.AxesImage` in "raster" mode).
 
         Returns:
             A `CurtainFigure` object containing the plot.
@@ -8,7 +8,12 @@
 from numpy.typing import ArrayLike
 
 from ...color import Color, ColorLike
-from ...stats import get_hist_mean, get_hist_median, get_hist_percentile
+from ...stats import (
+    HistogramAccumulator,
+    get_hist_mean,
+    get_hist_median,
+    get_hist_percentile,
+)
 from ...utils.numpy import bins_to_centers, centers_to_bins
 from ..text import add_shade_to_text, format_var_label
 from ._figure import BaseFigure
@@ -95,7 +100,7 @@ def set_ax(
 
     def plot(
         self: Self,
-        values: ArrayLike,
+        values: ArrayLike | HistogramAccumulator,
         edges: ArrayLike | None = None,
         *,
         show_mean: bool = False,
@@ -130,6 +135,9 @@ def plot(
             raise ValueError(f'Invalid mode "{mode}"; expected "step" or "line".')
 
         # Histogram
+        if isinstance(values, HistogramAccumulator):
+            edges = values.edges if edges is None else edges
+            values = values.counts
         values = np.asarray(values)
         if edges is None:
             if centers is None:
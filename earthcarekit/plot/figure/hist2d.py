@@ -11,7 +11,7 @@
 from numpy.typing import ArrayLike, NDArray
 
 from ...color import ColorLike
-from ...stats import get_hist_mean, get_hist_median
+from ...stats import Histogram2DAccumulator, get_hist_mean, get_hist_median
 from ..text import add_shade_to_text, format_var_label
 from ._figure import BaseFigure
 
@@ -143,9 +143,9 @@ def _set_ax(
 
     def plot(
         self: Self,
-        values: ArrayLike,
-        xedges: ArrayLike,
-        yedges: ArrayLike,
+        values: ArrayLike | Histogram2DAccumulator,
+        xedges: ArrayLike | None = None,
+        yedges: ArrayLike | None = None,
         *,
         cmap: str = "viridis",
         log_scale: bool = False,
@@ -177,6 +177,12 @@ def plot(
         kwargs_annotate: dict[str, Any] = {},
     ) -> Self:
         # Histogram
+        if isinstance(values, Histogram2DAccumulator):
+            xedges = values.xedges if xedges is None else xedges
+            yedges = values.yedges if yedges is None else yedges
+            values = values.counts.T
+        if xedges is None or yedges is None:
+            raise ValueError("Missing 'xedges' or 'yedges' argument.")
         values = np.asarray(values)
         xedges = np.asarray(xedges)
         yedges = np.asarray(yedges)
@@ -15,7 +15,6 @@
 from cartopy.mpl.geoaxes import GeoAxes  # type: ignore
 from cartopy.mpl.gridliner import Gridliner  # type: ignore
 from matplotlib.axes import Axes
-from matplotlib.collections import LineCollection
 from matplotlib.colors import LogNorm, Normalize
 from matplotlib.figure import Figure, SubFigure
 from matplotlib.image import AxesImage
@@ -70,6 +69,7 @@
 from ._texture import remove_features as remove_features_from_axis
 from ._texture import remove_images as remove_images_from_axis
 from ._texture import remove_rectangles
+from ._track_collection import TrackCollection
 from .default import get_default_cmap, get_default_norm
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -908,35 +908,16 @@ def plot_track(
         label: str | None = None,
         units: str | None = None,
         line_overlap: int = 20,
+        min_segment_length: float | None = 0.25,
     ) -> Self:
         latitude = np.asarray(latitude)
         longitude = np.asarray(longitude)
 
         if z is not None:
             z = np.asarray(z)
-            line_overlap = min(line_overlap, int(len(z) * 0.01))
             cmap, value_range, norm = self._init_cmap(cmap, value_range, log_scale, norm)
 
             coords = np.column_stack([longitude, latitude])
-            segments = [s for s in np.stack([coords[:-1], coords[1:]], axis=1)]
-            coords_borders = np.array(
-                [coords[0]]
-                + [
-                    get_coord_between(s[0][::-1], s[1][::-1])[::-1] for s in segments
-                ]  # Reverse lon/lat to lat/lon for get_coord_between and back again
-                + [coords[-1]] * (line_overlap + 1)
-            )
-            segments = [s for s in np.stack([coords_borders[:-1], coords_borders[1:]], axis=1)]
-
-            def _stack_points(points, line_overlap):
-                n_stacks = line_overlap + 2
-                return np.stack(
-                    [points[i : len(points) - (n_stacks - 1) + i] for i in range(n_stacks)],
-                    axis=1,
-                )
-
-            segments = [s for s in _stack_points(coords_borders, line_overlap=line_overlap)]
-            z_segments = z
 
             if show_border:
                 _l_border = self._ax.plot(
@@ -950,8 +931,13 @@ def _stack_points(points, line_overlap):
                     solid_capstyle="butt",
                 )
 
-            _lc = LineCollection(
-                segments,
+            _lc = TrackCollection(
+                self._ax,
+                latitude,
+                longitude,
+                z,
+                line_overlap=line_overlap,
+                min_segment_length=min_segment_length,
                 cmap=cmap,
                 norm=norm,
                 linewidth=linewidth,
@@ -959,7 +945,6 @@ def _stack_points(points, line_overlap):
                 zorder=zorder,
                 antialiased=True,
             )
-            _lc.set_array(z_segments)
             self._ax.add_collection(_lc)
 
             if colorbar and not self._colorbar:
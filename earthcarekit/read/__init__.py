@@ -33,11 +33,21 @@
     get_product_infos,
     is_earthcare_product,
 )
-from .lazy import LazyDataset, LazyVariable
+from .lazy import (
+    LazyDataset,
+    LazyVariable,
+    VariableCache,
+    VariableCacheStats,
+    get_variable_cache,
+)
 from .netcdf import read_nc
 from .pollynet import read_polly
 from .product import (
+    KDTreeRegridder,
+    ProductCatalog,
     add_isccp_cloud_type,
+    map_products,
+    map_reduce_products,
     read_hdr_fixed_header,
     read_product,
     read_products,
@@ -55,11 +65,15 @@
     "read_header_data",
     "read_product",
     "read_products",
+    "map_products",
+    "map_reduce_products",
     "read_science_data",
     "read_nc",
     "rebin_xmet_to_vertical_track",
     "rebin_msi_to_jsg",
+    "KDTreeRegridder",
     "search_product",
+    "ProductCatalog",
     "update_rgb",
     "FileAgency",
     "FileLatency",
@@ -79,6 +93,9 @@
     "add_potential_temperature",
     "LazyDataset",
     "LazyVariable",
+    "VariableCache",
+    "VariableCacheStats",
+    "get_variable_cache",
 ]
 
 _DEPRECATED = {
@@ -3,6 +3,7 @@
 import urllib.parse as urlp
 import warnings
 from dataclasses import asdict, dataclass
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -528,6 +529,19 @@ def filter_file_type_tuples(
             .sort_values([_oaf, _ft])
         )
 
+    def map_products(self, func: Callable, **kwargs) -> list:
+        """Applies a function to each product in parallel (see `earthcarekit.map_products`)."""
+        from ..product._map import map_products
+
+        return map_products(self, func, **kwargs)
+
+    def map_reduce_products(self, func: Callable, reduce_func: Callable, **kwargs) -> Any:
+        """Applies a function to each product in parallel and reduces the results in order
+        (see `earthcarekit.map_reduce_products`)."""
+        from ..product._map import map_reduce_products
+
+        return map_reduce_products(self, func, reduce_func, **kwargs)
+
     @classmethod
     def from_files(cls, filepaths: list[str]) -> "ProductDataFrame":
         """Creates `ProductDataFrame` from filepath strings."""
@@ -1 +1,3 @@
+from ._cache import VariableCache, VariableCacheStats, get_variable_cache
 from ._dataset import LazyDataset, LazyVariable
+from ._remote import RemoteRangeFile, RemoteReadStats
@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Final, Hashable
+
+from numpy.typing import NDArray
+
+DEFAULT_VARIABLE_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+
+_CacheEntry = tuple[tuple[str, ...], dict[str, str], NDArray]
+
+
+@dataclass(frozen=True)
+class VariableCacheStats:
+    """Snapshot of the usage of a `VariableCache`.
+
+    Attributes:
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that required reading from file.
+        evictions: Number of entries removed to stay within `max_bytes`.
+        num_entries: Number of cached variables.
+        current_bytes: Total size of cached values in bytes.
+        max_bytes: Size limit of the cache in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    current_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (NaN if there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else float("nan")
+
+
+class VariableCache:
+    """Thread-safe LRU cache of decoded `LazyDataset` variables, bounded by memory size.
+
+    Entries hold variable values after fill-value filtering, time conversion and geoid
+    correction. Cached arrays are read-only; `get` returns writable copies so that callers can
+    not modify cached data.
+
+    Args:
+        max_bytes: Maximum total size of cached values in bytes; 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_VARIABLE_CACHE_MAX_BYTES) -> None:
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes: int = max_bytes
+        self._current_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of cached values in bytes; reducing it evicts entries."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = int(value)
+            self._evict()
+
+    @property
+    def stats(self) -> VariableCacheStats:
+        """Current hit/miss statistics and memory usage."""
+        with self._lock:
+            return VariableCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def get(self, key: Hashable) -> _CacheEntry | None:
+        """Returns `(dims, attrs, values)` copies of a cached variable or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        dims, attrs, values = entry
+        return dims, dict(attrs), values.copy()
+
+    def put(
+        self, key: Hashable, dims: tuple[str, ...], attrs: dict[str, str], values: NDArray
+    ) -> bool:
+        """Stores a read-only copy of a variable.
+
+        Returns:
+            False if the values are larger than `max_bytes` and were not stored, True otherwise.
+        """
+        nbytes = int(values.nbytes)
+        if nbytes > self._max_bytes:
+            return False
+
+        values = values.copy()
+        values.flags.writeable = False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= int(old[2].nbytes)
+            self._entries[key] = (dims, dict(attrs), values)
+            self._current_bytes += nbytes
+            self._evict()
+        return True
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._current_bytes > self._max_bytes and self._entries:
+            _, (_, _, values) = self._entries.popitem(last=False)
+            self._current_bytes -= int(values.nbytes)
+            self._evictions += 1
+
+
+_VARIABLE_CACHE: Final[VariableCache] = VariableCache()
+
+
+def get_variable_cache() -> VariableCache:
+    """Returns the process-wide cache shared by all `LazyDataset` instances.
+
+    Examples:
+        >>> cache = eck.get_variable_cache()
+        >>> cache.max_bytes = 2 * 1024**3
+        >>> print(cache.stats.hit_rate)
+    """
+    return _VARIABLE_CACHE
@@ -1,5 +1,6 @@
 import copy
 import logging
+import os
 import re
 from dataclasses import dataclass, field, fields
 from types import MappingProxyType
@@ -15,23 +16,27 @@
 from pandas._typing import TimestampConvertibleTypes
 
 from ...constants import (
+    FRAME_INDEX_OFFSET_VAR,
     GEOID_OFFSET_VAR,
     HEIGHT_VAR,
     SENSOR_ELEVATION_ANGLE_VAR,
     SENSOR_ZENITH_ANGLE_VAR,
     TIME_VAR,
     TRACK_LAT_VAR,
+    TRIM_INDEX_OFFSET_VAR,
     TROPOPAUSE_VAR,
     UNITS_RENAME_MAP,
 )
 from ...data.profile import Profile, ProfileValidationState
 from ...filter._frame import get_frame_slice_tuple
-from ...typing import is_iterable_of_str
+from ...typing import NumberPairNoneLike, is_iterable_of_str, validate_numeric_pair
 from ...utils import get_file_info_from_str
 from ...utils.dict import invert_nonunique
 from ...utils.maap import get_maap_access_token
 from ...utils.numpy import rolling_mean_1d, rolling_mean_2d
 from ...utils.parse import is_url
+from ...utils.time import TimeRangeLike, validate_time_range
+from ._cache import get_variable_cache
 from ._defaults import (
     DEFAULT_NADIR_INDEX,
     ProductDefaults,
@@ -39,6 +44,7 @@
     get_defaults,
     get_supported_file_types,
 )
+from ._remote import RemoteRangeFile, get_dataset_byte_ranges
 from ._variable import LazyVariable
 
 
@@ -103,6 +109,34 @@ def _get_var_obj_dims(var_obj: h5py.Dataset, known_sizes: dict[str, int]) -> tup
     return tuple(dims_tmp)
 
 
+def _get_file_slice(outer: slice, inner: slice, size: int) -> slice | None:
+    """Maps `inner`, given relative to `array[outer]`, to a contiguous slice into `array`.
+
+    Returns None if the composed selection is not contiguous (i.e., `outer` has a step).
+    """
+    r = range(size)[outer]
+    if r.step != 1:
+        return None
+    r = r[inner]
+    return slice(r.start, max(r.start, r.stop))
+
+
+def _select_span(sel: slice, mask: NDArray[np.bool_], name: str) -> slice:
+    """Narrows `sel` to the span between the first and last True value of `mask`."""
+    idxs = np.flatnonzero(mask)
+    if idxs.size == 0:
+        raise ValueError(f"No data falls into the given {name} range")
+    return slice(sel.start + int(idxs[0]), sel.start + int(idxs[-1]) + 1)
+
+
+def _select_index_range(sel: slice, index_range: tuple[int | None, int | None]) -> slice:
+    """Narrows `sel` to an index range given relative to the selected data."""
+    r = range(sel.start, sel.stop)[slice(*index_range)]
+    if len(r) == 0:
+        raise ValueError(f"No data falls into the given index range: {index_range}")
+    return slice(r.start, r.stop)
+
+
 def detect_product_origin(filepath: str) -> Literal["native", "derived"]:
     pattern = r".*ECA_[EJ][XNO][A-Z]{2}_..._..._.._\d{8}T\d{6}Z_\d{8}T\d{6}Z_\d{5}[ABCDEFGH]\.h5"
 
@@ -135,11 +169,30 @@ class LazyDataset:
         vars: Variable names to load at init; all loaded if `in_memory=True` and None.
         origin: Product origin ("native", "derived", or None for auto-detect).
         logger: Logger for debug messages; defaults to root logger.
+        along_track_index_range: Along-track index range (start, stop) relative to the (trimmed) data.
+        time_range: Along-track selection by time (start, end).
+        lat_range: Along-track selection by latitude (min, max) of the nadir track.
+        vertical_index_range: Vertical index range (start, stop).
+        height_range: Vertical selection by height (min, max) in m, covering all selected profiles.
+        across_track_index_range: Across-track index range (start, stop) of swath products;
+            must include the nadir pixel.
+        use_cache: Share decoded variables of local files through the process-wide
+            `VariableCache` (see `get_variable_cache`) if True.
+        remote_mode: How remote files are read: "fsspec" (block cache of `fsspec`) or "range"
+            (`RemoteRangeFile`, which prefetches HDF5 metadata and coalesces chunk reads).
+        remote_cache_dir: Persistent block cache directory used by `remote_mode="range"`.
+
+    Selections are pushed down into the HDF5 reads: each variable is read as a single hyperslab
+    aligned to the dataset's chunk layout, so only chunks overlapping the selection are read.
+    Multiple along-track selections are combined.
 
     Examples:
         >>> with LazyDataset(filepath) as lds:
         >>>     for var in lds.variables:
         >>>         print(var)
+
+        >>> with LazyDataset(filepath, lat_range=(45, 47), height_range=(0, 15e3)) as lds:
+        >>>     values = lds["particle_backscatter_coefficient_355nm"].values
     """
 
     filepath: str | HTTPFile
@@ -149,6 +202,15 @@ class LazyDataset:
     vars: str | Iterable[str] | None = field(default=None, repr=False)
     origin: Literal["native", "derived"] | None = field(default=None, repr=False)
     logger: logging.Logger = logging.getLogger()
+    along_track_index_range: tuple[int | None, int | None] | None = field(default=None, repr=False)
+    time_range: TimeRangeLike | None = field(default=None, repr=False)
+    lat_range: NumberPairNoneLike | None = field(default=None, repr=False)
+    vertical_index_range: tuple[int | None, int | None] | None = field(default=None, repr=False)
+    height_range: NumberPairNoneLike | None = field(default=None, repr=False)
+    across_track_index_range: tuple[int | None, int | None] | None = field(default=None, repr=False)
+    use_cache: bool = field(default=True, repr=False)
+    remote_mode: Literal["fsspec", "range"] = field(default="fsspec", repr=False)
+    remote_cache_dir: str | None = field(default=None, repr=False)
     _ds_grp_esa: str = field(default="ScienceData", repr=False)
     _ds_grp_jaxa_geo: str = field(default="ScienceData/Geo", repr=False)
     _ds_grp_jaxa_data: str = field(default="ScienceData/Data", repr=False)
@@ -166,9 +228,14 @@ class LazyDataset:
     def __post_init__(self) -> None:
         self._info: dict[str, Any]
         self._http_file: None | HTTPFile = None
+        self._range_file: None | RemoteRangeFile = None
         self._fspec = None
+        self._file_id: tuple[str, int, int] | None = None
+
+        if isinstance(self.filepath, str) and is_url(self.filepath) and self.remote_mode == "range":
+            self._range_file = self._open_range_file()
 
-        if isinstance(self.filepath, str) and is_url(self.filepath):
+        elif isinstance(self.filepath, str) and is_url(self.filepath):
             fsspec_kwargs = get_default_fsspec_kwargs()
             fsspec_kwargs.update(self.fsspec_kwargs)
             self.fsspec_kwargs = fsspec_kwargs
@@ -183,7 +250,8 @@ def __post_init__(self) -> None:
         self._info = get_file_info_from_str(self.filepath)
         file_type = self._info["file_type"]
         self._is_jaxa: bool = self._info["agency"] == "J"
-        self._nadir_index: int | None = DEFAULT_NADIR_INDEX.get(file_type)
+        self._default_nadir_index: int | None = DEFAULT_NADIR_INDEX.get(file_type)
+        self._nadir_index: int | None = self._default_nadir_index
         self._loaded_vars: list[str] = []
         self._data: dict[str, LazyVariable] = {}
         self._sizes: dict[str, int] = {}
@@ -205,16 +273,41 @@ def __post_init__(self) -> None:
             self.load(self.vars)
             self.close()
 
+    def _open_range_file(self) -> RemoteRangeFile:
+        if "headers" in self.fsspec_kwargs:
+            headers = self.fsspec_kwargs["headers"]
+        else:
+            headers = get_default_fsspec_kwargs()["headers"]
+        return RemoteRangeFile(
+            str(self.filepath),
+            headers=headers,
+            cache_dir=self.remote_cache_dir,
+        )
+
     def __enter__(self: "LazyDataset") -> "LazyDataset":
         if self._read is False:
             return self
 
         if self._file is None or not bool(self._file.id.valid):
+            if (
+                self._range_file is None
+                and self._http_file is None
+                and is_url(str(self.filepath))
+                and self.remote_mode == "range"
+            ):
+                # Reopened after `__exit__` released the range file
+                self._range_file = self._open_range_file()
             if self._http_file:
                 self._file = h5py.File(self._http_file, "r")
+            elif self._range_file:
+                self._file = h5py.File(self._range_file, "r")
             else:
                 self._file = h5py.File(self.filepath, "r")
 
+        if self._http_file is None and self._range_file is None:
+            stat = os.stat(self.filepath)
+            self._file_id = (os.path.abspath(self.filepath), stat.st_mtime_ns, stat.st_size)
+
         if self._is_jaxa:
             lats_untrimmed = np.array(
                 self._file.get("ScienceData/Geo", self._file)[
@@ -247,8 +340,10 @@ def __enter__(self: "LazyDataset") -> "LazyDataset":
                 dtype=np.float64,
             )
 
+        # Index relative to the valid across-track pixels, derived anew on each entry
+        nadir_index: int | None = self._default_nadir_index
         self._slice_across_track_valid: slice
-        if self._nadir_index is not None:
+        if nadir_index is not None:
             lats_untrimmed = lats_untrimmed[:, self._slice_across_track]
             lats_untrimmed = LazyDataset._filter_fill_value(lats_untrimmed)
             idxs = np.argwhere(~np.isnan(lats_untrimmed).all(axis=0))
@@ -278,12 +373,12 @@ def __enter__(self: "LazyDataset") -> "LazyDataset":
                 angle = LazyDataset._filter_fill_value(angle)
 
                 if i == 0:
-                    self._nadir_index = int(np.median(np.nanargmax(angle, axis=1)))
+                    nadir_index = int(np.median(np.nanargmax(angle, axis=1)))
                 else:
-                    self._nadir_index = int(np.median(np.nanargmin(angle, axis=1)))
+                    nadir_index = int(np.median(np.nanargmin(angle, axis=1)))
                 break
 
-            lats_untrimmed = lats_untrimmed[:, self._nadir_index]
+            lats_untrimmed = lats_untrimmed[:, nadir_index]
         else:
             self._slice_across_track_valid = slice(None)
 
@@ -293,6 +388,14 @@ def __enter__(self: "LazyDataset") -> "LazyDataset":
                 frame_id=self._info["frame_id"],
             )
         )
+        self._slice_along_track_selection: slice = self._get_along_track_selection(lats_untrimmed)
+        self._slice_across_track_selection: slice = self._get_across_track_selection(nadir_index)
+        self._nadir_index = nadir_index
+        if nadir_index is not None:
+            self._nadir_index = nadir_index - (
+                self._slice_across_track_selection.start - self._slice_across_track_valid.start
+            )
+        self._slice_vertical_selection: slice = self._get_vertical_selection()
 
         def _add_info_var(_var: str, _rename: str | None = None) -> None:
             if _rename is None:
@@ -315,8 +418,19 @@ def _add_info_var(_var: str, _rename: str | None = None) -> None:
         _add_info_var("start_sensing_time", "sensing_start_time")
         _add_info_var("start_processing_time", "processing_start_time")
 
+        # The selection start includes frame trimming and all along-track selections, while the
+        # frame offset only records the frame trimming, so `from_xarray` can restore `trim_to_frame`
         lvar_trim_index_offset = LazyVariable(
-            varname="trim_index_offset",
+            varname=TRIM_INDEX_OFFSET_VAR,
+            dims=(),
+            attrs={},
+            values=np.asarray(self._slice_along_track_selection.start, dtype=int),
+            _dataset=self,
+        )
+        self._add_var(lvar_trim_index_offset.varname, lvar_trim_index_offset)
+
+        lvar_frame_index_offset = LazyVariable(
+            varname=FRAME_INDEX_OFFSET_VAR,
             dims=(),
             attrs={},
             values=np.asarray(
@@ -324,7 +438,7 @@ def _add_info_var(_var: str, _rename: str | None = None) -> None:
             ),
             _dataset=self,
         )
-        self._add_var(lvar_trim_index_offset.varname, lvar_trim_index_offset)
+        self._add_var(lvar_frame_index_offset.varname, lvar_frame_index_offset)
 
         if self._nadir_index is not None:
             lvar_nadir_index = LazyVariable(
@@ -352,6 +466,10 @@ def __exit__(
 
         if self._http_file:
             self._http_file.close()
+
+        if self._range_file is not None:
+            self._range_file.close()
+            self._range_file = None
         return False
 
     def __getitem__(self, key: str) -> LazyVariable:
@@ -548,6 +666,216 @@ def _load_var_obj(self, var: str) -> h5py.Dataset:
                 raise ValueError(f"I/O operation on closed file; '{var}' was not loaded yet") from e
             raise e
 
+    def _get_along_track_selection(self, lats: NDArray) -> slice:
+        """Combines frame trimming and along-track selections into one slice relative to the
+        along-track data read with `_slice_along_track`."""
+        sel = self._slice_along_track_frame if self.trim_to_frame else slice(0, lats.shape[0])
+
+        if self.along_track_index_range is not None:
+            sel = _select_index_range(sel, self.along_track_index_range)
+
+        if self.lat_range is not None:
+            lat_min, lat_max = sorted(validate_numeric_pair(self.lat_range, fallback=(-90, 90)))
+            _lats = lats[sel]
+            sel = _select_span(sel, (_lats >= lat_min) & (_lats <= lat_max), "latitude")
+
+        if self.time_range is not None:
+            time_min, time_max = validate_time_range(self.time_range)
+            var_obj = self._load_var_obj(self._varname_map.get(TIME_VAR, TIME_VAR))
+            key = _get_file_slice(self._slice_along_track, sel, var_obj.shape[0])
+            if key is None:
+                times = self._read_time(var_obj, (self._slice_along_track,))[sel]
+            else:
+                times = self._read_time(var_obj, (key,))
+            mask = (times >= time_min.to_datetime64()) & (times <= time_max.to_datetime64())
+            sel = _select_span(sel, mask, "time")
+
+        return sel
+
+    def _get_vertical_selection(self) -> slice:
+        """Returns the vertical selection relative to the data read with `_slice_vertical`."""
+        if self.vertical_index_range is None and self.height_range is None:
+            return slice(None)
+
+        height_var = self._varname_map.get(HEIGHT_VAR, HEIGHT_VAR)
+        var_obj = self._load_var_obj(height_var)
+        dims = _get_var_obj_dims(var_obj=var_obj, known_sizes=self._sizes)
+        if "vertical" not in dims:
+            raise ValueError(f"Vertical selection not supported; '{height_var}' has dims {dims}")
+        ivert = dims.index("vertical")
+        sel = slice(0, len(range(var_obj.shape[ivert])[self._slice_vertical]))
+
+        if self.vertical_index_range is not None:
+            sel = _select_index_range(sel, self.vertical_index_range)
+
+        if self.height_range is not None:
+            height_min, height_max = sorted(
+                validate_numeric_pair(self.height_range, fallback=(-np.inf, np.inf))
+            )
+            key, post = self._get_hyperslab(var_obj, dims, vertical=sel)
+            heights = LazyDataset._filter_fill_value(np.array(var_obj[*key], dtype=np.float64))[
+                *post
+            ]
+
+            if self.to_geoid and "along_track" in dims:
+                geoid_var = self._varname_map.get(GEOID_OFFSET_VAR, GEOID_OFFSET_VAR)
+                geoid_obj = self._load_var_obj(geoid_var)
+                key, post = self._get_hyperslab(geoid_obj, ("along_track",), vertical=sel)
+                geoid_offset = np.nan_to_num(
+                    LazyDataset._filter_fill_value(np.array(geoid_obj[*key], dtype=np.float64)),
+                    nan=0.0,
+                )[*post]
+                shape = [1] * heights.ndim
+                shape[dims.index("along_track")] = -1
+                heights = heights - geoid_offset.reshape(shape)
+
+            mask = (heights >= height_min) & (heights <= height_max)
+            other_axes = tuple(i for i in range(mask.ndim) if i != ivert)
+            sel = _select_span(sel, mask.any(axis=other_axes), "height")
+
+        return sel
+
+    def _get_across_track_selection(self, nadir_index: int | None) -> slice:
+        """Returns the across-track selection relative to the data read with `_slice_across_track`.
+
+        Args:
+            nadir_index: Nadir index relative to the valid across-track pixels.
+        """
+        sel = self._slice_across_track_valid
+        if self.across_track_index_range is None:
+            return sel
+
+        if nadir_index is None:
+            raise ValueError(
+                f"Across-track selection not supported for file type '{self._info['file_type']}'"
+            )
+
+        r = range(sel.stop - sel.start)[slice(*self.across_track_index_range)]
+        if len(r) == 0:
+            raise ValueError(
+                f"No data falls into the given index range: {self.across_track_index_range}"
+            )
+        if not (r.start <= nadir_index < r.stop):
+            raise ValueError(
+                f"Across-track selection {self.across_track_index_range} must include "
+                f"the nadir index ({nadir_index})"
+            )
+        return slice(sel.start + r.start, sel.start + r.stop)
+
+    def _get_hyperslab(
+        self,
+        var_obj: h5py.Dataset,
+        dims: tuple[str, ...],
+        rolling_w: int | None = None,
+        vertical: slice | None = None,
+    ) -> tuple[list[slice], list[slice]]:
+        """Translates the dataset selections into a hyperslab to read from file.
+
+        The hyperslab is expanded to the chunk boundaries of `var_obj` (and, for rolling means,
+        by `rolling_w` along-track samples), so HDF5 only reads and decompresses whole chunks.
+
+        Returns:
+            The slices to read from `var_obj` and the slices selecting the requested data from
+            the read array.
+        """
+        selections: dict[str, tuple[slice, slice]] = {
+            "along_track": (self._slice_along_track, self._slice_along_track_selection),
+            "vertical": (
+                self._slice_vertical,
+                self._slice_vertical_selection if vertical is None else vertical,
+            ),
+            "across_track": (self._slice_across_track, self._slice_across_track_selection),
+        }
+        chunks: tuple[int, ...] | None = var_obj.chunks
+
+        key: list[slice] = [slice(None)] * len(dims)
+        post: list[slice] = [slice(None)] * len(dims)
+        for i, d in enumerate(dims):
+            if d not in selections:
+                continue
+
+            outer, inner = selections[d]
+            size = var_obj.shape[i]
+            file_slice = _get_file_slice(outer, inner, size)
+            if file_slice is None:
+                key[i], post[i] = outer, inner
+                continue
+
+            bounds = range(size)[outer]
+            pad = rolling_w if d == "along_track" and isinstance(rolling_w, int) else 0
+            start = max(file_slice.start - pad, bounds.start)
+            stop = min(file_slice.stop + pad, bounds.stop)
+            if chunks is not None:
+                start = max((start // chunks[i]) * chunks[i], bounds.start)
+                stop = min(-(-stop // chunks[i]) * chunks[i], bounds.stop)
+
+            key[i] = slice(start, stop)
+            post[i] = slice(file_slice.start - start, file_slice.stop - start)
+
+        return key, post
+
+    def _read_time(
+        self,
+        var_obj: h5py.Dataset,
+        key: tuple[slice, ...] | list[slice],
+        time_unit: Literal["D", "s", "ms", "us", "ns"] | None = "s",
+        time_origin: (TimestampConvertibleTypes | Literal["julian", "unix"] | None) = None,
+    ) -> NDArray:
+        """Reads time values from file and converts them to `np.datetime64`."""
+        if time_origin is None:
+            try:  # FIXME
+                units = np.array(var_obj.attrs["units"]).item().decode("utf-8")
+                if "nanoseconds since " in units:
+                    time_unit = "ns"
+                    time_origin = units.lstrip("nanoseconds since ")
+                else:
+                    time_unit = "s"
+                    time_origin = units.lstrip("seconds since ")
+            except Exception:
+                time_origin = "2000-01-01 00:00:00 0:00"
+        return np.array(
+            pd.to_datetime(
+                var_obj[*key],
+                unit=time_unit,
+                origin=time_origin,
+            ),
+            dtype="datetime64[ns]",
+        )
+
+    def _get_cache_key(
+        self,
+        var: str,
+        dtype: np.dtype | Type[Any] | None,
+        is_time: bool,
+        time_unit: str | None,
+        time_origin: Any,
+        rolling_w: int | None,
+    ) -> tuple | None:
+        """Returns the `VariableCache` key of a variable or None if it must not be cached."""
+        if not self.use_cache or self._file_id is None:
+            return None
+
+        def _s(s: slice) -> tuple:
+            return (s.start, s.stop, s.step)
+
+        return (
+            *self._file_id,
+            var,
+            _s(self._slice_along_track),
+            _s(self._slice_along_track_selection),
+            _s(self._slice_vertical),
+            _s(self._slice_vertical_selection),
+            _s(self._slice_across_track),
+            _s(self._slice_across_track_selection),
+            self.to_geoid and var in self._height_vars,
+            None if dtype is None else str(np.dtype(dtype)),
+            is_time,
+            time_unit,
+            str(time_origin),
+            rolling_w,
+            self._fill_value_float,
+        )
+
     def _load_var(
         self,
         var: str,
@@ -584,6 +912,53 @@ def _load_var(
         if var == self._varname_map.get(TIME_VAR, TIME_VAR):
             is_time = True
 
+        cache_key = self._get_cache_key(var, dtype, is_time, time_unit, time_origin, rolling_w)
+        cached = None if cache_key is None else get_variable_cache().get(cache_key)
+        if cached is None:
+            loaded = self._read_var(var, dtype, is_time, time_unit, time_origin, rolling_w)
+            if loaded is None:
+                return None
+            dims, attrs, values = loaded
+            if cache_key is not None:
+                get_variable_cache().put(cache_key, dims, attrs, values)
+        else:
+            dims, attrs, values = cached
+            if self.to_geoid and var in self._height_vars and var != GEOID_OFFSET_VAR:
+                self.get(GEOID_OFFSET_VAR)
+
+        lvar = LazyVariable(
+            varname=var,
+            dims=dims,
+            attrs=attrs,
+            values=values,
+            _dataset=self,
+        )
+
+        self._perform_default_transforms(var, lvar)
+
+        for d, s in zip(dims, values.shape):
+            self._sizes.setdefault(d, s)
+
+        self._add_common_var(var, lvar)
+
+        self._add_var(var, lvar)
+
+        return lvar
+
+    def _read_var(
+        self,
+        var: str,
+        dtype: np.dtype | Type[Any] | None,
+        is_time: bool,
+        time_unit: Literal["D", "s", "ms", "us", "ns"] | None,
+        time_origin: (TimestampConvertibleTypes | Literal["julian", "unix"] | None),
+        rolling_w: int | None,
+    ) -> tuple[tuple[str, ...], dict[str, str], NDArray] | None:
+        """Reads and decodes a variable from file (see `_load_var`).
+
+        Returns:
+            A tuple `(dims, attrs, values)` or None if `var` refers to a dimension name.
+        """
         var_obj: h5py.Dataset = self._load_var_obj(var)
 
         attrs: dict[str, str] = _get_str_attrs(var_obj.attrs)
@@ -594,42 +969,13 @@ def _load_var(
 
         dims = _get_var_obj_dims(var_obj=var_obj, known_sizes=self._sizes)
 
-        _slice: list[slice] = [slice(None)] * len(dims)
-        _slice_frame: list[slice] = [slice(None)] * len(dims)
-        _slice_across_track_valid: list[slice] = [slice(None)] * len(dims)
-
-        if "along_track" in dims:
-            iat = dims.index("along_track")
-            _slice[iat] = self._slice_along_track
-            _slice_frame[iat] = self._slice_along_track_frame
-        if "vertical" in dims:
-            _slice[dims.index("vertical")] = self._slice_vertical
-        if "across_track" in dims:
-            iat = dims.index("across_track")
-            _slice[iat] = self._slice_across_track
-            _slice_across_track_valid[iat] = self._slice_across_track_valid
+        _slice, _slice_selection = self._get_hyperslab(var_obj, dims, rolling_w=rolling_w)
+        if self._range_file is not None:
+            self._range_file.prefetch(get_dataset_byte_ranges(var_obj, _slice))
 
         values: NDArray
         if is_time:
-            if time_origin is None:
-                try:  # FIXME
-                    units = np.array(var_obj.attrs["units"]).item().decode("utf-8")
-                    if "nanoseconds since " in units:
-                        time_unit = "ns"
-                        time_origin = units.lstrip("nanoseconds since ")
-                    else:
-                        time_unit = "s"
-                        time_origin = units.lstrip("seconds since ")
-                except Exception:
-                    time_origin = "2000-01-01 00:00:00 0:00"
-            values = np.array(
-                pd.to_datetime(
-                    var_obj[*_slice],
-                    unit=time_unit,
-                    origin=time_origin,
-                ),
-                dtype="datetime64[ns]",
-            )
+            values = self._read_time(var_obj, _slice, time_unit, time_origin)
         else:
             values = LazyDataset._filter_fill_value(np.array(var_obj[*_slice], dtype=dtype))
 
@@ -639,11 +985,7 @@ def _load_var(
             elif values.ndim == 1 and dims[0] == "along_track":
                 values = rolling_mean_1d(values, rolling_w)
 
-        if self.trim_to_frame:
-            values = values[*_slice_frame]
-
-        if self._nadir_index is not None:
-            values = values[*_slice_across_track_valid]
+        values = values[*_slice_selection]
 
         if self.to_geoid and var in self._height_vars and var != GEOID_OFFSET_VAR:
             geoid_offset = np.nan_to_num(self.get(GEOID_OFFSET_VAR).values, nan=0.0)
@@ -664,24 +1006,7 @@ def _load_var(
             values = np.array([b"".join(row).decode("utf-8").strip() for row in values])
             dims = (dims[0],)
 
-        lvar = LazyVariable(
-            varname=var,
-            dims=dims,
-            attrs=attrs,
-            values=values,
-            _dataset=self,
-        )
-
-        self._perform_default_transforms(var, lvar)
-
-        for d, s in zip(dims, values.shape):
-            self._sizes.setdefault(d, s)
-
-        self._add_common_var(var, lvar)
-
-        self._add_var(var, lvar)
-
-        return lvar
+        return dims, attrs, values
 
     def _add_var(self, var: str, lvar: LazyVariable) -> None:
         self.logger.debug("  Adding '%s'", var)
@@ -743,9 +1068,12 @@ def to_xarray(self) -> xr.Dataset:
 
     @classmethod
     def from_xarray(cls, ds: xr.Dataset) -> "LazyDataset":
+        frame_index_offset_var = (
+            FRAME_INDEX_OFFSET_VAR if FRAME_INDEX_OFFSET_VAR in ds else TRIM_INDEX_OFFSET_VAR
+        )
         new_lds = cls(
             filepath=ds.encoding["source"],
-            trim_to_frame=ds["trim_index_offset"].values != 0,
+            trim_to_frame=bool(ds[frame_index_offset_var].values != 0),
             in_memory=False,
             _read=False,
         )
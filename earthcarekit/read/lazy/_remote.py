@@ -0,0 +1,306 @@
+import hashlib
+import io
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Final, Sequence
+
+import h5py  # type: ignore
+import numpy as np
+import requests
+
+DEFAULT_BLOCK_SIZE: Final[int] = 256 * 1024
+DEFAULT_METADATA_PREFETCH_BYTES: Final[int] = 4 * 1024 * 1024
+DEFAULT_MAX_GAP_BYTES: Final[int] = 1024 * 1024
+
+_CONTENT_RANGE_PATTERN: Final[re.Pattern] = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass
+class RemoteReadStats:
+    """Request statistics of a `RemoteRangeFile`.
+
+    Attributes:
+        num_requests: Number of HTTP range requests sent.
+        bytes_fetched: Number of bytes received over the network.
+        bytes_from_cache_dir: Number of bytes read from the persistent block cache directory.
+    """
+
+    num_requests: int = 0
+    bytes_fetched: int = 0
+    bytes_from_cache_dir: int = 0
+
+
+class RemoteRangeFile(io.RawIOBase):
+    """Read-only file object on top of HTTP range requests, optimized for HDF5 access.
+
+    The file is divided into fixed-size blocks that are fetched on demand and kept in memory.
+    When opened, the beginning of the file holding the HDF5 superblock and (for EarthCARE
+    products) most of the metadata is fetched in a single request. Missing blocks of a read, or
+    of several byte ranges passed to `prefetch`, are merged into as few range requests as
+    possible. Optionally, blocks are also stored in a persistent cache directory.
+
+    Args:
+        url: URL of the remote file.
+        headers: HTTP headers sent with each request (e.g., authorization).
+        session: Session used for requests; a new one is created if None.
+        block_size: Size of cached blocks in bytes.
+        metadata_prefetch_bytes: Number of bytes fetched from the start of the file on open.
+        max_gap_bytes: Maximum gap between missing byte ranges that are fetched in one request.
+        cache_dir: Directory of the persistent block cache; disabled if None.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        session: requests.Session | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        metadata_prefetch_bytes: int = DEFAULT_METADATA_PREFETCH_BYTES,
+        max_gap_bytes: int = DEFAULT_MAX_GAP_BYTES,
+        cache_dir: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.url: str = url
+        self.headers: dict[str, str] = dict(headers or {})
+        self.block_size: int = block_size
+        self.max_gap_bytes: int = max_gap_bytes
+        self.stats: RemoteReadStats = RemoteReadStats()
+        self._session: requests.Session = session or requests.Session()
+        self._owns_session: bool = session is None
+        self._blocks: dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        self._pos: int = 0
+        self._cache_dirpath: str | None = None
+
+        head_size = max(metadata_prefetch_bytes, block_size)
+        if cache_dir is not None:
+            key = hashlib.sha1(f"{url}:{block_size}".encode("utf-8")).hexdigest()
+            self._cache_dirpath = os.path.join(cache_dir, key[:16])
+            os.makedirs(self._cache_dirpath, exist_ok=True)
+
+        cached_size = self._read_cached_size()
+        if cached_size is not None:
+            self.size = cached_size
+            self.prefetch([(0, head_size)])
+        else:
+            self.size = self._fetch_head(head_size)
+            self._write_cached_size()
+
+    def close(self) -> None:
+        """Releases the in-memory blocks and closes the session if it was created here."""
+        if not self.closed:
+            with self._lock:
+                self._blocks.clear()
+            if self._owns_session:
+                self._session.close()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        start = min(self._pos, self.size)
+        stop = min(start + len(view), self.size)
+        if stop <= start:
+            return 0
+
+        self.prefetch([(start, stop - start)])
+        first, last = start // self.block_size, (stop - 1) // self.block_size
+        written = 0
+        for i in range(first, last + 1):
+            block = self._blocks[i]
+            block_start = i * self.block_size
+            lo = max(start, block_start) - block_start
+            hi = min(stop, block_start + len(block)) - block_start
+            view[written : written + hi - lo] = block[lo:hi]
+            written += hi - lo
+        self._pos = stop
+        return written
+
+    def prefetch(self, ranges: Sequence[tuple[int, int]]) -> None:
+        """Makes sure the given `(offset, size)` byte ranges are available locally.
+
+        Missing blocks are loaded from the cache directory if possible; the remaining blocks are
+        grouped into runs, where runs separated by at most `max_gap_bytes` are merged and
+        fetched with one range request each.
+        """
+        needed: set[int] = set()
+        for offset, size in ranges:
+            if size <= 0:
+                continue
+            stop = min(offset + size, self.size)
+            needed.update(range(offset // self.block_size, (stop - 1) // self.block_size + 1))
+
+        with self._lock:
+            missing = sorted(i for i in needed if i not in self._blocks)
+            missing = [i for i in missing if not self._load_cached_block(i)]
+            if len(missing) == 0:
+                return
+
+            max_gap_blocks = self.max_gap_bytes // self.block_size
+            runs: list[list[int]] = [[missing[0], missing[0]]]
+            for i in missing[1:]:
+                if i - runs[-1][1] - 1 <= max_gap_blocks:
+                    runs[-1][1] = i
+                else:
+                    runs.append([i, i])
+
+            for first, last in runs:
+                start = first * self.block_size
+                stop = min((last + 1) * self.block_size, self.size)
+                self._store(start, self._fetch(start, stop))
+
+    def _fetch(self, start: int, stop: int) -> bytes:
+        headers = {**self.headers, "Range": f"bytes={start}-{stop - 1}"}
+        response = self._session.get(self.url, headers=headers)
+        response.raise_for_status()
+        self.stats.num_requests += 1
+        self.stats.bytes_fetched += len(response.content)
+        if response.status_code != 206:
+            # Server ignored the range header and sent the whole file
+            return response.content[start:stop]
+        return response.content
+
+    def _fetch_head(self, size: int) -> int:
+        """Fetches the beginning of the file and returns the total file size."""
+        headers = {**self.headers, "Range": f"bytes=0-{size - 1}"}
+        response = self._session.get(self.url, headers=headers)
+        response.raise_for_status()
+        self.stats.num_requests += 1
+        self.stats.bytes_fetched += len(response.content)
+
+        total_size = len(response.content)
+        match = _CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+        if response.status_code == 206 and match and match.group(3) != "*":
+            total_size = int(match.group(3))
+        self._store(0, response.content)
+        return total_size
+
+    def _store(self, offset: int, data: bytes) -> None:
+        for i in range(0, len(data), self.block_size):
+            index = (offset + i) // self.block_size
+            block = data[i : i + self.block_size]
+            self._blocks[index] = block
+            if self._cache_dirpath is not None:
+                self._write_cached_block(index, block)
+
+    def _read_cached_size(self) -> int | None:
+        if self._cache_dirpath is None:
+            return None
+        try:
+            with open(os.path.join(self._cache_dirpath, "size"), "r") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cached_size(self) -> None:
+        if self._cache_dirpath is None:
+            return
+        with open(os.path.join(self._cache_dirpath, "size"), "w") as f:
+            f.write(str(self.size))
+
+    def _get_cached_block_filepath(self, index: int) -> str:
+        assert self._cache_dirpath is not None
+        return os.path.join(self._cache_dirpath, f"{index:08d}.blk")
+
+    def _load_cached_block(self, index: int) -> bool:
+        if self._cache_dirpath is None:
+            return False
+        filepath = self._get_cached_block_filepath(index)
+        try:
+            with open(filepath, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+
+        expected_size = min(self.block_size, self.size - index * self.block_size)
+        if len(data) != expected_size:
+            return False
+        self._blocks[index] = data
+        self.stats.bytes_from_cache_dir += len(data)
+        return True
+
+    def _write_cached_block(self, index: int, data: bytes) -> None:
+        filepath = self._get_cached_block_filepath(index)
+        if os.path.exists(filepath):
+            return
+        tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_filepath, "wb") as f:
+            f.write(data)
+        os.replace(tmp_filepath, filepath)
+
+
+def _intersects(
+    chunk_offset: tuple[int, ...],
+    chunks: tuple[int, ...],
+    bounds: Sequence[tuple[int, int]],
+) -> bool:
+    return all(
+        o < stop and o + c > start for o, c, (start, stop) in zip(chunk_offset, chunks, bounds)
+    )
+
+
+def get_dataset_byte_ranges(
+    var_obj: h5py.Dataset,
+    key: Sequence[slice],
+) -> list[tuple[int, int]]:
+    """Returns the `(offset, size)` file byte ranges holding the data of a hyperslab.
+
+    Args:
+        var_obj: HDF5 dataset.
+        key: Hyperslab as one slice per dimension.
+
+    Returns:
+        Byte ranges of all chunks (or, for contiguous datasets, the rows) overlapping `key`.
+        Empty if the storage is compact or not allocated.
+    """
+    if var_obj.ndim == 0:
+        return []
+
+    bounds: list[tuple[int, int]] = []
+    for s, n in zip(key, var_obj.shape):
+        r = range(n)[s]
+        bounds.append((min(r.start, r.stop), max(r.start, r.stop)) if r.step > 0 else (0, n))
+
+    dsid = var_obj.id
+    if var_obj.chunks is None:
+        offset = dsid.get_offset()
+        if offset is None:
+            return []
+        row_size = int(var_obj.dtype.itemsize * np.prod(var_obj.shape[1:], dtype=np.int64))
+        start, stop = bounds[0]
+        return [(offset + start * row_size, (stop - start) * row_size)]
+
+    chunks: tuple[int, ...] = var_obj.chunks
+    ranges: list[tuple[int, int]] = []
+
+    def _visit(info) -> None:
+        if _intersects(info.chunk_offset, chunks, bounds):
+            ranges.append((info.byte_offset, info.size))
+
+    if hasattr(dsid, "chunk_iter"):
+        dsid.chunk_iter(_visit)
+    else:
+        for i in range(dsid.get_num_chunks()):
+            _visit(dsid.get_chunk_info(i))
+    return ranges
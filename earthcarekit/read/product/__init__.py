@@ -1,9 +1,13 @@
 from ...filter import filter_frame as _deprecated_filter_frame
-from ._concat import concat_datasets, read_products
+from ...utils.xarray import concat_datasets
+from ._catalog import ProductCatalog
+from ._concat import read_products
 from ._generic import read_product
 from ._header_file import read_hdr_fixed_header
+from ._map import map_products, map_reduce_products
 from ._rebin_msi_to_jsg import rebin_msi_to_jsg
 from ._rebin_xmet_to_vertical_track import rebin_xmet_to_vertical_track
+from ._regridder import KDTreeRegridder
 from ._search import search_product
 from .level1.msi_rgr_1c import update_rgb
 from .level2a.msi_cop_2a import add_isccp_cloud_type
@@ -0,0 +1,555 @@
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from ...utils._config import get_default_config_filepath
+from ...utils.parse.filename import FILE_INFO_REGEX
+from ...utils.path import search_files_by_regex
+from ..info import (
+    FileAgency,
+    FileLatency,
+    FileMissionID,
+    FileType,
+    ProductDataFrame,
+    ProductInfo,
+    get_product_infos,
+)
+from ..info._geo_extent import safe_read_geo_extent_from_hdr
+
+CATALOG_SCHEMA_VERSION: int = 4
+
+_FILE_INFO_PATTERN = re.compile(FILE_INFO_REGEX)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    dirpath TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    filepath TEXT PRIMARY KEY,
+    dirpath TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    agency TEXT,
+    latency TEXT,
+    baseline TEXT,
+    file_type TEXT,
+    start_sensing_time TEXT,
+    start_processing_time TEXT,
+    orbit_number INTEGER,
+    frame_id TEXT,
+    orbit_and_frame TEXT,
+    hdr_filepath TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS validity (
+    filepath TEXT PRIMARY KEY,
+    hdr_mtime_ns INTEGER NOT NULL,
+    validity_start_ns INTEGER NOT NULL,
+    validity_stop_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tracks (
+    filepath TEXT PRIMARY KEY,
+    h5_mtime_ns INTEGER NOT NULL,
+    step INTEGER NOT NULL,
+    num_samples INTEGER NOT NULL,
+    indices BLOB NOT NULL,
+    latitude BLOB NOT NULL,
+    longitude BLOB NOT NULL,
+    time_ns BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs (parent);
+CREATE INDEX IF NOT EXISTS idx_files_dirpath ON files (dirpath);
+CREATE INDEX IF NOT EXISTS idx_files_file_type ON files (file_type, start_sensing_time);
+CREATE INDEX IF NOT EXISTS idx_files_orbit_and_frame ON files (orbit_and_frame);
+"""
+
+
+def get_default_catalog_filepath(path_to_data: str) -> str:
+    """Returns the default catalog file path for a data directory.
+
+    Catalogs are stored next to the default configuration file, one SQLite file per data directory.
+    """
+    root = os.path.abspath(path_to_data)
+    key = hashlib.sha1(root.encode("utf-8")).hexdigest()[:16]
+    config_dir = os.path.dirname(get_default_config_filepath())
+    return os.path.join(config_dir, "catalog", f"catalog_{key}.sqlite")
+
+
+def _is_catalog_file(filename: str) -> bool:
+    return filename.endswith(".h5") and "ECA_" in filename
+
+
+def _parse_file_row(dirpath: str, filename: str, hdr_filenames: set[str]) -> tuple:
+    hdr_filename = filename.removesuffix(".h5") + ".HDR"
+    hdr_filepath = os.path.join(dirpath, hdr_filename) if hdr_filename in hdr_filenames else ""
+    m = _FILE_INFO_PATTERN.match(filename)
+    if m is None:
+        return (os.path.join(dirpath, filename), dirpath, filename) + (None,) * 9 + (hdr_filepath,)
+    agency, latency, baseline, file_type, sst, pst, oaf = m.groups()
+    return (
+        os.path.join(dirpath, filename),
+        dirpath,
+        filename,
+        agency,
+        latency,
+        baseline,
+        file_type,
+        sst,
+        pst,
+        int(oaf[:-1]),
+        oaf[-1],
+        oaf,
+        hdr_filepath,
+    )
+
+
+def _scan_dir(dirpath: str) -> tuple[list[str], list[str], set[str]]:
+    """Lists sub-directories, catalog files and header files of a directory (same rules as
+    `os.walk`)."""
+    subdirs: list[str] = []
+    filenames: list[str] = []
+    hdr_filenames: set[str] = set()
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif _is_catalog_file(entry.name):
+                    filenames.append(entry.name)
+                elif entry.name.endswith(".HDR"):
+                    hdr_filenames.add(entry.name)
+    except OSError:
+        pass
+    return subdirs, filenames, hdr_filenames
+
+
+@dataclass
+class CatalogUpdateResult:
+    """Summary of a catalog update.
+
+    Attributes:
+        num_dirs_scanned: Number of directories that were (re-)listed.
+        num_dirs_removed: Number of directories that disappeared since the last update.
+        num_files: Total number of cataloged files after the update.
+    """
+
+    num_dirs_scanned: int = 0
+    num_dirs_removed: int = 0
+    num_files: int = 0
+
+
+@dataclass
+class CatalogVerifyResult:
+    """Differences between a catalog and the files on disk.
+
+    Attributes:
+        missing: Files found on disk but not in the catalog.
+        stale: Files listed in the catalog but not found on disk.
+    """
+
+    missing: list[str] = field(default_factory=list)
+    stale: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self.missing) == 0 and len(self.stale) == 0
+
+
+@dataclass
+class CatalogTrack:
+    """Decimated along-track coordinates of a product, as stored in a `ProductCatalog`.
+
+    Attributes:
+        h5_mtime_ns: Modification time of the product file the track was read from.
+        step: Decimation step, i.e., every `step`-th sample (and the last one) is kept.
+        num_samples: Number of along-track samples of the (frame-trimmed) product.
+        indices: Along-track indices of the kept samples.
+        latitude: Latitudes of the kept samples.
+        longitude: Longitudes of the kept samples.
+        time: Times of the kept samples.
+    """
+
+    h5_mtime_ns: int
+    step: int
+    num_samples: int
+    indices: NDArray[np.int32]
+    latitude: NDArray[np.float64]
+    longitude: NDArray[np.float64]
+    time: NDArray[np.datetime64]
+
+
+class ProductCatalog:
+    """Persistent on-disk index of the EarthCARE product files below a data directory.
+
+    The catalog is a SQLite database storing the metadata encoded in product filenames
+    (file type, baseline, orbit, frame, sensing and processing times) and, once read, cached
+    header validity intervals and decimated along-track coordinates. It is updated
+    incrementally: only directories whose modification time changed since the last update are
+    listed again, so repeated searches do not need to walk the whole archive. Several processes
+    may use the same catalog; writes are serialized by SQLite.
+
+    Args:
+        path_to_data: Root data directory that is cataloged.
+        filepath: Path of the SQLite database file. Defaults to a file next to the default config.
+
+    Examples:
+        >>> with ProductCatalog("/data/earthcare") as catalog:
+        >>>     catalog.update()
+        >>>     files = catalog.search_files(pattern, file_types=["ATL_EBD_2A"])
+    """
+
+    def __init__(self, path_to_data: str, filepath: str | None = None) -> None:
+        self.path_to_data: str = os.path.abspath(path_to_data)
+        self.filepath: str = filepath or get_default_catalog_filepath(self.path_to_data)
+        os.makedirs(os.path.dirname(os.path.abspath(self.filepath)), exist_ok=True)
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            self.filepath, timeout=60.0, check_same_thread=False
+        )
+        self._init_schema()
+
+    def __enter__(self) -> "ProductCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._conn.close()
+
+    def _init_schema(self) -> None:
+        with self._conn:
+            # Tables of other schema versions are dropped before creating (and indexing) them
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is not None and int(row[0]) != CATALOG_SCHEMA_VERSION:
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS dirs; DROP TABLE IF EXISTS files; "
+                    "DROP TABLE IF EXISTS validity; DROP TABLE IF EXISTS tracks; "
+                    "DELETE FROM meta WHERE key = 'last_update';"
+                )
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(CATALOG_SCHEMA_VERSION),),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('path_to_data', ?)",
+                (self.path_to_data,),
+            )
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+    def clear(self) -> None:
+        """Removes all entries from the catalog."""
+        with self._conn:
+            self._conn.execute("DELETE FROM dirs")
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM validity")
+            self._conn.execute("DELETE FROM tracks")
+            self._conn.execute("DELETE FROM meta WHERE key = 'last_update'")
+
+    def rebuild(self) -> CatalogUpdateResult:
+        """Discards all entries and catalogs the data directory from scratch."""
+        self.clear()
+        return self.update()
+
+    @property
+    def last_update(self) -> float | None:
+        """Time of the last update as seconds since the epoch, or None if never updated."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_update'").fetchone()
+        return None if row is None else float(row[0])
+
+    def update(self, max_age: float | None = None) -> CatalogUpdateResult:
+        """Incrementally synchronizes the catalog with the data directory.
+
+        Directories are only listed again if their modification time has changed, otherwise
+        their cataloged sub-directories are visited directly. This still needs one `stat` call
+        per cataloged directory, which `max_age` allows to skip for recently updated catalogs.
+
+        Args:
+            max_age: If given, the update is skipped if the last update is less than
+                `max_age` seconds ago. Defaults to None (always update).
+
+        Returns:
+            A `CatalogUpdateResult` summarizing the changes.
+
+        Raises:
+            FileNotFoundError: If the data directory does not exist.
+        """
+        if not os.path.isdir(self.path_to_data):
+            raise FileNotFoundError(f"Data directory does not exist: {self.path_to_data}")
+
+        last_update = self.last_update
+        if max_age is not None and last_update is not None:
+            if time.time() - last_update < max_age:
+                return CatalogUpdateResult(num_files=len(self))
+
+        update_time = time.time()
+
+        known: dict[str, int] = {}
+        children: dict[str, list[str]] = defaultdict(list)
+        for dirpath, parent, mtime_ns in self._conn.execute(
+            "SELECT dirpath, parent, mtime_ns FROM dirs"
+        ):
+            known[dirpath] = mtime_ns
+            if parent is not None:
+                children[parent].append(dirpath)
+
+        result = CatalogUpdateResult()
+        seen: set[str] = set()
+        stack: list[tuple[str, str | None]] = [(self.path_to_data, None)]
+        with self._conn:
+            while stack:
+                dirpath, parent = stack.pop()
+                try:
+                    mtime_ns = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(dirpath)
+
+                if known.get(dirpath) == mtime_ns:
+                    stack.extend((d, dirpath) for d in children.get(dirpath, []))
+                    continue
+
+                subdirs, filenames, hdr_filenames = _scan_dir(dirpath)
+                self._conn.execute("DELETE FROM files WHERE dirpath = ?", (dirpath,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [_parse_file_row(dirpath, fn, hdr_filenames) for fn in filenames],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dirs (dirpath, parent, mtime_ns) VALUES (?, ?, ?)",
+                    (dirpath, parent, mtime_ns),
+                )
+                result.num_dirs_scanned += 1
+                stack.extend((d, dirpath) for d in subdirs)
+
+            removed = [(d,) for d in known if d not in seen]
+            self._conn.executemany("DELETE FROM files WHERE dirpath = ?", removed)
+            self._conn.executemany("DELETE FROM dirs WHERE dirpath = ?", removed)
+            result.num_dirs_removed = len(removed)
+
+            if result.num_dirs_scanned > 0 or result.num_dirs_removed > 0:
+                self._conn.execute(
+                    "DELETE FROM validity WHERE filepath NOT IN (SELECT filepath FROM files)"
+                )
+                self._conn.execute(
+                    "DELETE FROM tracks WHERE filepath NOT IN (SELECT filepath FROM files)"
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_update', ?)",
+                (repr(update_time),),
+            )
+
+        result.num_files = len(self)
+        return result
+
+    def verify(self) -> CatalogVerifyResult:
+        """Compares the catalog against a full scan of the data directory without modifying it."""
+        on_disk = set(
+            f
+            for f in search_files_by_regex(self.path_to_data, r".*ECA_.*\.h5$")
+            if _is_catalog_file(os.path.basename(f))
+        )
+        cataloged = set(f for (f,) in self._conn.execute("SELECT filepath FROM files"))
+        return CatalogVerifyResult(
+            missing=sorted(on_disk - cataloged),
+            stale=sorted(cataloged - on_disk),
+        )
+
+    def search_files(
+        self,
+        pattern: str,
+        file_types: Sequence[str] | None = None,
+    ) -> list[str]:
+        """Returns cataloged file paths whose filenames match a regular expression.
+
+        Args:
+            pattern: Regular expression applied to filenames (as in `search_files_by_regex`).
+            file_types: Optional file types (e.g., "ATL_EBD_2A") used to pre-select entries.
+
+        Returns:
+            Absolute paths to matching files.
+        """
+        query = "SELECT filepath, filename FROM files"
+        params: list[str] = []
+        if file_types:
+            query += f" WHERE file_type IN ({', '.join('?' * len(file_types))})"
+            params = [str(ft) for ft in file_types]
+
+        regex = re.compile(pattern)
+        return [fp for fp, fn in self._conn.execute(query, params) if regex.search(fn)]
+
+    def get_product_infos(
+        self,
+        filepaths: Sequence[str],
+        read_geo_from_hdr: bool = False,
+    ) -> ProductDataFrame:
+        """Returns product metadata of cataloged files from the stored filename columns.
+
+        Same as `get_product_infos`, but without checking the file system for the product and
+        header files. File paths that are not cataloged are passed to `get_product_infos`.
+
+        Args:
+            filepaths: Product file paths.
+            read_geo_from_hdr: Extract geo-coordinates from header if True.
+
+        Returns:
+            A `ProductDataFrame` with the metadata of the given files.
+        """
+        rows: dict[str, tuple] = {}
+        filepaths = list(filepaths)
+        chunk_size = 900
+        for i in range(0, len(filepaths), chunk_size):
+            chunk = filepaths[i : i + chunk_size]
+            query = (
+                "SELECT filepath, filename, agency, latency, baseline, file_type, "
+                "start_sensing_time, start_processing_time, orbit_number, frame_id, "
+                "orbit_and_frame, hdr_filepath FROM files WHERE agency IS NOT NULL AND "
+                f"filepath IN ({', '.join('?' * len(chunk))})"
+            )
+            for row in self._conn.execute(query, chunk):
+                rows[row[0]] = row
+
+        mission_id = FileMissionID.from_input("ECA")
+        infos = []
+        uncataloged = []
+        for filepath in filepaths:
+            row = rows.get(filepath)
+            if row is None:
+                uncataloged.append(filepath)
+                continue
+            _, filename, agency, latency, baseline, file_type, sst, pst, orbit, frame, oaf, hdr = (
+                row
+            )
+            geo_extent = (float("nan"),) * 4
+            if read_geo_from_hdr:
+                geo_extent = safe_read_geo_extent_from_hdr(filepath.removesuffix(".h5") + ".HDR")
+            infos.append(
+                ProductInfo(
+                    mission_id=mission_id,
+                    agency=FileAgency.from_input(agency),
+                    latency=FileLatency.from_input(latency),
+                    baseline=baseline,
+                    file_type=FileType.from_input(file_type),
+                    start_sensing_time=pd.Timestamp(sst),
+                    start_processing_time=pd.Timestamp(pst),
+                    orbit_number=orbit,
+                    frame_id=frame,
+                    orbit_and_frame=oaf,
+                    filename=filename.removesuffix(".h5"),
+                    filepath=filepath,
+                    hdr_filepath=hdr,
+                    start_latitude=geo_extent[0],
+                    start_longitude=geo_extent[1],
+                    end_latitude=geo_extent[2],
+                    end_longitude=geo_extent[3],
+                ).to_dict()
+            )
+
+        pdf = ProductDataFrame(infos)
+        if len(uncataloged) > 0:
+            _pdf = get_product_infos(uncataloged, read_geo_from_hdr=read_geo_from_hdr)
+            pdf = ProductDataFrame(pd.concat([pdf, _pdf], ignore_index=True)) if infos else _pdf
+        pdf.validate_columns()
+        return pdf
+
+    def get_validity(self, filepaths: Sequence[str]) -> dict[str, tuple[int, int, int]]:
+        """Returns cached header validity intervals.
+
+        Args:
+            filepaths: Product file paths.
+
+        Returns:
+            A mapping of file path to `(hdr_mtime_ns, validity_start_ns, validity_stop_ns)`
+            for all file paths with a cached interval.
+        """
+        result: dict[str, tuple[int, int, int]] = {}
+        filepaths = list(filepaths)
+        chunk_size = 900
+        for i in range(0, len(filepaths), chunk_size):
+            chunk = filepaths[i : i + chunk_size]
+            query = (
+                "SELECT filepath, hdr_mtime_ns, validity_start_ns, validity_stop_ns "
+                f"FROM validity WHERE filepath IN ({', '.join('?' * len(chunk))})"
+            )
+            for fp, mtime, start, stop in self._conn.execute(query, chunk):
+                result[fp] = (mtime, start, stop)
+        return result
+
+    def set_validity(self, rows: Sequence[tuple[str, int, int, int]]) -> None:
+        """Stores header validity intervals as `(filepath, hdr_mtime_ns, start_ns, stop_ns)` rows."""
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO validity VALUES (?, ?, ?, ?)", rows)
+
+    def get_tracks(self, filepaths: Sequence[str]) -> dict[str, CatalogTrack]:
+        """Returns cached decimated along-track coordinates.
+
+        Args:
+            filepaths: Product file paths.
+
+        Returns:
+            A mapping of file path to `CatalogTrack` for all file paths with a cached track.
+        """
+        result: dict[str, CatalogTrack] = {}
+        filepaths = list(filepaths)
+        chunk_size = 900
+        for i in range(0, len(filepaths), chunk_size):
+            chunk = filepaths[i : i + chunk_size]
+            query = (
+                "SELECT filepath, h5_mtime_ns, step, num_samples, indices, latitude, longitude, "
+                f"time_ns FROM tracks WHERE filepath IN ({', '.join('?' * len(chunk))})"
+            )
+            for fp, mtime, step, n, idx, lat, lon, t in self._conn.execute(query, chunk):
+                result[fp] = CatalogTrack(
+                    h5_mtime_ns=mtime,
+                    step=step,
+                    num_samples=n,
+                    indices=np.frombuffer(idx, dtype=np.int32),
+                    latitude=np.frombuffer(lat, dtype=np.float64),
+                    longitude=np.frombuffer(lon, dtype=np.float64),
+                    time=np.frombuffer(t, dtype=np.int64).astype("datetime64[ns]"),
+                )
+        return result
+
+    def set_tracks(self, tracks: dict[str, CatalogTrack]) -> None:
+        """Stores decimated along-track coordinates by file path."""
+        rows = [
+            (
+                fp,
+                t.h5_mtime_ns,
+                t.step,
+                t.num_samples,
+                np.asarray(t.indices, dtype=np.int32).tobytes(),
+                np.asarray(t.latitude, dtype=np.float64).tobytes(),
+                np.asarray(t.longitude, dtype=np.float64).tobytes(),
+                np.asarray(t.time, dtype="datetime64[ns]").astype(np.int64).tobytes(),
+            )
+            for fp, t in tracks.items()
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
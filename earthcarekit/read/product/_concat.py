@@ -1,4 +1,6 @@
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Sequence
 
 import numpy as np
@@ -8,8 +10,9 @@
 from xarray import Dataset
 
 from ...constants import ALONG_TRACK_DIM
-from ...utils.xarray import concat_datasets
+from ...utils.xarray import concat_dataset_list
 from ..info import ProductDataFrame
+from ._concat_lazy import read_products_lazy
 from ._generic import read_product
 
 
@@ -22,19 +25,57 @@ def circular_mean_np(data: NDArray, axis: int = -1, degrees: bool = True) -> NDA
     return np.rad2deg(angle) if degrees else angle
 
 
+def _select_preserving_dtypes(ds: Dataset, indexers: dict) -> Dataset:
+    original_dtypes = {v: ds[v].dtype for v in ds.variables}
+    ds = ds.sel(indexers)
+    for v, dtype in original_dtypes.items():
+        ds[v] = ds[v].astype(dtype)
+    return ds
+
+
+def _coarsen_frame(ds: Dataset, along_track_dim: str, factor: int) -> Dataset:
+    original_dtypes = {v: ds[v].dtype for v in ds.variables}
+
+    coarsen_dims = {along_track_dim: factor}
+
+    # Circular mean for longitude
+    lon_coarse = ds["longitude"].coarsen(coarsen_dims, boundary="trim").reduce(circular_mean_np)
+    _tmp_attrs = lon_coarse.attrs
+    lon_coarse.attrs = {}
+
+    # Regular mean for the rest
+    rest = ds.drop_vars("longitude").coarsen(coarsen_dims, boundary="trim").mean()  # type: ignore
+
+    # Merge results
+    ds = xr.merge([lon_coarse, rest])
+    ds["longitude"].attrs = _tmp_attrs
+
+    for v, dtype in original_dtypes.items():
+        ds[v] = ds[v].astype(dtype)
+    return ds
+
+
 def read_products(
     filepaths: Sequence[str] | NDArray[np.str_] | pd.DataFrame,
     zoom_at: float | None = None,
     along_track_dim: str = ALONG_TRACK_DIM,
     func: Callable | None = None,
     func_inputs: Sequence[dict] | None = None,
-    max_num_files: int = 8,
+    max_num_files: int | None = None,
     coarsen: bool = True,
+    max_workers: int | None = None,
+    lazy: bool = False,
 ) -> Dataset:
     """Read and concatenate EarthCARE frames into a single xarray Dataset.
 
     By default, coarsens data to keep along-track resolution comparable to a single product.
     Optionally applies a function per frame and/or zooms to a region (without coarsening).
+    Frames are read in parallel and copied into output arrays that are allocated only once,
+    so that even full-day mosaics (about 120 frames) can be read.
+
+    With `lazy=True`, frames are not loaded but opened as a single `dask`-backed dataset
+    with one chunk per frame (see `read_products_lazy`), e.g., to stream reductions over
+    months of data through the files with bounded memory.
 
     Args:
         filepaths: File paths (list) or DataFrame with `filepath`, `orbit_number`, `frame_id`.
@@ -42,8 +83,11 @@ def read_products(
         along_track_dim: Concatenation dimension; defaults to ALONG_TRACK_DIM.
         func: Function applied to each frame after loading.
         func_inputs: Per-frame arguments for `func`.
-        max_num_files: Max files loaded at once; raises `ValueError` if exceeded.
+        max_num_files: Max files loaded at once; raises `ValueError` if exceeded. No limit if None.
         coarsen: Coarsen data based on file count if True; ignored when `zoom_at` is set.
+        max_workers: Max number of threads reading frames. Defaults to the number of CPUs.
+        lazy: Return a `dask`-backed dataset at full resolution if True (requires `dask`);
+            `coarsen` is ignored and `zoom_at` and `func` are not supported.
 
     Returns:
         Concatenated dataset with all frames along `along_track_dim`.
@@ -60,19 +104,18 @@ def read_products(
 
     if len(filepaths) == 0:
         raise ValueError("Given sequence of product files paths is empty")
-    elif len(filepaths) == 1:
-        warnings.warn("Can not concatenate frames since only one file path was given")
-        return read_product(filepaths[0])
-    elif len(filepaths) > max_num_files:
+    elif max_num_files is not None and len(filepaths) > max_num_files:
         raise ValueError(
-            f"Too many files provided: {len(filepaths)} (currently maximum allowed is {max_num_files}). "
+            f"Too many files provided: {len(filepaths)} (maximum allowed is {max_num_files}). "
             "Please reduce the number of files or increase the allowed amount by setting the argument max_num_files."
         )
-    elif len(filepaths) > 8:
-        warnings.warn(
-            f"You provided {len(filepaths)} files, which is more than one full orbit (8 files). "
-            "Processing might take longer than usual."
-        )
+    elif lazy:
+        if zoom_at is not None or func is not None:
+            raise ValueError("`zoom_at` and `func` are not supported with lazy=True")
+        return read_products_lazy(filepaths, along_track_dim, max_workers=max_workers)
+    elif len(filepaths) == 1:
+        warnings.warn("Can not concatenate frames since only one file path was given")
+        return read_product(filepaths[0])
 
     # # Construct filename suffix from orbit/frame numbers
     # orbit_start = str(df["orbit_number"].iloc[0]).zfill(5)
@@ -100,21 +143,20 @@ def apply_func(ds: Dataset, i: int) -> Dataset:
         raise IndexError("Too few function inputs provided")
 
     num_files = len(filepaths)
-    ds: xr.Dataset | None = None
-
+    frame_indices = list(range(num_files))
+    offset = 0.0
     if zoom_at is not None:
         # Zoomed read: select portions of two adjacent frames
-        frame_indices = np.unique([int(np.floor(zoom_at)), int(np.ceil(zoom_at))])
+        frame_indices = list(np.unique([int(np.floor(zoom_at)), int(np.ceil(zoom_at))]))
         offset = zoom_at - frame_indices[0]
         filepaths = [filepaths[i] for i in frame_indices]
 
-        for i, filepath in enumerate(filepaths):
-            with read_product(filepath) as frame_ds:
-                frame_ds = apply_func(frame_ds, frame_indices[i])
-
-                # Preserve original dtypes
-                original_dtypes = {v: frame_ds[v].dtype for v in frame_ds.variables}
+    def read_frame(i: int) -> Dataset:
+        """Read, process and load the i-th frame."""
+        with read_product(filepaths[i]) as frame_ds:
+            frame_ds = apply_func(frame_ds, frame_indices[i])
 
+            if zoom_at is not None:
                 # Select relevant portion of the frame
                 n = len(frame_ds[along_track_dim])
                 sel_slice = (
@@ -122,57 +164,27 @@ def apply_func(ds: Dataset, i: int) -> Dataset:
                     if i == 0
                     else slice(0, int(np.ceil(n * offset)))
                 )
-                frame_ds = frame_ds.sel({along_track_dim: sel_slice})
+                frame_ds = _select_preserving_dtypes(frame_ds, {along_track_dim: sel_slice})
+            elif coarsen:
+                frame_ds = _coarsen_frame(frame_ds, along_track_dim, num_files)
 
-                # Restore dtypes
-                for v, dtype in original_dtypes.items():
-                    frame_ds[v] = frame_ds[v].astype(dtype)
-
-                ds = (
-                    frame_ds.copy()
-                    if ds is None
-                    else concat_datasets(ds.copy(), frame_ds.copy(), dim=along_track_dim)
-                )
+            return frame_ds.load()
 
+    # Frames are read in parallel and then copied into preallocated output arrays at once
+    max_workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(read_frame, range(len(filepaths))))
     else:
-        # Full read and coarsen each frame
-        for i, filepath in enumerate(filepaths):
-            with read_product(filepath) as frame_ds:
-                frame_ds = apply_func(frame_ds, i)
-
-                if coarsen:
-                    original_dtypes = {v: frame_ds[v].dtype for v in frame_ds.variables}
+        frames = [read_frame(i) for i in range(len(filepaths))]
 
-                    coarsen_dims = {along_track_dim: num_files}
-
-                    # Circular mean for longitude
-                    lon_coarse = (
-                        frame_ds["longitude"]
-                        .coarsen(coarsen_dims, boundary="trim")
-                        .reduce(circular_mean_np)
-                    )
-                    _tmp_attrs = lon_coarse.attrs
-                    lon_coarse.attrs = {}
-
-                    # Regular mean for the rest
-                    rest = (
-                        frame_ds.drop_vars("longitude")
-                        .coarsen(coarsen_dims, boundary="trim")
-                        .mean()  # type: ignore
-                    )
-
-                    # Merge results
-                    frame_ds = xr.merge([lon_coarse, rest])
-                    frame_ds["longitude"].attrs = _tmp_attrs
-
-                    for v, dtype in original_dtypes.items():
-                        frame_ds[v] = frame_ds[v].astype(dtype)
-
-                ds = frame_ds if ds is None else concat_datasets(ds, frame_ds, dim=along_track_dim)
+    ds: Dataset
+    if len(frames) == 1:
+        ds = frames[0]
+    else:
+        ds = concat_dataset_list(frames, dim=along_track_dim, max_workers=max_workers)
+    del frames
 
     # Set output file sources
-    if isinstance(ds, Dataset):
-        ds.encoding["sources"] = list(filepaths)
-        return ds
-    else:
-        raise RuntimeError("Bad implementation")
+    ds.encoding["sources"] = list(filepaths)
+    return ds
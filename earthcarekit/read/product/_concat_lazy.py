@@ -0,0 +1,165 @@
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final, Sequence
+
+import numpy as np
+import xarray as xr
+from xarray import Dataset
+
+from ...constants import TRACK_LAT_VAR
+from ...utils import get_file_info_from_str
+from ...utils.xarray._concat import SCALAR_CONCAT_DIM, _get_fill_value
+from ..lazy import LazyDataset
+
+HAS_DASK: Final[bool] = importlib.util.find_spec("dask") is not None
+
+
+def _load_frame_var(
+    filepath: str,
+    var: str,
+    dims: tuple[str, ...],
+    shape: tuple[int, ...],
+    dtype: np.dtype,
+    along_track_dim: str,
+) -> np.ndarray:
+    """Reads one variable of a frame and pads it to the chunk `shape` (ordered as `dims`)."""
+    with LazyDataset(filepath, vars=[var], use_cache=False) as lds:
+        lvar = lds[var]
+        values, var_dims = lvar.values, lvar.dims
+
+    da = xr.DataArray(values, dims=var_dims)
+    if along_track_dim not in var_dims:
+        da = da.expand_dims(along_track_dim)
+    da = da.transpose(*dims)
+    if any(s > t for s, t in zip(da.shape, shape)):
+        raise ValueError(
+            f"Variable '{var}' of {os.path.basename(filepath)} has shape {da.shape}, which "
+            f"exceeds the shape {shape} of the largest frame"
+        )
+
+    chunk = np.full(shape, _get_fill_value(dtype), dtype=dtype)
+    key = tuple(
+        slice(0, t if d == along_track_dim else s) for d, s, t in zip(dims, da.shape, shape)
+    )
+    chunk[key] = da.values
+    return chunk
+
+
+def _read_frame_layout(
+    filepath: str,
+    scalar_vars: Sequence[str],
+    size_vars: dict[str, str],
+) -> tuple[int, dict[str, int], dict[str, Any]]:
+    """Returns the along-track length, dimension sizes and scalar values of a frame.
+
+    Only the track latitudes and, for each dimension in `size_vars`, the given (smallest)
+    variable spanning it are read; dimensions whose variable is missing are left out.
+    """
+    with LazyDataset(filepath, use_cache=False) as lds:
+        num_profiles = lds[TRACK_LAT_VAR].shape[0]
+        sizes: dict[str, int] = {}
+        for dim, var in size_vars.items():
+            try:
+                lvar = lds[var]
+            except KeyError:
+                continue
+            if dim in lvar.dims:
+                sizes[dim] = lvar.shape[lvar.dims.index(dim)]
+        scalars = {v: lds[v].values for v in scalar_vars if v in lds}
+    return num_profiles, sizes, scalars
+
+
+def read_products_lazy(
+    filepaths: Sequence[str],
+    along_track_dim: str,
+    max_workers: int | None = None,
+) -> Dataset:
+    """Opens EarthCARE frames as a single dask-backed dataset with one chunk per frame.
+
+    The first frame is read to determine variables, dimensions, dtypes and attributes. The
+    other frames are only opened to obtain their along-track length, the sizes of the other
+    dimensions (reading the smallest variable spanning each) and scalar variables (e.g.,
+    `frame_id`), which are collected along "concat_dim" like in `concat_dataset_list`.
+    Each chunk reads a single variable of a single frame via `LazyDataset` (including its
+    product-specific renaming and modifications) once it is computed. Non-concatenation
+    dimensions are padded to their maximum size across frames.
+
+    Args:
+        filepaths: Paths of the frames, in along-track order.
+        along_track_dim: Concatenation dimension.
+        max_workers: Max number of threads opening frames. Defaults to the number of CPUs.
+
+    Returns:
+        Dataset of `dask` arrays spanning all frames along `along_track_dim`.
+
+    Raises:
+        ImportError: If `dask` is not installed.
+        ValueError: If a product type is not supported by `LazyDataset`.
+    """
+    if not HAS_DASK:
+        raise ImportError(
+            "Reading products lazily requires `dask`; install it with `pip install earthcarekit[dask]`"
+        )
+    import dask  # type: ignore
+    import dask.array as dsa  # type: ignore
+
+    supported_file_types = LazyDataset.get_supported_file_types()
+    for filepath in filepaths:
+        file_type = get_file_info_from_str(filepath)["file_type"]
+        if file_type not in supported_file_types:
+            raise ValueError(f"Product type '{file_type}' can not be read lazily")
+
+    template = LazyDataset(filepaths[0], in_memory=True, use_cache=False).to_xarray()
+    scalar_vars = [str(v) for v, da in template.data_vars.items() if da.ndim == 0]
+    size_vars: dict[str, str] = {}
+    for dim in template.dims:
+        if dim == along_track_dim:
+            continue
+        candidates = [(da.size, str(v)) for v, da in template.data_vars.items() if dim in da.dims]
+        if len(candidates) > 0:
+            size_vars[str(dim)] = min(candidates)[1]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(filepaths)))) as executor:
+        layouts = list(
+            executor.map(lambda fp: _read_frame_layout(fp, scalar_vars, size_vars), filepaths)
+        )
+
+    max_sizes: dict[str, int] = {str(d): s for d, s in template.sizes.items()}
+    for _, frame_sizes, _ in layouts:
+        for d, s in frame_sizes.items():
+            max_sizes[d] = max(max_sizes[d], s)
+
+    data_vars: dict[str, xr.DataArray] = {}
+    for name, var in template.data_vars.items():
+        if var.ndim == 0:
+            continue
+        dims = var.dims if along_track_dim in var.dims else (along_track_dim, *var.dims)
+        sizes = {str(d): max_sizes[str(d)] for d in var.dims}
+        axis = dims.index(along_track_dim)
+
+        chunks = []
+        for filepath, (num_profiles, _, _) in zip(filepaths, layouts):
+            sizes[along_track_dim] = num_profiles
+            shape = tuple(sizes[d] for d in dims)
+            delayed_values = dask.delayed(_load_frame_var, pure=True)(
+                filepath, str(name), dims, shape, var.dtype, along_track_dim
+            )
+            chunks.append(dsa.from_delayed(delayed_values, shape=shape, dtype=var.dtype))
+
+        data_vars[str(name)] = xr.DataArray(
+            dsa.concatenate(chunks, axis=axis), dims=dims, attrs=var.attrs
+        )
+
+    ds = Dataset(data_vars, attrs=template.attrs)
+    for name in scalar_vars:
+        values: list = []
+        for _, _, scalars in layouts:
+            if name in scalars:
+                values.extend(np.atleast_1d(scalars[name]))
+        ds[name] = xr.DataArray(values, dims=[SCALAR_CONCAT_DIM])
+
+    ds.encoding["sources"] = list(filepaths)
+    return ds
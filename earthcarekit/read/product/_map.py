@@ -0,0 +1,293 @@
+import os
+import pickle
+import traceback
+import warnings
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Final, Iterator, Literal, Sequence, TypeVar
+
+import pandas as pd
+from tqdm import tqdm
+
+from ._generic import read_product
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MapBackend = Literal["process", "thread"]
+
+
+class _NoInitial:
+    def __repr__(self) -> str:
+        return "<no initial value>"
+
+
+_NO_INITIAL: Final[Any] = _NoInitial()
+
+
+@dataclass
+class _TaskError:
+    """Exception of a failed task with the traceback formatted in the worker."""
+
+    exception: Exception
+    traceback: str
+
+    def __str__(self) -> str:
+        return f"{type(self.exception).__name__}: {self.exception}"
+
+
+def _run_task(
+    filepath: str,
+    func: Callable,
+    open_product: bool,
+    read_kwargs: dict[str, Any],
+    retries: int,
+) -> tuple[bool, Any]:
+    """Applies `func` to one product (opened in the worker); returns (success, result or error)."""
+    error: _TaskError | None = None
+    for _ in range(retries + 1):
+        try:
+            if not open_product:
+                return True, func(filepath)
+            with read_product(filepath, **read_kwargs) as ds:
+                return True, func(ds)
+        except Exception as e:
+            error = _TaskError(e, traceback.format_exc())
+    assert error is not None
+    try:
+        pickle.loads(pickle.dumps(error.exception))
+    except Exception:
+        # The exception can not be sent back from a worker process, so only its message is kept
+        error.exception = RuntimeError(str(error))
+    return False, error
+
+
+def _get_filepaths(products: pd.DataFrame | Sequence[str] | str) -> list[str]:
+    if isinstance(products, str):
+        return [products]
+    if isinstance(products, pd.DataFrame):
+        return [str(fp) for fp in products["filepath"]]
+    return [str(fp) for fp in products]
+
+
+def _iter_results(
+    filepaths: list[str],
+    func: Callable,
+    workers: int | None,
+    backend: MapBackend,
+    open_product: bool,
+    read_kwargs: dict[str, Any] | None,
+    retries: int,
+    on_error: Literal["raise", "skip"],
+    progress: bool,
+) -> Iterator[tuple[int, bool, Any]]:
+    """Yields `(index, success, result or error)` of all products in order of completion."""
+    if backend not in ("process", "thread"):
+        raise ValueError(f"Invalid backend '{backend}', expected 'process' or 'thread'")
+    if on_error not in ("raise", "skip"):
+        raise ValueError(f"Invalid on_error '{on_error}', expected 'raise' or 'skip'")
+
+    task = partial(
+        _run_task,
+        func=func,
+        open_product=open_product,
+        read_kwargs=read_kwargs or {},
+        retries=retries,
+    )
+    workers = max(1, min(workers or os.cpu_count() or 1, len(filepaths)))
+
+    with tqdm(total=len(filepaths), disable=not progress, unit="file") as pbar:
+
+        def _check(i: int, success: bool, result: Any) -> tuple[int, bool, Any]:
+            pbar.update(1)
+            if not success:
+                if on_error == "raise":
+                    raise RuntimeError(
+                        f"Failed to process '{filepaths[i]}': {result}\n\n"
+                        f"Traceback in worker:\n{result.traceback}"
+                    ) from result.exception
+                pbar.set_postfix_str(f"skipped {os.path.basename(filepaths[i])}")
+            return i, success, result
+
+        if workers == 1:
+            for i, filepath in enumerate(filepaths):
+                yield _check(i, *task(filepath))
+            return
+
+        executor: Executor
+        if backend == "process":
+            executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        with executor:
+            futures: dict[Future, int] = {
+                executor.submit(task, filepath): i for i, filepath in enumerate(filepaths)
+            }
+            try:
+                for future in as_completed(futures):
+                    yield _check(futures[future], *future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+def _warn_skipped(filepaths: list[str], errors: dict[int, _TaskError]) -> None:
+    if len(errors) > 0:
+        details = "\n".join(f"  {filepaths[i]}: {errors[i]}" for i in sorted(errors))
+        warnings.warn(f"Skipped {len(errors)} of {len(filepaths)} products:\n{details}")
+
+
+def map_products(
+    products: pd.DataFrame | Sequence[str] | str,
+    func: Callable[[Any], T],
+    workers: int | None = None,
+    backend: MapBackend = "process",
+    open_product: bool = True,
+    read_kwargs: dict[str, Any] | None = None,
+    retries: int = 0,
+    on_error: Literal["raise", "skip"] = "raise",
+    progress: bool = False,
+) -> list[T | None]:
+    """Applies a function to each EarthCARE product in parallel.
+
+    Each product is opened with `read_product` inside its worker and passed to `func`, so only
+    the (ideally small) results of `func` are sent back, e.g., statistics of a frame. With the
+    "process" backend this scales across all cores of a node; `func` must then be picklable
+    (i.e., defined at module level). The "thread" backend avoids that restriction and suits
+    functions that mostly release the GIL (e.g., I/O or larger NumPy operations).
+
+    Args:
+        products: `ProductDataFrame` (or `pandas.DataFrame` with column "filepath"), or file paths.
+        func: Function applied to each opened dataset (or file path, if `open_product` is False).
+        workers: Number of workers. Defaults to the number of CPUs; runs in-process if 1.
+        backend: Run workers as processes ("process") or threads ("thread").
+            Defaults to "process".
+        open_product: Pass the dataset opened via `read_product` to `func` if True, otherwise
+            the file path. Defaults to True.
+        read_kwargs: Keyword arguments passed to `read_product`.
+        retries: Number of times a failing product is retried. Defaults to 0.
+        on_error: Raise a `RuntimeError` (chained to the original exception and including
+            the worker's traceback) on the first failing product ("raise") or skip failing
+            products with a warning listing them ("skip"). Defaults to "raise".
+        progress: Show a progress bar if True. Defaults to False.
+
+    Returns:
+        Results of `func` in the order of `products`, with None for skipped products.
+
+    Examples:
+        >>> def get_mean_profile(ds):
+        ...     return ds["particle_backscatter_coefficient_355nm"].mean("along_track").values
+        >>> df = eck.search_product(file_type="ATL_EBD_2A", orbit_number=[1500, 1501])
+        >>> profiles = eck.map_products(df, get_mean_profile, workers=8, progress=True)
+    """
+    filepaths = _get_filepaths(products)
+    results: list[T | None] = [None] * len(filepaths)
+    errors: dict[int, _TaskError] = {}
+    for i, success, result in _iter_results(
+        filepaths,
+        func,
+        workers,
+        backend,
+        open_product,
+        read_kwargs,
+        retries,
+        on_error,
+        progress,
+    ):
+        if success:
+            results[i] = result
+        else:
+            errors[i] = result
+    _warn_skipped(filepaths, errors)
+    return results
+
+
+def map_reduce_products(
+    products: pd.DataFrame | Sequence[str] | str,
+    func: Callable[[Any], T],
+    reduce_func: Callable[[R, T], R],
+    initial: R = _NO_INITIAL,
+    workers: int | None = None,
+    backend: MapBackend = "process",
+    open_product: bool = True,
+    read_kwargs: dict[str, Any] | None = None,
+    retries: int = 0,
+    on_error: Literal["raise", "skip"] = "raise",
+    progress: bool = False,
+) -> R:
+    """Applies a function to each EarthCARE product in parallel and reduces the results.
+
+    Works like `map_products`, but combines the results with `reduce_func(accumulated, result)`
+    as they arrive. Results are always reduced in the order of `products` (results completed
+    out of order wait for their predecessors), so that the outcome is deterministic, e.g., for
+    floating-point sums, regardless of the number of workers.
+
+    Args:
+        products: `ProductDataFrame` (or `pandas.DataFrame` with column "filepath"), or file paths.
+        func: Function applied to each opened dataset (or file path, if `open_product` is False).
+        reduce_func: Function combining the accumulated value with the next result.
+        initial: Initial accumulated value (may be None). If not given, the first result
+            is used.
+        workers: Number of workers. Defaults to the number of CPUs; runs in-process if 1.
+        backend: Run workers as processes ("process") or threads ("thread").
+            Defaults to "process".
+        open_product: Pass the dataset opened via `read_product` to `func` if True, otherwise
+            the file path. Defaults to True.
+        read_kwargs: Keyword arguments passed to `read_product`.
+        retries: Number of times a failing product is retried. Defaults to 0.
+        on_error: Raise a `RuntimeError` (chained to the original exception and including
+            the worker's traceback) on the first failing product ("raise") or skip failing
+            products with a warning listing them ("skip"). Defaults to "raise".
+        progress: Show a progress bar if True. Defaults to False.
+
+    Returns:
+        The reduced result.
+
+    Raises:
+        ValueError: If no product was processed successfully and `initial` is not given.
+
+    Examples:
+        >>> def count_profiles(ds):
+        ...     return ds.sizes["along_track"]
+        >>> total = eck.map_reduce_products(df, count_profiles, operator.add, initial=0)
+    """
+    filepaths = _get_filepaths(products)
+    accumulated: Any = initial
+    has_value = initial is not _NO_INITIAL
+    pending: dict[int, tuple[bool, Any]] = {}
+    next_index = 0
+    errors: dict[int, _TaskError] = {}
+    for i, success, result in _iter_results(
+        filepaths,
+        func,
+        workers,
+        backend,
+        open_product,
+        read_kwargs,
+        retries,
+        on_error,
+        progress,
+    ):
+        pending[i] = (success, result)
+        while next_index in pending:
+            success, result = pending.pop(next_index)
+            if not success:
+                errors[next_index] = result
+            elif has_value:
+                accumulated = reduce_func(accumulated, result)
+            else:
+                accumulated, has_value = result, True
+            next_index += 1
+    _warn_skipped(filepaths, errors)
+
+    if not has_value:
+        raise ValueError("No products were processed successfully and no initial value was given")
+    return accumulated
@@ -1,8 +1,7 @@
 from typing import Final
 
-import numpy as np
 import xarray as xr
-from scipy.spatial import cKDTree  # type: ignore
+from numpy.typing import NDArray
 
 from ...constants import (
     ACROSS_TRACK_DIM,
@@ -13,6 +12,7 @@
 )
 from ...geo import sequence_geo_to_ecef
 from ._generic import read_product
+from ._regridder import KDTreeRegridder, _get_or_create_regridder
 
 _SKIP_VARS: Final[list[str]] = [
     "filename",
@@ -42,12 +42,19 @@ def rebin_msi_to_jsg(
     time_var_xjsg: str = TIME_VAR,
     along_track_dim_xjsg: str = ALONG_TRACK_DIM,
     across_track_dim_xjsg: str = ACROSS_TRACK_DIM,
+    regridder: KDTreeRegridder | None = None,
+    cache_dir: str | None = None,
+    workers: int | None = None,
 ) -> xr.Dataset:
     """Rebins MSI variables onto the geo-spatial grid of an AUX_JSG_1D dataset.
 
     Interpolates selected variables from `ds_msi` to `ds_xjsg`'s lat/lon grid using kd-tree nearest-neighbor
     search with inverse distance weighting of `k` neighbors. Output matches `ds_xjsg`'s resolution.
 
+    Neighbors and weights are only searched once per pair of MSI and JSG grid if a `regridder` is
+    given or if `cache_dir` is set, in which case they are stored in a file named after both products
+    and a digest of their grid coordinates.
+
     Args:
         ds_msi: Source MSI dataset (e.g., MSI_RGR_1C, MSI_COP_2A).
         ds_xjsg: Target JSG dataset defining the output grid.
@@ -64,9 +71,16 @@ def rebin_msi_to_jsg(
         time_var_xjsg: Time variable name in `ds_xjsg`.
         along_track_dim_xjsg: Along-track dimension name in `ds_xjsg`.
         across_track_dim_xjsg: Across-track dimension name in `ds_xjsg`.
+        regridder: Precomputed `KDTreeRegridder` from the MSI to the JSG grid; built if None.
+        cache_dir: Directory in which regridders are cached, keyed by the product file names and
+            grid coordinates.
+        workers: Maximum number of threads used to rebin variables; defaults to the number of CPUs.
 
     Returns:
         The MSI dataset with variables rebinned to the JSG grid.
+
+    Raises:
+        ValueError: If the given `regridder` does not match the MSI and JSG grids.
     """
 
     def _read_msi() -> xr.Dataset:
@@ -108,60 +122,43 @@ def _read_xjsg() -> xr.Dataset:
         )
         new_ds_msi[time_var] = ds_xjsg[time_var_xjsg].copy()
 
-        lat_msi = ds_msi[lat_var].values.flatten()
-        lon_msi = ds_msi[lon_var].values.flatten()
-        coords_msi = sequence_geo_to_ecef(lat_msi, lon_msi)
-
-        lat_jsg = ds_xjsg[lat_var_xjsg].values.flatten()
-        lon_jsg = ds_xjsg[lon_var_xjsg].values.flatten()
-        coords_jsg = sequence_geo_to_ecef(lat_jsg, lon_jsg)
+        def _get_coords() -> tuple[NDArray, NDArray]:
+            lat_msi = ds_msi[lat_var].values.flatten()
+            lon_msi = ds_msi[lon_var].values.flatten()
+            coords_msi = sequence_geo_to_ecef(lat_msi, lon_msi)
+
+            lat_jsg = ds_xjsg[lat_var_xjsg].values.flatten()
+            lon_jsg = ds_xjsg[lon_var_xjsg].values.flatten()
+            coords_jsg = sequence_geo_to_ecef(lat_jsg, lon_jsg)
+            return coords_msi, coords_jsg
+
+        regridder = _get_or_create_regridder(
+            source=ds_msi,
+            target=ds_xjsg,
+            get_coords=_get_coords,
+            source_shape=ds_msi[lat_var].shape,
+            target_shape=ds_xjsg[lat_var_xjsg].shape,
+            k=k,
+            eps=eps,
+            regridder=regridder,
+            cache_dir=cache_dir,
+        )
 
-        tree = cKDTree(coords_msi)
-        dists, idxs = tree.query(coords_jsg, k=k)
+        # Rebin all swath variables at once
+        dims = (along_track_dim, across_track_dim)
+        swath_vars = [var for var in vars if ds_msi[var].dims == dims]
+        new_values = regridder.apply(
+            [ds_msi[var].values for var in swath_vars],
+            workers=workers,
+        )
+        rebinned = dict(zip(swath_vars, new_values))
 
-        dims: str | tuple[str, str]
         for var in vars:
-            if ds_msi[var].dims == (along_track_dim, across_track_dim):
-                dims = (along_track_dim, across_track_dim)
-
-                values = ds_msi[var].values
-                values_flat = values.flatten()
-
-                mask_nan = np.isnan(values_flat[idxs])
-
-                _dists = dists
-                _dists[mask_nan] = np.inf
-
-                # Inverse distance weighting
-                if k > 1:
-                    weights = 1.0 / (_dists + eps)
-                    weights /= np.sum(weights, axis=1, keepdims=True)
-                else:
-                    weights = np.ones(idxs.shape)
-
-                if k > 1:
-                    _v = values_flat[idxs]
-
-                    if np.issubdtype(_v.dtype, np.floating):
-                        m = np.all(np.isnan(_v), axis=1)
-                        _v[np.isnan(_v)] = 0.0
-                        _v[m] = np.nan
-
-                    result = np.sum(_v * weights, axis=1)
-
-                    new_values = result
-                else:
-                    new_values = values_flat[idxs]
-
-                new_values = new_values.reshape(ds_xjsg.latitude_swath.shape)
-
-                new_var = f"{var}"
-                new_ds_msi[new_var] = (dims, new_values)
-                new_ds_msi[new_var].attrs = ds_msi[var].attrs
+            if var in rebinned:
+                new_ds_msi[var] = (dims, rebinned[var])
+                new_ds_msi[var].attrs = ds_msi[var].attrs
             elif var not in _SKIP_VARS and var in ds_msi and var in ds_xjsg:
                 new_ds_msi[var] = ds_xjsg[var].copy()
                 new_ds_msi[var].attrs = ds_xjsg[var].attrs
-            else:
-                continue
 
         return new_ds_msi
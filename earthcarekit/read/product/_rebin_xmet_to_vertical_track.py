@@ -1,7 +1,6 @@
 import numpy as np
 import xarray as xr
 from numpy.typing import NDArray
-from scipy.spatial import cKDTree  # type: ignore
 
 from ...constants import (
     ALONG_TRACK_DIM,
@@ -11,68 +10,18 @@
     TRACK_LON_VAR,
     VERTICAL_DIM,
 )
-from ...geo import sequence_ecef_to_geo, sequence_geo_to_ecef
+from ...geo.convertsions import _geo_to_unit_ecef, _unit_ecef_to_geo
 from ...utils.xarray import remove_dims
 from ._generic import read_product
+from ._regridder import KDTreeRegridder, _get_or_create_regridder
 
 
-def _grid_along_track(
-    hgrid_coords: NDArray,
-    target_coords: NDArray,
-    hgrid_alt: NDArray,
-    k: int = 4,
-    eps: float = 1e-12,
-) -> tuple[NDArray, NDArray, NDArray]:
-    tree = cKDTree(hgrid_coords)
-    dists, idxs = tree.query(target_coords, k=k)
-
-    # Inverse distance weighting
-    if k > 1:
-        weights = 1.0 / (dists + eps)
-        weights /= np.sum(weights, axis=1, keepdims=True)
-        track_gridded_alt = np.einsum("ij,ijh->ih", weights, hgrid_alt[idxs])
-    else:
-        weights = np.ones(idxs.shape)
-        track_gridded_alt = hgrid_alt[idxs]
-
-    return idxs, weights, track_gridded_alt
-
-
-def _interp_values_along_track_1d(
-    kdtree_idxs: NDArray,
-    kdtree_weights: NDArray,
-    hgrid_values: NDArray,
-    k: int = 4,
-) -> NDArray:
-    if k > 1:
-        return np.sum(hgrid_values[kdtree_idxs] * kdtree_weights, axis=1)
-    return hgrid_values[kdtree_idxs]
-
-
-def _interp_values_along_track_2d(
-    kdtree_idxs: NDArray,
-    kdtree_weights: NDArray,
-    target_gridded_alt: NDArray,
-    target_alt: NDArray,
-    hgrid_values: NDArray,
-    k: int = 4,
-) -> NDArray:
-    if k > 1:
-        target_gridded_values = np.einsum("ij,ijh->ih", kdtree_weights, hgrid_values[kdtree_idxs])
-    else:
-        target_gridded_values = hgrid_values[kdtree_idxs]
-
-    new_values = np.empty(target_alt.shape)
-    new_values[:] = np.nan
-
-    for i in np.arange(target_alt.shape[0]):
-        _new_values = np.interp(
-            target_alt[i],
-            target_gridded_alt[i],
-            target_gridded_values[i],
-        )
-
-        new_values[i] = _new_values
+def _interp_profiles(x: NDArray, xp: NDArray, fps: list[NDArray]) -> list[NDArray]:
+    """Interpolates profiles of many variables linearly from one set of heights to another."""
+    new_values = [np.empty(x.shape) for _ in fps]
+    for i in np.arange(x.shape[0]):
+        for fp, nv in zip(fps, new_values):
+            nv[i] = np.interp(x[i], xp[i], fp[i])
     return new_values
 
 
@@ -93,12 +42,19 @@ def rebin_xmet_to_vertical_track(
     xmet_height_var: str = "geometrical_height",
     xmet_height_dim: str = "height",
     xmet_horizontal_grid_dim: str = "horizontal_grid",
+    regridder: KDTreeRegridder | None = None,
+    cache_dir: str | None = None,
+    workers: int | None = None,
 ) -> xr.Dataset:
     """Rebins AUX_MET_1D (XMET) variables onto the vertical curtain track of another dataset.
 
     Interpolates selected variables from `ds_xmet` to `ds_vert`'s vertical track using kd-tree nearest-neighbor
     search with inverse distance weighting of `k` horizontal neighbors, followed by vertical interpolation.
 
+    Neighbors and weights are only searched once per pair of X-MET grid and track if a `regridder` is
+    given or if `cache_dir` is set, in which case they are stored in a file named after both products
+    and a digest of their grid coordinates.
+
     Args:
         ds_xmet: Source XMET dataset.
         ds_vert: Target dataset defining the vertical curtain track (e.g., ATL_EBD_2A).
@@ -116,12 +72,17 @@ def rebin_xmet_to_vertical_track(
         xmet_height_var: Height variable name in `ds_xmet`.
         xmet_height_dim: Vertical dimension name in `ds_xmet`.
         xmet_horizontal_grid_dim: Horizontal grid dimension name in `ds_xmet`.
+        regridder: Precomputed `KDTreeRegridder` from the X-MET grid to the track; built if None.
+        cache_dir: Directory in which regridders are cached, keyed by the product file names and
+            grid coordinates.
+        workers: Maximum number of threads used to rebin variables; defaults to the number of CPUs.
 
     Returns:
         A new dataset with XMET variables interpolated to `ds_vert`'s vertical track.
 
     Raises:
         KeyError: If any specified variable or coordinate is missing in `ds_xmet`.
+        ValueError: If the given `regridder` does not match the X-MET grid and track.
     """
     # Return given dataset, if nadir cross-section has already been extracted from it.
     if (
@@ -169,37 +130,48 @@ def _read_vert() -> xr.Dataset:
         hgrid_lat = ds_xmet[xmet_lat_var].values.flatten()
         hgrid_lon = ds_xmet[xmet_lon_var].values.flatten()
         hgrid_alt = ds_xmet[xmet_height_var].values
-        hgrid_coords = sequence_geo_to_ecef(hgrid_lat, hgrid_lon)
+        hgrid_coords = _geo_to_unit_ecef(hgrid_lat, hgrid_lon)
 
-        track_lat = ds_vert[lat_var].values
-        track_lon = ds_vert[lon_var].values
         track_alt = ds_vert[height_var].values
-        track_coords = sequence_geo_to_ecef(track_lat, track_lon)
 
-        idxs, weights, height = _grid_along_track(
-            hgrid_coords=hgrid_coords,
-            target_coords=track_coords,
-            hgrid_alt=hgrid_alt,
+        def _get_coords() -> tuple[NDArray, NDArray]:
+            track_lat = ds_vert[lat_var].values
+            track_lon = ds_vert[lon_var].values
+            track_coords = _geo_to_unit_ecef(track_lat, track_lon)
+            return hgrid_coords, track_coords
+
+        regridder = _get_or_create_regridder(
+            source=ds_xmet,
+            target=ds_vert,
+            get_coords=_get_coords,
+            source_shape=hgrid_lat.shape,
+            target_shape=ds_vert[lat_var].shape,
             k=k,
             eps=eps,
+            regridder=regridder,
+            cache_dir=cache_dir,
         )
 
         # Handle longitudes separately to account for sign changes at the dateline
         if xmet_lon_var in vars:
             vars.remove(xmet_lon_var)
 
-        new_coords = _interp_values_along_track_1d(
-            kdtree_idxs=idxs,
-            kdtree_weights=weights.reshape((*weights.shape, 1)),
-            hgrid_values=hgrid_coords,
-            k=k,
+        vars_1d = [var for var in vars if ds_xmet[var].ndim == 1]
+        vars_2d = [var for var in vars if ds_xmet[var].ndim > 1]
+
+        # Rebin horizontally all variables at once
+        new_coords, height, *new_values_1d = regridder.apply(
+            [hgrid_coords, hgrid_alt, *[ds_xmet[var].values for var in vars_1d]],
+            skipna=False,
+            workers=workers,
+        )
+        new_values_2d = regridder.apply(
+            [ds_xmet[var].values for var in vars_2d],
+            skipna=False,
+            workers=workers,
         )
 
-        new_lons = sequence_ecef_to_geo(
-            x=new_coords[:, 0],
-            y=new_coords[:, 1],
-            z=new_coords[:, 2],
-        )[:, 1]
+        _, new_lons = _unit_ecef_to_geo(new_coords)
 
         new_ds_xmet[xmet_lon_var] = xr.DataArray(
             data=new_lons,
@@ -207,37 +179,20 @@ def _read_vert() -> xr.Dataset:
             attrs=new_ds_xmet[xmet_lon_var].attrs,
         )
 
-        # Handle all remaining variables
-        dims: str | tuple[str, str]
+        # Interpolate vertically all variables at once
+        rebinned: dict[str, tuple[str | tuple[str, str], NDArray]] = {
+            var: (along_track_dim, v) for var, v in zip(vars_1d, new_values_1d)
+        }
+        if len(vars_2d) > 0:
+            new_values_2d = _interp_profiles(x=track_alt, xp=height, fps=new_values_2d)
+            for var, v in zip(vars_2d, new_values_2d):
+                rebinned[var] = ((along_track_dim, height_dim), v)
+
         for var in vars:
-            values = ds_xmet[var].values
-            if len(values.shape) == 0:
+            if var not in rebinned:
                 continue
-
-            if len(values.shape) == 1:
-                dims = along_track_dim
-
-                new_values = _interp_values_along_track_1d(
-                    kdtree_idxs=idxs,
-                    kdtree_weights=weights,
-                    hgrid_values=values,
-                    k=k,
-                )
-            else:
-                dims = (along_track_dim, height_dim)
-
-                new_values = _interp_values_along_track_2d(
-                    kdtree_idxs=idxs,
-                    kdtree_weights=weights,
-                    target_gridded_alt=height,
-                    target_alt=track_alt,
-                    hgrid_values=values,
-                    k=k,
-                )
-
-            new_var = f"{var}"
-            new_ds_xmet[new_var] = (dims, new_values)
-            new_ds_xmet[new_var].attrs = ds_xmet[var].attrs
+            new_ds_xmet[var] = rebinned[var]
+            new_ds_xmet[var].attrs = ds_xmet[var].attrs
 
         # Remove original horizontal grid dims and associated variables
         new_ds_xmet = remove_dims(new_ds_xmet, [xmet_horizontal_grid_dim, xmet_height_dim])
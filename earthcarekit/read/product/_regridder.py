@@ -0,0 +1,347 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
+
+import numpy as np
+import xarray as xr
+from numpy.typing import NDArray
+from scipy.spatial import cKDTree  # type: ignore
+
+from ...utils.numpy import savez_atomic
+
+# Minimum number of target points per thread when applying weights
+_MIN_CHUNK_SIZE = 4096
+
+
+@dataclass
+class KDTreeRegridder:
+    """Inverse distance weighting of the `k` nearest source grid points for every target grid point.
+
+    Neighbour indices and distances are found once per pair of source and target grid, after
+    which any number of variables on the source grid can be regridded without searching again.
+    Regridders can be saved to and loaded from `.npz` files to reuse them across sessions.
+
+    Attributes:
+        indices: Flat source grid indices of the `k` nearest neighbours, shape (num_target, k).
+        distances: Distances to the `k` nearest neighbours, shape (num_target, k).
+        source_shape: Shape of the source grid.
+        target_shape: Shape of the target grid.
+        eps: Numerical threshold to avoid division by zero.
+    """
+
+    indices: NDArray
+    distances: NDArray
+    source_shape: tuple[int, ...]
+    target_shape: tuple[int, ...]
+    eps: float = 1e-12
+    _inverse_distances: NDArray = field(init=False, repr=False)
+    _weights: NDArray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.indices = np.asarray(self.indices).reshape((self.num_target, -1))
+        self.distances = np.asarray(self.distances).reshape(self.indices.shape)
+        self.source_shape = tuple(int(n) for n in self.source_shape)
+        self.target_shape = tuple(int(n) for n in self.target_shape)
+        self._inverse_distances = 1.0 / (self.distances + self.eps)
+        self._weights = self._inverse_distances / np.sum(
+            self._inverse_distances, axis=1, keepdims=True
+        )
+
+    @property
+    def k(self) -> int:
+        """Number of neighbours per target point."""
+        return int(self.indices.shape[1])
+
+    @property
+    def num_source(self) -> int:
+        """Number of source grid points."""
+        return int(np.prod(self.source_shape))
+
+    @property
+    def num_target(self) -> int:
+        """Number of target grid points."""
+        return int(np.prod(self.target_shape))
+
+    @property
+    def weights(self) -> NDArray:
+        """Normalized inverse distance weights, shape (num_target, k)."""
+        return self._weights
+
+    @classmethod
+    def from_coords(
+        cls,
+        source_coords: NDArray,
+        target_coords: NDArray,
+        source_shape: tuple[int, ...] | None = None,
+        target_shape: tuple[int, ...] | None = None,
+        k: int = 4,
+        eps: float = 1e-12,
+        workers: int = 1,
+    ) -> "KDTreeRegridder":
+        """Builds a regridder by kd-tree search of the nearest source points of all target points.
+
+        Args:
+            source_coords: Cartesian (e.g., ECEF) source grid coordinates, shape (num_source, 3).
+            target_coords: Cartesian target grid coordinates, shape (num_target, 3).
+            source_shape: Shape of the source grid; defaults to (num_source,).
+            target_shape: Shape of the target grid; defaults to (num_target,).
+            k: Number of nearest neighbours; defaults to 4.
+            eps: Numerical threshold to avoid division by zero; defaults to 1e-12.
+            workers: Number of threads used by the kd-tree query; -1 uses all CPUs.
+
+        Returns:
+            The regridder.
+        """
+        source_coords = np.asarray(source_coords)
+        target_coords = np.asarray(target_coords)
+        tree = cKDTree(source_coords)
+        dists, idxs = tree.query(target_coords, k=k, workers=workers)
+        return cls(
+            indices=idxs,
+            distances=dists,
+            source_shape=source_shape or (source_coords.shape[0],),
+            target_shape=target_shape or (target_coords.shape[0],),
+            eps=eps,
+        )
+
+    def save(self, filepath: str) -> None:
+        """Saves neighbour indices and distances to a `.npz` file."""
+        savez_atomic(
+            filepath,
+            indices=self.indices,
+            distances=self.distances,
+            source_shape=np.asarray(self.source_shape, dtype=np.int64),
+            target_shape=np.asarray(self.target_shape, dtype=np.int64),
+            eps=np.float64(self.eps),
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> "KDTreeRegridder":
+        """Loads a regridder saved with `KDTreeRegridder.save`."""
+        with np.load(filepath) as data:
+            return cls(
+                indices=data["indices"],
+                distances=data["distances"],
+                source_shape=tuple(data["source_shape"]),
+                target_shape=tuple(data["target_shape"]),
+                eps=float(data["eps"]),
+            )
+
+    def is_compatible(
+        self,
+        source_shape: tuple[int, ...],
+        target_shape: tuple[int, ...],
+        k: int,
+        eps: float,
+    ) -> bool:
+        """Returns True if the regridder maps between grids of the given shapes with `k` and `eps`."""
+        return (
+            self.source_shape == tuple(source_shape)
+            and self.target_shape == tuple(target_shape)
+            and self.k == k
+            and self.eps == eps
+        )
+
+    def _apply_chunk(
+        self,
+        values: NDArray,
+        out: NDArray,
+        skipna: bool,
+        start: int,
+        stop: int,
+    ) -> None:
+        _v = values[self.indices[start:stop]]
+        weights = self._weights[start:stop]
+        if skipna and np.issubdtype(_v.dtype, np.floating):
+            # Neighbours with missing values are excluded by re-normalizing the remaining weights
+            mask_nan = np.isnan(_v)
+            if np.any(mask_nan):
+                weights = np.where(mask_nan, 0.0, self._inverse_distances[start:stop, :, None])
+                with np.errstate(invalid="ignore"):
+                    weights /= np.sum(weights, axis=1, keepdims=True)
+                _v[mask_nan] = 0.0
+                _v[:, 0][np.all(mask_nan, axis=1)] = np.nan
+                out[start:stop] = np.sum(_v * weights, axis=1)
+                return
+        if _v.shape[2] == 1:
+            out[start:stop, 0] = np.sum(_v[:, :, 0] * weights, axis=1)
+        else:
+            out[start:stop] = np.einsum("ij,ijm->im", weights, _v)
+
+    def apply(
+        self,
+        values: NDArray | Sequence[NDArray],
+        skipna: bool = True,
+        workers: int | None = None,
+    ) -> NDArray | list[NDArray]:
+        """Regrids one or many variables from the source to the target grid.
+
+        All variables are regridded in one batch of tasks, one per variable and chunk of the
+        target grid, which are processed in parallel threads.
+
+        Args:
+            values: Array or sequence of arrays whose leading dimensions match the source grid
+                shape; trailing dimensions (e.g., height) are kept.
+            skipna: If True, neighbours with NaN values are ignored and target points whose
+                neighbours are all NaN are set to NaN. Defaults to True.
+            workers: Maximum number of threads; defaults to the number of CPUs.
+
+        Returns:
+            The regridded array, or a list of arrays if a sequence was given, with leading
+            dimensions matching the target grid shape.
+        """
+        is_single = isinstance(values, np.ndarray)
+        arrays = [np.asarray(values)] if is_single else [np.asarray(v) for v in values]
+        if len(arrays) == 0:
+            return []
+
+        ndim = len(self.source_shape)
+        flat_arrays: list[NDArray] = []
+        trailing_shapes: list[tuple[int, ...]] = []
+        for a in arrays:
+            if a.shape[:ndim] != self.source_shape:
+                raise ValueError(
+                    f"array of shape {a.shape} does not match the source grid shape {self.source_shape}"
+                )
+            trailing_shapes.append(a.shape[ndim:])
+            flat_arrays.append(a.reshape((self.num_source, -1)))
+
+        if self.k == 1:
+            idxs = self.indices[:, 0]
+            outputs = [
+                a[idxs].reshape((*self.target_shape, *s))
+                for a, s in zip(flat_arrays, trailing_shapes)
+            ]
+            return outputs[0] if is_single else outputs
+
+        outputs = [
+            np.empty((self.num_target, a.shape[1]), dtype=np.result_type(np.float64, a.dtype))
+            for a in flat_arrays
+        ]
+
+        # Every variable is split into chunks along the target grid, which are processed in threads
+        num_workers = max(1, workers or os.cpu_count() or 1)
+        num_chunks = max(1, min(num_workers, self.num_target // _MIN_CHUNK_SIZE))
+        bounds = np.linspace(0, self.num_target, num_chunks + 1).astype(int)
+        tasks = [
+            (a, out, start, stop)
+            for a, out in zip(flat_arrays, outputs)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        if num_workers == 1 or len(tasks) == 1:
+            for a, out, start, stop in tasks:
+                self._apply_chunk(a, out, skipna, start, stop)
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = [
+                    executor.submit(self._apply_chunk, a, out, skipna, start, stop)
+                    for a, out, start, stop in tasks
+                ]
+                for future in futures:
+                    future.result()
+
+        outputs = [
+            out.reshape((*self.target_shape, *trailing_shape))
+            for out, trailing_shape in zip(outputs, trailing_shapes)
+        ]
+        return outputs[0] if is_single else outputs
+
+
+def _get_product_name(ds: xr.Dataset | str) -> str | None:
+    """Returns the product file name (without extension) of a file path or dataset, if known."""
+    if isinstance(ds, str):
+        filepath = ds
+    elif "filename" in ds.variables and ds["filename"].ndim == 0:
+        filepath = str(ds["filename"].values)
+    elif "source" in ds.encoding:
+        filepath = ds.encoding["source"]
+    else:
+        return None
+    return os.path.splitext(os.path.basename(filepath))[0] or None
+
+
+def _get_coords_digest(*coords: NDArray) -> str:
+    """Returns a hex digest of the shapes and values of the given coordinate arrays."""
+    h = hashlib.sha1()
+    for c in coords:
+        c = np.ascontiguousarray(c, dtype=np.float64)
+        h.update(str(c.shape).encode("utf-8"))
+        h.update(c.tobytes())
+    return h.hexdigest()
+
+
+def get_regridder_filepath(
+    source: xr.Dataset | str,
+    target: xr.Dataset | str,
+    cache_dir: str,
+    k: int,
+    digest: str | None = None,
+) -> str | None:
+    """Returns the file path of a cached regridder keyed by the source and target product names.
+
+    Args:
+        source: Source product file path or dataset.
+        target: Target product file path or dataset.
+        cache_dir: Directory containing cached regridders.
+        k: Number of nearest neighbours of the regridder.
+        digest: Digest of the source and target grid coordinates, which distinguishes different
+            subsets of the same products (e.g., trimmed to different areas) of equal shape.
+
+    Returns:
+        The file path or None, if the product name of `source` or `target` is unknown.
+    """
+    source_name = _get_product_name(source)
+    target_name = _get_product_name(target)
+    if source_name is None or target_name is None:
+        return None
+    filename = f"{source_name}__{target_name}__k{k}"
+    if digest is not None:
+        filename = f"{filename}__{digest[:16]}"
+    return os.path.join(cache_dir, f"{filename}.npz")
+
+
+def _get_or_create_regridder(
+    source: xr.Dataset,
+    target: xr.Dataset,
+    get_coords: Callable[[], tuple[NDArray, NDArray]],
+    source_shape: tuple[int, ...],
+    target_shape: tuple[int, ...],
+    k: int,
+    eps: float,
+    regridder: KDTreeRegridder | None = None,
+    cache_dir: str | None = None,
+) -> KDTreeRegridder:
+    """Returns the given or cached regridder, or builds (and caches) a new one if there is none."""
+    if regridder is not None:
+        if not regridder.is_compatible(source_shape, target_shape, k, eps):
+            raise ValueError(
+                f"regridder (source {regridder.source_shape}, target {regridder.target_shape}, "
+                f"k={regridder.k}, eps={regridder.eps}) does not match the given grids "
+                f"(source {source_shape}, target {target_shape}, k={k}, eps={eps})"
+            )
+        return regridder
+
+    source_coords, target_coords = get_coords()
+
+    filepath: str | None = None
+    if cache_dir is not None:
+        digest = _get_coords_digest(source_coords, target_coords)
+        filepath = get_regridder_filepath(source, target, cache_dir, k, digest=digest)
+        if filepath is not None and os.path.exists(filepath):
+            regridder = KDTreeRegridder.load(filepath)
+            if regridder.is_compatible(source_shape, target_shape, k, eps):
+                return regridder
+
+    regridder = KDTreeRegridder.from_coords(
+        source_coords,
+        target_coords,
+        source_shape=source_shape,
+        target_shape=target_shape,
+        k=k,
+        eps=eps,
+    )
+    if filepath is not None:
+        regridder.save(filepath)
+    return regridder
@@ -17,11 +17,11 @@
     format_frame_id,
     format_orbit_and_frame,
     format_orbit_number,
-    get_product_info,
     get_product_infos,
     validate_baseline,
 )
-from ._header_file import read_hdr_fixed_header
+from ._catalog import ProductCatalog
+from ._validity_index import ValidityIndex
 
 
 def _to_file_info_list(
@@ -78,33 +78,6 @@ def _list_to_regex(
     return f"({'|'.join(input)})"
 
 
-def _check_product_contains_timestamp(
-    filepath: str,
-    timestamp: TimestampLike,
-) -> bool:
-    """Checks if product may contain timestamp."""
-    product_info = get_product_info(filepath)
-    timestamp = to_timestamp(timestamp)
-    if (
-        product_info.start_sensing_time <= timestamp
-        and product_info.start_sensing_time + pd.Timedelta(minutes=13) >= timestamp
-    ):
-        hdr_filepath = os.path.join(
-            os.path.dirname(filepath), os.path.basename(filepath).split(".")[0] + ".HDR"
-        )
-        if os.path.exists(hdr_filepath):
-            hdr = read_hdr_fixed_header(hdr_filepath)
-            timestamp = to_timestamp(timestamp)
-            if isinstance(hdr.validity_start, pd.Timestamp) and isinstance(
-                hdr.validity_stop, pd.Timestamp
-            ):
-                if hdr.validity_start <= timestamp and hdr.validity_stop >= timestamp:
-                    return True
-        else:
-            return True
-    return False
-
-
 def _filter_time_range(
     df: ProductDataFrame,
     start_time: TimestampLike | None = None,
@@ -261,8 +234,9 @@ def search_product(
     filename: str | Sequence[str] | None = None,
     start_time: TimestampLike | None = None,
     end_time: TimestampLike | None = None,
-    mode: Literal["exhaustive", "fast"] = "exhaustive",
+    mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     read_geo_from_hdr: bool = False,
+    catalog_max_age: float = 600.0,
     **kwargs,
 ) -> ProductDataFrame:
     """Searches for EarthCARE product files matching given metadata filters.
@@ -281,8 +255,15 @@ def search_product(
         filename: Specific filename(s) or regex patterns to match.
         start_time: First timestamp in the product's time coverage.
         end_time: Last timestamp in the product's time coverage.
-        mode: Search strategy ("exhaustive" or "fast").
+        mode:
+            Search strategy: "exhaustive" (recursive scan), "fast" (expected paths only) or
+            "catalog" (incrementally updated on-disk index, see `ProductCatalog`).
         read_geo_from_hdr: Read geo-coordinates from `.HDR` files if True.
+        catalog_max_age:
+            With mode "catalog", the catalog is updated before searching if its last update is
+            at least this many seconds ago; files added or removed since then are not seen
+            until the next update (see `ProductCatalog.update` or `ecki catalog`). Set to 0 to
+            always update. Defaults to 600.
 
     Returns:
         A `ProductDataFrame` with matching product files.
@@ -382,6 +363,11 @@ def search_product(
 
     pattern = f".*{mission_id}_{agency}{latency}{baseline_and_file_type}_........T......Z_........T......Z_{oaf}.h5"
 
+    catalog: ProductCatalog | None = None
+    if mode == "catalog":
+        catalog = ProductCatalog(path_to_data)
+        catalog.update(max_age=catalog_max_age)
+
     files: list[str]
     if pattern == ".*ECA_...._..._..._.._........T......Z_........T......Z_.......h5":
         files = []
@@ -416,6 +402,8 @@ def search_product(
                 _files = []
 
             files.extend(_files)
+    elif catalog is not None:
+        files = catalog.search_files(pattern, file_types=file_type)
     else:
         files = search_files_by_regex(path_to_data, pattern)
 
@@ -433,7 +421,10 @@ def _get_pattern(fn):
         raise TypeError(f"Given filename has invalid type ({type(filename)}: {filename})")
 
     for fn in filename:
-        new_files = search_files_by_regex(path_to_data, fn)
+        if catalog is not None:
+            new_files = catalog.search_files(fn)
+        else:
+            new_files = search_files_by_regex(path_to_data, fn)
         files.extend(new_files)
 
     # Remove duplicates
@@ -441,16 +432,13 @@ def _get_pattern(fn):
 
     old_files = files.copy()
     if len(timestamp) > 0:
-        files = []
-        for t in timestamp:
-            new_files = [f for f in old_files if _check_product_contains_timestamp(f, t)]
-            if len(new_files) > 0:
-                files.extend(new_files)
+        files = ValidityIndex(old_files, catalog=catalog).filter(timestamp)
 
-    pdf = get_product_infos(files, read_geo_from_hdr=read_geo_from_hdr)
+    _get_product_infos = get_product_infos if catalog is None else catalog.get_product_infos
+    pdf = _get_product_infos(files, read_geo_from_hdr=read_geo_from_hdr)
 
     if start_time is not None or end_time is not None:
-        _pdf = get_product_infos(old_files, read_geo_from_hdr=read_geo_from_hdr)
+        _pdf = _get_product_infos(old_files, read_geo_from_hdr=read_geo_from_hdr)
         _pdf = _filter_time_range(_pdf, start_time=start_time, end_time=end_time)
 
         if not pdf.empty and not _pdf.empty:
@@ -458,6 +446,9 @@ def _get_pattern(fn):
         elif not _pdf.empty:
             pdf = _pdf
 
+    if catalog is not None:
+        catalog.close()
+
     pdf = pdf.sort_values(by=["orbit_and_frame", "file_type", "start_processing_time"])
     pdf = pdf.drop_duplicates()
     pdf = pdf.reset_index(drop=True)
@@ -0,0 +1,211 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from ...utils.parse.filename import FILE_INFO_REGEX
+from ...utils.time import TimestampLike, to_timestamps
+from ._header_file import read_hdr_fixed_header
+
+if TYPE_CHECKING:
+    from ._catalog import ProductCatalog
+
+FRAME_DURATION: Final[pd.Timedelta] = pd.Timedelta(minutes=13)
+_FRAME_DURATION_NS: Final[int] = int(FRAME_DURATION.value)
+_NO_HDR_MTIME: Final[int] = -1
+
+_VALIDITY_CACHE_MAX_ENTRIES: Final[int] = 100_000
+
+
+class _ValidityCache:
+    """Thread-safe LRU cache of header validity intervals, bounded by the number of entries.
+
+    Maps file paths to `(hdr_mtime_ns, validity_start_ns, validity_stop_ns)`.
+    """
+
+    def __init__(self, max_entries: int = _VALIDITY_CACHE_MAX_ENTRIES) -> None:
+        self._entries: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries: int = max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, filepath: str) -> bool:
+        return filepath in self._entries
+
+    def get(self, filepath: str) -> tuple[int, int, int] | None:
+        with self._lock:
+            entry = self._entries.get(filepath)
+            if entry is not None:
+                self._entries.move_to_end(filepath)
+            return entry
+
+    def update(self, entries: dict[str, tuple[int, int, int]]) -> None:
+        with self._lock:
+            for filepath, entry in entries.items():
+                self._entries[filepath] = entry
+                self._entries.move_to_end(filepath)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache of header validity intervals, shared by all `ValidityIndex` instances
+_VALIDITY_CACHE: Final[_ValidityCache] = _ValidityCache()
+
+
+def _get_hdr_filepath(filepath: str) -> str:
+    return os.path.join(
+        os.path.dirname(filepath), os.path.basename(filepath).split(".")[0] + ".HDR"
+    )
+
+
+def _get_start_sensing_times_ns(filepaths: Sequence[str]) -> NDArray[np.int64]:
+    names = pd.Series([os.path.basename(fp) for fp in filepaths], dtype="object")
+    sst = names.str.extract(FILE_INFO_REGEX)[4]
+    sst = pd.to_datetime(sst, format="%Y%m%dT%H%M%S")
+    return sst.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _read_validity_interval_ns(hdr_filepath: str, sst_ns: int) -> tuple[int, int]:
+    """Returns the interval in which a product contains data, same rules as the per-file check."""
+    window_stop_ns = sst_ns + _FRAME_DURATION_NS
+    if not os.path.exists(hdr_filepath):
+        return sst_ns, window_stop_ns
+
+    hdr = read_hdr_fixed_header(hdr_filepath)
+    if isinstance(hdr.validity_start, pd.Timestamp) and isinstance(hdr.validity_stop, pd.Timestamp):
+        vs = int(hdr.validity_start.as_unit("ns").value)
+        ve = int(hdr.validity_stop.as_unit("ns").value)
+        return max(sst_ns, vs), min(window_stop_ns, ve)
+
+    # Header without valid period: product never matches
+    return 1, 0
+
+
+def _get_hdr_mtime_ns(hdr_filepath: str) -> int:
+    try:
+        return os.stat(hdr_filepath).st_mtime_ns
+    except OSError:
+        return _NO_HDR_MTIME
+
+
+def _stab(
+    starts: NDArray[np.int64],
+    stops: NDArray[np.int64],
+    order: NDArray[np.intp],
+    max_length: int,
+    times: NDArray[np.int64],
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Finds all (time, interval) pairs with `start <= time <= stop` using sorted start times."""
+    sorted_starts = starts[order]
+    hi = np.searchsorted(sorted_starts, times, side="right")
+    lo = np.searchsorted(sorted_starts, times - max_length, side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    time_idx = np.repeat(np.arange(times.size), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    interval_idx = order[np.repeat(lo, counts) + offsets]
+
+    mask = stops[interval_idx] >= times[time_idx]
+    return time_idx[mask], interval_idx[mask]
+
+
+class ValidityIndex:
+    """Sorted index of product validity intervals for vectorized timestamp lookups.
+
+    Intervals are first estimated from the start sensing time encoded in filenames (frames span
+    at most 13 minutes) and only products that may contain one of the queried timestamps have
+    their `.HDR` validity period read. Header intervals are kept in a process-wide LRU cache of
+    the most recently used 100,000 products and, if a `ProductCatalog` is given, persisted in the
+    catalog.
+
+    Args:
+        filepaths: Product file paths (`.h5`).
+        catalog: Optional catalog used to load and store header validity intervals.
+    """
+
+    def __init__(
+        self,
+        filepaths: Sequence[str],
+        catalog: "ProductCatalog | None" = None,
+    ) -> None:
+        self.filepaths: list[str] = list(filepaths)
+        self._catalog = catalog
+        self._sst = _get_start_sensing_times_ns(self.filepaths)
+        self._order = np.argsort(self._sst, kind="stable")
+        self._window_stops = self._sst + _FRAME_DURATION_NS
+        self._starts = self._sst.copy()
+        self._stops = self._window_stops.copy()
+        self._resolved = np.zeros(len(self.filepaths), dtype=bool)
+
+    def _resolve(self, idxs: NDArray[np.intp]) -> None:
+        """Replaces filename-based intervals with header validity periods."""
+        idxs = idxs[~self._resolved[idxs]]
+        if idxs.size == 0:
+            return
+
+        filepaths = [self.filepaths[i] for i in idxs]
+        hdr_filepaths = [_get_hdr_filepath(fp) for fp in filepaths]
+        hdr_mtimes = [_get_hdr_mtime_ns(fp) for fp in hdr_filepaths]
+
+        if self._catalog is not None:
+            missing = [fp for fp in filepaths if fp not in _VALIDITY_CACHE]
+            _VALIDITY_CACHE.update(self._catalog.get_validity(missing))
+
+        new_rows: list[tuple[str, int, int, int]] = []
+        for i, fp, hdr_fp, mtime in zip(idxs, filepaths, hdr_filepaths, hdr_mtimes):
+            cached = _VALIDITY_CACHE.get(fp)
+            if cached is not None and cached[0] == mtime:
+                start, stop = cached[1], cached[2]
+            else:
+                start, stop = _read_validity_interval_ns(hdr_fp, int(self._sst[i]))
+                _VALIDITY_CACHE.update({fp: (mtime, start, stop)})
+                new_rows.append((fp, mtime, start, stop))
+            self._starts[i] = start
+            self._stops[i] = stop
+        self._resolved[idxs] = True
+
+        if self._catalog is not None and len(new_rows) > 0:
+            self._catalog.set_validity(new_rows)
+
+    def lookup(
+        self,
+        timestamps: TimestampLike | Sequence[TimestampLike],
+    ) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """Finds products containing the given timestamps.
+
+        Args:
+            timestamps: One or more timestamps.
+
+        Returns:
+            A tuple of index arrays `(timestamp_index, file_index)`, one entry per match.
+        """
+        if len(self.filepaths) == 0:
+            empty = np.array([], dtype=np.intp)
+            return empty, empty
+
+        times = np.asarray(
+            to_timestamps(np.atleast_1d(np.asarray(timestamps, dtype=object))).as_unit("ns").asi8,
+            dtype=np.int64,
+        )
+
+        # Coarse candidates from filenames, then refine with header validity periods
+        _, candidates = _stab(self._sst, self._window_stops, self._order, _FRAME_DURATION_NS, times)
+        self._resolve(np.unique(candidates))
+
+        order = np.argsort(self._starts, kind="stable")
+        return _stab(self._starts, self._stops, order, _FRAME_DURATION_NS, times)
+
+    def filter(self, timestamps: TimestampLike | Sequence[TimestampLike]) -> list[str]:
+        """Returns the file paths of products containing any of the given timestamps."""
+        _, file_idxs = self.lookup(timestamps)
+        return [self.filepaths[i] for i in np.unique(file_idxs)]
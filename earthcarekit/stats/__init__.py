@@ -10,6 +10,7 @@
 ---
 """
 
+from ._accumulator import Histogram2DAccumulator, HistogramAccumulator, get_log_edges
 from ._histogram import get_hist_mean, get_hist_median, get_hist_percentile
 from ._omitna import (
     nan_diff_of_means,
@@ -24,6 +25,9 @@
 )
 
 __all__ = [
+    "Histogram2DAccumulator",
+    "HistogramAccumulator",
+    "get_log_edges",
     "get_hist_mean",
     "get_hist_median",
     "get_hist_percentile",
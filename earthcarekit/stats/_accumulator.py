@@ -0,0 +1,297 @@
+from typing import Literal, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..utils.numpy import savez_atomic
+from ._histogram import get_hist_mean, get_hist_median, get_hist_percentile
+
+
+def get_log_edges(vmin: float, vmax: float, num_bins: int) -> NDArray:
+    """Returns logarithmically spaced histogram bin edges.
+
+    Args:
+        vmin: Lower edge of the first bin (must be positive).
+        vmax: Upper edge of the last bin.
+        num_bins: Number of bins.
+
+    Returns:
+        Array of `num_bins`+1 monotonically increasing bin edges.
+    """
+    if vmin <= 0 or vmax <= vmin:
+        raise ValueError(f"invalid range for log bins ({vmin}, {vmax}); expected 0 < vmin < vmax")
+    return np.geomspace(vmin, vmax, num_bins + 1)
+
+
+def _validate_edges(edges: ArrayLike, name: str = "edges") -> NDArray:
+    edges = np.asarray(edges, dtype=np.float64)
+    if edges.ndim != 1 or edges.size < 2:
+        raise ValueError(f"'{name}' must be a 1D sequence of at least 2 bin edges")
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError(f"'{name}' must be monotonically increasing")
+    return edges
+
+
+def _get_bin_indices(values: NDArray, edges: NDArray) -> NDArray:
+    """Returns the bin index of each value shifted by one, so that 0 counts values below and
+    `len(edges)` values above the bins, and `len(edges)+1` NaNs. Like `np.histogram`, the last
+    bin includes its upper edge."""
+    idxs = np.searchsorted(edges, values, side="right")
+    idxs[values == edges[-1]] = edges.size - 1
+    idxs[np.isnan(values)] = edges.size + 1
+    return idxs
+
+
+class HistogramAccumulator:
+    """Fixed-memory 1D histogram that is filled chunk by chunk (e.g., frame by frame).
+
+    Values are counted into fixed bins; values outside of the bins are counted separately as
+    underflow and overflow, NaNs are ignored. Accumulators with the same bins can be merged,
+    e.g., after filling them in separate processes, and saved to and loaded from `.npz` files.
+
+    Attributes:
+        edges: Monotonically increasing bin edges.
+        counts: Number of values per bin.
+        underflow: Number of values below the first bin.
+        overflow: Number of values above the last bin.
+    """
+
+    def __init__(self: Self, edges: ArrayLike) -> None:
+        self.edges: NDArray = _validate_edges(edges)
+        self.counts: NDArray = np.zeros(self.edges.size - 1, dtype=np.int64)
+        self.underflow: int = 0
+        self.overflow: int = 0
+
+    @classmethod
+    def from_log_bins(cls, vmin: float, vmax: float, num_bins: int) -> "HistogramAccumulator":
+        """Creates an empty accumulator with logarithmically spaced bins."""
+        return cls(get_log_edges(vmin, vmax, num_bins))
+
+    @property
+    def centers(self: Self) -> NDArray:
+        """Bin centers (arithmetic mean of the bin edges)."""
+        return 0.5 * (self.edges[:-1] + self.edges[1:])
+
+    @property
+    def total(self: Self) -> int:
+        """Number of values counted in the bins."""
+        return int(self.counts.sum())
+
+    def add(self: Self, values: ArrayLike) -> Self:
+        """Counts a chunk of values of any shape into the histogram."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        num_bins = self.counts.size
+        counts = np.bincount(_get_bin_indices(values, self.edges), minlength=num_bins + 3)
+        self.counts += counts[1 : num_bins + 1]
+        self.underflow += int(counts[0])
+        self.overflow += int(counts[num_bins + 1])
+        return self
+
+    def merge(self: Self, other: "HistogramAccumulator") -> Self:
+        """Adds the counts of another accumulator with identical bins to this one."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("cannot merge histogram accumulators with different bin edges")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def __add__(self: Self, other: "HistogramAccumulator") -> "HistogramAccumulator":
+        return self.copy().merge(other)
+
+    def copy(self: Self) -> "HistogramAccumulator":
+        """Returns a deep copy of the accumulator."""
+        new = HistogramAccumulator(self.edges)
+        return new.merge(self)
+
+    def density(self: Self) -> NDArray:
+        """Returns the probability density per bin (integrating to one over the bins)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.counts / (self.total * np.diff(self.edges))
+
+    def percentile(self: Self, q: float) -> float:
+        """Estimates the `q`-th percentile (0-100) of the values counted in the bins."""
+        return get_hist_percentile(self.counts, self.edges, q)
+
+    def median(self: Self) -> float:
+        """Estimates the median of the values counted in the bins."""
+        return get_hist_median(self.counts, self.edges)
+
+    def mean(self: Self) -> float:
+        """Estimates the mean of the values counted in the bins from the bin centers."""
+        if self.total == 0:
+            return np.nan
+        return get_hist_mean(self.counts, self.centers)
+
+    def save(self: Self, filepath: str) -> None:
+        """Saves the accumulator to a `.npz` file."""
+        savez_atomic(
+            filepath,
+            edges=self.edges,
+            counts=self.counts,
+            underflow=np.int64(self.underflow),
+            overflow=np.int64(self.overflow),
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> "HistogramAccumulator":
+        """Loads an accumulator saved with `HistogramAccumulator.save`."""
+        with np.load(filepath) as data:
+            acc = cls(data["edges"])
+            acc.counts[:] = data["counts"]
+            acc.underflow = int(data["underflow"])
+            acc.overflow = int(data["overflow"])
+        return acc
+
+
+class Histogram2DAccumulator:
+    """Fixed-memory 2D histogram (joint distribution) that is filled chunk by chunk.
+
+    Pairs of values are counted into fixed bins, like `np.histogram2d`, so that `counts` has the
+    shape (len(`xedges`)-1, len(`yedges`)-1). Pairs outside of the bins are counted as
+    `num_outside`, pairs with a NaN are ignored. Height-resolved histograms are 2D histograms whose y-values are heights,
+    see `add_profiles` and `percentile_profile`. Accumulators with the same bins can be merged
+    and saved to and loaded from `.npz` files.
+
+    Attributes:
+        xedges: Monotonically increasing bin edges along x.
+        yedges: Monotonically increasing bin edges along y.
+        counts: Number of value pairs per bin.
+        num_outside: Number of valid value pairs outside of the bins.
+    """
+
+    def __init__(self: Self, xedges: ArrayLike, yedges: ArrayLike) -> None:
+        self.xedges: NDArray = _validate_edges(xedges, "xedges")
+        self.yedges: NDArray = _validate_edges(yedges, "yedges")
+        self.counts: NDArray = np.zeros(
+            (self.xedges.size - 1, self.yedges.size - 1), dtype=np.int64
+        )
+        self.num_outside: int = 0
+
+    @property
+    def xcenters(self: Self) -> NDArray:
+        """Bin centers along x."""
+        return 0.5 * (self.xedges[:-1] + self.xedges[1:])
+
+    @property
+    def ycenters(self: Self) -> NDArray:
+        """Bin centers along y."""
+        return 0.5 * (self.yedges[:-1] + self.yedges[1:])
+
+    @property
+    def total(self: Self) -> int:
+        """Number of value pairs counted in the bins."""
+        return int(self.counts.sum())
+
+    def add(self: Self, xvalues: ArrayLike, yvalues: ArrayLike) -> Self:
+        """Counts a chunk of value pairs into the histogram.
+
+        Args:
+            xvalues: Values along x.
+            yvalues: Values along y, broadcastable to the shape of `xvalues` (e.g., heights
+                of shape (N,) for profiles of shape (M, N)).
+
+        Returns:
+            The accumulator itself.
+        """
+        # Bin indices are found before broadcasting, e.g., only once per height bin
+        xidxs = _get_bin_indices(np.atleast_1d(np.asarray(xvalues, dtype=np.float64)), self.xedges)
+        yidxs = _get_bin_indices(np.atleast_1d(np.asarray(yvalues, dtype=np.float64)), self.yedges)
+        nx, ny = self.counts.shape
+
+        # Pairs below, above or with NaN are counted in extra bins around the histogram
+        flat_idxs = xidxs * (ny + 3) + yidxs
+        counts = np.bincount(flat_idxs.ravel(), minlength=(nx + 3) * (ny + 3))
+        counts = counts.reshape((nx + 3, ny + 3))
+        inside = counts[1 : nx + 1, 1 : ny + 1]
+        self.counts += inside
+        self.num_outside += int(counts[: nx + 2, : ny + 2].sum() - inside.sum())
+        return self
+
+    def add_profiles(self: Self, values: ArrayLike, height: ArrayLike) -> Self:
+        """Counts a chunk of profiles into a height-resolved histogram (values along x, heights
+        along y).
+
+        Args:
+            values: Profile values, shape (M, N) for M profiles with N height bins.
+            height: Heights, shape (N,) or (M, N).
+
+        Returns:
+            The accumulator itself.
+        """
+        values = np.asarray(values)
+        height = np.asarray(height)
+        if height.ndim == 1 and values.ndim == 2 and height.size != values.shape[1]:
+            raise ValueError(
+                f"height of shape {height.shape} does not match profiles of shape {values.shape}"
+            )
+        return self.add(values, height)
+
+    def merge(self: Self, other: "Histogram2DAccumulator") -> Self:
+        """Adds the counts of another accumulator with identical bins to this one."""
+        if not (
+            np.array_equal(self.xedges, other.xedges) and np.array_equal(self.yedges, other.yedges)
+        ):
+            raise ValueError("cannot merge histogram accumulators with different bin edges")
+        self.counts += other.counts
+        self.num_outside += other.num_outside
+        return self
+
+    def __add__(self: Self, other: "Histogram2DAccumulator") -> "Histogram2DAccumulator":
+        return self.copy().merge(other)
+
+    def copy(self: Self) -> "Histogram2DAccumulator":
+        """Returns a deep copy of the accumulator."""
+        new = Histogram2DAccumulator(self.xedges, self.yedges)
+        return new.merge(self)
+
+    def marginal(self: Self, axis: Literal["x", "y"] = "x") -> HistogramAccumulator:
+        """Returns the 1D histogram of the x- or y-values counted in the bins."""
+        if axis == "x":
+            acc = HistogramAccumulator(self.xedges)
+            acc.counts[:] = self.counts.sum(axis=1)
+        elif axis == "y":
+            acc = HistogramAccumulator(self.yedges)
+            acc.counts[:] = self.counts.sum(axis=0)
+        else:
+            raise ValueError(f"invalid axis '{axis}', expected 'x' or 'y'")
+        return acc
+
+    def percentile_profile(self: Self, q: float) -> NDArray:
+        """Estimates the `q`-th percentile (0-100) of the x-values within each y-bin (e.g., per
+        height bin), which is NaN for empty y-bins."""
+        return np.array(
+            [
+                get_hist_percentile(self.counts[:, j], self.xedges, q)
+                for j in range(self.counts.shape[1])
+            ]
+        )
+
+    def median_profile(self: Self) -> NDArray:
+        """Estimates the median of the x-values within each y-bin."""
+        return self.percentile_profile(50)
+
+    def mean_profile(self: Self) -> NDArray:
+        """Estimates the mean of the x-values within each y-bin from the bin centers."""
+        num_per_ybin = self.counts.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.xcenters @ self.counts / num_per_ybin
+
+    def save(self: Self, filepath: str) -> None:
+        """Saves the accumulator to a `.npz` file."""
+        savez_atomic(
+            filepath,
+            xedges=self.xedges,
+            yedges=self.yedges,
+            counts=self.counts,
+            num_outside=np.int64(self.num_outside),
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> "Histogram2DAccumulator":
+        """Loads an accumulator saved with `Histogram2DAccumulator.save`."""
+        with np.load(filepath) as data:
+            acc = cls(data["xedges"], data["yedges"])
+            acc.counts[:] = data["counts"]
+            acc.num_outside = int(data["num_outside"])
+        return acc
@@ -1,14 +1,26 @@
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Final, Iterable, Literal, Protocol, Sequence, Tuple, TypeAlias
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Iterable,
+    Literal,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeAlias,
+)
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 from numpy.typing import ArrayLike, NDArray
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 _TypeTuple: TypeAlias = tuple[type[Any], ...]
 
 Number: TypeAlias = float | int | np.number
@@ -57,10 +69,10 @@
 class HasFigure(Protocol):
     """Protocol for objects exposing a `.fig` attribute of type `matplotlib.figure.Figure`."""
 
-    fig: Figure
+    fig: "Figure"
 
 
 class HasAxes(Protocol):
     """Protocol for objects exposing a `.ax` attribute of type `matplotlib.axes.Axes`."""
 
-    ax: Axes
+    ax: "Axes"
@@ -12,7 +12,20 @@
 ---
 """
 
-from . import _cli, decorator, dict, logging, math, numpy, parse, path, sentinels, time, xarray
+from . import (
+    _cli,
+    decorator,
+    dict,
+    kernels,
+    logging,
+    math,
+    numpy,
+    parse,
+    path,
+    sentinels,
+    time,
+    xarray,
+)
 from ._config import (
     create_example_config,
     get_config,
@@ -31,6 +44,7 @@
     "_cli",
     "decorator",
     "dict",
+    "kernels",
     "logging",
     "math",
     "numpy",
@@ -0,0 +1,37 @@
+"""
+**earthcarekit.utils.kernels**
+
+Registry of numerical kernels with interchangeable backends.
+
+Hot loops (geodesic distances, geo interpolation, height rebinning and rolling means) are
+implemented with NumPy and, if `numba` is installed, additionally as JIT-compiled kernels.
+The backend is selected at import time (`"numba"` if available, `"numpy"` otherwise) and can be
+changed with `set_backend`. Both backends produce the same results.
+
+## Notes
+
+This module does not depend on other internal modules at import time. The modules defining
+the kernels are imported by name on first use of a kernel (see `get_kernel`).
+
+---
+"""
+
+from ._registry import (
+    HAS_NUMBA,
+    KernelBackend,
+    get_available_backends,
+    get_backend,
+    get_kernel,
+    register_kernel,
+    set_backend,
+)
+
+__all__ = [
+    "HAS_NUMBA",
+    "KernelBackend",
+    "get_available_backends",
+    "get_backend",
+    "get_kernel",
+    "register_kernel",
+    "set_backend",
+]
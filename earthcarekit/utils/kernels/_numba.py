@@ -0,0 +1,314 @@
+"""Numba implementations of registered kernels.
+
+The kernels are written as plain Python loops so that this module can be imported without
+`numba`; they are JIT-compiled when `register_numba_kernels` is called. Each kernel mirrors
+the arithmetic of its NumPy counterpart to produce the same results.
+"""
+
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._registry import register_kernel
+
+
+def _vincenty(
+    lat_1: NDArray,
+    lon_1: NDArray,
+    lat_2: NDArray,
+    lon_2: NDArray,
+    tolerance: float,
+    max_iterations: int,
+) -> NDArray:
+    a = 6378137.0
+    f = 1 / 298.257223563
+    b = (1 - f) * a
+
+    n = lat_1.shape[0]
+    distance = np.empty(n)
+    for i in range(n):
+        beta_1 = np.arctan((1 - f) * np.tan(lat_1[i]))
+        beta_2 = np.arctan((1 - f) * np.tan(lat_2[i]))
+        initial_lon_diff = lon_2[i] - lon_1[i]
+        lon_diff = initial_lon_diff
+        sin_beta_1, cos_beta_1 = np.sin(beta_1), np.cos(beta_1)
+        sin_beta_2, cos_beta_2 = np.sin(beta_2), np.cos(beta_2)
+
+        sin_sigma = cos_sigma = sigma = cos2_alpha = cos2_sigma_m = 0.0
+        for _ in range(max_iterations):
+            sin_lon_diff, cos_lon_diff = np.sin(lon_diff), np.cos(lon_diff)
+
+            sin_sigma = np.sqrt(
+                (cos_beta_2 * sin_lon_diff) ** 2
+                + (cos_beta_1 * sin_beta_2 - sin_beta_1 * cos_beta_2 * cos_lon_diff) ** 2
+            )
+            cos_sigma = (sin_beta_1 * sin_beta_2) + (cos_beta_1 * cos_beta_2 * cos_lon_diff)
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+
+            sin_alpha = 0.0
+            if sin_sigma != 0.0:
+                sin_alpha = cos_beta_1 * cos_beta_2 * sin_lon_diff / sin_sigma
+            if np.isnan(sin_alpha):
+                sin_alpha = 0.0
+            cos2_alpha = 1 - sin_alpha**2
+
+            cos2_sigma_m = 0.0
+            if cos2_alpha != 0.0:
+                cos2_sigma_m = cos_sigma - ((2 * sin_beta_1 * sin_beta_2) / cos2_alpha)
+            if np.isnan(cos2_sigma_m):
+                cos2_sigma_m = 0.0
+
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+
+            previous_lon_diff = lon_diff
+            lon_diff = initial_lon_diff + (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos2_sigma_m + C * cos_sigma * (-1 + 2 * cos2_sigma_m**2))
+            )
+            if np.abs(lon_diff - previous_lon_diff) < tolerance:
+                break
+
+        u2 = cos2_alpha * (a**2 - b**2) / b**2
+        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+
+        delta_sigma = (
+            B
+            * sin_sigma
+            * (
+                cos2_sigma_m
+                + B
+                / 4
+                * (
+                    cos_sigma * (-1 + 2 * cos2_sigma_m**2)
+                    - B / 6 * cos2_sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos2_sigma_m**2)
+                )
+            )
+        )
+        distance[i] = b * A * (sigma - delta_sigma)
+    return distance
+
+
+def _haversine(
+    phi_1: NDArray,
+    lambda_1: NDArray,
+    phi_2: NDArray,
+    lambda_2: NDArray,
+    radius: float,
+) -> NDArray:
+    n = phi_1.shape[0]
+    d = np.empty(n)
+    for i in range(n):
+        h = (1 - np.cos(phi_2[i] - phi_1[i])) / 2 + np.cos(phi_1[i]) * np.cos(phi_2[i]) * (
+            (1 - np.cos(lambda_2[i] - lambda_1[i])) / 2
+        )
+        d[i] = 2 * radius * np.arcsin(np.sqrt(h))
+    return d
+
+
+def _geo_lerp(
+    lat0: NDArray,
+    lon0: NDArray,
+    lat1: NDArray,
+    lon1: NDArray,
+    w: NDArray,
+) -> tuple[NDArray, NDArray]:
+    n = lat0.shape[0]
+    lat = np.empty(n)
+    lon = np.empty(n)
+    for i in range(n):
+        phi0, lambda0 = np.radians(lat0[i]), np.radians(lon0[i])
+        phi1, lambda1 = np.radians(lat1[i]), np.radians(lon1[i])
+        x0, y0, z0 = np.cos(phi0) * np.cos(lambda0), np.cos(phi0) * np.sin(lambda0), np.sin(phi0)
+        x1, y1, z1 = np.cos(phi1) * np.cos(lambda1), np.cos(phi1) * np.sin(lambda1), np.sin(phi1)
+
+        cx = y0 * z1 - z0 * y1
+        cy = z0 * x1 - x0 * z1
+        cz = x0 * y1 - y0 * x1
+        omega = np.arctan2(np.sqrt(cx**2 + cy**2 + cz**2), x0 * x1 + y0 * y1 + z0 * z1)
+        sin_omega = np.sin(omega)
+
+        if sin_omega > 1e-12:
+            s0 = np.sin((1 - w[i]) * omega) / sin_omega
+            s1 = np.sin(w[i] * omega) / sin_omega
+            x = s0 * x0 + s1 * x1
+            y = s0 * y0 + s1 * y1
+            z = s0 * z0 + s1 * z1
+        elif omega > np.pi / 2:
+            # Antipodal points: follow the great circle through the poles (or lon=0 at the poles)
+            norm = np.sqrt(max(1 - z0**2, 0.0))
+            if norm < 1e-12:
+                mx, my, mz = 1.0, 0.0, 0.0
+            else:
+                mx, my, mz = -z0 * x0 / norm, -z0 * y0 / norm, norm
+            c, s = np.cos(w[i] * omega), np.sin(w[i] * omega)
+            x = c * x0 + s * mx
+            y = c * y0 + s * my
+            z = c * z0 + s * mz
+        else:
+            x = (1 - w[i]) * x0 + w[i] * x1
+            y = (1 - w[i]) * y0 + w[i] * y1
+            z = (1 - w[i]) * z0 + w[i] * z1
+
+        lat[i] = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        lon[i] = np.degrees(np.arctan2(y, x))
+    return lat, lon
+
+
+def _rebin_height_mean(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
+    n, m = h.shape
+    m_new = h_new.shape[1]
+
+    v_new = np.empty((n, m_new))
+    edges = np.empty(m_new + 1)
+    sums = np.empty(m_new)
+    counts = np.empty(m_new, dtype=np.int64)
+    for i in range(n):
+        # Bin edges halfway between centers (see `centers_to_bins`)
+        for k in range(m_new):
+            d = h_new[i, 1] - h_new[i, 0] if k == 0 else h_new[i, k] - h_new[i, k - 1]
+            edges[k] = h_new[i, k] - d / 2
+        edges[m_new] = h_new[i, m_new - 1] + (h_new[i, m_new - 1] - h_new[i, m_new - 2]) / 2
+        is_decreasing = edges[0] > edges[m_new]
+        sorted_edges = edges[::-1] if is_decreasing else edges
+
+        sums[:] = 0.0
+        counts[:] = 0
+        for j in range(m):
+            x = v[i, j]
+            if not np.isfinite(x):
+                continue
+
+            # Same as `np.digitize`, i.e. `np.searchsorted(..., side="right")` with NaNs last
+            y = h[i, j]
+            lo, hi = 0, m_new + 1
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if sorted_edges[mid] <= y or np.isnan(y):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            b = (m_new + 1 - lo if is_decreasing else lo) - 1
+            b = min(max(b, 0), m_new - 1)
+
+            sums[b] += x
+            counts[b] += 1
+
+        for k in range(m_new):
+            v_new[i, k] = sums[k] / counts[k] if counts[k] > 0 else np.nan
+    return v_new
+
+
+def _rebin_height_lerp(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
+    n, m = h.shape
+    m_new = h_new.shape[1]
+
+    v_new = np.empty((n, m_new))
+    for i in range(n):
+        for k in range(m_new):
+            # Same as `np.searchsorted(..., side="left")` with NaNs last
+            y = h_new[i, k]
+            lo, hi = 0, m
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if h[i, mid] < y or (np.isnan(y) and not np.isnan(h[i, mid])):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            idx = min(max(lo, 1), m - 1)
+
+            h0 = h[i, idx - 1]
+            dh = h[i, idx] - h0
+            v0 = v[i, idx - 1]
+            dv = v[i, idx] - v0
+            w = (y - h0) / dh if dh != 0.0 else 0.0
+            v_new[i, k] = v0 + w * dv
+    return v_new
+
+
+def _rolling_mean_1d(a: NDArray, w: int) -> NDArray:
+    n = max(a.shape[0] - w + 1, 0)
+    result = np.empty(n)
+    for i in range(n):
+        total = 0.0
+        count = 0
+        for k in range(i, i + w):
+            if not np.isnan(a[k]):
+                total += a[k]
+                count += 1
+        result[i] = total / count if count > 0 else np.nan
+    return result
+
+
+def _rolling_mean_2d(a: NDArray, w: int, axis: int) -> NDArray:
+    # Same cumulative sums as the NumPy kernel, so that window sums are identical. Rows are
+    # traversed in memory order; for axis 0, only the last `w + 1` cumulative rows are kept.
+    if axis == 0:
+        n, m = a.shape
+        n_out = max(n - w + 1, 0)
+        out = np.empty((n_out, m))
+        cum_sum = np.zeros((w + 1, m))
+        valid_cum_sum = np.zeros((w + 1, m), dtype=np.int64)
+        for i in range(n):
+            r_prev, r = i % (w + 1), (i + 1) % (w + 1)
+            for j in range(m):
+                x = a[i, j]
+                if np.isfinite(x):
+                    cum_sum[r, j] = cum_sum[r_prev, j] + x
+                    valid_cum_sum[r, j] = valid_cum_sum[r_prev, j] + 1
+                else:
+                    cum_sum[r, j] = cum_sum[r_prev, j] + 0.0
+                    valid_cum_sum[r, j] = valid_cum_sum[r_prev, j]
+            k = i + 1 - w
+            if k >= 0:
+                r_k = k % (w + 1)
+                for j in range(m):
+                    count = valid_cum_sum[r, j] - valid_cum_sum[r_k, j]
+                    out[k, j] = (cum_sum[r, j] - cum_sum[r_k, j]) / count if count > 0 else np.nan
+        return out
+
+    m, n = a.shape
+    n_out = max(n - w + 1, 0)
+    out = np.empty((m, n_out))
+    cum_sum = np.empty(n + 1)
+    valid_cum_sum = np.empty(n + 1, dtype=np.int64)
+    for j in range(m):
+        cum_sum[0] = 0.0
+        valid_cum_sum[0] = 0
+        for i in range(n):
+            x = a[j, i]
+            if np.isfinite(x):
+                cum_sum[i + 1] = cum_sum[i] + x
+                valid_cum_sum[i + 1] = valid_cum_sum[i] + 1
+            else:
+                cum_sum[i + 1] = cum_sum[i] + 0.0
+                valid_cum_sum[i + 1] = valid_cum_sum[i]
+
+        for i in range(n_out):
+            count = valid_cum_sum[i + w] - valid_cum_sum[i]
+            out[j, i] = (cum_sum[i + w] - cum_sum[i]) / count if count > 0 else np.nan
+    return out
+
+
+_NUMBA_KERNELS: dict[str, Callable] = {
+    "vincenty": _vincenty,
+    "haversine": _haversine,
+    "geo_lerp": _geo_lerp,
+    "rebin_height_mean": _rebin_height_mean,
+    "rebin_height_lerp": _rebin_height_lerp,
+    "rolling_mean_1d": _rolling_mean_1d,
+    "rolling_mean_2d": _rolling_mean_2d,
+}
+
+
+def register_numba_kernels() -> None:
+    """JIT-compiles (lazily, on first call) and registers all kernels of this module.
+
+    Raises:
+        ImportError: If `numba` is not installed.
+    """
+    import numba  # type: ignore
+
+    jit = numba.njit(cache=True, nogil=True, error_model="numpy")
+    for name, func in _NUMBA_KERNELS.items():
+        register_kernel(name, "numba")(jit(func))
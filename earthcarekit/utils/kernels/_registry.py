@@ -0,0 +1,106 @@
+import importlib
+import importlib.util
+import logging
+from typing import Callable, Final, Literal, TypeAlias, TypeVar, get_args
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+KernelBackend: TypeAlias = Literal["numpy", "numba"]
+
+HAS_NUMBA: Final[bool] = importlib.util.find_spec("numba") is not None
+
+_F = TypeVar("_F", bound=Callable)
+
+_KERNELS: dict[str, dict[KernelBackend, Callable]] = {}
+
+# Modules registering the NumPy implementation of each kernel; imported on first use of a
+# kernel, since submodules of `earthcarekit` are loaded lazily
+_KERNEL_MODULES: Final[dict[str, str]] = {
+    "vincenty": "earthcarekit.geo.distance._vincenty",
+    "haversine": "earthcarekit.geo.distance._haversine",
+    "geo_lerp": "earthcarekit.geo.interpolate",
+    "rebin_height_lerp": "earthcarekit.data.profile._rebin",
+    "rebin_height_mean": "earthcarekit.data.profile._rebin",
+    "rolling_mean_1d": "earthcarekit.utils.numpy._rolling_mean",
+    "rolling_mean_2d": "earthcarekit.utils.numpy._rolling_mean",
+}
+_backend: KernelBackend = "numba" if HAS_NUMBA else "numpy"
+_is_numba_loaded: bool = False
+
+
+def register_kernel(name: str, backend: KernelBackend = "numpy") -> Callable[[_F], _F]:
+    """Decorator registering a function as the `backend` implementation of kernel `name`.
+
+    Every kernel needs a `"numpy"` implementation, which is used as fallback for other backends.
+    Kernels defined in `earthcarekit` are listed in `_KERNEL_MODULES`, so that `get_kernel`
+    can import their module if it is not loaded yet.
+    """
+
+    def decorator(func: _F) -> _F:
+        _KERNELS.setdefault(name, {})[backend] = func
+        return func
+
+    return decorator
+
+
+def get_available_backends() -> list[KernelBackend]:
+    """Returns the backends that can be used in the current environment."""
+    return [b for b in get_args(KernelBackend) if b != "numba" or HAS_NUMBA]
+
+
+def get_backend() -> KernelBackend:
+    """Returns the currently selected kernel backend."""
+    return _backend
+
+
+def set_backend(backend: KernelBackend) -> None:
+    """Selects the backend used by all kernels.
+
+    Args:
+        backend: `"numba"` for JIT-compiled kernels (requires `numba`) or `"numpy"`.
+
+    Raises:
+        ValueError: If the backend is unknown or not available.
+    """
+    global _backend
+    if backend not in get_available_backends():
+        raise ValueError(
+            f"invalid kernel backend '{backend}', available: {get_available_backends()}"
+        )
+    _backend = backend
+
+
+def _load_numba_kernels() -> bool:
+    global _is_numba_loaded, _backend
+    if not _is_numba_loaded:
+        try:
+            from ._numba import register_numba_kernels
+
+            register_numba_kernels()
+            _is_numba_loaded = True
+        except Exception as e:
+            logger.warning(f"Failed to load numba kernels, falling back to numpy: {e}")
+            _backend = "numpy"
+    return _is_numba_loaded
+
+
+def get_kernel(name: str, backend: KernelBackend | None = None) -> Callable:
+    """Returns the implementation of kernel `name` for the selected (or given) backend.
+
+    Numba kernels are compiled on first use; kernels without an implementation for the
+    backend fall back to NumPy. If the kernel is not registered yet, its defining module is
+    imported first.
+
+    Raises:
+        KeyError: If no kernel with this name is registered.
+    """
+    if "numpy" not in _KERNELS.get(name, {}) and name in _KERNEL_MODULES:
+        importlib.import_module(_KERNEL_MODULES[name])
+
+    if backend is None:
+        backend = _backend
+    if backend == "numba" and not _load_numba_kernels():
+        backend = "numpy"
+
+    implementations = _KERNELS[name]
+    return implementations.get(backend, implementations["numpy"])
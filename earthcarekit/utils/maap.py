@@ -8,17 +8,20 @@
 See comments below for attribution.
 """
 
+import threading
+import time
+
 import requests
 
 from ._config import ECKConfig, get_config
 
 
-def _get_maap_access_token(offline_token: str) -> str:
-    """Retrieves MAAP access token from generated offline token"""
+def _request_maap_access_token(offline_token: str) -> dict:
+    """Retrieves the IAM response holding a MAAP access token for the generated offline token"""
     # The code of this function was adapted from ESA code by Saskia Brose (© ESA, 2025 - European Space Agency Community License)
     # By explicit permission of the author this code is licensed for use under Apache-2.0.
     # Original available at https://catalog.maap.eo.esa.int/doc/examples/ESAMAAP_ecdataaccess.html# (accessed 2025-12-08)
-    # Changes: Minor variable renames
+    # Changes: Minor variable renames, returns the whole response to expose the token lifetime
     client_id = "offline-token"
     client_secret = "p1eL7uonXs6MDxtGbgKdPVRAmnGxHpVE"
     url = "https://iam.maap.eo.esa.int/realms/esa-maap/protocol/openid-connect/token"
@@ -39,7 +42,70 @@ def _get_maap_access_token(offline_token: str) -> str:
     if not access_token:
         raise RuntimeError("Failed to retrieve access token from IAM response")
 
-    return access_token
+    return response_json
+
+
+def _get_maap_access_token(offline_token: str) -> str:
+    """Retrieves MAAP access token from generated offline token"""
+    return _request_maap_access_token(offline_token)["access_token"]
+
+
+class _MaapAuth(requests.auth.AuthBase):
+    """Bearer authentication for MAAP requests that keeps the access token valid.
+
+    The access token is refreshed shortly before it expires and, once per request, when the
+    server answers with 401 Unauthorized. Instances are thread-safe and can be shared by the
+    workers of a `requests.Session`.
+
+    Args:
+        offline_token: Offline token used to retrieve access tokens.
+        expiry_margin_seconds: Refresh the access token this many seconds before it expires.
+    """
+
+    def __init__(self, offline_token: str, expiry_margin_seconds: float = 60.0):
+        self.offline_token = offline_token
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self._access_token: str | None = None
+        self._expires_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def get_access_token(self, stale_token: str | None = None) -> str:
+        """Returns a valid access token, refreshing it if expired or equal to `stale_token`."""
+        with self._lock:
+            is_expired = time.monotonic() >= self._expires_at - self.expiry_margin_seconds
+            if self._access_token is None or is_expired or self._access_token == stale_token:
+                response_json = _request_maap_access_token(self.offline_token)
+                self._access_token = response_json["access_token"]
+                # Without a given lifetime the token is only refreshed on 401 responses
+                self._expires_at = time.monotonic() + float(
+                    response_json.get("expires_in", float("inf"))
+                )
+            return self._access_token
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = "Bearer " + self.get_access_token()
+        r.register_hook("response", self._handle_401)
+        return r
+
+    def _handle_401(self, r: requests.Response, **kwargs) -> requests.Response:
+        """Resends the request once with a refreshed access token if it was unauthorized."""
+        if r.status_code != 401 or getattr(r.request, "_is_maap_auth_retry", False):
+            return r
+
+        stale_token = str(r.request.headers.get("Authorization", "")).removeprefix("Bearer ")
+        access_token = self.get_access_token(stale_token=stale_token)
+
+        # Release the connection before sending the request again
+        r.content
+        r.close()
+
+        prepared_request = r.request.copy()
+        prepared_request.headers["Authorization"] = "Bearer " + access_token
+        prepared_request._is_maap_auth_retry = True  # type: ignore[attr-defined]
+        retried_response = r.connection.send(prepared_request, **kwargs)  # type: ignore[attr-defined]
+        retried_response.history.append(r)
+        retried_response.request = prepared_request
+        return retried_response
 
 
 def get_maap_access_token(
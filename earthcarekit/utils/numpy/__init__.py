@@ -5,7 +5,9 @@
 
 ## Notes
 
-This module does not depend on other internal modules.
+This module depends on other internal modules:
+
+- [earthcarekit.utils.kernels][]
 
 ---
 """
@@ -20,10 +22,11 @@
 from ._flatten import flatten_array
 from ._misc import get_number_range, lookup_value_by_number
 from ._normalize import normalize
-from ._rebin import rebin_lerp, rebin_mean, rebin_median
+from ._rebin import rebin_count, rebin_lerp, rebin_mean, rebin_median, rebin_std
 from ._rescale import rescale
 from ._rolling_mean import rolling_mean_1d, rolling_mean_2d
 from ._round_to_step import step_ceil, step_floor, step_round
+from ._savez import savez_atomic
 from ._true_sequence import pad_true_sequence, pad_true_sequence_2d, shift_true_sequence
 
 __all__ = [
@@ -45,10 +48,13 @@
     "get_number_range",
     "lookup_value_by_number",
     "normalize",
+    "rebin_count",
     "rebin_lerp",
     "rebin_mean",
     "rebin_median",
+    "rebin_std",
     "rescale",
+    "savez_atomic",
     "step_ceil",
     "step_floor",
     "step_round",
@@ -19,18 +19,18 @@ def centers_to_bins(centers: ArrayLike) -> NDArray:
     """Estimates bin edges from bin centers, assuming edges lie halfway between centers.
 
     Args:
-        centers: Array of N bin centers.
+        centers: Array of N bin centers; for N-D arrays, edges are estimated along the last axis.
 
     Returns:
         An array of N+1 bin edges.
     """
     centers = np.asarray(centers)
 
-    d1 = np.diff(centers)
-    d2 = np.append(d1[0], d1)
-    d3 = np.append(d1, d1[-1])
+    d1 = np.diff(centers, axis=-1)
+    d2 = np.concatenate((d1[..., :1], d1), axis=-1)
+    d3 = np.concatenate((d1, d1[..., -1:]), axis=-1)
 
     bins1 = centers - d2 / 2
     bins2 = centers + d3 / 2
 
-    return np.append(bins1, bins2[-1])
+    return np.concatenate((bins1, bins2[..., -1:]), axis=-1)
@@ -1,3 +1,5 @@
+from ._rebin_count import rebin_count
 from ._rebin_lerp import rebin_lerp
 from ._rebin_mean import rebin_mean
 from ._rebin_median import rebin_median
+from ._rebin_std import rebin_std
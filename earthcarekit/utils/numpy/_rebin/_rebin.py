@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Literal
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
@@ -48,3 +48,55 @@ def _rebin(
         return func1d(v, v_new, rebin_index, ignore_nans)
     else:
         raise ValueError(f"{v.ndim}d array not supported: requires 1d or 2d")
+
+
+def _get_cell_index(rebin_index: NDArray, num_columns: int) -> NDArray:
+    """Maps each element of a 2D array to the flat index of its (bin, column) cell."""
+    return rebin_index[:, np.newaxis] * num_columns + np.arange(num_columns)
+
+
+def _bincount_cells(
+    cell_index: NDArray,
+    shape: tuple[int, int],
+    weights: NDArray | None = None,
+) -> NDArray:
+    """Sums `weights` (or counts elements) per cell of a 2D output grid with one `np.bincount`."""
+    size = shape[0] * shape[1]
+    return np.bincount(cell_index, weights=weights, minlength=size).reshape(shape)
+
+
+def _searchsorted_rows(
+    a: NDArray,
+    v: NDArray,
+    side: Literal["left", "right"] = "left",
+) -> NDArray:
+    """Row-wise `np.searchsorted` of a 2D array `v` in the ascending rows of a 2D array `a`.
+
+    Runs a binary search over all rows at once; NaNs are sorted to the end like in NumPy.
+    """
+    m = a.shape[1]
+    lo = np.zeros(v.shape, dtype=np.intp)
+    hi = np.full(v.shape, m, dtype=np.intp)
+    v_nan = np.isnan(v)
+    for _ in range(m.bit_length()):
+        active = lo < hi
+        mid = (lo + hi) // 2
+        a_mid = np.take_along_axis(a, np.minimum(mid, m - 1), axis=1)
+        if side == "left":
+            is_right = (a_mid < v) | (v_nan & ~np.isnan(a_mid))
+        else:
+            is_right = (a_mid <= v) | v_nan
+        lo = np.where(active & is_right, mid + 1, lo)
+        hi = np.where(active & ~is_right, mid, hi)
+    return lo
+
+
+def _digitize_rows(x: NDArray, bins: NDArray) -> NDArray:
+    """Row-wise `np.digitize` of a 2D array `x` with the monotonic rows of a 2D array `bins`."""
+    if np.all(bins == bins[0]):
+        return np.digitize(x, bins[0])
+
+    is_decreasing = (bins[:, 0] > bins[:, -1])[:, np.newaxis]
+    bins = np.where(is_decreasing, bins[:, ::-1], bins)
+    idx = _searchsorted_rows(bins, x, side="right")
+    return np.where(is_decreasing, bins.shape[1] - idx, idx)
@@ -0,0 +1,56 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._rebin import _bincount_cells, _get_cell_index, _rebin
+
+
+def _rebin_count_1d(
+    v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
+) -> NDArray:
+    if ignore_nans:
+        rebin_index = rebin_index[np.isfinite(v)]
+    return np.bincount(rebin_index, minlength=len(v_new))
+
+
+def _rebin_count_2d(
+    v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
+) -> NDArray:
+    cell_index = _get_cell_index(rebin_index, v.shape[1])
+    if ignore_nans:
+        cell_index = cell_index[np.isfinite(v)]
+    else:
+        cell_index = cell_index.ravel()
+    return _bincount_cells(cell_index, v_new.shape)
+
+
+def rebin_count(
+    v: ArrayLike,
+    rebin_index: ArrayLike | None = None,
+    axis0_coords: ArrayLike | None = None,
+    bin_edges: ArrayLike | None = None,
+    bin_centers: ArrayLike | None = None,
+    ignore_nans: bool = True,
+) -> NDArray:
+    """Counts the samples of 1D or 2D arrays within bins along axis 0.
+
+    Args:
+        v: 1D or 2D array to rebin.
+        rebin_index: Bin indices mapping `v` to target bins; derived if None.
+        axis0_coords: Reference values for deriving `rebin_index`; required if `rebin_index` is None.
+        bin_edges: Bin edges (N+1); used to derive `rebin_index` if given.
+        bin_centers: Bin centers (N); used to derive `rebin_index` if given.
+        ignore_nans: Count only finite samples if True; count all samples otherwise.
+
+    Returns:
+        Integer array of sample counts per bin along axis 0.
+    """
+    return _rebin(
+        func1d=_rebin_count_1d,
+        func2d=_rebin_count_2d,
+        v=v,
+        rebin_index=rebin_index,
+        axis0_coords=axis0_coords,
+        bin_edges=bin_edges,
+        bin_centers=bin_centers,
+        ignore_nans=ignore_nans,
+    )
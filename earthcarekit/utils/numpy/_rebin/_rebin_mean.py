@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
-from ._rebin import _rebin
+from ._rebin import _bincount_cells, _get_cell_index, _rebin
 
 
 def _rebin_nanmean_1d(v: NDArray, v_new: NDArray, rebin_index: NDArray) -> NDArray:
@@ -31,10 +31,17 @@ def _rebin_mean_1d(
 def _rebin_mean_2d(
     v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
 ) -> NDArray:
-    func = _rebin_nanmean_1d if ignore_nans else _rebin_mean_keep_nans_1d
+    cell_index = _get_cell_index(rebin_index, v.shape[1])
+    if ignore_nans:
+        mask = np.isfinite(v)
+        cell_index, weights = cell_index[mask], v[mask]
+    else:
+        cell_index, weights = cell_index.ravel(), v.ravel()
 
-    for j in range(v.shape[1]):
-        v_new[:, j] = func(v[:, j], v_new[:, j], rebin_index)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_new[:] = _bincount_cells(cell_index, v_new.shape, weights) / _bincount_cells(
+            cell_index, v_new.shape
+        )
     return v_new
 
 
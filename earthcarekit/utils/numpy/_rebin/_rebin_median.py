@@ -1,51 +1,69 @@
-import warnings
-
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
 from ._rebin import _rebin
 
 
-def _get_chunk_nanmedian(chunk: NDArray):
-    with warnings.catch_warnings():  # ignore warings about all-nan values
-        warnings.simplefilter("ignore", category=RuntimeWarning)
-        return np.nanmedian(chunk, axis=0)
+def _sort_segments(v_sorted: NDArray, starts: NDArray, ends: NDArray) -> NDArray:
+    """Sorts the values of each row segment per column (NaNs last) into a NaN-padded 3D array."""
+    lengths = ends - starts
+    segment = np.repeat(np.arange(len(starts)), lengths)
+    position = np.arange(len(v_sorted)) - starts[segment]
 
+    padded = np.full((len(starts), int(lengths.max()), v_sorted.shape[1]), np.nan)
+    padded[segment, position] = v_sorted
+    padded.sort(axis=1)
+    return padded
 
-def _get_chunk_median(chunk: NDArray):
-    n = len(chunk)
-    k = n // 2
 
-    tmp = np.partition(chunk, k, axis=0)
+def _sort_segments_lexsort(
+    v_sorted: NDArray, bins_sorted: NDArray, starts: NDArray, ends: NDArray
+) -> NDArray:
+    """Like `_sort_segments` but without padding, for bins of very different sizes."""
+    columns = v_sorted.T
+    order = np.lexsort((columns, np.broadcast_to(bins_sorted, columns.shape)), axis=-1)
+    columns = np.take_along_axis(columns, order, axis=-1).T
 
-    if n % 2:
-        return tmp[k]
-    else:
-        tmp2 = np.partition(chunk, k - 1, axis=0)
-        return (tmp[k] + tmp2[k - 1]) * 0.5
+    lengths = ends - starts
+    position = np.minimum(np.arange(int(lengths.max())), lengths[:, np.newaxis] - 1)
+    padded = columns[starts[:, np.newaxis] + position]
+    padded[np.arange(padded.shape[1]) >= lengths[:, np.newaxis]] = np.nan
+    return padded
 
 
 def _rebin_median(
     v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
 ) -> NDArray:
-    func = _get_chunk_nanmedian if ignore_nans else _get_chunk_median
+    # Sorted-segment reduction: samples are grouped by bin and sorted by value (NaNs last)
+    # for all bins and columns at once, then each median is read from the segment's middle.
+    v2d = v.reshape(v.shape[0], -1)
+    v_new2d = v_new.reshape(v_new.shape[0], -1)
 
     if not np.all(rebin_index[:-1] <= rebin_index[1:]):
-        order = np.argsort(rebin_index)
+        order = np.argsort(rebin_index, kind="stable")
         bins_sorted = rebin_index[order]
-        v_sorted = v[order]
+        v_sorted = v2d[order]
     else:
         bins_sorted = rebin_index
-        v_sorted = v
+        v_sorted = v2d
 
     edges = np.flatnonzero(np.diff(bins_sorted)) + 1
     starts = np.append(0, edges)
     ends = np.append(edges, len(bins_sorted))
 
-    for start, end in zip(starts, ends):
-        b = bins_sorted[start]
-        chunk = v_sorted[start:end]
-        v_new[b] = func(chunk)
+    if len(starts) * int(np.max(ends - starts)) <= 2 * len(bins_sorted):
+        segments = _sort_segments(v_sorted, starts, ends)
+    else:
+        segments = _sort_segments_lexsort(v_sorted, bins_sorted, starts, ends)
+
+    num_valid = np.sum(~np.isnan(segments), axis=1)
+    if not ignore_nans:
+        # Like `np.median`, bins containing NaNs have a NaN median
+        num_valid = np.where(num_valid < (ends - starts)[:, np.newaxis], 0, num_valid)
+
+    lo = np.take_along_axis(segments, (np.maximum(num_valid - 1, 0) // 2)[:, np.newaxis], axis=1)
+    hi = np.take_along_axis(segments, (num_valid // 2)[:, np.newaxis], axis=1)
+    v_new2d[bins_sorted[starts]] = np.where(num_valid > 0, (lo[:, 0] + hi[:, 0]) * 0.5, np.nan)
 
     return v_new
 
@@ -0,0 +1,62 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._rebin import _bincount_cells, _get_cell_index, _rebin
+
+
+def _rebin_std_1d(
+    v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
+) -> NDArray:
+    return _rebin_std_2d(v[:, np.newaxis], v_new[:, np.newaxis], rebin_index, ignore_nans)[:, 0]
+
+
+def _rebin_std_2d(
+    v: NDArray, v_new: NDArray, rebin_index: NDArray, ignore_nans: bool = True
+) -> NDArray:
+    cell_index = _get_cell_index(rebin_index, v.shape[1])
+    if ignore_nans:
+        mask = np.isfinite(v)
+        cell_index, weights = cell_index[mask], v[mask]
+    else:
+        cell_index, weights = cell_index.ravel(), v.ravel()
+
+    # Two passes (mean first, then squared deviations) to avoid cancellation errors
+    counts = _bincount_cells(cell_index, v_new.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = _bincount_cells(cell_index, v_new.shape, weights) / counts
+        deviations = weights - mean.ravel()[cell_index]
+        v_new[:] = np.sqrt(_bincount_cells(cell_index, v_new.shape, deviations**2) / counts)
+    return v_new
+
+
+def rebin_std(
+    v: ArrayLike,
+    rebin_index: ArrayLike | None = None,
+    axis0_coords: ArrayLike | None = None,
+    bin_edges: ArrayLike | None = None,
+    bin_centers: ArrayLike | None = None,
+    ignore_nans: bool = True,
+) -> NDArray:
+    """Rebins 1D or 2D arrays along axis 0 by computing the standard deviation within bins.
+
+    Args:
+        v: 1D or 2D array to rebin.
+        rebin_index: Bin indices mapping `v` to target bins; derived if None.
+        axis0_coords: Reference values for deriving `rebin_index`; required if `rebin_index` is None.
+        bin_edges: Bin edges (N+1); used to derive `rebin_index` if given.
+        bin_centers: Bin centers (N); used to derive `rebin_index` if given.
+        ignore_nans: Ignore NaNs if True; bins with NaN return NaN otherwise.
+
+    Returns:
+        Rebinned array of population standard deviations (`ddof=0`) along axis 0.
+    """
+    return _rebin(
+        func1d=_rebin_std_1d,
+        func2d=_rebin_std_2d,
+        v=v,
+        rebin_index=rebin_index,
+        axis0_coords=axis0_coords,
+        bin_edges=bin_edges,
+        bin_centers=bin_centers,
+        ignore_nans=ignore_nans,
+    )
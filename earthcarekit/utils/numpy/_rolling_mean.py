@@ -3,31 +3,20 @@
 import numpy as np
 from numpy.typing import NDArray
 
+from ..kernels import get_kernel, register_kernel
 
-def rolling_mean_1d(a: NDArray, w: int, is_pad: bool = True) -> NDArray:
-    if w > len(a):
-        return np.full(len(a), np.nan)
 
+@register_kernel("rolling_mean_1d")
+def _rolling_mean_1d(a: NDArray, w: int) -> NDArray:
     windows = np.lib.stride_tricks.sliding_window_view(a, w)
 
     with warnings.catch_warnings():  # ignore warings about all-nan values
         warnings.simplefilter("ignore", category=RuntimeWarning)
-        result = np.nanmean(windows, axis=-1)
-
-    if is_pad:
-        left_pad = np.full(w // 2, np.nan)
-        right_pad = np.full((w - 1) // 2, np.nan)
-        return np.concatenate([left_pad, result, right_pad])
-    else:
-        return result
+        return np.nanmean(windows, axis=-1)
 
 
-def rolling_mean_2d(
-    a: NDArray,
-    w: int,
-    axis: int = 1,
-    is_pad: bool = True,
-) -> NDArray:
+@register_kernel("rolling_mean_2d")
+def _rolling_mean_2d(a: NDArray, w: int, axis: int) -> NDArray:
     pad_width = [(0, 0), (0, 0)]
     pad_width[axis] = (1, 0)
 
@@ -49,7 +38,30 @@ def rolling_mean_2d(
 
     valid_sum = valid_sum.astype(float)
     valid_sum[valid_sum == 0] = np.nan
-    out = roll_sum / valid_sum
+    return roll_sum / valid_sum
+
+
+def rolling_mean_1d(a: NDArray, w: int, is_pad: bool = True) -> NDArray:
+    if w > len(a):
+        return np.full(len(a), np.nan)
+
+    result = get_kernel("rolling_mean_1d")(a, w)
+
+    if is_pad:
+        left_pad = np.full(w // 2, np.nan)
+        right_pad = np.full((w - 1) // 2, np.nan)
+        return np.concatenate([left_pad, result, right_pad])
+    else:
+        return result
+
+
+def rolling_mean_2d(
+    a: NDArray,
+    w: int,
+    axis: int = 1,
+    is_pad: bool = True,
+) -> NDArray:
+    out = get_kernel("rolling_mean_2d")(a, w, axis)
 
     if is_pad:
         pad_width = [(0, 0), (0, 0)]
@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def savez_atomic(filepath: str, **arrays: ArrayLike) -> None:
+    """Writes arrays to a `.npz` file via a temporary file, so readers never see partial files.
+
+    The temporary file has a unique name in the directory of `filepath` and replaces the target
+    file once written, so that concurrent writers (threads or processes) do not interfere.
+
+    Args:
+        filepath: Path of the `.npz` file; missing parent directories are created.
+        **arrays: Arrays to save by name (see `numpy.savez`).
+    """
+    dirpath = os.path.dirname(filepath)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
+    fd, tmp_filepath = tempfile.mkstemp(
+        suffix=".tmp.npz",
+        prefix=f"{os.path.basename(filepath)}.",
+        dir=dirpath or None,
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)  # type: ignore
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
@@ -10,7 +10,7 @@
 ---
 """
 
-from ._concat import concat_datasets
+from ._concat import concat_dataset_list, concat_datasets
 from ._delete import remove_dims
 from ._demote_coordinate_dimension import demote_coords
 from ._fill_values import _convert_all_fill_values_to_nan
@@ -20,6 +20,7 @@
 
 __all__ = [
     "concat_datasets",
+    "concat_dataset_list",
     "remove_dims",
     "insert_var",
     "merge_datasets",
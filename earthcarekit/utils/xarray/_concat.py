@@ -1,7 +1,26 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
+
 import numpy as np
 import xarray as xr
 from xarray import Dataset
 
+SCALAR_CONCAT_DIM = "concat_dim"
+
+
+def _get_fill_value(dtype: np.dtype, int_fill: int = -9999) -> Any:
+    """Returns the value used to pad variables of the given dtype."""
+    if np.issubdtype(dtype, np.integer):
+        if np.iinfo(dtype).min <= int_fill:
+            return int_fill
+        return np.iinfo(dtype).min
+    if np.issubdtype(dtype, np.datetime64) or np.issubdtype(dtype, np.timedelta64):
+        return np.array("NaT", dtype=dtype)
+    if np.issubdtype(dtype, np.inexact):
+        return np.nan
+    return np.zeros((), dtype=dtype)
+
 
 def pad_dataset(ds: Dataset, target_sizes: dict, int_fill: int = -9999) -> Dataset:
     """Pad a dataset to match target sizes along all relevant dimensions."""
@@ -17,75 +36,139 @@ def pad_dataset(ds: Dataset, target_sizes: dict, int_fill: int = -9999) -> Datas
         if not pad_width:
             continue  # Skip scalar variables
 
-        fill_value: int | float
-        if np.issubdtype(var.dtype, np.integer):
-            if np.iinfo(var.dtype).min <= int_fill:
-                fill_value = int_fill
-            else:
-                fill_value = np.iinfo(var.dtype).min
-        else:
-            fill_value = np.nan
-
+        fill_value = _get_fill_value(var.dtype, int_fill)
         padded_values = np.pad(var.values, pad_width, constant_values=fill_value)
         padded_vars[name] = xr.DataArray(padded_values, dims=var.dims, attrs=var.attrs)
 
     return Dataset(padded_vars, attrs=ds.attrs)
 
 
-def concat_datasets(ds1: Dataset, ds2: Dataset, dim: str) -> Dataset:
-    """Concatenates two `xarray.Dataset` objects along a specified dimension, padding other dimensions to match.
+def _is_scalar_var(var: xr.DataArray) -> bool:
+    return var.ndim == 0 or var.dims == (SCALAR_CONCAT_DIM,)
 
-    Pads non-concatenation dimensions to the maximum size (if they differ) before concatenating.
-    Integer variables are padded with -9999 or dtype-specific minimum (e.g., -128 for int8);
-    non-integer variables are padded with NaN.
+
+def concat_dataset_list(
+    datasets: Sequence[Dataset],
+    dim: str,
+    int_fill: int = -9999,
+    max_workers: int | None = None,
+) -> Dataset:
+    """Concatenates a sequence of `xarray.Dataset` objects along a dimension in a single pass.
+
+    Same result as chaining `concat_datasets` over all datasets, but the output layout (sizes,
+    dtypes and attributes of all variables) is derived from the datasets' metadata first, so
+    that each output array is allocated only once. The datasets are then copied into their
+    slices of the output in parallel. Datasets backed by files are thus read directly into the
+    output without intermediate copies.
+
+    Non-concatenation dimensions are padded to the maximum size across datasets: integer
+    variables with `int_fill` (or the dtype-specific minimum, e.g., -128 for int8), times with
+    NaT and other variables with NaN. Variables without `dim` are broadcast along it, while
+    scalar variables are collected along a new dimension named "concat_dim".
 
     Args:
-        ds1: First dataset to concatenate.
-        ds2: Second dataset to concatenate.
+        datasets: Datasets to concatenate.
         dim: Dimension along which to concatenate.
+        int_fill: Fill value of padded integer variables. Defaults to -9999.
+        max_workers: Maximum number of threads copying datasets into the output.
+            Defaults to the number of CPUs.
 
     Returns:
         A new dataset resulting from the concatenation.
-    """
-
-    def get_scalars(ds: xr.Dataset) -> list:
-        scalars = [k for k, v in ds.data_vars.items() if v.ndim == 0]
-        return scalars
-
-    ds1_scalars = get_scalars(ds1)
-    ds2_scalars = get_scalars(ds2)
-    scalar_vars: list = list(set(ds1_scalars + ds2_scalars))
-
-    scalar_data: dict = {v: [] for v in scalar_vars}
-    for v in scalar_vars:
-        if v in ds1:
-            scalar_data[v].extend(np.atleast_1d(ds1[v].values))
-        if v in ds2:
-            scalar_data[v].extend(np.atleast_1d(ds2[v].values))
-
-    max_dim_sizes = {
-        d: max(ds1.sizes.get(d, 0), ds2.sizes.get(d, 0))
-        for d in set(ds1.dims).union(ds2.dims)
-        if d != dim
-    }
 
-    ds1_padded = pad_dataset(ds1, max_dim_sizes)
-    ds2_padded = pad_dataset(ds2, max_dim_sizes)
+    Raises:
+        ValueError: If `datasets` is empty.
+    """
+    if len(datasets) == 0:
+        raise ValueError("No datasets to concatenate")
+
+    var_dims: dict[str, tuple] = {}
+    var_dtypes: dict[str, list[np.dtype]] = {}
+    var_attrs: dict[str, dict] = {}
+    scalar_data: dict[str, list] = {}
+    sizes: dict[str, int] = {}
+    lengths: list[int] = []
+    for ds in datasets:
+        lengths.append(ds.sizes.get(dim, 1))
+        for d, s in ds.sizes.items():
+            if d != dim:
+                sizes[d] = max(sizes.get(d, 0), s)
+
+        for name, var in ds.data_vars.items():
+            if _is_scalar_var(var):
+                scalar_data.setdefault(str(name), []).extend(np.atleast_1d(var.values))
+                continue
+            if name not in var_dims:
+                var_dims[str(name)] = var.dims if dim in var.dims else (dim, *var.dims)
+                var_attrs[str(name)] = var.attrs
+            var_dtypes.setdefault(str(name), []).append(var.dtype)
+
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    sizes[dim] = int(offsets[-1])
+
+    data: dict[str, np.ndarray] = {}
+    for name, dims in var_dims.items():
+        dtype = np.result_type(*var_dtypes[name])
+        shape = tuple(sizes[d] for d in dims)
+        data[name] = np.full(shape, _get_fill_value(dtype, int_fill), dtype=dtype)
+
+    def _fill(i: int) -> None:
+        ds = datasets[i]
+        for name, dims in var_dims.items():
+            if name not in ds.data_vars or _is_scalar_var(ds[name]):
+                continue
+            var = ds[name]
+            if dim not in var.dims:
+                var = var.expand_dims(dim)
+            var = var.transpose(*dims)
+            key = tuple(
+                slice(offsets[i], offsets[i + 1]) if d == dim else slice(0, s)
+                for d, s in zip(dims, var.shape)
+            )
+            data[name][key] = var.values
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(datasets))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_fill, range(len(datasets))))
+    else:
+        for i in range(len(datasets)):
+            _fill(i)
+
+    ds_combined = Dataset(
+        {
+            name: xr.DataArray(data[name], dims=dims, attrs=var_attrs[name])
+            for name, dims in var_dims.items()
+        },
+        attrs=datasets[0].attrs,
+    )
+    for name, values in scalar_data.items():
+        ds_combined[name] = xr.DataArray(values, dims=[SCALAR_CONCAT_DIM])
+
+    sources = [ds.encoding.get("source") for ds in datasets]
+    sources = [s for s in sources if isinstance(s, str)]
+    if len(sources) > 0:
+        ds_combined.encoding["sources"] = sources
 
-    ds_combined = xr.concat([ds1_padded, ds2_padded], dim=dim, data_vars="all")
+    return ds_combined
 
-    if "concat_dim" in ds_combined.dims:
-        ds_combined = ds_combined.drop_dims("concat_dim", errors="ignore")
 
-    for v in scalar_vars:
-        da = xr.DataArray(scalar_data[v], dims=["concat_dim"])
-        ds_combined[v] = da
+def concat_datasets(ds1: Dataset, ds2: Dataset, dim: str) -> Dataset:
+    """Concatenates two `xarray.Dataset` objects along a specified dimension, padding other dimensions to match.
 
-    source1 = ds1.encoding.get("source")
-    source2 = ds2.encoding.get("source")
-    sources = [s for s in [source1, source2] if isinstance(s, str)]
+    Pads non-concatenation dimensions to the maximum size (if they differ) before concatenating.
+    Integer variables are padded with -9999 or dtype-specific minimum (e.g., -128 for int8);
+    non-integer variables are padded with NaN. To concatenate more than two datasets, use
+    `concat_dataset_list` instead of chaining calls to this function.
 
-    if len(sources) > 0:
-        ds_combined.encoding["sources"] = sources
+    Args:
+        ds1: First dataset to concatenate.
+        ds2: Second dataset to concatenate.
+        dim: Dimension along which to concatenate.
 
-    return ds_combined
+    Returns:
+        A new dataset resulting from the concatenation.
+    """
+    return concat_dataset_list([ds1, ds2], dim=dim, max_workers=1)
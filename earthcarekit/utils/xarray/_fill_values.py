@@ -1,19 +1,82 @@
+from functools import partial
+from typing import Any
+
 import numpy as np
 import xarray as xr
+from numpy.typing import DTypeLike, NDArray
+
+try:
+    # Private xarray API (xarray>=2025.7.1), only used to mask lazily loaded variables that are
+    # not backed by dask; without it, such variables are masked eagerly.
+    from xarray.coding.variables import lazy_elemwise_func
+    from xarray.core.indexing import MemoryCachedArray
+except ImportError:  # pragma: no cover
+    lazy_elemwise_func = None
+    MemoryCachedArray = None
+
+# Floating-point values at or above the default netCDF fill value are treated as missing
+_FLOAT_FILL_VALUE_THRESHOLD = 9.969209968386869e36
+
+
+def _mask_fill_values(
+    values: NDArray,
+    int_dtype: DTypeLike | None,
+    int_fill_value: int | None,
+) -> NDArray:
+    """Sets float fill values to NaN and, if `int_dtype` is given, NaNs to an integer fill value."""
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.floating):
+        values = np.where(values >= _FLOAT_FILL_VALUE_THRESHOLD, np.nan, values)
+    if int_dtype is not None:
+        values = np.where(np.isnan(values), int_fill_value, values).astype(int_dtype)
+    return values
+
+
+def _lazy_mask_fill_values(var: xr.Variable, func: Any, dtype: DTypeLike) -> Any | None:
+    """Returns the data of `var` with `func` applied on access, without loading it now.
+
+    Returns None if the installed xarray version does not support this.
+    """
+    if var.chunks is not None:
+        return xr.apply_ufunc(func, var, dask="parallelized", output_dtypes=[dtype]).data
+
+    data = getattr(var, "_data", None)
+    if lazy_elemwise_func is None or MemoryCachedArray is None or data is None:
+        return None
+    if isinstance(data, MemoryCachedArray):
+        # Cache the masked instead of the raw values (as `xarray.open_dataset` does by default)
+        return MemoryCachedArray(lazy_elemwise_func(data.array, func, dtype))
+    return lazy_elemwise_func(data, func, dtype)
 
 
 def _convert_all_fill_values_to_nan(ds: xr.Dataset) -> xr.Dataset:
-    for v in ds.variables:
-        if not hasattr(ds[v].encoding, "_FillValue"):
-            if np.issubdtype(ds[v].values.dtype, np.floating):
-                ds[v].values[ds[v].values >= 9.969209968386869e36] = np.nan
-        if not hasattr(ds[v].encoding, "dtype"):
-            _dtype = ds[v].encoding["dtype"]
-            if np.issubdtype(_dtype, np.integer):
-                if hasattr(ds[v].encoding, "_FillValue"):
-                    fill_value = int(ds[v].encoding["_FillValue"])
-                else:
-                    fill_value = np.iinfo(_dtype).min
-                ds[v].values[np.isnan(ds[v].values)] = fill_value
-                ds[v] = ds[v].astype(_dtype)
+    """Replaces float fill values by NaN and restores integer variables masked while decoding.
+
+    Masking is applied lazily, i.e., only to the values of a variable that are actually
+    read, so that datasets opened from file are not loaded into memory by this function.
+    """
+    for v in list(ds.variables):
+        var = ds.variables[v]
+
+        encoded_dtype = var.encoding.get("dtype")
+        int_dtype: np.dtype | None = None
+        if encoded_dtype is not None and np.issubdtype(encoded_dtype, np.integer):
+            int_dtype = np.dtype(encoded_dtype)
+        if int_dtype is None and not np.issubdtype(var.dtype, np.floating):
+            continue
+
+        func = partial(
+            _mask_fill_values,
+            int_dtype=int_dtype,
+            int_fill_value=None if int_dtype is None else int(np.iinfo(int_dtype).min),
+        )
+        dtype = var.dtype if int_dtype is None else int_dtype
+        # Variables are considered loaded if xarray does not tell otherwise
+        is_in_memory = var.chunks is None and getattr(var, "_in_memory", True)
+        data = None
+        if not is_in_memory and v not in ds.indexes:
+            data = _lazy_mask_fill_values(var, func, dtype)
+        if data is None:
+            data = func(var.values)
+        ds[v] = xr.Variable(var.dims, data, attrs=var.attrs, encoding=var.encoding)
     return ds
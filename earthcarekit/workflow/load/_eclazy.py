@@ -13,7 +13,7 @@ def eclazy(
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: Literal[False] = ...,
@@ -26,7 +26,7 @@ def eclazy(
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: Literal[True] = ...,
@@ -38,7 +38,7 @@ def eclazy(
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: bool = False,
@@ -56,8 +56,8 @@ def eclazy(
         baseline: Two-letter processor baseline. Ignored if already in ``type_or_path``.
         path_to_data: Root search directory; defaults to config value if None.
         search_mode:
-            Search strategy: "exhaustive" (recursive scan) or "fast" (expected paths only).
-            Defaults to "exhaustive".
+            Search strategy: "exhaustive" (recursive scan), "fast" (expected paths only) or
+            "catalog" (incrementally updated on-disk index). Defaults to "exhaustive".
         download: Download missing files if True; raise ``ValueError`` otherwise.
         verbose: Print logs to console if True.
         return_path: If True, return the file path instead of loading the dataset.
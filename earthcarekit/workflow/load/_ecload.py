@@ -1,7 +1,9 @@
 from typing import Literal, cast, overload
 
+import pandas as pd
 from xarray import Dataset
 
+from ...read import read_products
 from ...typing import PathLike
 from ...utils.time import TimestampLike
 from ._load_product import _load_product
@@ -9,12 +11,12 @@
 
 @overload
 def ecload(
-    type_or_path: str | PathLike,
+    type_or_path: str | PathLike | pd.DataFrame,
     frame_or_time: str | TimestampLike | None = None,
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: Literal[False] = ...,
@@ -27,19 +29,19 @@ def ecload(
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: Literal[True] = ...,
     **kwargs,
 ) -> str: ...
 def ecload(
-    type_or_path: str | PathLike,
+    type_or_path: str | PathLike | pd.DataFrame,
     frame_or_time: str | TimestampLike | None = None,
     baseline: str | None = None,
     *,
     path_to_data: str | None = None,
-    search_mode: Literal["exhaustive", "fast"] = "exhaustive",
+    search_mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = False,
     verbose: bool = False,
     return_path: bool = False,
@@ -50,15 +52,18 @@ def ecload(
     Args:
         type_or_path:
             Product name (e.g., "ATL_EBD_2A", "ATL_EBD_2A:BA") or file path.
-            If path, loads directly.
+            If path, loads directly. If a `ProductDataFrame` (e.g., from `search_product`),
+            opens all its frames as one `dask`-backed dataset with one chunk per frame
+            (see `read_products` with `lazy=True`; requires `dask`). Other arguments
+            (except `verbose`) are not supported then.
         frame_or_time:
             Orbit frame (e.g., "01234B") or timestamp (e.g., "2024-09-02 21:04:37").
             Required when ``type_or_path`` is a product name.
         baseline: Two-letter processor baseline. Ignored if already in ``type_or_path``.
         path_to_data: Root search directory; defaults to config value if None.
         search_mode:
-            Search strategy: "exhaustive" (recursive scan) or "fast" (expected paths only).
-            Defaults to "exhaustive".
+            Search strategy: "exhaustive" (recursive scan), "fast" (expected paths only) or
+            "catalog" (incrementally updated on-disk index). Defaults to "exhaustive".
         download: Download missing files if True; raise ``ValueError`` otherwise.
         verbose: Print logs to console if True.
         return_path: If True, return the file path instead of loading the dataset.
@@ -66,6 +71,9 @@ def ecload(
     Returns:
         The opened EarthCARE product (default) or file path (str) if ``return_path`` is True.
 
+    Raises:
+        ValueError: If `type_or_path` is a `ProductDataFrame` and other arguments are given.
+
     See Also:
         [`eclazy()`][earthcarekit.eclazy]: Opens file as [`LazyDataset`][earthcarekit.LazyDataset].
 
@@ -85,7 +93,33 @@ def ecload(
 
         >>> ds = eck.ecload("ATL_EBD_2A:BA", "01508B")
         >>> ds = eck.ecload("aebd:ba", "01508B")
+
+        Many frames can be opened lazily, e.g., to compute monthly statistics:
+
+        >>> df = eck.search_product(
+        ...     file_type="ATL_EBD_2A", start_time="2025-01-01", end_time="2025-01-31"
+        ... )
+        >>> ds = eck.ecload(df)
     """
+    if isinstance(type_or_path, pd.DataFrame):
+        unsupported = [
+            name
+            for name, value, default in [
+                ("frame_or_time", frame_or_time, None),
+                ("baseline", baseline, None),
+                ("path_to_data", path_to_data, None),
+                ("search_mode", search_mode, "exhaustive"),
+                ("download", download, False),
+                ("return_path", return_path, False),
+            ]
+            if value != default
+        ] + list(kwargs)
+        if len(unsupported) > 0:
+            raise ValueError(
+                f"Arguments not supported when opening a `ProductDataFrame`: {unsupported}"
+            )
+        return read_products(type_or_path, lazy=True)
+
     return cast(
         Dataset | str,
         _load_product(
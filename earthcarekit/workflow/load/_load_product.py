@@ -4,7 +4,6 @@
 
 from xarray import Dataset
 
-from ...download import ecdownload
 from ...read import LazyDataset, read_product, search_product
 from ...read.info import FileType
 from ...typing import PathLike
@@ -17,7 +16,7 @@ def _load_product(
     frame_or_time: str | TimestampLike | None,
     baseline: str | None = None,
     path_to_data: str | None = None,
-    mode: Literal["exhaustive", "fast"] = "exhaustive",
+    mode: Literal["exhaustive", "fast", "catalog"] = "exhaustive",
     download: bool = True,
     verbose: bool = False,
     logger: logging.Logger | None = None,
@@ -75,6 +74,8 @@ def _load_product(
             elif download:
                 if logger:
                     logger.info("File not found locally. Starting download ...")
+                from ...download import ecdownload  # imported on demand (pystac_client, requests)
+
                 ecdownload(
                     path_to_data=path_to_data,
                     file_type=file_type,
@@ -93,6 +94,7 @@ def _load_product(
                     timestamp=timestamp,
                     baseline=baseline,
                     mode=mode,
+                    catalog_max_age=0,  # the catalog has to include the downloaded file
                 ).filter_latest()
 
         if df.size == 0:
@@ -0,0 +1,96 @@
+"""Benchmark: `CurtainFigure` rendering with `pcolormesh` ("exact", "fast") vs. `imshow` ("raster").
+
+Plots a synthetic full-resolution curtain (e.g., like an ATL_NOM_1B frame) in every mode, renders
+it to an in-memory RGBA buffer and reports the time, the peak memory and the fraction of pixels
+inside the axes that differ from the "exact" rendering.
+
+Usage:
+    python tests/benchmarks/bench_curtain.py [--num_profiles 20000] [--num_bins 254]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from earthcarekit.plot import CurtainFigure  # noqa: E402
+
+
+def _create_curtain(num_profiles: int, num_bins: int, rng) -> tuple:
+    times = np.datetime64("2025-01-01T00:00:00") + np.arange(num_profiles) * np.timedelta64(
+        142, "ms"
+    )
+    height = np.linspace(40e3, -500.0, num_bins)[None, :] + rng.normal(0.0, 5.0, (num_profiles, 1))
+    x = np.linspace(0.0, 8.0 * np.pi, num_profiles)[:, None]
+    values = 1e-6 * (1.5 + np.sin(x + height / 4e3))
+    values[num_profiles // 3 : num_profiles // 2, num_bins // 2 :] = np.nan
+    return values, times, height
+
+
+def _render(
+    values, times, height, mode: str, sampling: str | None = None, trace_memory: bool = False
+) -> tuple[np.ndarray, tuple, float, float]:
+    if trace_memory:
+        tracemalloc.start()
+    t = time.perf_counter()
+    cf = CurtainFigure(mode=mode, dpi=100)  # type: ignore
+    cf.plot(
+        values=values,
+        time=times,
+        height=height,
+        height_range=(0, 20e3),
+        cmap=plt.get_cmap("viridis"),
+        log_scale=True,
+        raster_sampling=sampling,  # type: ignore
+    )
+    cf.fig.canvas.draw()
+    elapsed = time.perf_counter() - t
+    peak = 0.0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    image = np.asarray(cf.fig.canvas.buffer_rgba()).copy()
+    bbox = cf.ax.get_window_extent()
+    plt.close(cf.fig)
+    return image, (bbox.x0, bbox.y0, bbox.x1, bbox.y1), elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_profiles", type=int, default=20000)
+    parser.add_argument("--num_bins", type=int, default=254)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values, times, height = _create_curtain(args.num_profiles, args.num_bins, rng)
+    _render(values[:10], times[:10], height[:10], "exact")  # warm up
+
+    print(f"{args.num_profiles} profiles x {args.num_bins} bins")
+    reference = None
+    for mode, sampling in [
+        ("exact", None),
+        ("fast", None),
+        ("raster", "nearest"),
+        ("raster", "mean"),
+    ]:
+        image, bbox, elapsed, _ = _render(values, times, height, mode, sampling)
+        *_, peak = _render(values, times, height, mode, sampling, trace_memory=True)
+        x0, y0, x1, y1 = (int(np.ceil(bbox[0])), int(np.ceil(bbox[1])), int(bbox[2]), int(bbox[3]))
+        inner = image[image.shape[0] - y1 : image.shape[0] - y0, x0:x1, :3].astype(int)
+        if reference is None:
+            reference = inner
+        diff = np.any(np.abs(inner - reference) > 16, axis=2).mean()
+        print(
+            f"  {mode + (f' ({sampling})' if sampling else ''):17s} {elapsed:6.2f} s, peak {peak / 1e6:6.0f} MB, "
+            f"{100 * diff:5.1f}% of pixels differ from exact"
+        )
+
+
+if __name__ == "__main__":
+    main()
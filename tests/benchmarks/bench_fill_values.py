@@ -0,0 +1,80 @@
+"""Benchmark: eager vs. lazy fill value handling when opening products with `ensure_nans`.
+
+Writes a synthetic ATL_EBD_2A frame (see `bench_read_products.py`) and opens its science data
+with `ensure_nans=True`, once with the former implementation (which loads and masks all
+variables) and once with the current one (which masks variables lazily on access), then reads
+a single variable. Results are checked to be identical.
+
+Usage:
+    python tests/benchmarks/bench_fill_values.py [--num_samples 20000] [--num_vars 6]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import xarray as xr
+from bench_read_products import _create_frame
+from earthcarekit.read import read_science_data
+
+_VAR = "particle_backscatter_coefficient_355nm"
+
+
+def _convert_all_fill_values_to_nan_eager(ds: xr.Dataset) -> xr.Dataset:
+    """Former `_convert_all_fill_values_to_nan` (materializes every variable)."""
+    for v in ds.variables:
+        if np.issubdtype(ds[v].values.dtype, np.floating):
+            ds[v].values[ds[v].values >= 9.969209968386869e36] = np.nan
+        _dtype = ds[v].encoding["dtype"]
+        if np.issubdtype(_dtype, np.integer):
+            ds[v].values[np.isnan(ds[v].values)] = np.iinfo(_dtype).min
+            ds[v] = ds[v].astype(_dtype)
+    return ds
+
+
+def _open_and_read(filepath: str, eager: bool) -> tuple[np.ndarray, float, float, float]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    kwargs = {"drop_variables": ["along_track", "JSG_height"]}
+    if eager:
+        ds = _convert_all_fill_values_to_nan_eager(read_science_data(filepath, **kwargs))
+    else:
+        ds = read_science_data(filepath, ensure_nans=True, **kwargs)
+    t_open = time.perf_counter() - t
+    values = ds[_VAR].values
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    ds.close()
+    return values, t_open, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=20000)
+    parser.add_argument("--num_vars", type=int, default=6)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = _create_frame(tmp, 0, args.num_samples, num_vars=args.num_vars)
+        _open_and_read(filepath, eager=False)  # warm up the OS file cache
+
+        expected, t_open_old, t_old, peak_old = _open_and_read(filepath, eager=True)
+        result, t_open_new, t_new, peak_new = _open_and_read(filepath, eager=False)
+        np.testing.assert_array_equal(result, expected)
+
+        print(f"{args.num_samples} samples, {args.num_vars} variables (results identical)")
+        print(
+            f"  eager: open {t_open_old:6.3f} s, open + read 1 variable {t_old:6.3f} s, "
+            f"peak {peak_old / 1e6:7.0f} MB"
+        )
+        print(
+            f"  lazy:  open {t_open_new:6.3f} s, open + read 1 variable {t_new:6.3f} s, "
+            f"peak {peak_new / 1e6:7.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: `filter_radius` with geodesic distances of all samples vs. a haversine prefilter.
+
+Writes synthetic ATL_EBD_2A frames (see `bench_read_products.py`) and runs a batch overpass
+job, i.e., `filter_radius` for many sites (near and far from the tracks) on every frame, once
+calculating geodesic distances of all samples (former implementation) and once only for
+samples preselected by haversine distances. Filtered datasets, closest samples and minimum
+distances of empty results are checked to be identical.
+
+Usage:
+    python tests/benchmarks/bench_filter_radius.py [--num_frames 16] [--num_sites 42]
+"""
+
+import argparse
+import tempfile
+import time
+
+import earthcarekit.filter._filter_radius as _filter_radius_module
+import numpy as np
+import xarray as xr
+from bench_read_products import _create_frame
+from earthcarekit.filter import EmptyFilterResultError, filter_radius
+from earthcarekit.geo import geodesic
+from earthcarekit.read import read_product
+
+
+def _run(func, datasets, sites, radius_km, closest) -> tuple[list, float]:
+    results = []
+    t = time.perf_counter()
+    for ds in datasets:
+        for lat, lon in sites:
+            try:
+                results.append(func(ds, radius_km, lat, lon, closest))
+            except EmptyFilterResultError as e:
+                results.append(e.min_distance)
+    return results, time.perf_counter() - t
+
+
+def _filter_radius(ds, radius_km, lat, lon, closest) -> xr.Dataset:
+    return filter_radius(ds, radius_km, center_lat=lat, center_lon=lon, closest=closest)
+
+
+def _get_all_geodesic_distances(center_coords, satellite_coords, radius_km) -> np.ndarray:
+    """Former distance calculation of `filter_radius` (geodesic distances of all samples)."""
+    return geodesic(center_coords, satellite_coords)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=16)
+    parser.add_argument("--num_samples", type=int, default=5000)
+    parser.add_argument("--num_sites", type=int, default=42)
+    parser.add_argument("--radius_km", type=float, default=100.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets = []
+        for i in range(args.num_frames):
+            filepath = _create_frame(tmp, i, args.num_samples, num_bins=8, num_vars=1)
+            with read_product(filepath) as ds:
+                datasets.append(ds.load())
+
+        sites = []
+        for _ in range(args.num_sites):
+            ds = datasets[rng.integers(len(datasets))]
+            k = rng.integers(ds.sizes["along_track"])
+            sites.append(
+                (
+                    float(np.clip(ds["latitude"].values[k] + rng.uniform(-1, 1), -89.9, 89.9)),
+                    float(ds["longitude"].values[k] + rng.uniform(-1, 1)),
+                )
+            )
+
+        for closest in [False, True]:
+            prefiltered = _filter_radius_module._get_geodesic_distances
+            _filter_radius_module._get_geodesic_distances = _get_all_geodesic_distances
+            try:
+                expected, t_old = _run(_filter_radius, datasets, sites, args.radius_km, closest)
+            finally:
+                _filter_radius_module._get_geodesic_distances = prefiltered
+            results, t_new = _run(_filter_radius, datasets, sites, args.radius_km, closest)
+            num_empty = 0
+            for r, e in zip(results, expected):
+                if isinstance(e, float):
+                    assert r == e, (r, e)
+                    num_empty += 1
+                else:
+                    xr.testing.assert_identical(r, e)
+
+            print(
+                f"{args.num_frames} frames x {args.num_sites} sites, closest={closest} "
+                f"({len(results) - num_empty} overpasses, results identical)"
+            )
+            print(f"  geodesic, all samples:     {t_old:6.2f} s")
+            print(f"  haversine prefilter:       {t_new:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
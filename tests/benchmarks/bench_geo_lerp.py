@@ -0,0 +1,87 @@
+"""Benchmark: per-sample geodesic interpolation vs. vectorized great-circle slerp.
+
+Rebins a synthetic along-track lat/lon series (crossing the antimeridian and passing close to
+the north pole) to coarser time bins with the former `interpgeo` loop and with
+`rebin_time(..., is_geo=True)`, and reports the largest distance (chord length) between both results.
+
+Usage:
+    python tests/benchmarks/bench_geo_lerp.py [--num_samples 50000] [--factor 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from earthcarekit.data.profile._rebin import _get_time_lerp_params, rebin_time
+from earthcarekit.geo import interpgeo
+from earthcarekit.geo.convertsions import _geo_to_unit_ecef
+from earthcarekit.utils import kernels
+from numpy.typing import NDArray
+
+
+def _create_orbit_track(num_samples: int) -> NDArray:
+    # Half an orbit passing the north polar region and crossing the antimeridian
+    phase = np.linspace(-np.pi / 2, np.pi / 2, num_samples)
+    inclination = np.radians(97.05)
+    lat = np.degrees(np.arcsin(np.sin(inclination) * np.cos(phase)))
+    lon = np.degrees(np.arctan2(np.cos(inclination) * np.cos(phase), -np.sin(phase))) - 80
+    lon = (lon + 180) % 360 - 180
+    return np.column_stack([lat, lon])
+
+
+def _create_polar_track(num_samples: int) -> NDArray:
+    # Meridian track crossing the north pole from 20°E to 160°W
+    s = np.linspace(-10, 10, num_samples)
+    return np.column_stack([90 - np.abs(s), np.where(s < 0, 20.0, -160.0)])
+
+
+def _loop_rebin_geo(time: NDArray, new_time: NDArray, coords: NDArray) -> NDArray:
+    idx, w = _get_time_lerp_params(time, new_time)
+    v0, v1 = coords[idx - 1], coords[idx]
+    rebinned = np.full((w.shape[0], 2), np.nan)
+    for i in range(w.shape[0]):
+        lon, lat = interpgeo(v0[i, 0], v0[i, 1], v1[i, 0], v1[i, 1], w[i])
+        rebinned[i] = [lat, lon]
+    return rebinned
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=50000)
+    parser.add_argument("--factor", type=int, default=5, help="Along-track samples per bin")
+    args = parser.parse_args()
+
+    time_ = np.datetime64("2025-01-01") + np.arange(args.num_samples) * np.timedelta64(142, "ms")
+    new_time = time_[:: args.factor] + np.timedelta64(71, "ms")
+
+    for label, coords in [
+        ("orbit", _create_orbit_track(args.num_samples)),
+        ("polar", _create_polar_track(args.num_samples)),
+    ]:
+        print(
+            f"{label} track: {args.num_samples} samples -> {len(new_time)} bins, "
+            f"max lat {coords[:, 0].max():.2f}, "
+            f"{np.sum(np.abs(np.diff(coords[:, 1])) > 180)} antimeridian crossing(s)"
+        )
+
+        t = time.perf_counter()
+        expected = _loop_rebin_geo(time_, new_time, coords)
+        t_loop = time.perf_counter() - t
+        print(f"{'interpgeo loop':>16}: {t_loop * 1e3:8.1f} ms")
+
+        for backend in kernels.get_available_backends():
+            kernels.set_backend(backend)
+            rebin_time(coords, time_, new_time, is_geo=True, method="interpolate")  # JIT warm-up
+            t = time.perf_counter()
+            result = rebin_time(coords, time_, new_time, is_geo=True, method="interpolate")
+            t_vec = time.perf_counter() - t
+            chord = _geo_to_unit_ecef(*result.T) - _geo_to_unit_ecef(*expected.T)
+            max_dist = np.max(np.linalg.norm(chord, axis=-1)) * 6371e3
+            print(
+                f"{'slerp (' + backend + ')':>16}: {t_vec * 1e3:8.1f} ms "
+                f"({t_loop / t_vec:6.1f}x), max deviation {max_dist:.1e} m"
+            )
+
+
+if __name__ == "__main__":
+    main()
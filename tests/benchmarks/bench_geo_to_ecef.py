@@ -0,0 +1,85 @@
+"""Benchmark: point-by-point vs. vectorized `sequence_geo_to_ecef` and `sequence_ecef_to_geo`.
+
+Converts the coordinates of a synthetic full MSI_RGR_1C frame swath (about 2.2 million pixels)
+on the sphere and the WGS 84 ellipsoid, once with the former implementation (the scalar
+`geo_to_ecef`/`ecef_to_geo` per point, timed on a fraction of the points and extrapolated) and
+once with the vectorized one. Results are checked to agree to within floating-point rounding.
+
+Usage:
+    python tests/benchmarks/bench_geo_to_ecef.py [--num_along 5800] [--num_across 384]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from earthcarekit.geo import (
+    ecef_to_geo,
+    geo_to_ecef,
+    sequence_ecef_to_geo,
+    sequence_geo_to_ecef,
+)
+
+
+def _former_geo_to_ecef(lats, lons, perfect_sphere: bool) -> np.ndarray:
+    """Former `sequence_geo_to_ecef` (scalar conversion per point)."""
+    return np.array(
+        [
+            list(geo_to_ecef(lt, ln, 0.0, perfect_sphere=perfect_sphere))
+            for lt, ln in zip(lats, lons)
+        ]
+    )
+
+
+def _former_ecef_to_geo(xyz, perfect_sphere: bool) -> np.ndarray:
+    """Former `sequence_ecef_to_geo` (scalar conversion per point)."""
+    return np.array([list(ecef_to_geo(*c, perfect_sphere=perfect_sphere)) for c in xyz])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_along", type=int, default=5800)
+    parser.add_argument("--num_across", type=int, default=384)
+    parser.add_argument("--former_fraction", type=float, default=0.05)
+    args = parser.parse_args()
+
+    lat = np.linspace(-60.0, 60.0, args.num_along)[:, None] + np.zeros((1, args.num_across))
+    lon = 10.0 + np.linspace(-1.5, 1.5, args.num_across)[None, :] + 0.3 * lat
+    lats, lons = lat.ravel(), lon.ravel()
+    n = lats.size
+    m = max(1, int(n * args.former_fraction))
+
+    print(f"{args.num_along} x {args.num_across} swath ({n} points)")
+    for perfect_sphere in [True, False]:
+        name = "sphere" if perfect_sphere else "WGS 84"
+
+        t = time.perf_counter()
+        expected = _former_geo_to_ecef(lats[:m], lons[:m], perfect_sphere)
+        t_old = (time.perf_counter() - t) * n / m
+        t = time.perf_counter()
+        xyz = sequence_geo_to_ecef(lats, lons, perfect_sphere=perfect_sphere)
+        t_new = time.perf_counter() - t
+        np.testing.assert_allclose(xyz[:m], expected, rtol=0, atol=1e-14)
+        t = time.perf_counter()
+        sequence_geo_to_ecef(lats, lons, perfect_sphere=perfect_sphere, dtype=np.float32)
+        t_new32 = time.perf_counter() - t
+        print(f"  geo -> ECEF ({name}):")
+        print(f"    point by point (extrapolated): {t_old:7.2f} s")
+        print(f"    vectorized:                    {t_new:7.2f} s")
+        print(f"    vectorized, float32 output:    {t_new32:7.2f} s")
+
+        t = time.perf_counter()
+        expected = _former_ecef_to_geo(xyz[:m], perfect_sphere)
+        t_old = (time.perf_counter() - t) * n / m
+        t = time.perf_counter()
+        geo = sequence_ecef_to_geo(xyz[:, 0], xyz[:, 1], xyz[:, 2], perfect_sphere=perfect_sphere)
+        t_new = time.perf_counter() - t
+        np.testing.assert_allclose(geo[:m, :2], expected[:, :2], rtol=0, atol=1e-9)
+        np.testing.assert_allclose(geo[:m, 2], expected[:, 2], rtol=0, atol=1e-6)
+        print(f"  ECEF -> geo ({name}):")
+        print(f"    point by point (extrapolated): {t_old:7.2f} s")
+        print(f"    vectorized:                    {t_new:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark: streaming histogram accumulators vs. `np.histogram`/`np.histogram2d` on all data.
+
+Creates synthetic frames of lidar-ratio-like values, depolarization ratios and heights and
+computes 1D (log bins), 2D and height-resolved histograms, once by concatenating all frames and
+calling numpy, and once by feeding the frames one by one into accumulators split across two
+"processes" (which are merged and round-tripped through `.npz` files). Reports the time and the
+peak memory and checks that the counts are identical.
+
+Usage:
+    python tests/benchmarks/bench_histogram_accumulator.py [--num_frames 20] [--num_samples 5000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from earthcarekit.stats import Histogram2DAccumulator, HistogramAccumulator, get_log_edges
+
+_NUM_BINS = 242
+
+
+def _create_frame(i: int, num_samples: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(i)
+    lidar_ratio = rng.lognormal(np.log(50.0), 0.5, (num_samples, _NUM_BINS))
+    depol = rng.normal(0.2, 0.1, (num_samples, _NUM_BINS))
+    lidar_ratio[rng.random(lidar_ratio.shape) < 0.3] = np.nan
+    height = np.linspace(40e3, -500.0, _NUM_BINS)
+    return lidar_ratio, depol, height
+
+
+def _run_numpy(num_frames: int, num_samples: int, edges: tuple) -> tuple[list, float, float]:
+    lr_edges, depol_edges, height_edges = edges
+    tracemalloc.start()
+    t = time.perf_counter()
+    frames = [_create_frame(i, num_samples) for i in range(num_frames)]
+    lr = np.concatenate([f[0] for f in frames])
+    depol = np.concatenate([f[1] for f in frames])
+    height = np.broadcast_to(frames[0][2], lr.shape)
+    is_valid = ~np.isnan(lr)
+    counts = [
+        np.histogram(lr[is_valid], lr_edges)[0],
+        np.histogram2d(lr[is_valid], depol[is_valid], (lr_edges, depol_edges))[0],
+        np.histogram2d(lr[is_valid], height[is_valid], (lr_edges, height_edges))[0],
+    ]
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return counts, elapsed, peak
+
+
+def _run_accumulators(
+    num_frames: int, num_samples: int, edges: tuple, tmp: str
+) -> tuple[list, float, float]:
+    lr_edges, depol_edges, height_edges = edges
+    tracemalloc.start()
+    t = time.perf_counter()
+    filepaths = []
+    for process in range(2):
+        acc_lr = HistogramAccumulator(lr_edges)
+        acc_joint = Histogram2DAccumulator(lr_edges, depol_edges)
+        acc_profile = Histogram2DAccumulator(lr_edges, height_edges)
+        for i in range(process, num_frames, 2):
+            lr, depol, height = _create_frame(i, num_samples)
+            acc_lr.add(lr)
+            acc_joint.add(lr, depol)
+            acc_profile.add_profiles(lr, height)
+        names = [f"p{process}_{name}.npz" for name in ("lr", "joint", "profile")]
+        for acc, name in zip((acc_lr, acc_joint, acc_profile), names):
+            acc.save(os.path.join(tmp, name))
+        filepaths.append(names)
+
+    accs = [
+        HistogramAccumulator.load(os.path.join(tmp, filepaths[0][0])),
+        Histogram2DAccumulator.load(os.path.join(tmp, filepaths[0][1])),
+        Histogram2DAccumulator.load(os.path.join(tmp, filepaths[0][2])),
+    ]
+    accs[0].merge(HistogramAccumulator.load(os.path.join(tmp, filepaths[1][0])))
+    accs[1].merge(Histogram2DAccumulator.load(os.path.join(tmp, filepaths[1][1])))
+    accs[2].merge(Histogram2DAccumulator.load(os.path.join(tmp, filepaths[1][2])))
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return accs, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=20)
+    parser.add_argument("--num_samples", type=int, default=5000)
+    args = parser.parse_args()
+
+    edges = (
+        get_log_edges(1.0, 1e3, 100),
+        np.linspace(-0.2, 0.8, 101),
+        np.linspace(-1e3, 40e3, 83),
+    )
+    expected, t_old, peak_old = _run_numpy(args.num_frames, args.num_samples, edges)
+    with tempfile.TemporaryDirectory() as tmp:
+        accs, t_new, peak_new = _run_accumulators(args.num_frames, args.num_samples, edges, tmp)
+    for acc, counts in zip(accs, expected):
+        np.testing.assert_array_equal(acc.counts, counts)
+
+    print(
+        f"{args.num_frames} frames x {args.num_samples} profiles x {_NUM_BINS} bins "
+        "(counts identical)"
+    )
+    print(f"  numpy, all frames at once: {t_old:6.2f} s, peak {peak_old / 1e6:7.0f} MB")
+    print(f"  accumulators, per frame:   {t_new:6.2f} s, peak {peak_new / 1e6:7.0f} MB")
+    print(
+        f"  median lidar ratio {accs[0].percentile(50):.2f}, "
+        f"median profile (lowest bins) {np.round(accs[2].median_profile()[:3], 2)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark: cold-start time of `import earthcarekit` and lightweight entry points.
+
+Runs each import statement in fresh interpreters (after one warm-up run that fills the bytecode
+and OS file caches) and reports the fastest wall-clock time, along with the number of loaded
+modules. Submodules of `earthcarekit` are loaded lazily, so that these statements do not import
+the plotting and download stacks.
+
+Usage:
+    python tests/benchmarks/bench_import_time.py [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    "import earthcarekit",
+    "from earthcarekit import eclazy",
+    "from earthcarekit import ecload",
+    "import earthcarekit as eck; eck.plot",
+]
+
+
+def _run(statement: str) -> tuple[float, int]:
+    code = f"{statement}\nimport sys\nprint(len(sys.modules))"
+    t = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - t, int(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        _run(statement)  # warm up
+        runs = [_run(statement) for _ in range(args.repeat)]
+        elapsed = min(t for t, _ in runs)
+        print(f"{statement:40s} {elapsed:6.2f} s, {runs[0][1]:5d} modules")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark: per-frame statistics with a Python loop vs. `map_products`/`map_reduce_products`.
+
+Writes synthetic ATL_EBD_2A frames (see `bench_read_products.py`) plus one corrupt file, and
+computes per-frame height-binned sums and counts with an increasing number of workers.
+Results are checked to be identical to the sequential loop.
+
+Usage:
+    python tests/benchmarks/bench_map_products.py [--num_frames 32] [--num_samples 4000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import warnings
+
+import numpy as np
+from bench_read_products import _create_frame
+from earthcarekit.read import map_products, map_reduce_products, read_product
+
+_VAR = "particle_backscatter_coefficient_355nm"
+
+
+def frame_stats(ds) -> tuple[np.ndarray, np.ndarray]:
+    values = ds[_VAR].values.astype(np.float64)
+    values = np.sort(values, axis=0)  # some CPU-bound work per frame
+    return np.nansum(values, axis=0), np.sum(np.isfinite(values), axis=0)
+
+
+def add_stats(a: tuple, b: tuple) -> tuple:
+    return a[0] + b[0], a[1] + b[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=32)
+    parser.add_argument("--num_samples", type=int, default=4000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepaths = [_create_frame(tmp, i, args.num_samples) for i in range(args.num_frames)]
+        corrupt = os.path.join(tmp, os.path.basename(filepaths[-1]).replace("_015", "_099"))
+        with open(corrupt, "wb") as f:
+            f.write(b"not a HDF5 file")
+
+        for _ in range(2):  # first pass warms up the OS file cache
+            t = time.perf_counter()
+            expected = []
+            for filepath in filepaths:
+                with read_product(filepath, use_cache=False) as ds:
+                    expected.append(frame_stats(ds))
+            t_loop = time.perf_counter() - t
+        print(f"{args.num_frames} frames, {os.cpu_count()} CPUs")
+        print(f"  python loop:            {t_loop:6.2f} s")
+
+        for backend in ["thread", "process"]:
+            for workers in [1, 2, 4, 8]:
+                t = time.perf_counter()
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter("always")
+                    results = map_products(
+                        filepaths + [corrupt],
+                        frame_stats,
+                        workers=workers,
+                        backend=backend,
+                        read_kwargs={"use_cache": False},
+                        on_error="skip",
+                    )
+                elapsed = time.perf_counter() - t
+                assert results[-1] is None and any("Skipped 1" in str(x.message) for x in w)
+                for r, e in zip(results[:-1], expected):
+                    assert r is not None
+                    np.testing.assert_array_equal(r[0], e[0])
+                print(f"  map {backend:>7}, {workers} workers: {elapsed:6.2f} s")
+
+        total = map_reduce_products(filepaths, frame_stats, add_stats, workers=4, backend="thread")
+        total_expected = expected[0]
+        for e in expected[1:]:
+            total_expected = add_stats(total_expected, e)
+        np.testing.assert_array_equal(total[0], total_expected[0])
+        print("  map_reduce: identical to sequential reduction")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark: drawing a colored satellite track with `MapFigure.plot_track`.
+
+Creates a synthetic sun-synchronous ground track with along-track values and draws it colored by
+these values, once with the former per-segment implementation (mid points computed one by one,
+all samples drawn) and once with `MapFigure.plot_track` (vectorized mid points, decimated to the
+map's resolution and extent), on a global and on a zoomed-in map without coastlines. Reports the
+time to plot and render the figure, the peak memory and the share of track pixels that differ
+between both images. They differ at the antialiased edges of the track, which are lighter now that
+fewer overlapping lines are drawn per pixel, and where many noisy samples fall into one pixel.
+
+Usage:
+    python tests/benchmarks/bench_map_track.py [--num_samples 1000 10000 50000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+from cartopy.mpl.feature_artist import FeatureArtist
+from earthcarekit.geo import get_coord_between
+from earthcarekit.plot import MapFigure
+from matplotlib.collections import LineCollection
+
+_CMAP = plt.get_cmap("viridis")
+_MAP_KWARGS = dict(
+    style="none",
+    show_grid=False,
+    show_night_shade=False,
+    show_text_time=False,
+    show_text_frame=False,
+    show_text_overpass=False,
+)
+
+
+def _create_track(num_samples: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns latitudes, longitudes and values of a half orbit (inclination 97.05 degrees)."""
+    u = np.linspace(-0.5 * np.pi, 0.5 * np.pi, num_samples)
+    inclination = np.radians(97.05)
+    latitude = np.degrees(np.arcsin(np.sin(inclination) * np.sin(u)))
+    longitude = np.degrees(np.arctan2(np.cos(inclination) * np.sin(u), np.cos(u)))
+    longitude = (longitude - 12.0 * (u + 0.5 * np.pi) + 180.0) % 360.0 - 180.0
+    values = np.sin(8 * u) + 0.3 * np.random.default_rng(0).normal(size=num_samples)
+    return latitude, longitude, values
+
+
+def _plot_track_per_segment(mf: MapFigure, latitude, longitude, z, line_overlap: int = 20) -> None:
+    """Former implementation of `MapFigure.plot_track` with `z`."""
+    line_overlap = min(line_overlap, int(len(z) * 0.01))
+    coords = np.column_stack([longitude, latitude])
+    segments = [s for s in np.stack([coords[:-1], coords[1:]], axis=1)]
+    coords_borders = np.array(
+        [coords[0]]
+        + [get_coord_between(s[0][::-1], s[1][::-1])[::-1] for s in segments]
+        + [coords[-1]] * (line_overlap + 1)
+    )
+    n_stacks = line_overlap + 2
+    segments = [
+        s
+        for s in np.stack(
+            [coords_borders[i : len(coords_borders) - (n_stacks - 1) + i] for i in range(n_stacks)],
+            axis=1,
+        )
+    ]
+    lc = LineCollection(
+        segments, cmap=_CMAP, linewidth=2, transform=mf.transform, zorder=4, antialiased=True
+    )
+    lc.set_array(z)
+    mf._ax.add_collection(lc)
+
+
+def _run(
+    num_samples: int, view: str, per_segment: bool
+) -> tuple[np.ndarray, np.ndarray, float, float]:
+    latitude, longitude, values = _create_track(num_samples)
+    if view == "global":
+        mf = MapFigure(
+            central_latitude=0.0,
+            central_longitude=float(longitude[num_samples // 2]),
+            **_MAP_KWARGS,
+        )
+    else:
+        mf = MapFigure(projection="platecarree", extent=[-30, 0, -10, 10], **_MAP_KWARGS)
+    for artist in mf.ax.get_children():
+        if isinstance(artist, FeatureArtist):
+            artist.remove()  # coastlines would need to be downloaded
+    mf.fig.canvas.draw()
+    background = np.asarray(mf.fig.canvas.buffer_rgba())[..., :3].astype(int)  # type: ignore
+    tracemalloc.start()
+    t = time.perf_counter()
+    if per_segment:
+        _plot_track_per_segment(mf, latitude, longitude, values)
+    else:
+        # A colormap object, since looking up names also loads all plotly colormaps
+        mf.plot_track(latitude, longitude, z=values, cmap=_CMAP, colorbar=False)
+    mf.fig.canvas.draw()
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    image = np.asarray(mf.fig.canvas.buffer_rgba())[..., :3].astype(int)  # type: ignore
+    plt.close(mf.fig)
+    return background, image, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    _run(100, "global", per_segment=False)  # warm up
+    for view in ("global", "zoomed"):
+        print(f"{view} map")
+        for num_samples in args.num_samples:
+            background, image_old, t_old, peak_old = _run(num_samples, view, per_segment=True)
+            _, image_new, t_new, peak_new = _run(num_samples, view, per_segment=False)
+            is_track = np.any(np.abs(image_old - background) > 32, axis=-1)
+            differs = np.any(np.abs(image_old - image_new) > 32, axis=-1)
+            print(
+                f"  {num_samples:7d} samples: per segment {t_old:6.2f} s, {peak_old / 1e6:5.0f} MB"
+                f" | plot_track {t_new:6.2f} s, {peak_new / 1e6:5.0f} MB"
+                f" | {100 * differs.sum() / is_track.sum():.1f}% of track pixels differ"
+            )
+
+
+if __name__ == "__main__":
+    main()
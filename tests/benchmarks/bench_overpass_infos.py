@@ -0,0 +1,76 @@
+"""Benchmark: `get_overpass_info` per site vs. `get_overpass_infos` for all sites at once.
+
+Writes synthetic ATL_EBD_2A frames (see `bench_read_products.py`) and evaluates a network of
+ground stations (near and far from the tracks) against every frame. Results of both
+approaches are checked to be identical.
+
+Usage:
+    python tests/benchmarks/bench_overpass_infos.py [--num_frames 8] [--num_sites 60]
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from bench_read_products import _create_frame
+from earthcarekit.overpass import get_overpass_info, get_overpass_infos
+from earthcarekit.read import read_product
+from earthcarekit.site import Site
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=8)
+    parser.add_argument("--num_samples", type=int, default=5000)
+    parser.add_argument("--num_sites", type=int, default=60)
+    parser.add_argument("--radius_km", type=float, default=100.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets = []
+        for i in range(args.num_frames):
+            filepath = _create_frame(tmp, i, args.num_samples, num_bins=8, num_vars=1)
+            with read_product(filepath) as ds:
+                datasets.append(ds.load())
+
+        sites = []
+        for i in range(args.num_sites):
+            ds = datasets[rng.integers(len(datasets))]
+            k = rng.integers(ds.sizes["along_track"])
+            lat = np.clip(ds["latitude"].values[k] + rng.uniform(-1, 1), -89.9, 89.9)
+            lon = ds["longitude"].values[k] + rng.uniform(-1, 1)
+            sites.append(Site(latitude=float(lat), longitude=float(lon), long_name=f"site{i}"))
+
+        t = time.perf_counter()
+        expected = []
+        for ds in datasets:
+            infos = []
+            for site in sites:
+                try:
+                    infos.append(get_overpass_info(ds, site, args.radius_km).to_dataframe())
+                except ValueError:
+                    continue
+            expected.append(pd.concat(infos, ignore_index=True))
+        t_loop = time.perf_counter() - t
+
+        t = time.perf_counter()
+        results = [get_overpass_infos(ds, sites, args.radius_km) for ds in datasets]
+        t_batch = time.perf_counter() - t
+
+        for r, e in zip(results, expected):
+            pd.testing.assert_frame_equal(r, e, check_exact=True)
+
+        num_overpasses = sum(len(r) for r in results)
+        print(
+            f"{args.num_frames} frames x {args.num_sites} sites "
+            f"({num_overpasses} overpasses, results identical)"
+        )
+        print(f"  get_overpass_info per site: {t_loop:6.2f} s")
+        print(f"  get_overpass_infos:         {t_batch:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark: mean/std profiles of many overpasses with `ProfileAccumulator` vs. concatenation.
+
+Creates synthetic site overpasses (e.g., ATLID backscatter profiles of one site) with slightly
+different height grids and computes the mean and standard deviation profiles on a common height
+grid, once by rebinning and concatenating all overpasses and calling `Profile.mean`/`Profile.std`,
+and once by adding the overpasses one by one to two accumulators (as if filled in separate
+processes) which are merged after a round trip through `.npz` files. Reports the time, the peak
+memory and the largest relative difference between the results.
+
+Usage:
+    python tests/benchmarks/bench_profile_accumulator.py [--num_overpasses 500] [--num_profiles 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from earthcarekit.data.profile import Profile, ProfileAccumulator
+
+_HEIGHT = np.linspace(-500.0, 20e3, 206)
+
+
+def _create_overpass(i: int, num_profiles: int) -> Profile:
+    rng = np.random.default_rng(i)
+    height = np.linspace(40e3, -500.0, 242)[None, :] + rng.normal(0.0, 20.0, (num_profiles, 1))
+    values = 1e-6 * np.exp(-np.clip(height, 0, None) / 8e3) * rng.lognormal(0.0, 0.3, height.shape)
+    values[rng.random(values.shape) < 0.2] = np.nan
+    return Profile(
+        values=values,
+        height=height,
+        time=np.datetime64("2025-01-01")
+        + np.timedelta64(i, "D")
+        + np.arange(num_profiles) * np.timedelta64(1, "s"),
+        latitude=np.full(num_profiles, 51.35),
+        longitude=np.full(num_profiles, 12.43),
+        units="m-1 sr-1",
+    )
+
+
+def _run_concatenated(num_overpasses: int, num_profiles: int) -> tuple[tuple, float, float]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    ps = [_create_overpass(i, num_profiles).rebin_height(_HEIGHT) for i in range(num_overpasses)]
+    p = Profile(
+        values=np.concatenate([p.values for p in ps]),
+        height=_HEIGHT,
+        time=np.concatenate([p.time for p in ps]),
+    )
+    result = (p.mean().values[0], p.std().values[0])
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def _run_accumulator(
+    num_overpasses: int, num_profiles: int, tmp: str
+) -> tuple[tuple, float, float]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    filepaths = []
+    for process in range(2):
+        acc = ProfileAccumulator(_HEIGHT)
+        for i in range(process, num_overpasses, 2):
+            acc.add(_create_overpass(i, num_profiles))
+        filepaths.append(os.path.join(tmp, f"p{process}.npz"))
+        acc.save(filepaths[-1])
+    acc = ProfileAccumulator.load(filepaths[0]).merge(ProfileAccumulator.load(filepaths[1]))
+    result = (acc.mean().values[0], acc.std().values[0])
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_overpasses", type=int, default=500)
+    parser.add_argument("--num_profiles", type=int, default=200)
+    args = parser.parse_args()
+
+    expected, t_old, peak_old = _run_concatenated(args.num_overpasses, args.num_profiles)
+    with tempfile.TemporaryDirectory() as tmp:
+        result, t_new, peak_new = _run_accumulator(args.num_overpasses, args.num_profiles, tmp)
+    with np.errstate(invalid="ignore"):
+        max_diff = [float(np.nanmax(np.abs(r / e - 1))) for r, e in zip(result, expected)]
+
+    print(f"{args.num_overpasses} overpasses x {args.num_profiles} profiles")
+    print(f"  concatenated: {t_old:6.2f} s, peak {peak_old / 1e6:6.0f} MB")
+    print(f"  accumulator:  {t_new:6.2f} s, peak {peak_new / 1e6:6.0f} MB")
+    print(f"  max. relative difference: mean {max_diff[0]:.1e}, std {max_diff[1]:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark: `Profile` operations in the calval pipelines.
+
+Creates a synthetic ATL_NOM_1B-like dataset and runs `compute_anom_depol_statistics`, the
+`Profile` chain it is built on (means, standard deviations, arithmetic and height range
+statistics of co-, cross-polar and Rayleigh profiles), `Profile.compare_to` and the profile
+selection done by `CurtainFigure.plot`. Reports the time, the peak memory and the number of full
+`Profile` validations (each re-parsing times and scanning heights) per pipeline.
+
+Usage:
+    python tests/benchmarks/bench_profile_ops.py [--num_samples 5000] [--num_bins 242]
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+import xarray as xr
+from earthcarekit.calval import compute_anom_depol_statistics
+from earthcarekit.data.profile import Profile
+
+
+def _create_anom(num_samples: int, num_bins: int, rng) -> xr.Dataset:
+    times = np.datetime64("2025-01-01T00:00:00") + np.arange(num_samples) * np.timedelta64(
+        142, "ms"
+    )
+    height = np.linspace(40e3, -500.0, num_bins)[None, :] + rng.normal(0.0, 5.0, (num_samples, 1))
+    signal = 1e-6 * np.exp(-np.clip(height, 0, None) / 8e3)
+    dims2d = ("along_track", "vertical")
+    return xr.Dataset(
+        {
+            "time": ("along_track", times),
+            "height": (dims2d, height),
+            "latitude": ("along_track", np.linspace(30.0, 40.0, num_samples)),
+            "longitude": ("along_track", np.linspace(60.0, 62.0, num_samples)),
+            "elevation": ("along_track", rng.uniform(0.0, 500.0, num_samples)),
+            "mie_attenuated_backscatter": (dims2d, signal * rng.uniform(0.8, 1.2, height.shape)),
+            "crosspolar_attenuated_backscatter": (
+                dims2d,
+                0.2 * signal * rng.uniform(0.8, 1.2, height.shape),
+            ),
+            "rayleigh_attenuated_backscatter": (
+                dims2d,
+                0.5 * signal * rng.uniform(0.8, 1.2, height.shape),
+            ),
+        }
+    )
+
+
+def _profile_chain(ds: xr.Dataset) -> float:
+    """Profile operations of `compute_anom_depol_statistics` (with Rayleigh correction)."""
+    cpol_p = Profile.from_dataset(ds, var="mie_attenuated_backscatter")
+    xpol_p = Profile.from_dataset(ds, var="crosspolar_attenuated_backscatter")
+    ray_p = Profile.from_dataset(ds, var="rayleigh_attenuated_backscatter")
+    xpol_mean_p = xpol_p.mean() - (ray_p.mean() * 0.004)
+    dpol_mean_p = xpol_mean_p / cpol_p.mean()
+    xpol_p_corr = xpol_p - (ray_p * 0.004)
+    height_range = (1000.0, 4000.0)
+    return (
+        dpol_mean_p.stats(height_range).mean
+        + cpol_p.stats(height_range).std
+        + xpol_p_corr.stats(height_range).std
+        + cpol_p.std().stats(height_range).std
+        + xpol_p.std().stats(height_range).std
+    )
+
+
+def _compare(ds: xr.Dataset) -> float:
+    p = Profile.from_dataset(ds, var="mie_attenuated_backscatter")
+    t = Profile.from_dataset(ds, var="crosspolar_attenuated_backscatter").coarsen_mean(10)
+    return p.compare_to(t, height_range=(1000.0, 4000.0)).rmse
+
+
+def _curtain_selection(ds: xr.Dataset) -> float:
+    """Profile selection steps of `CurtainFigure.plot`."""
+    p = Profile(
+        values=ds["mie_attenuated_backscatter"].values,
+        time=ds["time"].values,
+        height=ds["height"].values,
+    )
+    p = p.select_height_range((0.0, 20e3), pad_idx=1)
+    p = p.select_time_range((p.time[100], p.time[-100]))
+    return float(np.nanmean(p.values))
+
+
+def _run(func, ds: xr.Dataset) -> tuple[float, float, float, int]:
+    with mock.patch.object(Profile, "_validate", autospec=True, side_effect=Profile._validate) as m:
+        tracemalloc.start()
+        t = time.perf_counter()
+        result = func(ds)
+        elapsed = time.perf_counter() - t
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, elapsed, peak, m.call_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=5000)
+    parser.add_argument("--num_bins", type=int, default=242)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ds = _create_anom(args.num_samples, args.num_bins, rng)
+
+    def _anom_depol(ds: xr.Dataset) -> float:
+        results = compute_anom_depol_statistics(ds, (1000.0, 4000.0), is_rayleigh_corrected=True)
+        return results.error
+
+    print(f"{args.num_samples} profiles x {args.num_bins} bins")
+    for name, func in [
+        ("compute_anom_depol_statistics", _anom_depol),
+        ("profile chain", _profile_chain),
+        ("compare_to", _compare),
+        ("curtain selection", _curtain_selection),
+    ]:
+        func(ds)  # warm up
+        result, elapsed, peak, num_validations = _run(func, ds)
+        print(
+            f"  {name:30s} {elapsed:6.3f} s, peak {peak / 1e6:5.0f} MB, "
+            f"{num_validations:3d} validations, result {result:.6e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
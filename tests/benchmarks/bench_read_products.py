@@ -0,0 +1,164 @@
+"""Benchmark: multi-frame `read_products` with pairwise vs. preallocated concatenation.
+
+Writes synthetic ATL_EBD_2A frames (cycling through frames A-H of consecutive orbits) and
+compares the former frame-by-frame `concat_datasets` loop with `concat_dataset_list`, which
+allocates the output once and fills it in parallel. Results are checked to be identical.
+Also streams a zonal mean through the dask-backed dataset returned with `lazy=True`.
+
+Usage:
+    python tests/benchmarks/bench_read_products.py [--num_frames 24] [--num_samples 2000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import h5py  # type: ignore
+import numpy as np
+import xarray as xr
+from earthcarekit.read import read_product, read_products
+from earthcarekit.utils.xarray._concat import pad_dataset
+
+_FRAME_LATS = {
+    "A": (-23, 23),
+    "B": (22, 68),
+    "C": (67, 67),
+    "D": (68, 22),
+    "E": (23, -23),
+    "F": (-22, -68),
+    "G": (-67, -67),
+    "H": (-68, -22),
+}
+
+
+def _create_frame(
+    dirpath: str,
+    index: int,
+    num_samples: int,
+    num_bins: int = 242,
+    num_vars: int = 6,
+) -> str:
+    rng = np.random.default_rng(index)
+    orbit, frame_id = 1500 + index // 8, "ABCDEFGH"[index % 8]
+    t0 = 778539637.0 + index * 5800 / 8
+    name = f"ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_{orbit:05d}{frame_id}.h5"
+    filepath = os.path.join(dirpath, name)
+
+    start, stop = _FRAME_LATS[frame_id]
+    if start == stop:
+        # Polar frames: over the pole and back
+        sign = np.sign(start)
+        lat = sign * (90 - np.abs(np.linspace(-(90 - abs(start)), 90 - abs(start), num_samples)))
+    else:
+        lat = np.linspace(start, stop, num_samples)
+
+    with h5py.File(filepath, "w") as f:
+        g = f.create_group("ScienceData")
+        for dim, size in [("along_track", num_samples), ("JSG_height", num_bins)]:
+            g.create_dataset(dim, data=np.arange(size)).make_scale(dim)
+
+        def add(name, data, dims):
+            d = g.create_dataset(name, data=data)
+            for i, dim in enumerate(dims):
+                d.dims[i].attach_scale(g[dim])
+            return d
+
+        add("latitude", lat, ["along_track"])
+        add("longitude", np.linspace(-10, 10, num_samples) + index * 22.5, ["along_track"])
+        t = add("time", t0 + np.arange(num_samples) * 0.14, ["along_track"])
+        t.attrs["units"] = np.bytes_(b"seconds since 2000-01-01 00:00:00")
+        height = np.linspace(40e3, -1e3, num_bins)[None, :] + rng.normal(0, 10, (num_samples, 1))
+        add("height", height, ["along_track", "JSG_height"])
+        for i in range(num_vars):
+            name = "particle_backscatter_coefficient_355nm"
+            add(
+                f"{name}_{i}" if i else name,
+                rng.random((num_samples, num_bins)).astype(np.float32),
+                ["along_track", "JSG_height"],
+            )
+    return filepath
+
+
+def _concat_pairwise(ds1: xr.Dataset, ds2: xr.Dataset, dim: str) -> xr.Dataset:
+    """Former `concat_datasets` implementation (pads and concatenates both datasets)."""
+    scalar_vars = [k for ds in (ds1, ds2) for k, v in ds.data_vars.items() if v.ndim == 0]
+    scalar_vars = list(dict.fromkeys(scalar_vars))
+    scalar_data: dict = {v: [] for v in scalar_vars}
+    for v in scalar_vars:
+        for ds in (ds1, ds2):
+            if v in ds:
+                scalar_data[v].extend(np.atleast_1d(ds[v].values))
+
+    max_dim_sizes = {
+        d: max(ds1.sizes.get(d, 0), ds2.sizes.get(d, 0))
+        for d in set(ds1.dims).union(ds2.dims)
+        if d != dim
+    }
+    ds = xr.concat(
+        [pad_dataset(ds1, max_dim_sizes), pad_dataset(ds2, max_dim_sizes)],
+        dim=dim,
+        data_vars="all",
+    )
+    ds = ds.drop_dims("concat_dim", errors="ignore")
+    for v in scalar_vars:
+        ds[v] = xr.DataArray(scalar_data[v], dims=["concat_dim"])
+    return ds
+
+
+def _read_pairwise(filepaths: list[str]) -> xr.Dataset:
+    ds: xr.Dataset | None = None
+    for filepath in filepaths:
+        with read_product(filepath) as frame_ds:
+            frame_ds = frame_ds.load()
+            ds = frame_ds if ds is None else _concat_pairwise(ds, frame_ds, "along_track")
+    assert ds is not None
+    return ds
+
+
+def _measure(func, *args, **kwargs) -> tuple[xr.Dataset, float, float]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=24)
+    parser.add_argument("--num_samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepaths = [_create_frame(tmp, i, args.num_samples) for i in range(args.num_frames)]
+
+        expected, t_old, peak_old = _measure(_read_pairwise, filepaths)
+        result, t_new, peak_new = _measure(read_products, filepaths, coarsen=False)
+        del result.encoding["sources"]
+        xr.testing.assert_identical(result, expected)
+
+        size = expected.nbytes / 1e6
+        print(f"{args.num_frames} frames, output {size:.0f} MB (results identical)")
+        print(f"  pairwise:     {t_old:7.2f} s, peak {peak_old / 1e6:7.0f} MB")
+        print(f"  preallocated: {t_new:7.2f} s, peak {peak_new / 1e6:7.0f} MB")
+
+        _, t_coarse, _ = _measure(read_products, filepaths)
+        print(f"  preallocated, coarsened: {t_coarse:7.2f} s")
+
+        def _zonal_mean() -> xr.Dataset:
+            ds = read_products(filepaths, lazy=True)
+            bsc = ds["particle_backscatter_coefficient_355nm"]
+            return (
+                bsc.groupby_bins(ds["latitude"].compute(), np.arange(-90, 91, 10)).mean().compute()
+            )
+
+        _, t_lazy, peak_lazy = _measure(_zonal_mean)
+        print(f"  lazy zonal mean:         {t_lazy:7.2f} s, peak {peak_lazy / 1e6:7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
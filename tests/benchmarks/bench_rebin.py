@@ -0,0 +1,113 @@
+"""Benchmark: per-column/per-profile rebinning loops vs. vectorized rebinning kernels.
+
+Compares the former loop implementations (kept here as reference) with `rebin_mean`,
+`rebin_median` and `rebin_height` on a synthetic ATL_EBD_2A-sized curtain and checks that
+both yield the same results.
+
+Usage:
+    python tests/benchmarks/bench_rebin.py [--num_samples 20000] [--num_bins 242]
+"""
+
+import argparse
+import time
+import warnings
+from typing import Callable
+
+import numpy as np
+from earthcarekit.data.profile._rebin import rebin_height
+from earthcarekit.utils.numpy import centers_to_bins, rebin_mean, rebin_median
+from numpy.typing import NDArray
+
+
+def _loop_rebin_mean(v: NDArray, rebin_index: NDArray) -> NDArray:
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n, v.shape[1]), np.nan)
+    for j in range(v.shape[1]):
+        mask = np.isfinite(v[:, j])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v_new[:, j] = np.bincount(
+                rebin_index[mask], weights=v[mask, j], minlength=n
+            ) / np.bincount(rebin_index[mask], minlength=n)
+    return v_new
+
+
+def _loop_rebin_median(v: NDArray, rebin_index: NDArray) -> NDArray:
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n, v.shape[1]), np.nan)
+    edges = np.flatnonzero(np.diff(rebin_index)) + 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for start, end in zip(np.append(0, edges), np.append(edges, len(rebin_index))):
+            v_new[rebin_index[start]] = np.nanmedian(v[start:end], axis=0)
+    return v_new
+
+
+def _loop_rebin_height_mean(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
+    n, m_new = h.shape[0], h_new.shape[0]
+    v_new = np.full((n, m_new), np.nan)
+    edges = centers_to_bins(h_new)
+    for i in range(n):
+        bins = np.clip(np.digitize(h[i], edges) - 1, 0, m_new - 1)
+        mask = np.isfinite(v[i])
+        sums = np.bincount(bins[mask], weights=v[i, mask], minlength=m_new)
+        counts = np.bincount(bins[mask], minlength=m_new)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v_new[i] = sums / counts
+    return v_new
+
+
+def _best_of(func: Callable[[], NDArray], repeat: int) -> tuple[float, NDArray]:
+    times: list[float] = []
+    result = np.empty(0)
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=20000)
+    parser.add_argument("--num_bins", type=int, default=242)
+    parser.add_argument("--factor", type=int, default=10, help="Along-track samples per bin")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    v = rng.lognormal(-13, 1, (args.num_samples, args.num_bins))
+    v[rng.random(v.shape) < 0.2] = np.nan
+    rebin_index = np.arange(args.num_samples) // args.factor
+    h = np.linspace(40e3, -1e3, args.num_bins)[::-1] + rng.normal(0, 50, (args.num_samples, 1))
+    h_new = np.arange(0, 20e3, 250.0)
+
+    cases = [
+        (
+            "rebin_mean",
+            lambda: _loop_rebin_mean(v, rebin_index),
+            lambda: rebin_mean(v, rebin_index=rebin_index),
+        ),
+        (
+            "rebin_median",
+            lambda: _loop_rebin_median(v, rebin_index),
+            lambda: rebin_median(v, rebin_index=rebin_index),
+        ),
+        (
+            "rebin_height",
+            lambda: _loop_rebin_height_mean(h, h_new, v),
+            lambda: rebin_height(v, h, h_new, method="mean"),
+        ),
+    ]
+    print(f"Curtain: {args.num_samples} x {args.num_bins}, 20% NaN")
+    for label, loop_func, vectorized_func in cases:
+        t_loop, expected = _best_of(loop_func, args.repeat)
+        t_vec, result = _best_of(vectorized_func, args.repeat)
+        is_equal = np.allclose(result, expected, equal_nan=True, rtol=1e-12, atol=0)
+        print(
+            f"{label:>13}: loop {t_loop * 1e3:8.1f} ms, vectorized {t_vec * 1e3:8.1f} ms "
+            f"({t_loop / t_vec:5.1f}x), equal={is_equal}"
+        )
+
+
+if __name__ == "__main__":
+    main()
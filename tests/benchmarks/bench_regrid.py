@@ -0,0 +1,175 @@
+"""Benchmark: per-variable kd-tree regridding vs. a reusable `KDTreeRegridder`.
+
+Creates synthetic MSI swath, AUX_JSG_1D, AUX_MET_1D and vertical track datasets and rebins
+many variables with `rebin_msi_to_jsg` and `rebin_xmet_to_vertical_track`. Results are checked
+against the former implementations (kd-tree search and weighting per call, one variable and,
+for X-MET, one profile at a time), then timed once with a cold and once with a warm regridder
+cache directory.
+
+Usage:
+    python tests/benchmarks/bench_regrid.py [--num_samples 5000] [--num_vars 12]
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import xarray as xr
+from earthcarekit.geo import sequence_geo_to_ecef
+from earthcarekit.geo.convertsions import _geo_to_unit_ecef
+from earthcarekit.read import rebin_msi_to_jsg, rebin_xmet_to_vertical_track
+from scipy.spatial import cKDTree  # type: ignore
+
+
+def _create_msi_and_jsg(num_samples: int, num_vars: int, rng) -> tuple[xr.Dataset, xr.Dataset]:
+    def _swath(n: int, m: int, filename: str) -> xr.Dataset:
+        lat = np.linspace(-30.0, 30.0, n)[:, None] + np.zeros((1, m))
+        lon = 10.0 + np.linspace(-1.5, 1.5, m)[None, :] + 0.1 * lat
+        return xr.Dataset(
+            {
+                "latitude_swath": (("along_track", "across_track"), lat),
+                "longitude_swath": (("along_track", "across_track"), lon),
+                "time": ("along_track", np.arange(n).astype("datetime64[s]")),
+                "filename": ((), filename),
+            }
+        )
+
+    ds_msi = _swath(
+        2 * num_samples, 384, "ECA_EXAA_MSI_RGR_1C_20250101T000000Z_20250101T000000Z_00001A"
+    )
+    ds_xjsg = _swath(
+        num_samples, 29, "ECA_EXAA_AUX_JSG_1D_20250101T000000Z_20250101T000000Z_00001A"
+    )
+    for i in range(num_vars):
+        values = rng.normal(size=ds_msi["latitude_swath"].shape)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        ds_msi[f"var{i}"] = (("along_track", "across_track"), values)
+    return ds_msi, ds_xjsg
+
+
+def _create_xmet_and_track(num_samples: int, num_vars: int, rng) -> tuple[xr.Dataset, xr.Dataset]:
+    n_hgrid, n_height = 3000, 137
+    hlat = rng.uniform(-32.0, 32.0, n_hgrid)
+    hlon = rng.uniform(5.0, 15.0, n_hgrid)
+    hheight = np.sort(rng.uniform(-100.0, 80e3, (n_hgrid, n_height)), axis=1)
+    ds_xmet = xr.Dataset(
+        {
+            "latitude": ("horizontal_grid", hlat),
+            "longitude": ("horizontal_grid", hlon),
+            "geometrical_height": (("horizontal_grid", "height"), hheight),
+            "filename": ((), "ECA_EXAA_AUX_MET_1D_20250101T000000Z_20250101T000000Z_00001A"),
+        }
+    )
+    for i in range(num_vars):
+        ds_xmet[f"var{i}"] = (("horizontal_grid", "height"), rng.normal(size=hheight.shape))
+        ds_xmet[f"var1d{i}"] = ("horizontal_grid", rng.normal(size=n_hgrid))
+
+    lat = np.linspace(-30.0, 30.0, num_samples)
+    ds_vert = xr.Dataset(
+        {
+            "latitude": ("along_track", lat),
+            "longitude": ("along_track", 10.0 + 0.1 * lat),
+            "time": ("along_track", np.arange(num_samples).astype("datetime64[s]")),
+            "height": (
+                ("along_track", "vertical"),
+                np.linspace(40e3, -500.0, 242)[None, :] + np.zeros((num_samples, 1)),
+            ),
+            "filename": ((), "ECA_EXAA_ATL_EBD_2A_20250101T000000Z_20250101T000000Z_00001A"),
+        }
+    )
+    return ds_xmet, ds_vert
+
+
+def _rebin_msi_former(ds_msi, ds_xjsg, vars, k=4, eps=1e-12) -> dict:
+    """Former per-variable weighting of `rebin_msi_to_jsg` (NaN masks not kept across variables)."""
+    coords_msi = sequence_geo_to_ecef(
+        ds_msi["latitude_swath"].values.flatten(), ds_msi["longitude_swath"].values.flatten()
+    )
+    coords_jsg = sequence_geo_to_ecef(
+        ds_xjsg["latitude_swath"].values.flatten(), ds_xjsg["longitude_swath"].values.flatten()
+    )
+    dists, idxs = cKDTree(coords_msi).query(coords_jsg, k=k)
+    results = {}
+    for var in vars:
+        values_flat = ds_msi[var].values.flatten()
+        _dists = dists.copy()
+        _dists[np.isnan(values_flat[idxs])] = np.inf
+        weights = 1.0 / (_dists + eps)
+        weights /= np.sum(weights, axis=1, keepdims=True)
+        _v = values_flat[idxs]
+        m = np.all(np.isnan(_v), axis=1)
+        _v[np.isnan(_v)] = 0.0
+        _v[m] = np.nan
+        results[var] = np.sum(_v * weights, axis=1).reshape(ds_xjsg["latitude_swath"].shape)
+    return results
+
+
+def _rebin_xmet_former(ds_xmet, ds_vert, vars, k=4, eps=1e-12) -> dict:
+    """Former per-variable and per-profile interpolation of `rebin_xmet_to_vertical_track`."""
+    hgrid_coords = _geo_to_unit_ecef(ds_xmet["latitude"].values, ds_xmet["longitude"].values)
+    track_coords = _geo_to_unit_ecef(ds_vert["latitude"].values, ds_vert["longitude"].values)
+    track_alt = ds_vert["height"].values
+    dists, idxs = cKDTree(hgrid_coords).query(track_coords, k=k)
+    weights = 1.0 / (dists + eps)
+    weights /= np.sum(weights, axis=1, keepdims=True)
+    height = np.einsum("ij,ijh->ih", weights, ds_xmet["geometrical_height"].values[idxs])
+    results = {}
+    for var in vars:
+        values = ds_xmet[var].values
+        if values.ndim == 1:
+            results[var] = np.sum(values[idxs] * weights, axis=1)
+            continue
+        gridded = np.einsum("ij,ijh->ih", weights, values[idxs])
+        new_values = np.empty(track_alt.shape)
+        for i in range(track_alt.shape[0]):
+            new_values[i] = np.interp(track_alt[i], height[i], gridded[i])
+        results[var] = new_values
+    return results
+
+
+def _time(func, *args, **kwargs) -> tuple[object, float]:
+    t = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - t
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=5000)
+    parser.add_argument("--num_vars", type=int, default=12)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ds_msi, ds_xjsg = _create_msi_and_jsg(args.num_samples, args.num_vars, rng)
+    ds_xmet, ds_vert = _create_xmet_and_track(args.num_samples, args.num_vars, rng)
+    msi_vars = [f"var{i}" for i in range(args.num_vars)]
+    xmet_vars = msi_vars + [f"var1d{i}" for i in range(args.num_vars)]
+
+    cases = [
+        ("rebin_msi_to_jsg", rebin_msi_to_jsg, _rebin_msi_former, ds_msi, ds_xjsg, msi_vars),
+        (
+            "rebin_xmet_to_vertical_track",
+            rebin_xmet_to_vertical_track,
+            _rebin_xmet_former,
+            ds_xmet,
+            ds_vert,
+            xmet_vars,
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func, former, ds_src, ds_tgt, vars in cases:
+            expected, t_old = _time(former, ds_src, ds_tgt, vars)
+            result, t_cold = _time(func, ds_src, ds_tgt, vars=list(vars), cache_dir=tmp)
+            result, t_warm = _time(func, ds_src, ds_tgt, vars=list(vars), cache_dir=tmp)
+            for var in vars:
+                np.testing.assert_array_equal(result[var].values, expected[var])
+
+            print(f"{name}: {len(vars)} variables, {args.num_samples} samples (results identical)")
+            print(f"  former, per variable:   {t_old:6.2f} s")
+            print(f"  regridder, cold cache:  {t_cold:6.2f} s")
+            print(f"  regridder, warm cache:  {t_warm:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
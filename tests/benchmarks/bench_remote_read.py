@@ -0,0 +1,152 @@
+"""Benchmark: remote `LazyDataset` reads with fsspec block cache vs. `RemoteRangeFile`.
+
+Serves a synthetic, chunked ATL_EBD_2A frame from a local HTTP server that supports range
+requests and counts requests and transferred bytes for typical access patterns.
+
+Usage:
+    python tests/benchmarks/bench_remote_read.py [--num_samples 20000]
+"""
+
+import argparse
+import http.server
+import os
+import re
+import tempfile
+import threading
+import time
+
+import h5py  # type: ignore
+import numpy as np
+from earthcarekit.read import LazyDataset
+from earthcarekit.read.lazy import _dataset
+
+_NAME = "ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_01500B.h5"
+_VAR = "particle_backscatter_coefficient_355nm"
+
+
+def _create_product(dirpath: str, num_samples: int, num_bins: int = 242) -> str:
+    rng = np.random.default_rng(0)
+    filepath = os.path.join(dirpath, _NAME)
+    with h5py.File(filepath, "w") as f:
+        g = f.create_group("ScienceData")
+        for name, size in [("along_track", num_samples), ("JSG_height", num_bins)]:
+            g.create_dataset(name, data=np.arange(size)).make_scale(name)
+
+        def add(name, data, dims):
+            chunks = (1000,) if data.ndim == 1 else (256, num_bins)
+            d = g.create_dataset(name, data=data, chunks=chunks, compression="gzip")
+            for i, dim in enumerate(dims):
+                d.dims[i].attach_scale(g[dim])
+            return d
+
+        add("latitude", np.linspace(15, 75, num_samples), ["along_track"])
+        add("longitude", np.linspace(0, 10, num_samples), ["along_track"])
+        t = add("time", 778539637.0 + np.arange(num_samples) * 0.14, ["along_track"])
+        t.attrs["units"] = np.bytes_(b"seconds since 2000-01-01 00:00:00")
+        height = np.linspace(40e3, -1e3, num_bins)[None, :] + rng.normal(0, 10, (num_samples, 1))
+        add("height", height, ["along_track", "JSG_height"])
+        for i in range(6):
+            add(
+                f"{_VAR}_{i}" if i else _VAR,
+                rng.random((num_samples, num_bins)),
+                ["along_track", "JSG_height"],
+            )
+    return filepath
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.num_requests = 0
+        self.num_bytes = 0
+        self.lock = threading.Lock()
+
+
+def _serve(dirpath: str, counter: _Counter) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, with_body: bool) -> None:
+            filepath = os.path.join(dirpath, os.path.basename(self.path))
+            size = os.path.getsize(filepath)
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            start, stop = 0, size - 1
+            if match:
+                start = int(match.group(1))
+                stop = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{stop}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(stop - start + 1))
+            self.end_headers()
+            if not with_body:
+                return
+            with open(filepath, "rb") as f:
+                f.seek(start)
+                data = f.read(stop - start + 1)
+            self.wfile.write(data)
+            with counter.lock:
+                counter.num_requests += 1
+                counter.num_bytes += len(data)
+
+        def do_GET(self):
+            self._send(True)
+
+        def do_HEAD(self):
+            with counter.lock:
+                counter.num_requests += 1
+            self._send(False)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _run(url: str, counter: _Counter, **kwargs) -> tuple[float, int, int]:
+    counter.num_requests = counter.num_bytes = 0
+    t = time.perf_counter()
+    with LazyDataset(url, use_cache=False, fsspec_kwargs={"headers": {}}, **kwargs) as lds:
+        for var in ["time", "latitude", "height", _VAR]:
+            lds[var].values
+    return time.perf_counter() - t, counter.num_requests, counter.num_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=20000)
+    args = parser.parse_args()
+
+    # No MAAP token needed for the local server
+    _dataset.get_maap_access_token = lambda *args, **kwargs: ""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = _create_product(tmp, args.num_samples)
+        print(f"Product: {os.path.getsize(filepath) / 1e6:.1f} MB")
+        counter = _Counter()
+        server = _serve(tmp, counter)
+        url = f"http://127.0.0.1:{server.server_address[1]}/{_NAME}"
+        cache_dir = os.path.join(tmp, "cache")
+        try:
+            for selection, kwargs in [("full frame", {}), ("lat cutout", {"lat_range": (45, 47)})]:
+                for label, mode_kwargs in [
+                    ("fsspec", {}),
+                    ("range", {"remote_mode": "range"}),
+                    ("range (warm dir)", {"remote_mode": "range", "remote_cache_dir": cache_dir}),
+                ]:
+                    if "remote_cache_dir" in mode_kwargs:
+                        _run(url, counter, **kwargs, **mode_kwargs)  # populate cache directory
+                    elapsed, num_requests, num_bytes = _run(url, counter, **kwargs, **mode_kwargs)
+                    print(
+                        f"{selection:>11} | {label:>16}: {num_requests:5d} requests, "
+                        f"{num_bytes / 1e6:8.2f} MB, {elapsed:6.3f} s"
+                    )
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
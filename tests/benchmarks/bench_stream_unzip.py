@@ -0,0 +1,123 @@
+"""Benchmark: download-then-unzip vs. streaming extraction of product archives.
+
+Serves a synthetic L1-sized product archive from a local HTTP server and compares
+the classic pipeline (write ZIP, extract, delete ZIP) with `stream_unzip`.
+
+Usage:
+    python tests/benchmarks/bench_stream_unzip.py [--size_mb 500]
+"""
+
+import argparse
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+
+import numpy as np
+import requests
+from earthcarekit.download._stream_unzip import stream_unzip
+from earthcarekit.download._unzip import unzip_file
+
+_CHUNK_SIZE = 1024 * 1024
+_NAME = "ECA_EXBA_ATL_NOM_1B_20240902T210037Z_20240903T003512Z_01500B"
+
+
+def _create_archive(dirpath: str, size_mb: int) -> str:
+    # Mix of random and repeated bytes, roughly as compressible as L1 HDF5 data
+    rng = np.random.default_rng(42)
+    filepath = os.path.join(dirpath, f"{_NAME}.ZIP")
+    with zipfile.ZipFile(filepath, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr(f"{_NAME}/{_NAME}.HDR", "<Earth_Explorer_Header/>" * 100)
+        with z.open(f"{_NAME}/{_NAME}.h5", "w", force_zip64=True) as f:
+            for _ in range(size_mb):
+                block = rng.integers(0, 16, _CHUNK_SIZE, dtype=np.uint8)
+                block[::2] = 0
+                f.write(block.tobytes())
+    return filepath
+
+
+def _serve(dirpath: str) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=dirpath, **kwargs)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _dir_size(dirpath: str) -> int:
+    return sum(os.path.getsize(os.path.join(r, f)) for r, _, fs in os.walk(dirpath) for f in fs)
+
+
+def _bench_download_then_unzip(url: str, dest: str) -> tuple[float, int]:
+    t = time.perf_counter()
+    zip_filepath = os.path.join(dest, f"{_NAME}.ZIP")
+    with requests.get(url, stream=True) as r:
+        r.raise_for_status()
+        with open(zip_filepath, "wb") as f:
+            for chunk in r.iter_content(_CHUNK_SIZE):
+                f.write(chunk)
+    zip_size = os.path.getsize(zip_filepath)
+    unzip_file(zip_filepath, delete=True)
+    elapsed = time.perf_counter() - t
+    # ZIP written + ZIP read + members written
+    io_bytes = 2 * zip_size + _dir_size(dest)
+    return elapsed, io_bytes
+
+
+def _bench_stream_unzip(url: str, dest: str) -> tuple[float, int]:
+    t = time.perf_counter()
+    with requests.get(url, stream=True) as r:
+        r.raise_for_status()
+        result = stream_unzip(r.iter_content(_CHUNK_SIZE), os.path.join(dest, _NAME))
+    elapsed = time.perf_counter() - t
+    return elapsed, result.bytes_written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size_mb", type=int, default=500, help="Uncompressed product size")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        srv_dirpath = os.path.join(tmp, "srv")
+        os.makedirs(srv_dirpath)
+        archive = _create_archive(srv_dirpath, args.size_mb)
+        print(
+            f"Archive: {os.path.getsize(archive) / 1e6:.1f} MB compressed, "
+            f"{args.size_mb * _CHUNK_SIZE / 1e6:.1f} MB uncompressed"
+        )
+
+        server = _serve(srv_dirpath)
+        url = f"http://127.0.0.1:{server.server_address[1]}/{os.path.basename(archive)}"
+        try:
+            for label, bench in [
+                ("download + unzip", _bench_download_then_unzip),
+                ("stream unzip", _bench_stream_unzip),
+            ]:
+                times: list[float] = []
+                io_bytes = 0
+                for _ in range(args.repeat):
+                    dest = os.path.join(tmp, "data")
+                    os.makedirs(dest)
+                    elapsed, io_bytes = bench(url, dest)
+                    times.append(elapsed)
+                    shutil.rmtree(dest)
+                print(
+                    f"{label:>18}: {min(times):7.3f} s (best of {args.repeat}), "
+                    f"disk I/O {io_bytes / 1e6:8.1f} MB"
+                )
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
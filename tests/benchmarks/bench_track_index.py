@@ -0,0 +1,115 @@
+"""Benchmark: overpass discovery by reading every product vs. querying a `TrackIndex`.
+
+Writes synthetic ATL_EBD_2A frames (see `bench_read_products.py`) and searches overpasses of
+many sites placed near (and far from) the tracks, once with `get_overpass_info` on every
+product and once with a track index built from (and cached in) a `ProductCatalog`. Closest
+distances and index ranges of both approaches are compared.
+
+Usage:
+    python tests/benchmarks/bench_track_index.py [--num_frames 48] [--num_sites 42]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from bench_read_products import _create_frame
+from earthcarekit.overpass import TrackIndex, get_overpass_info
+from earthcarekit.read import ProductCatalog, read_product
+from earthcarekit.site import Site
+
+
+def _create_sites(filepaths: list[str], num_sites: int, seed: int = 0) -> list[Site]:
+    rng = np.random.default_rng(seed)
+    sites = []
+    for i in range(num_sites):
+        with read_product(filepaths[rng.integers(len(filepaths))]) as ds:
+            k = rng.integers(ds.sizes["along_track"])
+            lat = float(ds["latitude"].values[k]) + rng.uniform(-0.5, 0.5)
+            lon = float(ds["longitude"].values[k]) + rng.uniform(-0.5, 0.5)
+        sites.append(Site(latitude=np.clip(lat, -89.9, 89.9), longitude=lon, long_name=f"s{i}"))
+    return sites
+
+
+def _search_all(filepaths: list[str], sites: list[Site], radius_km: float) -> dict:
+    results = {}
+    for filepath in filepaths:
+        for site in sites:
+            try:
+                info = get_overpass_info(filepath, site, radius_km)
+            except ValueError:
+                continue
+            results[(site.long_name, filepath)] = info
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_frames", type=int, default=48)
+    parser.add_argument("--num_samples", type=int, default=2000)
+    parser.add_argument("--num_sites", type=int, default=42)
+    parser.add_argument("--radius_km", type=float, default=100.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepaths = [
+            _create_frame(tmp, i, args.num_samples, num_bins=8, num_vars=1)
+            for i in range(args.num_frames)
+        ]
+        sites = _create_sites(filepaths, args.num_sites)
+
+        t = time.perf_counter()
+        expected = _search_all(filepaths, sites, args.radius_km)
+        t_loop = time.perf_counter() - t
+
+        catalog_path = os.path.join(tmp, "catalog.sqlite")
+        t = time.perf_counter()
+        with ProductCatalog(tmp, filepath=catalog_path) as catalog:
+            index = TrackIndex.from_products(filepaths, catalog=catalog)
+        t_build = time.perf_counter() - t
+
+        t = time.perf_counter()
+        with ProductCatalog(tmp, filepath=catalog_path) as catalog:
+            index = TrackIndex.from_products(filepaths, catalog=catalog)
+        t_cached = time.perf_counter() - t
+
+        t = time.perf_counter()
+        df = index.query(sites, radius_km=args.radius_km)
+        t_query = time.perf_counter() - t
+
+        found = {(r.site_name, r.filepath): r for r in df.itertuples()}
+        only_loop = [k for k in expected if k not in found]
+        only_index = [k for k in found if k not in expected]
+        for key in only_loop + only_index:
+            # Misses are only allowed at the edge of the search radius
+            d = (
+                expected[key].closest_distance_km
+                if key in expected
+                else found[key].closest_distance_km
+            )
+            assert abs(d - args.radius_km) < 1.0, (key, d)
+
+        errors = {"distance_km": [], "closest_index": [], "start_index": [], "end_index": []}
+        for key in set(expected) & set(found):
+            e, r = expected[key], found[key]
+            errors["distance_km"].append(abs(e.closest_distance_km - r.closest_distance_km))
+            errors["closest_index"].append(abs(e.closest_index - r.closest_index))
+            errors["start_index"].append(abs(e.start_index - r.start_index))
+            errors["end_index"].append(abs(e.end_index - r.end_index))
+
+        print(
+            f"{args.num_frames} frames, {args.num_sites} sites, {len(expected)} overpasses "
+            f"({len(only_loop)} missed, {len(only_index)} extra at the radius edge)"
+        )
+        print(f"  read all products:  {t_loop:7.2f} s")
+        print(f"  build index:        {t_build:7.2f} s")
+        print(f"  build from catalog: {t_cached:7.2f} s")
+        print(f"  query index:        {t_query:7.3f} s")
+        for name, values in errors.items():
+            print(f"  max abs. error {name:>13}: {np.max(values, initial=0):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Shared fixtures: synthetic EarthCARE products written with `h5py`."""
+
+import os
+from typing import Callable
+
+import h5py  # type: ignore
+import numpy as np
+import pytest
+
+_T0 = 778626037.0  # 2024-09-02T21:00:37 in seconds since 2000-01-01
+
+
+def write_atl_ebd_2a(
+    dirpath: str,
+    orbit_and_frame: str = "01500A",
+    num_samples: int = 200,
+    num_bins: int = 40,
+    lat_range: tuple[float, float] = (-25.0, 25.0),
+    time_offset: float = 0.0,
+    chunks: tuple[int, int] | None = (16, 8),
+    extra_vars: dict[str, tuple[np.ndarray, list[str]]] | None = None,
+) -> str:
+    """Writes a minimal ATL_EBD_2A product and returns its path.
+
+    Besides the track coordinates, time, height and geoid offset, the product contains the
+    float variable "particle_backscatter_coefficient_355nm" (with fill values 9.96921e36 in the
+    middle profile) and the integer variable "simple_classification" (fill value -127). Variables
+    in `extra_vars` map names to values and dimension names ("along_track", "JSG_height").
+    """
+    rng = np.random.default_rng(int(orbit_and_frame[:5]) * 8 + "ABCDEFGH".index(orbit_and_frame[5]))
+    name = f"ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_{orbit_and_frame}.h5"
+    filepath = os.path.join(dirpath, name)
+
+    with h5py.File(filepath, "w") as f:
+        g = f.create_group("ScienceData")
+        for dim, size in [("along_track", num_samples), ("JSG_height", num_bins)]:
+            g.create_dataset(dim, data=np.arange(size)).make_scale(dim)
+
+        def add(name: str, data: np.ndarray, dims: list[str]) -> h5py.Dataset:
+            _chunks = None if chunks is None else tuple(chunks[: data.ndim])
+            if data.ndim == 0:
+                _chunks = None
+            d = g.create_dataset(name, data=data, chunks=_chunks)
+            for i, dim in enumerate(dims):
+                d.dims[i].attach_scale(g[dim])
+            return d
+
+        add("latitude", np.linspace(*lat_range, num_samples), ["along_track"])
+        add("longitude", np.linspace(-10, 10, num_samples), ["along_track"])
+        t = add("time", _T0 + time_offset + np.arange(num_samples) * 0.14, ["along_track"])
+        t.attrs["units"] = np.bytes_(b"seconds since 2000-01-01 00:00:00")
+        add("geoid_offset", rng.normal(20, 5, num_samples), ["along_track"])
+        height = np.linspace(20e3, -500, num_bins)[None, :] + rng.normal(0, 10, (num_samples, 1))
+        add("height", height, ["along_track", "JSG_height"])
+
+        bsc = rng.random((num_samples, num_bins)).astype(np.float32)
+        bsc[num_samples // 2, :] = 9.96921e36
+        add("particle_backscatter_coefficient_355nm", bsc, ["along_track", "JSG_height"])
+        classification = rng.integers(-1, 5, (num_samples, num_bins)).astype(np.int8)
+        classification[num_samples // 2, :] = -127
+        d = add("simple_classification", classification, ["along_track", "JSG_height"])
+        d.attrs["_FillValue"] = np.int8(-127)
+
+        for name, (data, dims) in (extra_vars or {}).items():
+            add(name, np.asarray(data), dims)
+
+    return filepath
+
+
+@pytest.fixture
+def atl_ebd_2a(tmp_path) -> Callable[..., str]:
+    """Returns a function writing synthetic ATL_EBD_2A products to a temporary directory."""
+
+    def _write(**kwargs) -> str:
+        return write_atl_ebd_2a(str(tmp_path), **kwargs)
+
+    return _write
@@ -0,0 +1,198 @@
+"""Tests for the on-disk product catalog used by `search_product(mode="catalog")`."""
+
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+import pytest
+from earthcarekit.read.product import _catalog, _search
+from earthcarekit.read.product._catalog import CATALOG_SCHEMA_VERSION, ProductCatalog
+from earthcarekit.read.product._search import search_product
+from earthcarekit.utils._config import ECKConfig
+
+
+def _filename(file_type: str, orbit_and_frame: str, baseline: str = "BA") -> str:
+    return f"ECA_EX{baseline}_{file_type}_20250101T000000Z_20250101T010000Z_{orbit_and_frame}.h5"
+
+
+def _touch(dirpath: str, filename: str, hdr: bool = True) -> str:
+    os.makedirs(dirpath, exist_ok=True)
+    filepath = os.path.join(dirpath, filename)
+    open(filepath, "w").close()
+    if hdr:
+        open(filepath.removesuffix(".h5") + ".HDR", "w").close()
+    return filepath
+
+
+def _bump_mtime(dirpath: str) -> None:
+    # Directory mtimes may not change within one timer tick, so they are advanced explicitly
+    mtime_ns = os.stat(dirpath).st_mtime_ns + 1_000_000_000
+    os.utime(dirpath, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def archive(tmp_path) -> str:
+    root = str(tmp_path / "data")
+    _touch(os.path.join(root, "level2a", "ATL_EBD_2A", "a"), _filename("ATL_EBD_2A", "01234A"))
+    _touch(os.path.join(root, "level2a", "ATL_EBD_2A", "b"), _filename("ATL_EBD_2A", "01234B"))
+    _touch(
+        os.path.join(root, "level1b", "ATL_NOM_1B"),
+        _filename("ATL_NOM_1B", "01234A"),
+        hdr=False,
+    )
+    return root
+
+
+@pytest.fixture
+def catalog(archive, tmp_path):
+    with ProductCatalog(archive, filepath=str(tmp_path / "catalog.sqlite")) as catalog:
+        yield catalog
+
+
+def test_update_catalogs_files_and_headers(catalog, archive) -> None:
+    result = catalog.update()
+    assert result.num_files == 3
+    assert result.num_dirs_scanned == 7
+    assert catalog.verify().is_valid
+
+    pdf = catalog.get_product_infos(catalog.search_files(r".*\.h5"))
+    hdr = dict(zip(pdf["file_type"].map(str), pdf["hdr_filepath"]))
+    assert hdr["ATL_NOM_1B"] == ""
+    assert os.path.isfile(hdr["ATL_EBD_2A"])
+
+
+def test_update_is_incremental(catalog, archive) -> None:
+    catalog.update()
+    assert catalog.update().num_dirs_scanned == 0
+
+    dirpath = os.path.join(archive, "level2a", "ATL_EBD_2A", "a")
+    _touch(dirpath, _filename("ATL_EBD_2A", "01235A"))
+    _bump_mtime(dirpath)
+    result = catalog.update()
+    assert result.num_dirs_scanned == 1
+    assert result.num_files == 4
+    assert len(catalog.search_files(r".*01235A\.h5")) == 1
+
+
+def test_update_removes_deleted_files_and_dirs(catalog, archive) -> None:
+    catalog.update()
+    dirpath = os.path.join(archive, "level2a", "ATL_EBD_2A", "a")
+    os.remove(os.path.join(dirpath, _filename("ATL_EBD_2A", "01234A")))
+    _bump_mtime(dirpath)
+    assert catalog.update().num_files == 2
+
+    dirpath = os.path.join(archive, "level1b", "ATL_NOM_1B")
+    for filename in os.listdir(dirpath):
+        os.remove(os.path.join(dirpath, filename))
+    os.rmdir(dirpath)
+    _bump_mtime(os.path.join(archive, "level1b"))
+    result = catalog.update()
+    assert result.num_dirs_removed == 1
+    assert result.num_files == 1
+    assert catalog.verify().is_valid
+
+
+def test_update_max_age(catalog, archive) -> None:
+    assert catalog.last_update is None
+    catalog.update(max_age=3600)
+    assert catalog.last_update is not None
+
+    dirpath = os.path.join(archive, "level2a", "ATL_EBD_2A", "b")
+    _touch(dirpath, _filename("ATL_EBD_2A", "01235B"))
+    _bump_mtime(dirpath)
+    assert catalog.update(max_age=3600).num_files == 3
+    assert catalog.update(max_age=0).num_files == 4
+
+
+def test_schema_migration(archive, tmp_path) -> None:
+    filepath = str(tmp_path / "catalog.sqlite")
+    with sqlite3.connect(filepath) as conn:
+        conn.executescript(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+            "CREATE TABLE dirs (dirpath TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER);"
+            "CREATE TABLE files (filepath TEXT PRIMARY KEY, dirpath TEXT, filename TEXT);"
+            "INSERT INTO meta VALUES ('schema_version', '1');"
+            f"INSERT INTO dirs VALUES ('{archive}', NULL, 0);"
+            "INSERT INTO files VALUES ('/old/file.h5', '/old', 'file.h5');"
+        )
+    conn.close()
+
+    with ProductCatalog(archive, filepath=filepath) as catalog:
+        assert len(catalog) == 0
+        assert catalog.update().num_files == 3
+        version = catalog._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert int(version) == CATALOG_SCHEMA_VERSION
+
+
+def test_concurrent_updates(archive, tmp_path) -> None:
+    filepath = str(tmp_path / "catalog.sqlite")
+    errors: list[Exception] = []
+
+    def _update() -> None:
+        try:
+            with ProductCatalog(archive, filepath=filepath) as catalog:
+                for _ in range(5):
+                    catalog.update()
+                    catalog.search_files(r".*\.h5")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=_update) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with ProductCatalog(archive, filepath=filepath) as catalog:
+        assert len(catalog) == 3
+        assert catalog.verify().is_valid
+
+
+def test_search_product_catalog_matches_exhaustive(archive, tmp_path, monkeypatch) -> None:
+    filepath = str(tmp_path / "catalog.sqlite")
+    monkeypatch.setattr(_catalog, "get_default_catalog_filepath", lambda path: filepath)
+    config = ECKConfig(path_to_data=archive)
+
+    for kwargs in [dict(file_type="ATL_EBD_2A"), dict(orbit_and_frame="01234A")]:
+        expected = search_product(config=config, mode="exhaustive", **kwargs)
+        result = search_product(config=config, mode="catalog", **kwargs)
+        assert len(result) > 0
+        pd.testing.assert_frame_equal(pd.DataFrame(result), pd.DataFrame(expected))
+
+
+@pytest.mark.parametrize("mode", ["catalog", "exhaustive"])
+def test_load_product_finds_file_after_download(archive, tmp_path, monkeypatch, mode) -> None:
+    import earthcarekit.download
+    from earthcarekit.workflow.load._load_product import _load_product
+
+    filepath = str(tmp_path / "catalog.sqlite")
+    monkeypatch.setattr(_catalog, "get_default_catalog_filepath", lambda path: filepath)
+    dirpath = os.path.join(archive, "level2a", "ATL_EBD_2A", "a")
+    calls: list[dict] = []
+
+    def _ecdownload(**kwargs) -> None:
+        calls.append(kwargs)
+        _touch(dirpath, _filename("ATL_EBD_2A", "01236A"))
+        _bump_mtime(dirpath)
+
+    monkeypatch.setattr(earthcarekit.download, "ecdownload", _ecdownload)
+    monkeypatch.setattr(_search, "read_config", lambda config: ECKConfig(path_to_data=archive))
+
+    # The catalog was updated just before the download
+    assert len(search_product(path_to_data=archive, orbit_and_frame="01236A", mode=mode)) == 0
+    result = _load_product(
+        False,
+        "ATL_EBD_2A",
+        "01236A",
+        baseline="BA",
+        path_to_data=archive,
+        mode=mode,
+        download=True,
+        return_path=True,
+    )
+    assert len(calls) == 1
+    assert result == os.path.join(dirpath, _filename("ATL_EBD_2A", "01236A"))
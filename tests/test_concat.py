@@ -0,0 +1,179 @@
+"""Tests for concatenating frames with `concat_dataset_list` and `read_products` (eager and lazy)."""
+
+import numpy as np
+import pytest
+import xarray as xr
+from earthcarekit.read import read_product, read_products
+from earthcarekit.read.info import ProductDataFrame
+from earthcarekit.utils.xarray import concat_dataset_list
+
+_TIME0 = np.datetime64("2025-01-01T00:00:00", "ns")
+
+
+def _frame(n: int, m: int, i: int, **extra) -> xr.Dataset:
+    ds = xr.Dataset(
+        {
+            "time": ("along_track", _TIME0 + np.arange(n) * np.timedelta64(1, "s")),
+            "height": (("along_track", "vertical"), np.full((n, m), 1.0 + i)),
+            "int8": (("along_track", "vertical"), np.full((n, m), i, dtype=np.int8)),
+            "int32": (("along_track", "vertical"), np.full((n, m), i, dtype=np.int32)),
+            "uint8": (("along_track", "vertical"), np.full((n, m), i, dtype=np.uint8)),
+            "layer": ("vertical", np.arange(m, dtype=np.float32)),
+            "orbit_number": ((), 100 + i),
+            "frame_id": ((), "ABCDEFGH"[i]),
+        },
+        attrs={"title": f"frame {i}"},
+    )
+    for name, value in extra.items():
+        ds[name] = value
+    ds["height"].attrs["units"] = "m"
+    return ds
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_concat_dataset_list_pads_mismatched_sizes(max_workers) -> None:
+    frames = [_frame(3, 4, 0), _frame(2, 6, 1), _frame(4, 5, 2)]
+    ds = concat_dataset_list(frames, dim="along_track", max_workers=max_workers)
+
+    assert dict(ds.sizes) == {"along_track": 9, "vertical": 6, "concat_dim": 3}
+    assert ds.attrs == {"title": "frame 0"}
+    assert ds["height"].attrs == {"units": "m"}
+
+    height = ds["height"].values
+    np.testing.assert_array_equal(height[:3, :4], 1.0)
+    assert np.isnan(height[:3, 4:]).all()
+    np.testing.assert_array_equal(height[3:5], 2.0)
+    assert np.isnan(height[5:, 5:]).all()
+
+    # Integer fill values: -9999 if representable, otherwise the dtype's minimum
+    assert ds["int8"].dtype == np.int8 and ds["int8"].values[0, -1] == -128
+    assert ds["int32"].dtype == np.int32 and ds["int32"].values[0, -1] == -9999
+    assert ds["uint8"].dtype == np.uint8 and ds["uint8"].values[0, -1] == 0
+    np.testing.assert_array_equal(ds["int32"].values[5:, :5], 2)
+
+    # Variables without the concatenation dimension are broadcast along it
+    assert ds["layer"].dims == ("along_track", "vertical")
+    np.testing.assert_array_equal(ds["layer"].values[3], np.arange(6))
+    assert np.isnan(ds["layer"].values[0, 4:]).all()
+
+    expected_time = xr.concat([f["time"] for f in frames], dim="along_track")
+    np.testing.assert_array_equal(ds["time"].values, expected_time.values)
+
+
+def test_concat_dataset_list_scalars_and_missing_variables() -> None:
+    frames = [
+        _frame(2, 3, 0, extra=(("along_track",), np.ones(2, dtype=np.float32))),
+        _frame(2, 3, 1),
+        _frame(2, 3, 2, extra=(("along_track",), np.full(2, 3.0))),
+    ]
+    ds = concat_dataset_list(frames, dim="along_track", int_fill=-1)
+
+    assert ds["orbit_number"].dims == ("concat_dim",)
+    np.testing.assert_array_equal(ds["orbit_number"].values, [100, 101, 102])
+    np.testing.assert_array_equal(ds["frame_id"].values, ["A", "B", "C"])
+
+    # Missing from the middle frame and promoted to the common dtype of both frames
+    assert ds["extra"].dtype == np.float64
+    np.testing.assert_array_equal(ds["extra"].values, [1, 1, np.nan, np.nan, 3, 3])
+    assert ds["int32"].values.min() == 0  # nothing padded, so `int_fill` is unused
+
+    # Concatenating already concatenated datasets keeps collecting scalars
+    ds = concat_dataset_list([ds, _frame(1, 3, 3)], dim="along_track", int_fill=-1)
+    np.testing.assert_array_equal(ds["orbit_number"].values, [100, 101, 102, 103])
+    np.testing.assert_array_equal(ds["extra"].values[-1:], [np.nan])
+    assert ds.sizes["along_track"] == 7
+
+
+def test_concat_dataset_list_time_padding() -> None:
+    frames = [_frame(2, 3, 0), _frame(2, 3, 1)]
+    frames[1]["time_2d"] = (
+        ("along_track", "vertical"),
+        np.full((2, 3), _TIME0, dtype="datetime64[ns]"),
+    )
+    ds = concat_dataset_list(frames, dim="along_track")
+    assert ds["time_2d"].dtype == np.dtype("datetime64[ns]")
+    assert np.isnat(ds["time_2d"].values[:2]).all()
+    assert not np.isnat(ds["time_2d"].values[2:]).any()
+
+
+def test_concat_dataset_list_empty() -> None:
+    with pytest.raises(ValueError):
+        concat_dataset_list([], dim="along_track")
+
+
+def test_read_products_matches_frames(atl_ebd_2a) -> None:
+    filepaths = [
+        atl_ebd_2a(orbit_and_frame="01500B", num_bins=42, lat_range=(20, 70)),
+        atl_ebd_2a(orbit_and_frame="01500A"),
+        atl_ebd_2a(
+            orbit_and_frame="01500C",
+            num_samples=150,
+            lat_range=(65, 89),
+            extra_vars={"c_only": (np.arange(150, dtype=np.int16), ["along_track"])},
+        ),
+    ]
+    frames = []
+    for filepath in sorted(filepaths):
+        with read_product(filepath) as frame:
+            frames.append(frame.load())
+
+    ds = read_products(filepaths, coarsen=False, max_workers=2)
+    assert list(ds.encoding["sources"]) == sorted(filepaths)
+    assert ds.sizes["along_track"] == sum(f.sizes["along_track"] for f in frames)
+    assert ds.sizes["vertical"] == 42
+    np.testing.assert_array_equal(ds["orbit_and_frame"].values, ["01500A", "01500B", "01500C"])
+
+    start = 0
+    for frame in frames:
+        stop = start + frame.sizes["along_track"]
+        m = frame.sizes["vertical"]
+        for var in ["time", "latitude", "height", "particle_backscatter_coefficient_355nm"]:
+            assert ds[var].dtype == frame[var].dtype
+            values = ds[var].values[start:stop]
+            if values.ndim == 2:
+                values = values[:, :m]
+            np.testing.assert_array_equal(values, frame[var].values)
+        assert np.isnan(ds["height"].values[start:stop, m:]).all()
+        classification = ds["simple_classification"].values[start:stop]
+        np.testing.assert_array_equal(classification[:, :m], frame["simple_classification"])
+        assert (classification[:, m:] == -128).all()
+        if "c_only" in frame:
+            np.testing.assert_array_equal(ds["c_only"].values[start:stop], frame["c_only"])
+        else:
+            assert (ds["c_only"].values[start:stop] == -9999).all()
+        start = stop
+
+    serial = read_products(filepaths, coarsen=False, max_workers=1)
+    xr.testing.assert_identical(ds, serial)
+
+
+def test_read_products_lazy_matches_eager(atl_ebd_2a) -> None:
+    pytest.importorskip("dask")
+    filepaths = [
+        atl_ebd_2a(orbit_and_frame="01500A"),
+        atl_ebd_2a(orbit_and_frame="01500B", num_bins=42, lat_range=(20, 70)),  # more bins
+        atl_ebd_2a(orbit_and_frame="01500C", num_samples=150, lat_range=(65, 89)),
+    ]
+    eager = read_products(filepaths, coarsen=False, max_workers=1)
+    lazy = read_products(filepaths, lazy=True, max_workers=2)
+
+    assert dict(lazy.sizes) == dict(eager.sizes)
+    assert len(lazy["height"].chunks[0]) == 3  # type: ignore[index]
+    for var in ["time", "height", "particle_backscatter_coefficient_355nm"]:
+        assert lazy[var].dtype == eager[var].dtype
+        np.testing.assert_array_equal(lazy[var].values, eager[var].values)
+    np.testing.assert_array_equal(
+        lazy["simple_classification"].values, eager["simple_classification"].values
+    )
+    np.testing.assert_array_equal(lazy["orbit_and_frame"].values, eager["orbit_and_frame"].values)
+
+
+def test_ecload_rejects_arguments_for_dataframes(atl_ebd_2a) -> None:
+    pytest.importorskip("dask")
+    from earthcarekit import ecload
+
+    df = ProductDataFrame.from_files([atl_ebd_2a(), atl_ebd_2a(orbit_and_frame="01500B")])
+    assert ecload(df).sizes["concat_dim"] == 2
+    for kwargs in [dict(frame_or_time="01500A"), dict(download=True), dict(zoom_at=0.5)]:
+        with pytest.raises(ValueError, match=next(iter(kwargs))):
+            ecload(df, **kwargs)
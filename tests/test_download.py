@@ -0,0 +1,277 @@
+"""Tests for resumable product downloads, MAAP token refresh and the download pipeline."""
+
+import io
+import os
+import struct
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pandas as pd
+import pytest
+import requests
+from earthcarekit.download import _eo_product, _run_downloads
+from earthcarekit.download._eo_product import (
+    PARTIAL_DOWNLOAD_SUFFIX,
+    EOProduct,
+    create_download_session,
+)
+from earthcarekit.utils import maap
+from earthcarekit.utils._config import ECKConfig
+
+_STEM = "ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_{}"
+
+
+def _make_archive(stem: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{stem}.h5", os.urandom(50_000) + bytes(50_000))
+        zf.writestr(f"{stem}.HDR", "<Earth_Explorer_Header/>")
+    return buffer.getvalue()
+
+
+class _Server:
+    """Serves archives with support for range requests and bearer token checks."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.valid_tokens: set[str] = {"token-1"}
+        self.requests: list[dict[str, str]] = []
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests.append({"path": self.path, **dict(self.headers)})
+                token = str(self.headers.get("Authorization", "")).removeprefix("Bearer ")
+                if token not in server.valid_tokens:
+                    self._respond(401, b"unauthorized")
+                    return
+                data = server.files.get(self.path.lstrip("/"))
+                if data is None:
+                    self._respond(404, b"not found")
+                    return
+                range_header = self.headers.get("Range")
+                if range_header is None:
+                    self._respond(200, data)
+                    return
+                start = int(range_header.removeprefix("bytes=").rstrip("-"))
+                if start >= len(data):
+                    self._respond(416, b"", {"Content-Range": f"bytes */{len(data)}"})
+                    return
+                content_range = f"bytes {start}-{len(data) - 1}/{len(data)}"
+                self._respond(206, data[start:], {"Content-Range": content_range})
+
+            def _respond(self, status: int, body: bytes, headers: dict | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def add_product(self, orbit_and_frame: str) -> tuple[EOProduct, bytes]:
+        stem = _STEM.format(orbit_and_frame)
+        data = _make_archive(stem)
+        self.files[f"{stem}.ZIP"] = data
+        product = EOProduct(
+            name=stem,
+            orbit_and_frame=orbit_and_frame,
+            file_type="ATL_EBD_2A",
+            version="AA",
+            start_processing_time=pd.Timestamp("2024-09-03T00:35:12"),
+            url_download=f"{self.url}/{stem}.ZIP",
+            url_quicklook=None,
+            size=len(data),
+        )
+        return product, data
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def server(monkeypatch) -> Iterator[_Server]:
+    """Local product server; the MAAP IAM returns "token-1", "token-2", ... on each call."""
+    issued: list[str] = []
+
+    def fake_request_maap_access_token(offline_token: str) -> dict:
+        issued.append(f"token-{len(issued) + 1}")
+        return {"access_token": issued[-1], "expires_in": 3600}
+
+    monkeypatch.setattr(maap, "_request_maap_access_token", fake_request_maap_access_token)
+    monkeypatch.setattr(_eo_product.time, "sleep", lambda seconds: None)
+
+    s = _Server()
+    s.issued = issued  # type: ignore[attr-defined]
+    yield s
+    s.close()
+
+
+def _download(product: EOProduct, dirpath: str, **kwargs):
+    kwargs = {
+        "is_overwrite": False,
+        "is_unzip": False,
+        "is_delete": False,
+        "is_create_subdirs": False,
+        "maap_token": "offline",
+        **kwargs,
+    }
+    return product.download(download_directory=dirpath, **kwargs)
+
+
+def test_download_renames_part_file(server, tmp_path):
+    product, data = server.add_product("01500A")
+
+    result = _download(product, str(tmp_path))
+
+    zip_path = tmp_path / f"{product.name}.ZIP"
+    assert result.success and result.downloaded
+    assert result.filepath == str(zip_path)
+    assert zip_path.read_bytes() == data
+    assert not os.path.exists(str(zip_path) + PARTIAL_DOWNLOAD_SUFFIX)
+
+
+def test_download_resumes_part_file(server, tmp_path):
+    product, data = server.add_product("01500A")
+    zip_path = tmp_path / f"{product.name}.ZIP"
+    part_path = str(zip_path) + PARTIAL_DOWNLOAD_SUFFIX
+    with open(part_path, "wb") as f:
+        f.write(data[:1000])
+
+    result = _download(product, str(tmp_path))
+
+    assert result.success
+    assert server.requests[-1]["Range"] == "bytes=1000-"
+    assert zip_path.read_bytes() == data
+    assert not os.path.exists(part_path)
+
+
+def test_download_restarts_after_range_not_satisfiable(server, tmp_path):
+    product, data = server.add_product("01500A")
+    zip_path = tmp_path / f"{product.name}.ZIP"
+    part_path = str(zip_path) + PARTIAL_DOWNLOAD_SUFFIX
+    with open(part_path, "wb") as f:
+        f.write(bytes(len(data) + 10))  # stale partial file larger than the archive
+
+    result = _download(product, str(tmp_path))
+
+    assert result.success
+    assert [r.get("Range") for r in server.requests] == [f"bytes={len(data) + 10}-", None]
+    assert zip_path.read_bytes() == data
+    assert not os.path.exists(part_path)
+
+
+@pytest.mark.parametrize("is_stream_unzip", [False, True])
+def test_download_refreshes_token_on_401(server, tmp_path, is_stream_unzip):
+    product, data = server.add_product("01500A")
+    session = create_download_session(maap_token="offline")
+    server.valid_tokens = {"token-2"}  # the token of the session has been revoked
+
+    result = _download(
+        product, str(tmp_path), is_unzip=True, session=session, is_stream_unzip=is_stream_unzip
+    )
+
+    assert result.success and result.unzipped
+    assert server.issued == ["token-1", "token-2"]
+    assert [r["Authorization"] for r in server.requests] == ["Bearer token-1", "Bearer token-2"]
+    assert (tmp_path / product.name / f"{product.name}.h5").exists()
+
+
+def test_stream_unzip_falls_back_to_downloading_the_archive(server, tmp_path):
+    product, _ = server.add_product("01500A")
+    # Stored members with data descriptors can not be extracted from the stream
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(f"{product.name}.h5", b"h5" * 1000)
+        zf.writestr(f"{product.name}.HDR", b"<Earth_Explorer_Header/>")
+    data = bytearray(buffer.getvalue())
+    offset = data.index(b"PK\x03\x04")
+    struct.pack_into("<H", data, offset + 6, 0x8)  # set the data descriptor flag
+    server.files[f"{product.name}.ZIP"] = bytes(data)
+
+    result = _download(product, str(tmp_path), is_unzip=True, is_stream_unzip=True)
+
+    assert result.success and result.downloaded and result.unzipped
+    assert len(server.requests) == 2
+    assert (tmp_path / product.name / f"{product.name}.h5").read_bytes() == b"h5" * 1000
+    assert not (tmp_path / product.name / f"{product.name}.h5.part").exists()
+
+
+def test_token_is_refreshed_before_expiry(monkeypatch):
+    lifetimes = iter([30, 3600])
+    calls: list[str] = []
+
+    def fake_request_maap_access_token(offline_token: str) -> dict:
+        calls.append(offline_token)
+        return {"access_token": f"token-{len(calls)}", "expires_in": next(lifetimes)}
+
+    monkeypatch.setattr(maap, "_request_maap_access_token", fake_request_maap_access_token)
+
+    auth = maap._MaapAuth("offline", expiry_margin_seconds=60)
+    tokens = [auth.get_access_token() for _ in range(3)]
+
+    # The first token expires within the margin, the second one is reused
+    assert tokens == ["token-1", "token-2", "token-2"]
+    assert calls == ["offline", "offline"]
+
+
+def test_persistent_401_fails_download(server, tmp_path):
+    product, _ = server.add_product("01500A")
+    server.valid_tokens = set()
+
+    result = _download(product, str(tmp_path), attempts=2)
+
+    assert not result.success and not result.downloaded
+    assert not (tmp_path / f"{product.name}.ZIP").exists()
+    # One retry with a refreshed token per attempt
+    assert len(server.requests) == 4
+
+
+@pytest.mark.parametrize("is_stream_unzip", [False, True])
+def test_concurrent_download_pipeline(server, tmp_path, is_stream_unzip):
+    products = [server.add_product(f"0150{i}A")[0] for i in range(5)]
+    config = ECKConfig(path_to_data=str(tmp_path), maap_token="offline")
+
+    results = _run_downloads.run_downloads(
+        products,
+        config,
+        is_download=True,
+        is_overwrite=False,
+        is_unzip=True,
+        is_delete=True,
+        is_create_subdirs=False,
+        num_workers=3,
+        is_stream_unzip=is_stream_unzip,
+    )
+
+    assert [r.success and r.unzipped for r in results] == [True] * len(products)
+    for p, r in zip(products, results):
+        assert os.path.basename(r.filepath).startswith(p.name)
+        assert (tmp_path / p.name / f"{p.name}.h5").exists()
+        assert (tmp_path / p.name / f"{p.name}.HDR").exists()
+    assert sorted(os.listdir(tmp_path)) == sorted(p.name for p in products)
+    # The session fetched a single access token for all downloads
+    assert server.issued == ["token-1"]
+
+
+def test_create_download_session_rejects_invalid_token(monkeypatch):
+    def failing_request(offline_token: str) -> dict:
+        raise requests.HTTPError("400 Client Error: invalid_grant")
+
+    monkeypatch.setattr(maap, "_request_maap_access_token", failing_request)
+
+    with pytest.raises(requests.HTTPError):
+        create_download_session(maap_token="expired")
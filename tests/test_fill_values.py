@@ -0,0 +1,74 @@
+"""Tests for lazily masking fill values when opening products with `ensure_nans=True`."""
+
+import h5py  # type: ignore
+import numpy as np
+import pytest
+import xarray as xr
+from earthcarekit.read.science import read_science_data
+from earthcarekit.utils.xarray import _convert_all_fill_values_to_nan, _fill_values
+
+_VARS = ["particle_backscatter_coefficient_355nm", "simple_classification"]
+
+
+def _read_raw(filepath: str, var: str) -> np.ndarray:
+    with h5py.File(filepath, "r") as f:
+        return f["ScienceData"][var][()]
+
+
+def _check_masked(ds: xr.Dataset, filepath: str) -> None:
+    bsc = _read_raw(filepath, _VARS[0])
+    expected = np.where(bsc >= 9.96e36, np.nan, bsc)
+    assert ds[_VARS[0]].dtype == np.float32
+    np.testing.assert_array_equal(ds[_VARS[0]].values, expected)
+
+    classification = _read_raw(filepath, _VARS[1])
+    expected = np.where(classification == -127, np.iinfo(np.int8).min, classification)
+    assert ds[_VARS[1]].dtype == np.int8
+    np.testing.assert_array_equal(ds[_VARS[1]].values, expected)
+
+
+def test_ensure_nans_stays_lazy(atl_ebd_2a) -> None:
+    filepath = atl_ebd_2a()
+    with read_science_data(filepath, ensure_nans=True) as ds:
+        for var in _VARS:
+            assert not ds[var].variable._in_memory
+
+        # Reading a slice masks only that slice and keeps the variable on file
+        middle = ds.sizes["along_track"] // 2
+        row = ds[_VARS[0]].isel(along_track=slice(middle - 1, middle + 2)).values
+        assert np.isnan(row[1]).all() and not np.isnan(row[[0, 2]]).any()
+        assert (ds[_VARS[1]].isel(along_track=middle).values == -128).all()
+        for var in _VARS:
+            assert not ds[var].variable._in_memory
+
+        _check_masked(ds, filepath)
+
+
+def test_ensure_nans_with_dask(atl_ebd_2a) -> None:
+    pytest.importorskip("dask")
+    filepath = atl_ebd_2a()
+    with read_science_data(filepath, ensure_nans=True, chunks={}) as ds:
+        for var in _VARS:
+            assert ds[var].chunks is not None
+        _check_masked(ds, filepath)
+
+
+def test_ensure_nans_matches_eager_masking(atl_ebd_2a) -> None:
+    filepath = atl_ebd_2a()
+    with read_science_data(filepath, ensure_nans=True) as lazy:
+        with read_science_data(filepath) as ds:
+            eager = _convert_all_fill_values_to_nan(ds.load())
+        for var in _VARS:
+            assert eager[var].variable._in_memory
+            assert lazy[var].dtype == eager[var].dtype
+            np.testing.assert_array_equal(lazy[var].values, eager[var].values)
+
+
+def test_ensure_nans_without_private_xarray_api(atl_ebd_2a, monkeypatch) -> None:
+    # Falls back to eager masking if xarray's lazy indexing internals are not available
+    monkeypatch.setattr(_fill_values, "lazy_elemwise_func", None)
+    filepath = atl_ebd_2a()
+    with read_science_data(filepath, ensure_nans=True) as ds:
+        for var in _VARS:
+            assert ds[var].variable._in_memory
+        _check_masked(ds, filepath)
@@ -0,0 +1,119 @@
+"""Tests pinning `filter_radius` results to a full-batch Vincenty calculation over all samples.
+
+Distances are calculated only for samples preselected via haversine distances, and Vincenty's
+method iterates each pair until it converges itself. Distances thus differ from the former
+calculation (all samples, iterated until all pairs converged) by a few 1e-9 km, while the
+selected samples and closest indices stay the same.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+import xarray as xr
+from earthcarekit.filter import filter_radius
+from earthcarekit.geo import geodesic
+
+RNG = np.random.default_rng(42)
+
+
+def _vincenty_all_pairs(center: tuple[float, float], coords: np.ndarray) -> np.ndarray:
+    """Former implementation: iterates all pairs until every pair has converged."""
+    lat_1, lon_1 = np.radians(center[0]), np.radians(center[1])
+    lat_2, lon_2 = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+    a = 6378137.0
+    f = 1 / 298.257223563
+    b = (1 - f) * a
+    beta_1 = np.arctan((1 - f) * np.tan(lat_1))
+    beta_2 = np.arctan((1 - f) * np.tan(lat_2))
+    initial_lon_diff = lon_2 - lon_1
+    lon_diff = initial_lon_diff
+    sin_beta_1, cos_beta_1 = np.sin(beta_1), np.cos(beta_1)
+    sin_beta_2, cos_beta_2 = np.sin(beta_2), np.cos(beta_2)
+    converged = np.full_like(lat_2, False, dtype=bool)
+    for _ in range(10):
+        sin_lon_diff, cos_lon_diff = np.sin(lon_diff), np.cos(lon_diff)
+        sin_sigma = np.sqrt(
+            (cos_beta_2 * sin_lon_diff) ** 2
+            + (cos_beta_1 * sin_beta_2 - sin_beta_1 * cos_beta_2 * cos_lon_diff) ** 2
+        )
+        cos_sigma = (sin_beta_1 * sin_beta_2) + (cos_beta_1 * cos_beta_2 * cos_lon_diff)
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            sin_alpha = cos_beta_1 * cos_beta_2 * sin_lon_diff / sin_sigma
+            sin_alpha = np.nan_to_num(sin_alpha, nan=0.0)
+            cos2_alpha = 1 - sin_alpha**2
+            cos2_sigma_m = np.where(
+                cos2_alpha != 0.0, cos_sigma - ((2 * sin_beta_1 * sin_beta_2) / cos2_alpha), 0.0
+            )
+        cos2_sigma_m = np.nan_to_num(cos2_sigma_m, nan=0.0)
+        C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        previous_lon_diff = lon_diff
+        lon_diff = initial_lon_diff + (1 - C) * f * sin_alpha * (
+            sigma + C * sin_sigma * (cos2_sigma_m + C * cos_sigma * (-1 + 2 * cos2_sigma_m**2))
+        )
+        converged = converged | (np.abs(lon_diff - previous_lon_diff) < 1e-12)
+        if np.all(converged):
+            break
+    u2 = cos2_alpha * (a**2 - b**2) / b**2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = (
+        B
+        * sin_sigma
+        * (
+            cos2_sigma_m
+            + B
+            / 4
+            * (
+                cos_sigma * (-1 + 2 * cos2_sigma_m**2)
+                - B / 6 * cos2_sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos2_sigma_m**2)
+            )
+        )
+    )
+    return b * A * (sigma - delta_sigma) / 1000.0
+
+
+def _track(num_samples: int) -> xr.Dataset:
+    """Half orbit (inclination 97 degrees) starting at a random longitude."""
+    u = np.linspace(-0.5 * np.pi, 0.5 * np.pi, num_samples)
+    inclination = np.radians(97.05)
+    lat = np.degrees(np.arcsin(np.sin(inclination) * np.sin(u)))
+    lon = np.degrees(np.arctan2(np.cos(inclination) * np.sin(u), np.cos(u)))
+    lon = (lon + RNG.uniform(-180, 180) + 180.0) % 360.0 - 180.0
+    return xr.Dataset(
+        {
+            "latitude": ("along_track", lat),
+            "longitude": ("along_track", lon),
+            "time": ("along_track", np.arange(num_samples).astype("datetime64[s]")),
+        }
+    )
+
+
+@pytest.mark.parametrize("radius_km", [10.0, 100.0, 500.0])
+def test_filter_radius_matches_all_pairs(radius_km) -> None:
+    for _ in range(20):
+        ds = _track(20_000)
+        k = int(RNG.integers(0, ds.sizes["along_track"]))
+        center = (
+            float(ds["latitude"].values[k] + RNG.normal(0, 1)),
+            float(ds["longitude"].values[k] + RNG.normal(0, 1)),
+        )
+        coords = np.column_stack([ds["latitude"].values, ds["longitude"].values])
+        expected = _vincenty_all_pairs(center, coords)
+
+        distances = np.asarray(geodesic(center, coords))
+        np.testing.assert_allclose(distances, expected, rtol=0, atol=1e-8)
+
+        closest = filter_radius(
+            ds, radius_km, center_lat=center[0], center_lon=center[1], closest=True
+        )
+        assert int(closest["trim_index_offset"].values) == int(np.argmin(expected))
+
+        mask = expected < radius_km
+        if not mask.any():
+            continue
+        filtered = filter_radius(ds, radius_km, center_lat=center[0], center_lon=center[1])
+        np.testing.assert_array_equal(filtered["time"].values, ds["time"].values[mask])
+        assert int(filtered["trim_index_offset"].values) == int(np.argmax(mask))
@@ -0,0 +1,151 @@
+"""Tests comparing the vectorized geodetic/ECEF conversions with `geo_to_ecef` and `ecef_to_geo`."""
+
+import numpy as np
+import pytest
+from earthcarekit.geo import (
+    ecef_to_geo,
+    geo_to_ecef,
+    sequence_ecef_to_geo,
+    sequence_geo_to_ecef,
+)
+from earthcarekit.geo.convertsions import _geo_to_unit_ecef, _unit_ecef_to_geo
+
+RNG = np.random.default_rng(3)
+N = 257
+
+LATS = RNG.uniform(-89.0, 89.0, N)
+LONS = RNG.uniform(-180.0, 180.0, N)
+ALTS = RNG.uniform(-500.0, 40_000.0, N)
+
+
+def _scalar_geo_to_ecef(lats, lons, alts, **kwargs) -> np.ndarray:
+    return np.array([geo_to_ecef(*p, **kwargs) for p in zip(lats, lons, alts)]).reshape((-1, 3))
+
+
+def _scalar_ecef_to_geo(xyz, **kwargs) -> np.ndarray:
+    return np.array([ecef_to_geo(*p, **kwargs) for p in xyz]).reshape((-1, 3))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 100, N, 10 * N])
+@pytest.mark.parametrize("perfect_sphere", [True, False])
+@pytest.mark.parametrize("target_radius", [1.0, 6371.0])
+def test_sequence_geo_to_ecef_matches_scalar(chunk_size, perfect_sphere, target_radius) -> None:
+    kwargs = dict(target_radius=target_radius, perfect_sphere=perfect_sphere)
+
+    result = sequence_geo_to_ecef(LATS, LONS, ALTS, chunk_size=chunk_size, **kwargs)
+
+    assert result.shape == (N, 3)
+    assert result.dtype == np.float64
+    expected = _scalar_geo_to_ecef(LATS, LONS, ALTS, **kwargs)
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12 * target_radius)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 100, N, 10 * N])
+@pytest.mark.parametrize("perfect_sphere", [True, False])
+def test_sequence_ecef_to_geo_matches_scalar(chunk_size, perfect_sphere) -> None:
+    xyz = _scalar_geo_to_ecef(LATS, LONS, ALTS, perfect_sphere=perfect_sphere)
+
+    result = sequence_ecef_to_geo(
+        xyz[:, 0], xyz[:, 1], xyz[:, 2], perfect_sphere=perfect_sphere, chunk_size=chunk_size
+    )
+
+    assert result.shape == (N, 3)
+    expected = _scalar_ecef_to_geo(xyz, perfect_sphere=perfect_sphere)
+    np.testing.assert_allclose(result[:, :2], expected[:, :2], rtol=1e-12, atol=1e-10)
+    np.testing.assert_allclose(result[:, 2], expected[:, 2], rtol=1e-12, atol=1e-6)
+    np.testing.assert_allclose(result[:, 1], LONS, atol=1e-8)
+    if perfect_sphere:
+        # Round trip back to the input coordinates (on the ellipsoid, `geo_to_ecef` and
+        # `ecef_to_geo` use different formulas for the prime vertical radius of curvature)
+        np.testing.assert_allclose(result[:, 0], LATS, atol=1e-8)
+        np.testing.assert_allclose(result[:, 2], ALTS, atol=1e-4)
+
+
+def test_sequence_geo_to_ecef_broadcasts_altitude() -> None:
+    without_alts = sequence_geo_to_ecef(LATS, LONS)
+    scalar_alt = sequence_geo_to_ecef(list(LATS), list(LONS), 1000.0)
+
+    np.testing.assert_allclose(without_alts, _scalar_geo_to_ecef(LATS, LONS, np.zeros(N)))
+    np.testing.assert_allclose(scalar_alt, _scalar_geo_to_ecef(LATS, LONS, np.full(N, 1000.0)))
+
+    # Multi-dimensional inputs are flattened
+    result = sequence_geo_to_ecef(LATS[:256].reshape((16, 16)), LONS[:256].reshape((16, 16)))
+    np.testing.assert_array_equal(result, without_alts[:256])
+
+
+@pytest.mark.parametrize("perfect_sphere", [True, False])
+def test_scalar_inputs(perfect_sphere) -> None:
+    xyz = sequence_geo_to_ecef(
+        np.float64(45.0), np.float64(-120.0), 250.0, perfect_sphere=perfect_sphere
+    )
+    assert xyz.shape == (1, 3)
+    np.testing.assert_allclose(
+        xyz[0], geo_to_ecef(45.0, -120.0, 250.0, perfect_sphere=perfect_sphere), rtol=1e-12
+    )
+
+    geo = sequence_ecef_to_geo(*xyz[0], perfect_sphere=perfect_sphere)
+    assert geo.shape == (1, 3)
+    np.testing.assert_allclose(
+        geo[0], ecef_to_geo(*xyz[0], perfect_sphere=perfect_sphere), rtol=1e-12, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1])
+def test_empty_inputs(chunk_size) -> None:
+    xyz = sequence_geo_to_ecef([], [], chunk_size=chunk_size)
+    geo = sequence_ecef_to_geo(np.empty(0), np.empty(0), np.empty(0), chunk_size=chunk_size)
+
+    assert xyz.shape == (0, 3)
+    assert geo.shape == (0, 3)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 100])
+def test_float32_output(chunk_size) -> None:
+    expected = sequence_geo_to_ecef(LATS, LONS, ALTS, chunk_size=chunk_size)
+    result = sequence_geo_to_ecef(LATS, LONS, ALTS, dtype=np.float32, chunk_size=chunk_size)
+
+    assert result.dtype == np.float32
+    # Computed in double precision and rounded once
+    np.testing.assert_array_equal(result, expected.astype(np.float32))
+
+    geo = sequence_ecef_to_geo(*expected.T, dtype=np.float32, chunk_size=chunk_size)
+    assert geo.dtype == np.float32
+    np.testing.assert_array_equal(geo, sequence_ecef_to_geo(*expected.T).astype(np.float32))
+
+
+def test_unit_ecef_matches_scalar() -> None:
+    result = _geo_to_unit_ecef(LATS, LONS)
+
+    assert result.shape == (N, 3)
+    np.testing.assert_allclose(
+        result, _scalar_geo_to_ecef(LATS, LONS, np.zeros(N)), rtol=1e-12, atol=1e-15
+    )
+    np.testing.assert_allclose(np.linalg.norm(result, axis=-1), 1.0)
+
+    # Leading dimensions are kept
+    grid = _geo_to_unit_ecef(LATS[:256].reshape((16, 16)), LONS[:256].reshape((16, 16)))
+    assert grid.shape == (16, 16, 3)
+    np.testing.assert_array_equal(grid.reshape((-1, 3)), result[:256])
+
+    # Scalar inputs and poles
+    np.testing.assert_allclose(_geo_to_unit_ecef(0.0, 0.0), geo_to_ecef(0.0, 0.0), atol=1e-15)
+    np.testing.assert_allclose(_geo_to_unit_ecef(90.0, 45.0), [0.0, 0.0, 1.0], atol=1e-15)
+
+
+def test_unit_ecef_to_geo_matches_scalar() -> None:
+    xyz = _geo_to_unit_ecef(LATS, LONS)
+    # Vectors do not need to be normalized
+    scaled = xyz * RNG.uniform(0.5, 2.0, (N, 1))
+
+    lat, lon = _unit_ecef_to_geo(scaled)
+
+    expected = _scalar_ecef_to_geo(scaled)
+    np.testing.assert_allclose(lat, expected[:, 0], atol=1e-10)
+    np.testing.assert_allclose(lon, expected[:, 1], atol=1e-10)
+    np.testing.assert_allclose(lat, LATS, atol=1e-10)
+    np.testing.assert_allclose(lon, LONS, atol=1e-10)
+
+    lat, lon = _unit_ecef_to_geo(xyz.reshape((N, 1, 3)))
+    assert lat.shape == lon.shape == (N, 1)
+    lat, lon = _unit_ecef_to_geo(geo_to_ecef(-30.0, 150.0))
+    np.testing.assert_allclose([lat, lon], [-30.0, 150.0])
@@ -0,0 +1,148 @@
+"""Tests for interpolating between coordinates along great circles with `get_coords_between`."""
+
+import numpy as np
+import pytest
+from earthcarekit.geo import get_coord_between, get_coords_between, haversine
+from earthcarekit.utils.kernels import get_available_backends, get_backend, set_backend
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def backend(request):
+    if request.param not in get_available_backends():
+        pytest.skip(f"backend '{request.param}' not available")
+    previous_backend = get_backend()
+    set_backend(request.param)
+    yield request.param
+    set_backend(previous_backend)
+
+
+def _angle_deg(coords1: np.ndarray, coords2: np.ndarray) -> np.ndarray:
+    """Central angle in degrees between lat/lon points."""
+    return np.degrees(haversine(coords1, coords2, units="m", radius=1.0))
+
+
+def _assert_coords_equal(result: np.ndarray, expected: np.ndarray, atol: float = 1e-9) -> None:
+    result, expected = np.atleast_2d(result), np.atleast_2d(expected)
+    np.testing.assert_allclose(result[:, 0], expected[:, 0], atol=atol)
+    # Longitudes are compared modulo 360° (-180° and 180° are the same meridian)
+    dlon = (result[:, 1] - expected[:, 1] + 180.0) % 360.0 - 180.0
+    is_pole = np.abs(expected[:, 0]) > 90.0 - 1e-9
+    np.testing.assert_allclose(np.where(is_pole, 0.0, dlon), 0.0, atol=atol)
+
+
+def test_matches_scalar_get_coord_between(backend) -> None:
+    rng = np.random.default_rng(0)
+    coords1 = np.column_stack([rng.uniform(-80, 80, 300), rng.uniform(-180, 180, 300)])
+    coords2 = coords1 + rng.uniform(-1, 1, coords1.shape)
+    f = rng.uniform(0, 1, 300)
+
+    result = get_coords_between(coords1, coords2, f)
+    expected = np.array([get_coord_between(a, b, ff) for a, b, ff in zip(coords1, coords2, f)])
+
+    # Great circles on the sphere vs. geodesics on the ellipsoid differ by a few meters
+    assert result.shape == (300, 2)
+    _assert_coords_equal(result, expected, atol=1e-4)
+
+
+def test_antimeridian_crossing(backend) -> None:
+    f = np.linspace(0, 1, 21)
+
+    result = get_coords_between([10.0, 175.0], [-10.0, -175.0], f)
+
+    assert result.shape == (21, 2)
+    assert np.all(np.abs(result[:, 1]) >= 175.0 - 1e-9)
+    assert np.all(np.abs(result[:, 1]) <= 180.0)
+    _assert_coords_equal(result[10], [0.0, 180.0])
+    _assert_coords_equal(
+        get_coords_between([[0, 179], [80, 0]], [[0, -179], [80, 180]], f=0.75),
+        [[0.0, -179.5], [85.0, 180.0]],
+    )
+
+
+def test_path_over_pole(backend) -> None:
+    f = np.linspace(0, 1, 11)
+
+    result = get_coords_between([80.0, 30.0], [80.0, -150.0], f)
+
+    _assert_coords_equal(result[5], [90.0, 0.0])
+    assert np.all(result[:, 0] >= 80.0 - 1e-9)
+    np.testing.assert_allclose(result[:5, 1], 30.0)
+    np.testing.assert_allclose(result[6:, 1], -150.0)
+    # Equal steps along the path
+    np.testing.assert_allclose(_angle_deg(result[:-1], result[1:]), 2.0, rtol=1e-6)
+
+
+def test_from_and_to_poles(backend) -> None:
+    result = get_coords_between([[90.0, 0.0], [0.0, 45.0]], [[0.0, 45.0], [-90.0, 123.0]], 0.5)
+
+    _assert_coords_equal(result, [[45.0, 45.0], [-45.0, 45.0]])
+
+
+@pytest.mark.parametrize("coord", [[0.0, 0.0], [45.0, -120.0], [90.0, 0.0], [-33.3, 180.0]])
+def test_identical_points(backend, coord) -> None:
+    f = np.linspace(0, 1, 5)
+
+    result = get_coords_between(coord, coord, f)
+
+    _assert_coords_equal(result, np.tile(coord, (5, 1)))
+
+
+@pytest.mark.parametrize(
+    "coord1, coord2",
+    [([0.0, 0.0], [0.0, 180.0]), ([30.0, 45.0], [-30.0, -135.0]), ([90.0, 0.0], [-90.0, 0.0])],
+)
+def test_antipodal_points(backend, coord1, coord2) -> None:
+    f = np.linspace(0, 1, 9)
+
+    result = get_coords_between(coord1, coord2, f)
+
+    assert np.all(np.isfinite(result))
+    _assert_coords_equal(result[0], coord1)
+    _assert_coords_equal(result[-1], coord2)
+    # All points lie on one great circle through both points, in equal steps
+    np.testing.assert_allclose(_angle_deg(np.array(coord1), result), f * 180.0, atol=1e-6)
+    np.testing.assert_allclose(_angle_deg(np.array(coord2), result), (1 - f) * 180.0, atol=1e-6)
+
+
+def test_antipodal_points_match_between_backends() -> None:
+    if "numba" not in get_available_backends():
+        pytest.skip("backend 'numba' not available")
+    coords1 = np.array([[0.0, 0.0], [30.0, 45.0], [90.0, 0.0], [-90.0, 10.0]])
+    coords2 = np.column_stack([-coords1[:, 0], coords1[:, 1] - 180.0])
+    f = np.array([0.3, 0.5, 0.7, 0.1])
+
+    previous_backend = get_backend()
+    try:
+        set_backend("numpy")
+        expected = get_coords_between(coords1, coords2, f)
+        set_backend("numba")
+        result = get_coords_between(coords1, coords2, f)
+    finally:
+        set_backend(previous_backend)
+
+    _assert_coords_equal(result, expected)
+
+
+def test_array_fractions(backend) -> None:
+    coords1 = np.array([[0.0, 0.0], [10.0, 10.0], [-20.0, 100.0]])
+    coords2 = np.array([[0.0, 90.0], [20.0, 20.0], [-20.0, 110.0]])
+    f = np.array([0.0, 0.5, 1.0])
+
+    result = get_coords_between(coords1, coords2, f)
+    _assert_coords_equal(result[0], coords1[0])
+    _assert_coords_equal(result[2], coords2[2])
+    _assert_coords_equal(result[1], get_coord_between(coords1[1], coords2[1], 0.5), atol=1e-2)
+
+    # Scalar points with an array of fractions give points along one path
+    path = get_coords_between([0.0, 0.0], [0.0, 90.0], np.linspace(0, 1, 7))
+    _assert_coords_equal(path, np.column_stack([np.zeros(7), np.linspace(0, 90, 7)]))
+
+    # Scalar fractions are broadcast to all pairs
+    result = get_coords_between(coords1, coords2, 0.25)
+    expected = get_coords_between(coords1, coords2, np.full(3, 0.25))
+    _assert_coords_equal(result, expected)
+
+    with pytest.raises(ValueError):
+        get_coords_between(coords1, coords2, np.zeros((3, 1)))
+    with pytest.raises(ValueError):
+        get_coords_between(coords1, coords2, np.zeros(2))
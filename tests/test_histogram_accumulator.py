@@ -0,0 +1,165 @@
+"""Tests for `HistogramAccumulator` and `Histogram2DAccumulator` against `np.histogram(2d)`."""
+
+import os
+
+import numpy as np
+import pytest
+from earthcarekit.stats import Histogram2DAccumulator, HistogramAccumulator
+
+RNG = np.random.default_rng(11)
+
+EDGES = np.array([0.0, 0.5, 1.0, 2.0, 4.0])
+
+
+def _values(size: int) -> np.ndarray:
+    """Values inside, below and above the bins, exactly on edges (incl. the last one) and NaNs."""
+    values = RNG.uniform(-1.0, 5.0, size)
+    values[::7] = RNG.choice(EDGES, values[::7].size)
+    values[::11] = np.nan
+    return values
+
+
+def test_histogram_matches_numpy() -> None:
+    values = _values(10_000)
+    acc = HistogramAccumulator(EDGES)
+    for chunk in np.array_split(values.reshape((100, 100)), 7):  # chunks of any shape
+        acc.add(chunk)
+
+    finite = values[np.isfinite(values)]
+    expected, _ = np.histogram(finite, bins=EDGES)
+    np.testing.assert_array_equal(acc.counts, expected)
+    assert acc.counts[-1] == np.sum((finite >= 2.0) & (finite <= 4.0))  # last bin includes 4.0
+    assert acc.underflow == np.sum(finite < 0.0)
+    assert acc.overflow == np.sum(finite > 4.0)
+    assert acc.total + acc.underflow + acc.overflow == finite.size
+
+    density, _ = np.histogram(finite, bins=EDGES, density=True)
+    np.testing.assert_allclose(acc.density(), density)
+    assert acc.mean() == pytest.approx(np.sum(acc.centers * expected) / expected.sum())
+
+
+def test_histogram_edges_and_empty() -> None:
+    acc = HistogramAccumulator(EDGES).add([0.0, 4.0, 4.0 + 1e-12, -1e-12, np.nan, np.inf, -np.inf])
+    np.testing.assert_array_equal(acc.counts, [1, 0, 0, 1])
+    assert (acc.underflow, acc.overflow) == (2, 2)
+
+    empty = HistogramAccumulator(EDGES)
+    assert empty.total == 0
+    assert np.isnan(empty.mean())
+    assert np.isnan(empty.median())
+    with pytest.raises(ValueError):
+        HistogramAccumulator([1.0, 0.0])
+    with pytest.raises(ValueError):
+        HistogramAccumulator.from_log_bins(0.0, 1.0, 10)
+
+
+def test_histogram_merge_and_save_load(tmp_path) -> None:
+    values = _values(3000)
+    a = HistogramAccumulator(EDGES).add(values[:1000])
+    b = HistogramAccumulator(EDGES).add(values[1000:])
+    whole = HistogramAccumulator(EDGES).add(values)
+
+    merged = a + b
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert (merged.underflow, merged.overflow) == (whole.underflow, whole.overflow)
+    np.testing.assert_array_equal(a.counts + b.counts, merged.counts)  # operands unchanged
+    with pytest.raises(ValueError):
+        a.merge(HistogramAccumulator(EDGES * 2))
+
+    filepath = str(tmp_path / "hist.npz")
+    merged.save(filepath)
+    loaded = HistogramAccumulator.load(filepath)
+    np.testing.assert_array_equal(loaded.edges, merged.edges)
+    np.testing.assert_array_equal(loaded.counts, merged.counts)
+    assert (loaded.underflow, loaded.overflow) == (merged.underflow, merged.overflow)
+    assert loaded.median() == merged.median()
+    assert os.listdir(tmp_path) == ["hist.npz"]
+
+
+def test_histogram_percentiles() -> None:
+    values = RNG.normal(0.0, 1.0, 100_000)
+    edges = np.linspace(-5, 5, 201)
+    acc = HistogramAccumulator(edges).add(values)
+    for q in [5, 25, 50, 75, 95]:
+        assert acc.percentile(q) == pytest.approx(np.percentile(values, q), abs=0.05)
+    assert acc.median() == acc.percentile(50)
+
+
+def test_histogram_2d_matches_numpy() -> None:
+    xedges = np.array([0.0, 1.0, 2.0, 3.0])
+    yedges = np.array([-1.0, 0.0, 2.0])
+    x = _values(5000) * 0.75
+    y = RNG.uniform(-2.0, 3.0, 5000)
+    y[::13] = RNG.choice(yedges, y[::13].size)
+    y[::17] = np.nan
+
+    acc = Histogram2DAccumulator(xedges, yedges)
+    for xc, yc in zip(np.array_split(x, 4), np.array_split(y, 4)):
+        acc.add(xc, yc)
+
+    is_valid = np.isfinite(x) & np.isfinite(y)
+    expected, _, _ = np.histogram2d(x[is_valid], y[is_valid], bins=(xedges, yedges))
+    np.testing.assert_array_equal(acc.counts, expected)
+    assert acc.num_outside == is_valid.sum() - expected.sum()
+
+    np.testing.assert_array_equal(acc.marginal("x").counts, expected.sum(axis=1))
+    np.testing.assert_array_equal(acc.marginal("y").counts, expected.sum(axis=0))
+    with pytest.raises(ValueError):
+        acc.marginal("z")  # type: ignore[arg-type]
+
+
+def test_histogram_2d_profiles_merge_and_save_load(tmp_path) -> None:
+    height = np.linspace(10e3, 0.0, 30)  # descending, like EarthCARE profiles
+    values = RNG.lognormal(-13, 1, (200, 30)) * (1 + height / 10e3)
+    values[RNG.random(values.shape) < 0.1] = np.nan
+    xedges = np.geomspace(1e-8, 1e-4, 51)
+    yedges = np.linspace(0.0, 10e3, 11)
+
+    a = Histogram2DAccumulator(xedges, yedges).add_profiles(values[:120], height)
+    b = Histogram2DAccumulator(xedges, yedges).add_profiles(values[120:], np.tile(height, (80, 1)))
+    whole = Histogram2DAccumulator(xedges, yedges).add_profiles(values, height)
+    merged = a + b
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert merged.num_outside == whole.num_outside
+    with pytest.raises(ValueError):
+        a.add_profiles(values, height[:-1])
+    with pytest.raises(ValueError):
+        a.merge(Histogram2DAccumulator(xedges, yedges[:-1]))
+
+    h = np.broadcast_to(height, values.shape)
+    is_valid = np.isfinite(values)
+    expected, _, _ = np.histogram2d(values[is_valid], h[is_valid], bins=(xedges, yedges))
+    np.testing.assert_array_equal(whole.counts, expected)
+
+    filepath = str(tmp_path / "sub" / "hist2d.npz")
+    merged.save(filepath)
+    loaded = Histogram2DAccumulator.load(filepath)
+    np.testing.assert_array_equal(loaded.counts, merged.counts)
+    np.testing.assert_array_equal(loaded.xedges, xedges)
+    np.testing.assert_array_equal(loaded.yedges, yedges)
+    assert loaded.num_outside == merged.num_outside
+
+
+def test_histogram_2d_percentile_profile() -> None:
+    height = np.linspace(10e3, 0.0, 100)
+    values = RNG.normal(height / 1e3, 1.0, (500, 100))
+    xedges = np.linspace(-5.0, 15.0, 401)
+    yedges = np.array([-2e3, 0.0, 2e3, 4e3, 6e3, 8e3, 10e3])  # first bin is empty
+    acc = Histogram2DAccumulator(xedges, yedges).add_profiles(values, height)
+
+    h = np.broadcast_to(height, values.shape)
+    bins = [(h >= lo) & (h < hi) for lo, hi in zip(yedges[:-1], yedges[1:])]
+    bins[-1] |= h == yedges[-1]  # the last bin includes its upper edge
+    for q in [10, 50, 90]:
+        profile = acc.percentile_profile(q)
+        assert profile.shape == (6,)
+        assert np.isnan(profile[0])
+        for j in range(1, 6):
+            assert profile[j] == pytest.approx(np.percentile(values[bins[j]], q), abs=0.05)
+            assert profile[j] == HistogramAccumulator(xedges).add(values[bins[j]]).percentile(q)
+    np.testing.assert_array_equal(acc.median_profile(), acc.percentile_profile(50))
+
+    means = acc.mean_profile()
+    assert np.isnan(means[0])
+    for j in range(1, 6):
+        assert means[j] == pytest.approx(values[bins[j]].mean(), abs=0.05)
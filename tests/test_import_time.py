@@ -0,0 +1,64 @@
+"""
+Tests that guard the cold start of ``import earthcarekit``.
+
+Submodules are loaded lazily on first attribute access, so that lightweight entry points do
+not pull in the plotting (matplotlib, cartopy) and download (pystac_client) stacks. Import
+times are measured by ``tests/benchmarks/bench_import_time.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+STATEMENTS = ["import earthcarekit", "from earthcarekit import eclazy"]
+
+HEAVY_MODULES = ["matplotlib", "cartopy", "pystac_client", "scipy.signal"]
+
+# Packages of `earthcarekit` that are only loaded when they are accessed
+LAZY_PACKAGES = ["earthcarekit.plot", "earthcarekit.download"]
+
+
+def _get_loaded_modules(code: str) -> list[str]:
+    code = f"{code}\nimport json, sys\nprint(json.dumps(list(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", STATEMENTS)
+def test_import_does_not_load_heavy_modules(statement: str) -> None:
+    modules = _get_loaded_modules(statement)
+    heavy = [m for m in modules if any(m == h or m.startswith(f"{h}.") for h in HEAVY_MODULES)]
+    assert heavy == [], f"'{statement}' imported {heavy}"
+
+    lazy = [m for m in modules if any(m == p or m.startswith(f"{p}.") for p in LAZY_PACKAGES)]
+    assert lazy == [], f"'{statement}' imported {lazy}"
+
+
+def test_kernels_resolve_in_fresh_interpreter() -> None:
+    code = (
+        "from earthcarekit.utils.kernels import get_kernel\n"
+        "from earthcarekit.utils.kernels._registry import _KERNEL_MODULES\n"
+        "for name in _KERNEL_MODULES:\n"
+        "    get_kernel(name, backend='numpy')"
+    )
+    modules = _get_loaded_modules(code)
+    assert not any(m == "matplotlib" or m.startswith("matplotlib.") for m in modules)
+
+
+def test_lazy_attributes_resolve() -> None:
+    import earthcarekit as eck
+    import earthcarekit.plot
+    import earthcarekit.read
+
+    names = set(eck.__all__) | set(earthcarekit.read.__all__) | set(earthcarekit.plot.__all__)
+    missing = [name for name in sorted(names) if not hasattr(eck, name)]
+    assert missing == [], f"Not available from earthcarekit: {missing}"
@@ -0,0 +1,117 @@
+"""Checks that the NumPy and Numba kernel backends produce the same results."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from earthcarekit.geo import geodesic, get_coords_between, haversine, vincenty  # noqa: E402
+from earthcarekit.utils.kernels import get_backend, get_kernel, set_backend  # noqa: E402
+
+RNG = np.random.default_rng(42)
+
+
+def _compare(name: str, *args, exact: bool = True, rtol: float = 1e-12) -> None:
+    expected = get_kernel(name, backend="numpy")(*args)
+    result = get_kernel(name, backend="numba")(*args)
+    if not isinstance(expected, tuple):
+        expected, result = (expected,), (result,)
+    for e, r in zip(expected, result):
+        if exact:
+            np.testing.assert_array_equal(r, e)
+        else:
+            np.testing.assert_allclose(r, e, rtol=rtol, atol=1e-9, equal_nan=True)
+
+
+def _random_coords(n: int) -> tuple[np.ndarray, np.ndarray]:
+    return RNG.uniform(-90, 90, n), RNG.uniform(-180, 180, n)
+
+
+def test_vincenty() -> None:
+    lat_1, lon_1 = np.radians(_random_coords(1000))
+    lat_2, lon_2 = np.radians(_random_coords(1000))
+    lat_2[:100], lon_2[:100] = lat_1[:100], lon_1[:100]  # identical points
+    lat_2[100:200] = lat_1[100:200] + 1e-4  # short distances
+    _compare("vincenty", lat_1, lon_1, lat_2, lon_2, 1e-12, 10, exact=False, rtol=1e-9)
+
+
+def test_haversine() -> None:
+    lat_1, lon_1 = np.radians(_random_coords(1000))
+    lat_2, lon_2 = np.radians(_random_coords(1000))
+    _compare("haversine", lat_1, lon_1, lat_2, lon_2, 6371.0, exact=False)
+
+
+def test_geo_lerp() -> None:
+    lat0, lon0 = _random_coords(1000)
+    lat1 = np.clip(lat0 + RNG.normal(0, 0.05, 1000), -90, 90)
+    lon1 = lon0 + RNG.normal(0, 0.05, 1000)
+    lat1[:10], lon1[:10] = lat0[:10], lon0[:10]  # identical points
+    w = RNG.uniform(0, 1, 1000)
+    _compare("geo_lerp", lat0, lon0, lat1, lon1, w, exact=False)
+
+
+@pytest.mark.parametrize("is_descending", [False, True])
+@pytest.mark.parametrize("is_shared_grid", [False, True])
+def test_rebin_height(is_descending: bool, is_shared_grid: bool) -> None:
+    h = np.sort(RNG.uniform(0, 20e3, (200, 120)), axis=1)
+    v = RNG.normal(size=h.shape)
+    v[RNG.random(v.shape) < 0.1] = np.nan
+    if is_shared_grid:
+        h_new = np.tile(np.linspace(0, 20e3, 40), (200, 1))
+    else:
+        h_new = np.sort(RNG.uniform(0, 20e3, (200, 40)), axis=1)
+    if is_descending:
+        h_new = h_new[:, ::-1]
+
+    _compare("rebin_height_mean", h, h_new, v)
+    _compare("rebin_height_lerp", h, np.sort(h_new, axis=1), v)
+
+
+def test_rolling_mean_1d() -> None:
+    a = RNG.normal(size=500)
+    a[RNG.random(a.shape) < 0.2] = np.nan
+    a[100:120] = np.nan
+    for w in [1, 4, 15]:
+        _compare("rolling_mean_1d", a, w, exact=False)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_rolling_mean_2d(axis: int) -> None:
+    a = RNG.normal(size=(300, 80)).astype(np.float32)
+    a[RNG.random(a.shape) < 0.2] = np.nan
+    a[5, 5] = np.inf
+    for w in [1, 3, 10]:
+        _compare("rolling_mean_2d", a, w, axis)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_broadcast_inputs_do_not_warn(backend: str) -> None:
+    # Broadcast views passed to Numba emit "future versions will not create a writeable array"
+    coords = np.column_stack(_random_coords(50))
+    point = np.array([45.0, 10.0])
+    previous_backend = get_backend()
+    set_backend(backend)  # type: ignore[arg-type]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            for func in (geodesic, vincenty, haversine):
+                many_to_one = func(coords, point)
+                one_to_many = func(point, coords)
+                np.testing.assert_allclose(one_to_many, many_to_one, rtol=1e-9)
+                assert np.ndim(func(point, point)) == 0
+            between = get_coords_between(coords, point, np.linspace(0, 1, len(coords)))
+            single = get_coords_between(point, coords[:1], 0.5)
+    finally:
+        set_backend(previous_backend)
+
+    assert between.shape == coords.shape
+    assert single.shape == (1, 2)
+
+
+def test_kernel_modules_cover_all_kernels() -> None:
+    from earthcarekit.utils.kernels._numba import _NUMBA_KERNELS
+    from earthcarekit.utils.kernels._registry import _KERNEL_MODULES
+
+    assert set(_KERNEL_MODULES) == set(_NUMBA_KERNELS)
@@ -0,0 +1,205 @@
+"""Tests for `LazyDataset`: selections pushed down into the HDF5 reads and remote files."""
+
+import os
+
+import h5py  # type: ignore
+import numpy as np
+import pytest
+import xarray as xr
+from earthcarekit.read.lazy import LazyDataset, _remote
+
+_VARS = [
+    "latitude",
+    "time",
+    "height",
+    "particle_backscatter_coefficient_355nm",
+    "simple_classification",
+]
+
+
+def _read(filepath: str, **kwargs) -> xr.Dataset:
+    with LazyDataset(filepath, use_cache=False, **kwargs) as lds:
+        return lds.load(_VARS).to_xarray()
+
+
+def _span(mask: np.ndarray) -> slice:
+    idxs = np.flatnonzero(mask)
+    return slice(int(idxs[0]), int(idxs[-1]) + 1)
+
+
+@pytest.mark.parametrize("trim_to_frame", [True, False])
+@pytest.mark.parametrize(
+    "selection",
+    [
+        dict(along_track_index_range=(5, 50)),
+        dict(lat_range=(0, 10)),
+        dict(time_range=("2024-09-02T21:00:45", "2024-09-02T21:00:50")),
+        dict(vertical_index_range=(3, -4)),
+        dict(height_range=(0, 5e3)),
+        dict(lat_range=(-5, 15), height_range=(1e3, 12e3), along_track_index_range=(2, None)),
+    ],
+)
+def test_selection_matches_full_read(atl_ebd_2a, trim_to_frame, selection) -> None:
+    filepath = atl_ebd_2a()
+    full = _read(filepath, trim_to_frame=trim_to_frame)
+    ds = _read(filepath, trim_to_frame=trim_to_frame, **selection)
+
+    expected = full
+    if "along_track_index_range" in selection:
+        expected = expected.isel(along_track=slice(*selection["along_track_index_range"]))
+    if "lat_range" in selection:
+        lats = expected["latitude"].values
+        lat_min, lat_max = selection["lat_range"]
+        expected = expected.isel(along_track=_span((lats >= lat_min) & (lats <= lat_max)))
+    if "time_range" in selection:
+        times = expected["time"].values
+        time_min, time_max = (np.datetime64(t) for t in selection["time_range"])
+        expected = expected.isel(along_track=_span((times >= time_min) & (times <= time_max)))
+    if "vertical_index_range" in selection:
+        expected = expected.isel(vertical=slice(*selection["vertical_index_range"]))
+    if "height_range" in selection:
+        height = expected["height"].values
+        height_min, height_max = selection["height_range"]
+        expected = expected.isel(
+            vertical=_span(((height >= height_min) & (height <= height_max)).any(axis=0))
+        )
+
+    assert ds.sizes == expected.sizes
+    for var in _VARS:
+        np.testing.assert_array_equal(ds[var].values, expected[var].values)
+    np.testing.assert_array_equal(
+        ds["latitude"].values[:1],
+        full["latitude"].values[
+            int(ds["trim_index_offset"].values) - int(full["trim_index_offset"].values)
+        ][None],
+    )
+    assert int(ds["frame_index_offset"].values) == int(full["frame_index_offset"].values)
+
+
+def test_selection_offsets_and_from_xarray(atl_ebd_2a) -> None:
+    filepath = atl_ebd_2a()
+    full = _read(filepath, trim_to_frame=True)
+    ds = _read(filepath, trim_to_frame=True, along_track_index_range=(7, 20))
+    frame_offset = int(full["frame_index_offset"].values)
+
+    assert frame_offset > 0
+    assert int(full["trim_index_offset"].values) == frame_offset
+    assert int(ds["trim_index_offset"].values) == frame_offset + 7
+    assert int(ds["frame_index_offset"].values) == frame_offset
+    assert LazyDataset.from_xarray(ds).trim_to_frame
+
+    untrimmed = _read(filepath, trim_to_frame=False, along_track_index_range=(7, 20))
+    assert int(untrimmed["trim_index_offset"].values) == 7
+    assert int(untrimmed["frame_index_offset"].values) == 0
+    assert not LazyDataset.from_xarray(untrimmed).trim_to_frame
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes, start: int, size: int) -> None:
+        self.content = content
+        self.status_code = 206
+        self.headers = {"Content-Range": f"bytes {start}-{start + len(content) - 1}/{size}"}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _FakeSession:
+    """Serves range requests from a local file in place of `requests.Session`."""
+
+    instances: list["_FakeSession"] = []
+
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+        self.closed = False
+        _FakeSession.instances.append(self)
+
+    def get(self, url: str, headers: dict[str, str]) -> _FakeResponse:
+        assert not self.closed
+        start, stop = (int(x) for x in headers["Range"].removeprefix("bytes=").split("-"))
+        with open(self.filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(start)
+            return _FakeResponse(f.read(stop + 1 - start), start, size)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_range_file_is_closed_on_exit(atl_ebd_2a, monkeypatch) -> None:
+    filepath = atl_ebd_2a()
+    monkeypatch.setattr(_FakeSession, "instances", [])
+    monkeypatch.setattr(_remote.requests, "Session", lambda: _FakeSession(filepath))
+    url = f"https://example.com/data/{os.path.basename(filepath)}"
+    expected = _read(filepath)
+
+    lds = LazyDataset(url, remote_mode="range", fsspec_kwargs={"headers": {}})
+    with lds:
+        range_file = lds._range_file
+        assert range_file is not None
+        ds = lds.load(_VARS).to_xarray()
+    assert lds._range_file is None
+    assert range_file.closed
+    assert _FakeSession.instances[0].closed
+    for var in _VARS:
+        np.testing.assert_array_equal(ds[var].values, expected[var].values)
+
+    with lds:  # reopening creates a new range file
+        assert lds._range_file is not None
+        longitude = lds["longitude"].values  # not loaded yet, read through the new file
+    with LazyDataset(filepath, use_cache=False) as local:
+        np.testing.assert_array_equal(longitude, local["longitude"].values)
+    assert lds._range_file is None
+    assert len(_FakeSession.instances) == 2
+    assert all(session.closed for session in _FakeSession.instances)
+
+
+def _write_am_cth_2b(dirpath: str, num_samples: int = 60, num_pixels: int = 300) -> str:
+    """Writes a minimal swath product whose nadir index is taken from `DEFAULT_NADIR_INDEX`."""
+    name = "ECA_EXAA_AM__CTH_2B_20240902T210037Z_20240903T003512Z_01500A.h5"
+    filepath = os.path.join(dirpath, name)
+    dims_2d = ["along_track", "across_track"]
+    with h5py.File(filepath, "w") as f:
+        g = f.create_group("ScienceData")
+        for dim, size in [("along_track", num_samples), ("across_track", num_pixels)]:
+            g.create_dataset(dim, data=np.arange(size)).make_scale(dim)
+
+        def add(name: str, data: np.ndarray, dims: list[str]) -> h5py.Dataset:
+            d = g.create_dataset(name, data=data)
+            for i, dim in enumerate(dims):
+                d.dims[i].attach_scale(g[dim])
+            return d
+
+        ones = np.ones((num_samples, num_pixels))
+        add("latitude", np.linspace(-25, 25, num_samples)[:, None] * ones, dims_2d)
+        add("longitude", np.linspace(-10, 10, num_pixels)[None, :] * ones, dims_2d)
+        t = add("time", 778626037.0 + np.arange(num_samples) * 0.14, ["along_track"])
+        t.attrs["units"] = np.bytes_(b"seconds since 2000-01-01 00:00:00")
+        cth = np.arange(num_samples * num_pixels, dtype=np.float32).reshape(ones.shape)
+        add("cloud_top_height_MSI", cth, dims_2d)
+    return filepath
+
+
+def test_across_track_selection_is_stable_on_reentry(tmp_path) -> None:
+    filepath = _write_am_cth_2b(str(tmp_path))
+    vars = ["cloud_top_height_MSI", "cloud_top_height_MSI_track"]
+    with LazyDataset(filepath, use_cache=False) as lds:
+        full = lds.load(vars).to_xarray()
+    nadir_index = int(full["nadir_index"].values)
+    assert nadir_index == 150
+
+    lds = LazyDataset(filepath, use_cache=False, across_track_index_range=(100, 200))
+    for _ in range(3):
+        with lds:
+            assert lds.nadir_index == nadir_index - 100
+            ds = lds.load(vars).to_xarray()
+
+        assert int(ds["nadir_index"].values) == nadir_index - 100
+        np.testing.assert_array_equal(
+            ds["cloud_top_height_MSI"].values,
+            full["cloud_top_height_MSI"].values[:, 100:200],
+        )
+        np.testing.assert_array_equal(
+            ds["cloud_top_height_MSI_track"].values,
+            full["cloud_top_height_MSI_track"].values,
+        )
@@ -0,0 +1,99 @@
+"""Tests for applying functions to many products with `map_products` and `map_reduce_products`."""
+
+import os
+import threading
+import time
+
+import pytest
+from earthcarekit.read import map_products, map_reduce_products
+
+_FILEPATHS = [f"/data/product_{i}.h5" for i in range(6)]
+
+
+def _index(filepath: str) -> int:
+    return int(os.path.basename(filepath).removesuffix(".h5").split("_")[1])
+
+
+def _slow_first(filepath: str) -> int:
+    i = _index(filepath)
+    time.sleep(0.02 * (len(_FILEPATHS) - i))  # earlier products finish later
+    return i
+
+
+def _fail_odd(filepath: str) -> int:
+    i = _index(filepath)
+    if i % 2 == 1:
+        raise KeyError(f"missing variable in product {i}")
+    return i
+
+
+class _FailOnce:
+    """Fails on the first call for each product."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, filepath: str) -> int:
+        with self.lock:
+            self.calls[filepath] = self.calls.get(filepath, 0) + 1
+            if self.calls[filepath] == 1:
+                raise OSError(f"temporary failure reading {filepath}")
+        return _index(filepath)
+
+
+@pytest.mark.parametrize("backend,workers", [("thread", 1), ("thread", 4), ("process", 2)])
+def test_results_are_in_product_order(backend, workers) -> None:
+    kwargs = dict(workers=workers, backend=backend, open_product=False)
+    assert map_products(_FILEPATHS, _slow_first, **kwargs) == list(range(6))
+
+    order = map_reduce_products(
+        _FILEPATHS, _slow_first, lambda acc, i: acc + [i], initial=[], **kwargs
+    )
+    assert order == list(range(6))
+
+
+def test_retries() -> None:
+    func = _FailOnce()
+    kwargs = dict(workers=3, backend="thread", open_product=False)
+    assert map_products(_FILEPATHS, func, retries=1, **kwargs) == list(range(6))
+    assert all(n == 2 for n in func.calls.values())
+
+    with pytest.warns(UserWarning, match="Skipped 6 of 6 products"):
+        results = map_products(_FILEPATHS, _FailOnce(), on_error="skip", **kwargs)
+    assert results == [None] * 6
+
+
+def test_skip_warns_about_failed_products() -> None:
+    kwargs = dict(workers=2, backend="thread", open_product=False, on_error="skip")
+    with pytest.warns(UserWarning, match="Skipped 3 of 6 products") as record:
+        results = map_products(_FILEPATHS, _fail_odd, **kwargs)
+    assert results == [0, None, 2, None, 4, None]
+    message = str(record[0].message)
+    assert all(f"product_{i}.h5: KeyError" in message for i in (1, 3, 5))
+
+    with pytest.warns(UserWarning, match="Skipped 3 of 6 products"):
+        total = map_reduce_products(_FILEPATHS, _fail_odd, lambda a, b: a + b, **kwargs)
+    assert total == 0 + 2 + 4
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_raise_keeps_exception_and_traceback(backend) -> None:
+    with pytest.raises(RuntimeError, match=r"product_[135]\.h5") as excinfo:
+        map_products(_FILEPATHS, _fail_odd, workers=2, backend=backend, open_product=False)
+    assert isinstance(excinfo.value.__cause__, KeyError)
+    assert "missing variable in product" in str(excinfo.value.__cause__)
+    assert "in _fail_odd" in str(excinfo.value)  # traceback formatted in the worker
+
+
+def test_reduce_initial_none_is_a_value() -> None:
+    def _collect(acc, i):
+        return [i] if acc is None else acc + [i]
+
+    kwargs = dict(workers=1, open_product=False)
+    assert map_reduce_products(_FILEPATHS[:2], _index, _collect, initial=None, **kwargs) == [0, 1]
+    assert map_reduce_products(_FILEPATHS[:2], _index, lambda a, b: a + b, **kwargs) == 1
+    assert map_reduce_products([], _index, _collect, initial=None, **kwargs) is None
+
+    with pytest.raises(ValueError):
+        map_reduce_products([], _index, _collect, **kwargs)
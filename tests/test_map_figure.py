@@ -0,0 +1,121 @@
+"""Tests for drawing colored tracks with `MapFigure.ecplot` and `MapFigure.plot_track`."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+import xarray as xr  # noqa: E402
+from cartopy.mpl.feature_artist import FeatureArtist  # noqa: E402
+from earthcarekit.plot import MapFigure  # noqa: E402
+from earthcarekit.plot.figure import _track_collection  # noqa: E402
+from earthcarekit.read import LazyDataset  # noqa: E402
+from matplotlib.collections import LineCollection  # noqa: E402
+
+_MAP_KWARGS = dict(
+    projection="platecarree",
+    style="none",
+    show_grid=False,
+    show_night_shade=False,
+    show_text_time=False,
+    show_text_frame=False,
+    show_text_overpass=False,
+)
+
+
+@pytest.fixture
+def ds(atl_ebd_2a) -> xr.Dataset:
+    filepath = atl_ebd_2a(num_samples=2000)
+    with LazyDataset(filepath, use_cache=False) as lds:
+        return lds.load(["latitude", "longitude", "time", "geoid_offset"]).to_xarray()
+
+
+def _remove_features(mf: MapFigure) -> MapFigure:
+    for artist in mf.ax.get_children():
+        if isinstance(artist, FeatureArtist):
+            artist.remove()  # coastlines would need to be downloaded
+    return mf
+
+
+def _map_figure() -> MapFigure:
+    return _remove_features(MapFigure(**_MAP_KWARGS))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("view", ["global", "data"])
+def test_ecplot_decimates_track_at_final_extent(ds, view, monkeypatch) -> None:
+    extents: list[tuple[float, ...]] = []
+
+    def _record_extent(ax, *args, **kwargs):
+        extents.append(tuple(ax.get_extent()))
+        return get_indices(ax, *args, **kwargs)
+
+    get_indices = _track_collection._get_track_decimation_indices
+    monkeypatch.setattr(_track_collection, "_get_track_decimation_indices", _record_extent)
+
+    mf = _map_figure().ecplot(ds, "geoid_offset", view=view, extent=[-5.0, 5.0, -4.0, 4.0])
+    np.testing.assert_allclose(mf.ax.get_extent(), [-5.0, 5.0, -4.0, 4.0])
+    _remove_features(mf).fig.canvas.draw()
+
+    # The track is decimated again when drawn at the extent set after plotting it
+    x0, x1, y0, y1 = extents[-1]
+    np.testing.assert_allclose(extents[-1], mf.ax.get_extent())
+    assert x0 <= -5.0 and x1 >= 5.0 and y0 <= -4.0 and y1 >= 4.0 and x1 - x0 < 20.0
+    plt.close(mf.fig)
+
+
+def test_plot_track_decimation_keeps_visible_samples(ds) -> None:
+    lat, lon, z = (ds[v].values for v in ["latitude", "longitude", "geoid_offset"])
+
+    mf = _map_figure().zoom(extent=[-5.0, 5.0, -4.0, 4.0])
+    mf.plot_track(lat, lon, z=z, colorbar=False)
+    (lc,) = [c for c in mf.ax.collections if isinstance(c, LineCollection)]
+    assert len(lc.get_array()) < lat.size  # type: ignore[arg-type]
+
+    full = _map_figure().zoom(extent=[-5.0, 5.0, -4.0, 4.0])
+    full.plot_track(lat, lon, z=z, colorbar=False, min_segment_length=None)
+    (lc_full,) = [c for c in full.ax.collections if isinstance(c, LineCollection)]
+    np.testing.assert_array_equal(lc_full.get_array(), z)
+
+    # Zoomed in, samples further apart than `min_segment_length` on the map are all kept
+    zoomed = _map_figure().zoom(extent=[-1.0, 1.0, -1.0, 1.0])
+    idxs = _track_collection._get_track_decimation_indices(zoomed.ax, lat, lon, 0.25)
+    is_visible = (np.abs(lat) < 1.0) & (np.abs(lon) < 1.0)
+    assert is_visible.sum() > 10
+    assert set(np.flatnonzero(is_visible)) <= set(idxs)
+    assert len(idxs) < len(lc.get_array())  # type: ignore[arg-type]
+    for fig in [mf.fig, full.fig, zoomed.fig]:
+        plt.close(fig)
+
+
+def test_plot_track_is_decimated_again_after_zooming() -> None:
+    lat = np.linspace(-25.0, 25.0, 20_000)
+    lon = 0.4 * lat
+    z = np.sin(lat)
+    is_visible = (np.abs(lat) < 1.0) & (np.abs(lon) < 1.0)
+
+    mf = _map_figure().zoom(extent=[-180.0, 180.0, -90.0, 90.0])
+    mf.plot_track(lat, lon, z=z, colorbar=False)
+    (lc,) = [c for c in mf.ax.collections if isinstance(c, LineCollection)]
+    initial = _track_collection._get_track_decimation_indices(mf.ax, lat, lon, 0.25)
+    np.testing.assert_array_equal(lc.get_array(), z[initial])
+    assert not set(np.flatnonzero(is_visible)) <= set(initial)
+    vmin, vmax = lc.get_clim()
+
+    mf.zoom(extent=[-1.0, 1.0, -1.0, 1.0])
+    mf.fig.canvas.draw()
+
+    # After zooming in, the track is decimated to the new extent when drawn
+    expected = _track_collection._get_track_decimation_indices(mf.ax, lat, lon, 0.25)
+    np.testing.assert_array_equal(lc.get_array(), z[expected])
+    assert set(np.flatnonzero(is_visible)) <= set(expected)
+    # The color scale still covers all values
+    assert (vmin, vmax) == (np.nanmin(z), np.nanmax(z))
+    assert lc.get_clim() == (vmin, vmax)
+
+    # Drawing again without changes keeps the segments
+    paths = lc.get_paths()
+    mf.fig.canvas.draw()
+    assert lc.get_paths() is paths
+    plt.close(mf.fig)
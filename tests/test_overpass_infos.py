@@ -0,0 +1,120 @@
+"""Tests comparing the batch `get_overpass_infos` with `get_overpass_info` for each site."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from earthcarekit.overpass._overpass_info import (
+    _DATAFRAME_DTYPES,
+    get_overpass_info,
+    get_overpass_infos,
+)
+from earthcarekit.read.lazy import LazyDataset
+from earthcarekit.site import Site
+
+_SITES = [
+    Site(latitude=0.0, longitude=0.0, name="center", long_name="Center"),
+    Site(latitude=60.0, longitude=60.0, name="far", long_name="Far away"),  # no overpass
+    Site(latitude=10.3, longitude=4.8, name="offset", long_name="Off track"),
+    Site(latitude=-22.6, longitude=-9.2, name="edge", long_name="Track edge"),
+    Site(latitude=5.0, longitude=2.3),  # without names
+]
+_VARS = ["latitude", "longitude", "time"]
+
+
+@pytest.fixture
+def ds(atl_ebd_2a) -> xr.Dataset:
+    with LazyDataset(atl_ebd_2a(), use_cache=False) as lds:
+        return lds.load(_VARS).to_xarray()
+
+
+def _get_expected(ds: xr.Dataset | str, sites: list[Site], radius_km: float) -> pd.DataFrame:
+    frames = []
+    for site in sites:
+        try:
+            info = get_overpass_info(ds, site, radius_km=radius_km)
+        except ValueError:
+            continue  # site not overpassed
+        frames.append(info.to_dataframe())
+    if len(frames) == 0:
+        return pd.DataFrame(columns=list(_DATAFRAME_DTYPES)).astype(_DATAFRAME_DTYPES)
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize("radius_km", [20.0, 100.0, 500.0])
+def test_matches_get_overpass_info(ds, radius_km) -> None:
+    df = get_overpass_infos(ds, _SITES, radius_km=radius_km)
+    expected = _get_expected(ds, _SITES, radius_km)
+
+    assert "Far away" not in df["site_name"].values
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_site_names(ds) -> None:
+    df = get_overpass_infos(ds, ["leipzig", *_SITES], radius_km=100.0)
+
+    # Leipzig is not overpassed by the synthetic track
+    assert list(df["site_name"]) == ["Center", "Off track", "Track edge", ""]
+
+
+def test_no_overpass(ds) -> None:
+    df = get_overpass_infos(ds, [_SITES[1]], radius_km=100.0)
+
+    assert len(df) == 0
+    assert list(df.columns) == list(_DATAFRAME_DTYPES)
+    pd.testing.assert_series_equal(df.dtypes, _get_expected(ds, [], 100.0).dtypes)
+    with pytest.raises(ValueError, match="not a valid overpass"):
+        get_overpass_info(ds, _SITES[1], radius_km=100.0)
+
+
+def test_empty_sites(ds) -> None:
+    df = get_overpass_infos(ds, [], radius_km=100.0)
+
+    assert len(df) == 0
+    assert list(df.columns) == list(_DATAFRAME_DTYPES)
+    assert df["start_time"].dtype == np.dtype("datetime64[ns]")
+
+
+def test_filepath_input(atl_ebd_2a) -> None:
+    filepath = atl_ebd_2a()
+
+    df = get_overpass_infos(filepath, _SITES, radius_km=100.0)
+
+    assert len(df) == 4
+    pd.testing.assert_frame_equal(df, _get_expected(filepath, _SITES, 100.0))
+
+
+def test_invalid_input(ds) -> None:
+    with pytest.raises(TypeError):
+        get_overpass_infos(ds["latitude"], _SITES)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        get_overpass_infos(ds, [(0.0, 0.0)])  # type: ignore[list-item]
+
+
+def test_to_dataframe_dtypes(ds) -> None:
+    df = get_overpass_info(ds, _SITES[0], radius_km=100.0).to_dataframe()
+
+    assert len(df) == 1
+    assert pd.api.types.is_string_dtype(df["site_name"])
+    for column in ["start_time", "end_time", "closest_time"]:
+        assert df[column].dtype == np.dtype("datetime64[ns]")
+    for column in ["start_index", "end_index", "closest_index", "samples"]:
+        assert np.issubdtype(df[column].dtype, np.integer)
+    for column in ["site_lat_deg_north", "closest_lon_deg_east", "along_track_distance_km"]:
+        assert df[column].dtype == np.float64
+    assert df["frame_crosses_pole"].dtype == bool
+
+
+def test_closest_lon_is_longitude(ds) -> None:
+    # `closest_lon_deg_east` used to report the latitude of the closest sample
+    site = _SITES[2]
+    info = get_overpass_info(ds, site, radius_km=100.0)
+
+    i = info.closest_index
+    assert info.closest_lat_deg_north == ds["latitude"].values[i]
+    assert info.closest_lon_deg_east == ds["longitude"].values[i]
+    assert info.closest_lon_deg_east != info.closest_lat_deg_north
+    assert info.closest_coords == (ds["latitude"].values[i], ds["longitude"].values[i])
+
+    df = get_overpass_infos(ds, [site], radius_km=100.0)
+    assert df["closest_lon_deg_east"].iloc[0] == ds["longitude"].values[i]
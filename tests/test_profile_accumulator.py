@@ -0,0 +1,135 @@
+"""Tests for streaming profile statistics with `ProfileAccumulator` against `Profile.mean/std`."""
+
+import os
+
+import numpy as np
+import pytest
+from earthcarekit.data.profile import Profile, ProfileAccumulator
+
+RNG = np.random.default_rng(5)
+
+HEIGHT = np.linspace(0.0, 10e3, 41)
+
+
+def _profiles(num_profiles: int, start: str = "2025-01-01T00:00:00") -> Profile:
+    values = RNG.lognormal(-13, 1, (num_profiles, HEIGHT.size))
+    values[RNG.random(values.shape) < 0.2] = np.nan
+    values[:, -1] = np.nan  # no valid values in the top bin
+    time = np.datetime64(start) + np.arange(num_profiles) * np.timedelta64(1420, "ms")
+    return Profile(
+        values=values,
+        height=HEIGHT,
+        time=time,
+        latitude=np.linspace(40.0, 45.0, num_profiles),
+        longitude=np.linspace(10.0, 11.0, num_profiles),
+        label="Backscatter",
+        units="m-1 sr-1",
+    )
+
+
+def _concat(profiles: list[Profile]) -> Profile:
+    return Profile(
+        values=np.concatenate([p.values for p in profiles]),
+        height=HEIGHT,
+        time=np.concatenate([p.time for p in profiles]),
+        latitude=np.concatenate([p.latitude for p in profiles]),  # type: ignore
+        longitude=np.concatenate([p.longitude for p in profiles]),  # type: ignore
+    )
+
+
+def _assert_matches(acc: ProfileAccumulator, expected: Profile) -> None:
+    mean, std = acc.mean(), acc.std()
+    np.testing.assert_allclose(mean.values, expected.mean().values, rtol=1e-10)
+    np.testing.assert_allclose(std.values, expected.std().values, rtol=1e-8)
+    np.testing.assert_array_equal(mean.height, HEIGHT)
+    # `Profile.mean` averages times truncated to seconds, so compare with the exact mean time
+    offsets = (expected.time - expected.time[0]) / np.timedelta64(1, "ns")
+    expected_time = expected.time[0] + np.timedelta64(round(np.mean(offsets)), "ns")
+    assert abs(mean.time[0] - expected_time) <= np.timedelta64(1, "us")
+    np.testing.assert_allclose(mean.latitude, expected.mean().latitude)  # type: ignore
+    np.testing.assert_allclose(mean.longitude, expected.mean().longitude)  # type: ignore
+
+
+def test_streaming_matches_profile_mean_and_std() -> None:
+    frames = [_profiles(n, f"2025-01-01T0{i}:00:00") for i, n in enumerate([50, 1, 200, 30])]
+    acc = ProfileAccumulator(HEIGHT)
+    for frame in frames:
+        acc.add(frame)
+
+    whole = _concat(frames)
+    assert acc.num_profiles == 281
+    np.testing.assert_array_equal(acc.count, np.sum(np.isfinite(whole.values), axis=0))
+    _assert_matches(acc, whole)
+    assert acc.label == "Backscatter"
+    assert acc.units == frames[0].units
+
+    mean = acc.mean()
+    assert np.isnan(mean.values[0, -1]) and np.isnan(acc.std().values[0, -1])
+    sem = acc.std().values / np.sqrt(acc.count)
+    np.testing.assert_allclose(mean.error, sem)  # type: ignore
+
+
+def test_merge() -> None:
+    frames = [_profiles(40), _profiles(70, "2025-03-01T12:00:00"), _profiles(5)]
+    accs = [ProfileAccumulator(HEIGHT).add(frame) for frame in frames]
+
+    merged = accs[0] + accs[1] + accs[2]
+    _assert_matches(merged, _concat(frames))
+    assert accs[0].num_profiles == 40  # operands unchanged
+
+    # Merging into and from empty accumulators
+    empty = ProfileAccumulator(HEIGHT)
+    _assert_matches(empty + accs[1], frames[1])
+    _assert_matches(accs[1] + ProfileAccumulator(HEIGHT), frames[1])
+
+    with pytest.raises(ValueError):
+        accs[0].merge(ProfileAccumulator(HEIGHT[:-1]))
+
+
+def test_rebins_added_profiles() -> None:
+    frame = _profiles(20)
+    coarse = HEIGHT[::2]
+    acc = ProfileAccumulator(coarse, method="interpolate").add(frame)
+    expected = frame.rebin_height(coarse, method="interpolate")
+    np.testing.assert_allclose(acc.mean().values, expected.mean().values, rtol=1e-10)
+    with pytest.raises(ValueError):
+        ProfileAccumulator(HEIGHT[::-1])
+
+
+def test_empty_accumulator() -> None:
+    acc = ProfileAccumulator(HEIGHT)
+    mean = acc.mean()
+    assert mean.values.shape == (1, HEIGHT.size)
+    assert np.isnan(mean.values).all()
+    assert np.isnan(acc.std().values).all()
+    assert np.isnat(mean.time).all()
+    assert mean.latitude is None and mean.longitude is None
+
+
+@pytest.mark.parametrize("is_empty", [False, True])
+def test_save_load_round_trip(tmp_path, is_empty) -> None:
+    acc = ProfileAccumulator(HEIGHT, units="m-1 sr-1")  # label is None
+    if not is_empty:
+        acc.add(_profiles(30)).add(_profiles(10, "2025-02-01T00:00:00"))
+        acc.label = None
+
+    filepath = str(tmp_path / "stats" / "acc.npz")
+    acc.save(filepath)
+    loaded = ProfileAccumulator.load(filepath)
+    assert os.listdir(tmp_path / "stats") == ["acc.npz"]
+
+    assert loaded.label is None and acc.label is None
+    assert (loaded.units, loaded.platform, loaded.color) == (acc.units, None, None)
+    assert loaded.method == acc.method
+    assert loaded.num_profiles == acc.num_profiles
+    np.testing.assert_array_equal(loaded.count, acc.count)
+    for a, b in [(loaded.mean(), acc.mean()), (loaded.std(), acc.std())]:
+        np.testing.assert_array_equal(a.values, b.values)
+        np.testing.assert_array_equal(a.time, b.time)
+        assert (a.latitude is None) == (b.latitude is None)
+    assert np.isnat(loaded.mean().time).all() == is_empty
+
+    # Loaded accumulators keep accumulating
+    frame = _profiles(15)
+    np.testing.assert_array_equal(loaded.add(frame).count, acc.add(frame).count)
+    np.testing.assert_allclose(loaded.mean().values, acc.mean().values, rtol=1e-12)
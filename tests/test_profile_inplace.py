@@ -0,0 +1,87 @@
+"""Tests that in-place operators of `Profile` never modify arrays shared with other objects."""
+
+import numpy as np
+import pytest
+from earthcarekit.data.profile import Profile
+
+_TIME = np.datetime64("2025-01-01T00:00:00") + np.arange(3) * np.timedelta64(1, "s")
+
+
+def _profile() -> tuple[Profile, np.ndarray]:
+    values = np.arange(12, dtype=np.float64).reshape((3, 4))
+    return Profile(values=values, height=np.arange(4.0), time=_TIME), values
+
+
+def test_inplace_on_selection_keeps_caller_array() -> None:
+    p, values = _profile()
+    original = values.copy()
+    q = p.select_height_range((0, 2))
+    assert np.shares_memory(q.values, values)
+
+    q += 5
+    np.testing.assert_array_equal(values, original)
+    np.testing.assert_array_equal(p.values, original)
+    np.testing.assert_array_equal(q.values, original[:, :3] + 5)
+
+    p += 1  # values given to the constructor are shared with the caller
+    np.testing.assert_array_equal(values, original)
+    np.testing.assert_array_equal(p.values, original + 1)
+
+
+def test_inplace_on_rebinned_profile_keeps_source() -> None:
+    p, values = _profile()
+    original = values.copy()
+    r = p.rebin_height(p.height)
+    r *= 0
+    np.testing.assert_array_equal(p.values, original)
+    np.testing.assert_array_equal(values, original)
+    np.testing.assert_array_equal(r.values, 0)
+
+
+@pytest.mark.parametrize(
+    "derive",
+    [
+        lambda p: p.select_height_range((1, 3)),
+        lambda p: p.select_time_range((_TIME[0], _TIME[1])),
+        lambda p: p[0:2],
+        lambda p: p.rebin_height(p.height),
+    ],
+)
+def test_owner_copies_after_sharing(derive) -> None:
+    p, _ = _profile()
+    owner = p.copy()
+    values = owner.values
+    owner += 1
+    assert owner.values is values  # owned values are modified in place
+    owner -= 1
+
+    derived = derive(owner)
+    expected = derived.values.copy()
+    owner *= 10
+    np.testing.assert_array_equal(derived.values, expected)
+    np.testing.assert_array_equal(owner.values, p.values * 10)
+
+    values = owner.values
+    owner += 1  # owns its new values again
+    assert owner.values is values
+
+
+def test_inplace_operators() -> None:
+    p, values = _profile()
+    q = p.copy()
+    q += 2
+    q -= 1
+    q *= 3
+    q /= 2
+    q **= 2
+    np.testing.assert_allclose(q.values, ((values + 1) * 3 / 2) ** 2)
+
+    other = p.copy()
+    other += p
+    np.testing.assert_array_equal(other.values, 2 * values)
+
+    integers = Profile(values=np.ones((3, 4), dtype=np.int32), height=np.arange(4.0), time=_TIME)
+    integers = integers.copy()
+    integers /= 2  # result is not castable to the integer dtype
+    assert integers.values.dtype == np.float64
+    np.testing.assert_array_equal(integers.values, 0.5)
@@ -0,0 +1,140 @@
+"""Tests for resampling curtains to images with `rasterize_curtain` ("raster" mode)."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+from earthcarekit.plot import CurtainFigure  # noqa: E402
+from earthcarekit.plot.figure._rasterize_curtain import (  # noqa: E402
+    CurtainImage,
+    rasterize_curtain,
+)
+
+RNG = np.random.default_rng(3)
+
+
+def _curtain(num_profiles: int, num_bins: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Irregular time bins and descending height bins (top to bottom) varying per profile."""
+    time_edges = np.concatenate([[0.0], np.cumsum(RNG.uniform(0.5, 1.5, num_profiles))])
+    top = 20e3 + RNG.normal(0, 200, (num_profiles, 1))
+    height_edges = top - np.cumsum(RNG.uniform(300, 700, (num_profiles, num_bins + 1)), axis=1)
+    values = RNG.random((num_profiles, num_bins))
+    values[RNG.random(values.shape) < 0.1] = np.nan
+    return values, time_edges, height_edges
+
+
+def _pixel_edges(vmin: float, vmax: float, num_pixels: int) -> np.ndarray:
+    return np.linspace(vmin, vmax, num_pixels + 1)
+
+
+def _nearest_reference(values, time_edges, height_edges, x_range, y_range, shape) -> np.ndarray:
+    """Value of the bin containing each pixel center, searched by brute force."""
+    xe = _pixel_edges(*x_range, shape[1])
+    ye = _pixel_edges(*y_range, shape[0])
+    raster = np.full(shape, np.nan)
+    for c, x in enumerate((xe[:-1] + xe[1:]) / 2):
+        for i in range(values.shape[0]):
+            if not time_edges[i] <= x < time_edges[i + 1]:
+                continue
+            for r, y in enumerate((ye[:-1] + ye[1:]) / 2):
+                for j in range(values.shape[1]):
+                    lo, hi = sorted(height_edges[i, j : j + 2])
+                    if lo <= y < hi:
+                        raster[r, c] = values[i, j]
+    return raster
+
+
+def _mean_reference(values, time_edges, height_edges, x_range, y_range, shape) -> np.ndarray:
+    """Mean of the finite bins centered in each pixel, or the nearest bin if there are none."""
+    xe = _pixel_edges(*x_range, shape[1])
+    ye = _pixel_edges(*y_range, shape[0])
+    tc = (time_edges[:-1] + time_edges[1:]) / 2
+    hc = (height_edges[:, :-1] + height_edges[:, 1:]) / 2
+    nearest = _nearest_reference(values, time_edges, height_edges, x_range, y_range, shape)
+    raster = np.full(shape, np.nan)
+    for r in range(shape[0]):
+        for c in range(shape[1]):
+            is_inside = (
+                (tc[:, None] >= xe[c])
+                & (tc[:, None] < xe[c + 1])
+                & (hc >= ye[r])
+                & (hc < ye[r + 1])
+            )
+            if not is_inside.any():
+                raster[r, c] = nearest[r, c]
+            elif np.isfinite(values[is_inside]).any():
+                raster[r, c] = np.nanmean(values[is_inside])
+    return raster
+
+
+@pytest.mark.parametrize("shape", [(7, 9), (60, 80)])  # pixels larger and smaller than bins
+@pytest.mark.parametrize("sampling", ["nearest", "mean"])
+def test_rasterize_curtain_matches_reference(sampling, shape) -> None:
+    values, time_edges, height_edges = _curtain(30, 25)
+    x_range, y_range = (2.0, 25.0), (0.0, 15e3)
+    raster = rasterize_curtain(
+        values, time_edges, height_edges, x_range, y_range, shape, sampling=sampling
+    )
+    reference = _nearest_reference if sampling == "nearest" else _mean_reference
+    expected = reference(values, time_edges, height_edges, x_range, y_range, shape)
+    assert raster.shape == shape
+    np.testing.assert_allclose(raster, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("sampling", ["nearest", "mean"])
+def test_rasterize_curtain_height_order(sampling) -> None:
+    values, time_edges, height_edges = _curtain(20, 15)
+    args = ((0.0, 20.0), (0.0, 15e3), (40, 30))
+    descending = rasterize_curtain(values, time_edges, height_edges, *args, sampling=sampling)
+    ascending = rasterize_curtain(
+        values[:, ::-1], time_edges, height_edges[:, ::-1], *args, sampling=sampling
+    )
+    np.testing.assert_array_equal(descending, ascending)
+
+    # Rows are ordered from bottom to top: the lowest row shows the lowest bins
+    raster = rasterize_curtain(
+        np.tile(np.arange(15.0), (20, 1)), time_edges, height_edges, *args, sampling=sampling
+    )
+    column = raster[:, 0][~np.isnan(raster[:, 0])]
+    assert np.all(np.diff(column) <= 0)
+
+
+def test_rasterize_curtain_outside_and_invalid() -> None:
+    values, time_edges, height_edges = _curtain(5, 5)
+    raster = rasterize_curtain(values, time_edges, height_edges, (100.0, 200.0), (0, 1e3), (4, 4))
+    assert np.isnan(raster).all()
+    with pytest.raises(ValueError, match="sampling"):
+        rasterize_curtain(values, time_edges, height_edges, (0, 1), (0, 1), (4, 4), "max")  # type: ignore[arg-type]
+
+
+def test_raster_mode_resamples_when_drawn() -> None:
+    num_profiles, num_bins = 400, 50
+    times = np.datetime64("2025-01-01") + np.arange(num_profiles) * np.timedelta64(142, "ms")
+    height = np.linspace(20e3, -500, num_bins)[None, :] + np.zeros((num_profiles, 1))
+    values = RNG.random((num_profiles, num_bins))
+
+    cf = CurtainFigure(mode="raster", dpi=100)
+    cf.plot(values=values, time=times, height=height, cmap=plt.get_cmap("viridis"))
+    (image,) = cf.ax.get_images()
+    assert isinstance(image, CurtainImage)
+    cf.fig.canvas.draw()
+    bbox = cf.ax.get_window_extent()
+    shape = (int(np.ceil(bbox.height)), int(np.ceil(bbox.width)))
+    assert image.get_array().shape == shape
+
+    # Zooming in resamples the visible part at full resolution
+    x0, x1 = cf.ax.get_xlim()
+    cf.ax.set_xlim(x0, x0 + (x1 - x0) / 10)
+    cf.ax.set_ylim(0, 5e3)
+    cf.fig.canvas.draw()
+    assert image.get_array().shape == shape
+    np.testing.assert_allclose(image.get_extent(), [x0, x0 + (x1 - x0) / 10, 0, 5e3])
+
+    cf.fig.set_dpi(200)
+    cf.fig.canvas.draw()
+    assert image.get_array().shape == (int(np.ceil(bbox.height)), int(np.ceil(bbox.width)))
+    assert image.get_array().shape[1] >= 2 * shape[1] - 1
+    plt.close(cf.fig)
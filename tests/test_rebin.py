@@ -0,0 +1,283 @@
+"""Tests for the vectorized rebinning kernels against their former loops and brute-force references."""
+
+import warnings
+from typing import Callable
+
+import numpy as np
+import pytest
+from earthcarekit.data.profile._rebin import rebin_height
+from earthcarekit.utils.numpy import (
+    centers_to_bins,
+    rebin_count,
+    rebin_mean,
+    rebin_median,
+    rebin_std,
+)
+from numpy.typing import NDArray
+
+# Former implementations (loops over columns, bins and profiles) kept as reference
+
+
+def _former_rebin_mean(v: NDArray, rebin_index: NDArray, ignore_nans: bool) -> NDArray:
+    v2d = v.reshape(len(v), -1)
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n, v2d.shape[1]), np.nan)
+    for j in range(v2d.shape[1]):
+        mask = np.isfinite(v2d[:, j]) if ignore_nans else np.ones(len(v2d), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v_new[:, j] = np.bincount(
+                rebin_index[mask], weights=v2d[mask, j], minlength=n
+            ) / np.bincount(rebin_index[mask], minlength=n)
+    return v_new.reshape((n,) + v.shape[1:])
+
+
+def _former_rebin_median(v: NDArray, rebin_index: NDArray) -> NDArray:
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n,) + v.shape[1:], np.nan)
+    order = np.argsort(rebin_index)
+    bins_sorted, v_sorted = rebin_index[order], v[order]
+    edges = np.flatnonzero(np.diff(bins_sorted)) + 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for start, end in zip(np.append(0, edges), np.append(edges, len(bins_sorted))):
+            v_new[bins_sorted[start]] = np.nanmedian(v_sorted[start:end], axis=0)
+    return v_new
+
+
+def _former_rebin_height_mean(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
+    n, m_new = h.shape[0], h_new.shape[1]
+    v_new = np.full((n, m_new), np.nan)
+    for i in range(n):
+        bins = np.clip(np.digitize(h[i], centers_to_bins(h_new[i])) - 1, 0, m_new - 1)
+        mask = np.isfinite(v[i])
+        sums = np.bincount(bins[mask], weights=v[i, mask], minlength=m_new)
+        counts = np.bincount(bins[mask], minlength=m_new)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v_new[i] = sums / counts
+    return v_new
+
+
+def _former_rebin_height_lerp(h: NDArray, h_new: NDArray, v: NDArray) -> NDArray:
+    m = h.shape[1]
+    idx = np.array([np.searchsorted(h[i], h_new[i], side="left") for i in range(h.shape[0])])
+    idx = np.clip(idx, 1, m - 1)
+    h0, h1 = np.take_along_axis(h, idx - 1, axis=1), np.take_along_axis(h, idx, axis=1)
+    v0, v1 = np.take_along_axis(v, idx - 1, axis=1), np.take_along_axis(v, idx, axis=1)
+    dh = h1 - h0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.where(dh != 0.0, (h_new - h0) / dh, 0.0)
+    return v0 + w * (v1 - v0)
+
+
+# Brute-force references: one reduction per bin and column
+
+
+def _brute_force(
+    v: NDArray,
+    rebin_index: NDArray,
+    func: Callable[[NDArray], float],
+    ignore_nans: bool,
+    empty: float = np.nan,
+) -> NDArray:
+    v2d = v.reshape(len(v), -1)
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n, v2d.shape[1]), empty)
+    for b in range(n):
+        for j in range(v2d.shape[1]):
+            samples = v2d[rebin_index == b, j]
+            if ignore_nans:
+                samples = samples[np.isfinite(samples)]
+            if len(samples) > 0:
+                v_new[b, j] = func(samples)
+    return v_new.reshape((n,) + v.shape[1:])
+
+
+def _brute_force_median(v: NDArray, rebin_index: NDArray, ignore_nans: bool) -> NDArray:
+    # Unlike mean, std and count, the median only ignores NaNs and keeps infinite values
+    v2d = v.reshape(len(v), -1)
+    n = int(np.max(rebin_index)) + 1
+    v_new = np.full((n, v2d.shape[1]), np.nan)
+    for b in range(n):
+        for j in range(v2d.shape[1]):
+            samples = v2d[rebin_index == b, j]
+            if ignore_nans:
+                samples = samples[~np.isnan(samples)]
+            if len(samples) > 0:
+                v_new[b, j] = np.median(samples)
+    return v_new.reshape((n,) + v.shape[1:])
+
+
+def _make_data(shape: tuple[int, ...], seed: int = 0) -> tuple[NDArray, NDArray]:
+    """Returns values with NaNs and infinite values, and a shuffled index with empty bins."""
+    rng = np.random.default_rng(seed)
+    v = rng.normal(10.0, 3.0, shape)
+    v[rng.random(shape) < 0.2] = np.nan
+    v[rng.random(shape) < 0.02] = np.inf
+    v[rng.random(shape) < 0.02] = -np.inf
+    # Bins 3 and 7 are empty and the bin sizes differ by a lot
+    rebin_index = rng.choice([0, 1, 2, 4, 5, 6, 8, 8, 8, 8, 8, 8, 9], shape[0])
+    rebin_index[-1] = 9
+    return v, rng.permutation(rebin_index)
+
+
+_SHAPES = [(200,), (200, 7)]
+
+
+def _assert_equal(result: NDArray, expected: NDArray) -> None:
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize("shape", _SHAPES)
+@pytest.mark.parametrize("ignore_nans", [True, False])
+def test_rebin_mean(shape, ignore_nans) -> None:
+    v, rebin_index = _make_data(shape)
+    result = rebin_mean(v, rebin_index=rebin_index, ignore_nans=ignore_nans)
+
+    assert result.shape == (10,) + shape[1:]
+    _assert_equal(result, _former_rebin_mean(v, rebin_index, ignore_nans))
+    with np.errstate(invalid="ignore"):
+        _assert_equal(result, _brute_force(v, rebin_index, np.mean, ignore_nans))
+    assert np.isnan(result[[3, 7]]).all()
+
+
+@pytest.mark.parametrize("shape", _SHAPES)
+@pytest.mark.parametrize("ignore_nans", [True, False])
+def test_rebin_median(shape, ignore_nans) -> None:
+    v, rebin_index = _make_data(shape)
+    result = rebin_median(v, rebin_index=rebin_index, ignore_nans=ignore_nans)
+
+    assert result.shape == (10,) + shape[1:]
+    _assert_equal(result, _brute_force_median(v, rebin_index, ignore_nans))
+    if ignore_nans:
+        _assert_equal(result, _former_rebin_median(v, rebin_index))
+    else:
+        # Any NaN in a bin makes its median NaN
+        assert np.isnan(result).sum() > np.isnan(_former_rebin_median(v, rebin_index)).sum()
+    assert np.isnan(result[[3, 7]]).all()
+
+
+@pytest.mark.parametrize("ignore_nans", [True, False])
+def test_rebin_median_without_nans_matches_former(ignore_nans) -> None:
+    v, rebin_index = _make_data((200, 7))
+    v = np.where(np.isnan(v), 0.0, v)
+
+    result = rebin_median(v, rebin_index=rebin_index, ignore_nans=ignore_nans)
+
+    _assert_equal(result, _former_rebin_median(v, rebin_index))
+
+
+def test_rebin_median_of_uneven_bins() -> None:
+    # One huge bin and many single-sample bins use the lexsort path of the sorted segments
+    rng = np.random.default_rng(1)
+    rebin_index = np.concatenate([np.zeros(500, dtype=int), np.arange(1, 60)])
+    v = rng.normal(size=(len(rebin_index), 5))
+    v[rng.random(v.shape) < 0.3] = np.nan
+
+    result = rebin_median(v, rebin_index=rebin_index)
+
+    _assert_equal(result, _brute_force_median(v, rebin_index, ignore_nans=True))
+    _assert_equal(result, _former_rebin_median(v, rebin_index))
+
+
+@pytest.mark.parametrize("shape", _SHAPES)
+@pytest.mark.parametrize("ignore_nans", [True, False])
+def test_rebin_std(shape, ignore_nans) -> None:
+    v, rebin_index = _make_data(shape)
+    result = rebin_std(v, rebin_index=rebin_index, ignore_nans=ignore_nans)
+
+    assert result.shape == (10,) + shape[1:]
+    with np.errstate(invalid="ignore"):
+        _assert_equal(result, _brute_force(v, rebin_index, np.std, ignore_nans))
+    assert np.isnan(result[[3, 7]]).all()
+
+
+def test_rebin_std_avoids_cancellation() -> None:
+    rebin_index = np.repeat(np.arange(4), 50)
+    v = 1e9 + np.random.default_rng(2).normal(0, 1e-3, len(rebin_index))
+
+    result = rebin_std(v, rebin_index=rebin_index)
+
+    # A one-pass E[x²] - E[x]² would lose all digits here
+    np.testing.assert_allclose(result, [np.std(v[rebin_index == b]) for b in range(4)], rtol=1e-5)
+
+
+@pytest.mark.parametrize("shape", _SHAPES)
+@pytest.mark.parametrize("ignore_nans", [True, False])
+def test_rebin_count(shape, ignore_nans) -> None:
+    v, rebin_index = _make_data(shape)
+    result = rebin_count(v, rebin_index=rebin_index, ignore_nans=ignore_nans)
+
+    assert result.shape == (10,) + shape[1:]
+    assert np.issubdtype(result.dtype, np.integer)
+    expected = _brute_force(v, rebin_index, len, ignore_nans, empty=0)
+    np.testing.assert_array_equal(result, expected)
+    assert (result[[3, 7]] == 0).all()
+
+
+@pytest.mark.parametrize(
+    "func", [rebin_mean, rebin_median, rebin_std, rebin_count], ids=lambda f: f.__name__
+)
+def test_rebin_from_coordinates(func) -> None:
+    v, _ = _make_data((200, 7))
+    coords = np.random.default_rng(3).uniform(0, 100, len(v))  # not monotonic
+    bin_centers = np.arange(5.0, 100.0, 10.0)
+
+    result_edges = func(v, axis0_coords=coords, bin_edges=centers_to_bins(bin_centers))
+    result_centers = func(v, axis0_coords=coords, bin_centers=bin_centers)
+    rebin_index = np.clip(np.digitize(coords, centers_to_bins(bin_centers)) - 1, 0, 9)
+    expected = func(v, rebin_index=rebin_index)
+
+    np.testing.assert_array_equal(result_edges, expected)
+    np.testing.assert_array_equal(result_centers, expected)
+
+
+def test_centers_to_bins_along_last_axis() -> None:
+    centers = np.random.default_rng(4).uniform(0, 10, (5, 8)).cumsum(axis=1)
+
+    edges = centers_to_bins(centers)
+
+    assert edges.shape == (5, 9)
+    for row_centers, row_edges in zip(centers, edges):
+        np.testing.assert_allclose(row_edges, centers_to_bins(row_centers))
+
+
+def _make_profiles(seed: int = 5) -> tuple[NDArray, NDArray]:
+    rng = np.random.default_rng(seed)
+    num_profiles, num_bins = 30, 60
+    h = np.linspace(-1e3, 25e3, num_bins) + rng.normal(0, 50, (num_profiles, 1))
+    v = rng.lognormal(-13, 1, (num_profiles, num_bins))
+    v[rng.random(v.shape) < 0.2] = np.nan
+    v[rng.random(v.shape) < 0.02] = np.inf
+    return h, v
+
+
+@pytest.mark.parametrize("is_shared_target", [True, False])
+def test_rebin_height_mean(is_shared_target) -> None:
+    h, v = _make_profiles()
+    rng = np.random.default_rng(6)
+    # Heights that are not monotonic within profiles
+    h = h + rng.normal(0, 300, h.shape)
+    h[::3] = h[::3, ::-1]
+    h_new = np.tile(np.arange(0.0, 20e3, 500.0), (len(h), 1))
+    if not is_shared_target:
+        # Target heights that differ per profile and descend in some of them
+        h_new = h_new + rng.normal(0, 100, (len(h), 1))
+        h_new[1::2] = h_new[1::2, ::-1]
+
+    result = rebin_height(v, h, h_new, method="mean")
+
+    _assert_equal(result, _former_rebin_height_mean(h, h_new, v))
+    assert np.isnan(result).any()  # bins without finite samples
+
+
+def test_rebin_height_lerp() -> None:
+    h, v = _make_profiles()
+    v = np.where(np.isfinite(v), v, 0.0)
+    h_new = np.arange(-2e3, 30e3, 400.0) + np.random.default_rng(7).normal(0, 100, (len(h), 1))
+
+    result = rebin_height(v, h, h_new, method="interpolate")
+
+    _assert_equal(result, _former_rebin_height_lerp(h, h_new, v))
+    for i in range(len(h)):
+        inside = (h_new[i] >= h[i, 0]) & (h_new[i] <= h[i, -1])
+        _assert_equal(result[i, inside], np.interp(h_new[i, inside], h[i], v[i]))
@@ -0,0 +1,163 @@
+"""Tests for regridding with `KDTreeRegridder` and saving `.npz` files with `savez_atomic`."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import xarray as xr
+from earthcarekit.geo.convertsions import _geo_to_unit_ecef
+from earthcarekit.read.product._regridder import KDTreeRegridder, _get_or_create_regridder
+from earthcarekit.utils.numpy import savez_atomic
+
+RNG = np.random.default_rng(7)
+
+
+def _idw(regridder: KDTreeRegridder, values: np.ndarray, skipna: bool) -> np.ndarray:
+    """Reference: inverse distance weighting of each target point in a plain loop."""
+    flat = values.reshape((regridder.num_source, -1)).astype(np.float64)
+    out = np.empty((regridder.num_target, flat.shape[1]))
+    for i in range(regridder.num_target):
+        w = 1.0 / (regridder.distances[i] + regridder.eps)
+        v = flat[regridder.indices[i]]
+        for j in range(flat.shape[1]):
+            valid = ~np.isnan(v[:, j]) if skipna else np.ones(regridder.k, dtype=bool)
+            if not valid.any():
+                out[i, j] = np.nan
+                continue
+            out[i, j] = np.sum(w[valid] * v[valid, j]) / np.sum(w[valid])
+    return out.reshape((*regridder.target_shape, *values.shape[len(regridder.source_shape) :]))
+
+
+@pytest.fixture
+def regridder() -> KDTreeRegridder:
+    source = RNG.random((30 * 20, 3))
+    target = RNG.random((50, 3))
+    return KDTreeRegridder.from_coords(source, target, source_shape=(30, 20), k=4)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_apply_matches_reference(regridder, workers, monkeypatch) -> None:
+    monkeypatch.setattr("earthcarekit.read.product._regridder._MIN_CHUNK_SIZE", 8)
+    values_2d = RNG.random((30, 20))
+    values_3d = RNG.random((30, 20, 5))  # trailing height dimension
+    outputs = regridder.apply([values_2d, values_3d], workers=workers)
+    assert outputs[0].shape == (50,)
+    assert outputs[1].shape == (50, 5)
+    np.testing.assert_allclose(outputs[0], _idw(regridder, values_2d, skipna=True))
+    np.testing.assert_allclose(outputs[1], _idw(regridder, values_3d, skipna=True))
+
+    single = regridder.apply(values_3d, workers=workers)
+    assert isinstance(single, np.ndarray)
+    np.testing.assert_array_equal(single, outputs[1])
+    assert regridder.apply([]) == []
+
+
+def test_apply_skipna(regridder) -> None:
+    values = RNG.random((30, 20, 2))
+    values[RNG.random((30, 20)) < 0.3, 0] = np.nan
+    values[:, :, 1] = np.nan
+    flat = values.reshape((-1, 2))
+    flat[regridder.indices[0], 0] = np.nan  # all neighbours of the first target point
+
+    out = regridder.apply(values, skipna=True)
+    assert np.isnan(out[0, 0])
+    assert np.isnan(out[:, 1]).all()
+    np.testing.assert_allclose(out, _idw(regridder, values, skipna=True))
+    assert not np.isnan(out[1:, 0]).any()
+
+    out = regridder.apply(values, skipna=False)
+    np.testing.assert_allclose(out, _idw(regridder, values, skipna=False))
+
+
+def test_apply_k1_returns_nearest(regridder) -> None:
+    source = RNG.random((30 * 20, 3))
+    target = source[[5, 17, 599]] + 1e-6
+    nearest = KDTreeRegridder.from_coords(source, target, source_shape=(30, 20), k=1)
+    values = RNG.integers(0, 10, (30, 20, 3)).astype(np.int8)
+    out = nearest.apply(values)
+    assert out.dtype == np.int8
+    np.testing.assert_array_equal(out, values.reshape((-1, 3))[[5, 17, 599]])
+
+
+def test_apply_rejects_mismatched_shape(regridder) -> None:
+    with pytest.raises(ValueError, match="source grid shape"):
+        regridder.apply(np.zeros((20, 30)))
+
+
+def test_save_load_round_trip(regridder, tmp_path) -> None:
+    filepath = str(tmp_path / "cache" / "regridder.npz")
+    regridder.save(filepath)
+    loaded = KDTreeRegridder.load(filepath)
+    np.testing.assert_array_equal(loaded.indices, regridder.indices)
+    np.testing.assert_array_equal(loaded.distances, regridder.distances)
+    assert loaded.source_shape == (30, 20)
+    assert loaded.target_shape == (50,)
+    assert loaded.is_compatible((30, 20), (50,), k=4, eps=regridder.eps)
+    values = RNG.random((30, 20))
+    np.testing.assert_array_equal(loaded.apply(values), regridder.apply(values))
+    assert os.listdir(tmp_path / "cache") == ["regridder.npz"]
+
+
+def test_savez_atomic_concurrent_writers(tmp_path) -> None:
+    filepath = str(tmp_path / "data.npz")
+
+    def _write(i: int) -> None:
+        savez_atomic(filepath, values=np.full(10_000, i))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_write, range(16)))
+
+    assert os.listdir(tmp_path) == ["data.npz"]
+    with np.load(filepath) as data:
+        values = data["values"]
+    assert len(np.unique(values)) == 1  # one writer's complete file
+
+
+def test_savez_atomic_removes_temporary_file_on_error(tmp_path) -> None:
+    filepath = str(tmp_path / "data.npz")
+    savez_atomic(filepath, values=np.arange(3))
+
+    class _Unconvertible:
+        def __array__(self, *args, **kwargs):
+            raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        savez_atomic(filepath, values=np.arange(5), bad=_Unconvertible())  # type: ignore[arg-type]
+    assert os.listdir(tmp_path) == ["data.npz"]
+    with np.load(filepath) as data:
+        np.testing.assert_array_equal(data["values"], np.arange(3))
+
+
+def test_cache_distinguishes_subsets_of_equal_shape(tmp_path) -> None:
+    lat = np.linspace(-30, 30, 61)
+    source = xr.Dataset({"filename": "ECA_EXBA_AUX_MET_1D_source"})
+    target = xr.Dataset({"filename": "ECA_EXBA_ATL_EBD_2A_target"})
+    source_coords = RNG.random((100, 3))
+
+    def _get_or_create(offset: int) -> KDTreeRegridder:
+        # Same products trimmed to different areas of equal size
+        target_coords = _geo_to_unit_ecef(lat[offset : offset + 10], np.zeros(10))
+        return _get_or_create_regridder(
+            source=source,
+            target=target,
+            get_coords=lambda: (source_coords, target_coords),
+            source_shape=(100,),
+            target_shape=(10,),
+            k=2,
+            eps=1e-12,
+            cache_dir=str(tmp_path),
+        )
+
+    first = _get_or_create(0)
+    second = _get_or_create(40)
+    assert len(os.listdir(tmp_path)) == 2
+    assert not np.array_equal(first.indices, second.indices)
+    expected = KDTreeRegridder.from_coords(
+        source_coords, _geo_to_unit_ecef(lat[40:50], np.zeros(10)), k=2
+    )
+    np.testing.assert_array_equal(second.indices, expected.indices)
+
+    # The cached regridder of the first subset is reused
+    np.testing.assert_array_equal(_get_or_create(0).indices, first.indices)
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,124 @@
+"""Tests for extracting ZIP archives from byte streams with `stream_unzip`."""
+
+import io
+import os
+import struct
+import zipfile
+
+import pytest
+from earthcarekit.download._stream_unzip import StreamUnzipError, stream_unzip
+
+_MEMBERS = {
+    "product/ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_01500A.h5": (
+        os.urandom(70_000) + bytes(200_000)
+    ),
+    "product/ECA_EXAA_ATL_EBD_2A_20240902T210037Z_20240903T003512Z_01500A.HDR": (
+        b"<Earth_Explorer_Header/>" * 10
+    ),
+}
+
+
+class _UnseekableWriter:
+    """Write-only file object, which makes `zipfile` append data descriptors to members."""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def write(self, data: bytes) -> int:
+        return self.buffer.write(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _make_archive(
+    compression: int,
+    is_seekable: bool = True,
+    force_zip64: bool = False,
+) -> bytes:
+    f: io.BytesIO | _UnseekableWriter = io.BytesIO() if is_seekable else _UnseekableWriter()
+    with zipfile.ZipFile(f, "w", compression=compression) as zf:  # type: ignore[arg-type]
+        zf.mkdir("product")
+        for name, data in _MEMBERS.items():
+            with zf.open(name, "w", force_zip64=force_zip64) as member:
+                member.write(data)
+    return f.getvalue() if isinstance(f, io.BytesIO) else f.buffer.getvalue()
+
+
+def _chunked(data: bytes, chunk_size: int) -> list[bytes]:
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def _assert_extracted(dirpath: str, result) -> None:
+    assert sorted(os.listdir(dirpath)) == sorted(os.path.basename(n) for n in _MEMBERS)
+    for name, data in _MEMBERS.items():
+        filepath = os.path.join(dirpath, os.path.basename(name))
+        with open(filepath, "rb") as f:
+            assert f.read() == data
+    assert sorted(result.filepaths) == sorted(
+        os.path.join(dirpath, os.path.basename(n)) for n in _MEMBERS
+    )
+    assert result.bytes_written == sum(len(d) for d in _MEMBERS.values())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 1 << 30])
+@pytest.mark.parametrize(
+    "compression, is_seekable, force_zip64",
+    [
+        (zipfile.ZIP_STORED, True, False),
+        (zipfile.ZIP_DEFLATED, True, False),
+        (zipfile.ZIP_DEFLATED, False, False),  # deflated with data descriptor
+        (zipfile.ZIP_STORED, True, True),  # ZIP64 sizes in the local header
+        (zipfile.ZIP_DEFLATED, True, True),
+        (zipfile.ZIP_DEFLATED, False, True),  # ZIP64 data descriptor
+    ],
+)
+def test_stream_unzip_matches_zipfile(tmp_path, chunk_size, compression, is_seekable, force_zip64):
+    archive = _make_archive(compression, is_seekable=is_seekable, force_zip64=force_zip64)
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        infos = [i for i in zf.infolist() if not i.is_dir()]
+        assert all(bool(i.flag_bits & 0x8) != is_seekable for i in infos)
+        assert all(zf.read(i) == _MEMBERS[i.filename] for i in infos)
+
+    result = stream_unzip(_chunked(archive, chunk_size), dest_dirpath=str(tmp_path))
+
+    _assert_extracted(str(tmp_path), result)
+    # Reading stops at the central directory
+    assert 0 < result.bytes_read < len(archive)
+
+
+def test_stream_unzip_rejects_stored_member_with_data_descriptor(tmp_path):
+    archive = _make_archive(zipfile.ZIP_STORED, is_seekable=False)
+
+    with pytest.raises(StreamUnzipError, match="unknown size"):
+        stream_unzip(_chunked(archive, 1000), dest_dirpath=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_stream_unzip_rejects_corrupted_crc(tmp_path, compression):
+    archive = bytearray(_make_archive(compression))
+    # Corrupt the CRC-32 field of the first file member's local header
+    offset = archive.index(b"PK\x03\x04", 1)
+    (crc,) = struct.unpack_from("<I", archive, offset + 14)
+    struct.pack_into("<I", archive, offset + 14, crc ^ 0xFFFFFFFF)
+
+    with pytest.raises(StreamUnzipError, match="CRC-32 mismatch"):
+        stream_unzip(_chunked(bytes(archive), 1000), dest_dirpath=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_unzip_rejects_truncated_stream(tmp_path):
+    archive = _make_archive(zipfile.ZIP_DEFLATED)
+
+    with pytest.raises(StreamUnzipError, match="unexpected end of stream"):
+        stream_unzip(_chunked(archive[:50_000], 1000), dest_dirpath=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_unzip_rejects_non_zip_stream(tmp_path):
+    with pytest.raises(StreamUnzipError, match="not a ZIP archive"):
+        stream_unzip([b"<html>Service unavailable</html>"], dest_dirpath=str(tmp_path))
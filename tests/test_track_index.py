@@ -0,0 +1,82 @@
+"""Tests for overpass discovery with `TrackIndex` against `get_overpass_info`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from earthcarekit.overpass import _track_index, get_overpass_info
+from earthcarekit.overpass._track_index import TrackIndex, read_track
+from earthcarekit.read import LazyDataset, read_product
+from earthcarekit.site import Site
+
+_SITES = [
+    Site(latitude=0.0, longitude=0.3, long_name="On track"),
+    Site(latitude=10.0, longitude=4.6, long_name="Off track"),
+    Site(latitude=-21.0, longitude=-8.1, long_name="Frame edge"),
+]
+
+
+@pytest.fixture
+def products(atl_ebd_2a) -> list[str]:
+    return [
+        atl_ebd_2a(orbit_and_frame="01500A", num_samples=2000),
+        atl_ebd_2a(orbit_and_frame="01501A", num_samples=2000, lat_range=(-24.0, 26.0)),
+    ]
+
+
+@pytest.mark.parametrize("radius_km", [50, 100])
+def test_query_matches_get_overpass_info(products, radius_km) -> None:
+    index = TrackIndex.from_products(products, step=20, workers=1)
+    df = index.query(_SITES, radius_km=radius_km)
+
+    expected = []
+    for site in _SITES:
+        for filepath in products:
+            try:
+                info = get_overpass_info(filepath, site=site, radius_km=radius_km)
+            except ValueError:
+                continue  # no overpass
+            expected.append((site.long_name, filepath, info))
+    assert len(df) == len(expected) > 0
+    assert set(zip(df["site_name"], df["filepath"])) == {(s, fp) for s, fp, _ in expected}
+
+    for site_name, filepath, info in expected:
+        row = df[(df["site_name"] == site_name) & (df["filepath"] == filepath)].iloc[0]
+        assert abs(row["closest_index"] - info.closest_index) <= 1
+        assert abs(row["start_index"] - info.start_index) <= 1
+        assert abs(row["end_index"] - info.end_index) <= 1
+        assert row["closest_distance_km"] == pytest.approx(info.closest_distance_km, abs=0.5)
+        assert abs(row["closest_time"] - info.closest_time) <= pd.Timedelta(seconds=0.3)
+
+
+def test_query_without_overpasses(products) -> None:
+    index = TrackIndex.from_products(products, workers=1)
+    df = index.query(Site(latitude=0.0, longitude=90.0), radius_km=100)
+    assert len(df) == 0
+    assert "closest_index" in df.columns
+    assert len(TrackIndex([], []).query(_SITES)) == 0
+
+
+def test_read_track_falls_back_to_read_product(products, monkeypatch) -> None:
+    track = read_track(products[0], step=20)
+
+    class _Unsupported(LazyDataset):
+        @classmethod
+        def get_supported_file_types(cls) -> set[str]:
+            return set()
+
+    calls: list[str] = []
+
+    def _read_product(filepath, *args, **kwargs):
+        calls.append(filepath)
+        return read_product(filepath, *args, **kwargs)
+
+    monkeypatch.setattr(_track_index, "LazyDataset", _Unsupported)
+    monkeypatch.setattr(_track_index, "read_product", _read_product)
+    fallback = read_track(products[0], step=20)
+    assert calls == [products[0]]
+
+    assert fallback.num_samples == track.num_samples
+    np.testing.assert_array_equal(fallback.indices, track.indices)
+    np.testing.assert_array_equal(fallback.latitude, track.latitude)
+    np.testing.assert_array_equal(fallback.longitude, track.longitude)
+    np.testing.assert_array_equal(fallback.time, track.time)
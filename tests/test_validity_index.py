@@ -0,0 +1,98 @@
+"""Tests for the interval index used to filter products by timestamps in `search_product`."""
+
+import os
+
+import numpy as np
+import pandas as pd
+from earthcarekit.read.product import _validity_index
+from earthcarekit.read.product._validity_index import ValidityIndex, _stab, _ValidityCache
+
+RNG = np.random.default_rng(0)
+
+
+def _brute_force(starts, stops, times) -> set[tuple[int, int]]:
+    return {
+        (i, j)
+        for i, t in enumerate(times)
+        for j, (start, stop) in enumerate(zip(starts, stops))
+        if start <= t <= stop
+    }
+
+
+def test_stab_matches_brute_force() -> None:
+    max_length = 50
+    starts = RNG.integers(0, 1000, 300)
+    stops = starts + RNG.integers(-5, max_length + 1, 300)  # includes empty intervals
+    times = np.concatenate([RNG.integers(-10, 1100, 200), starts[:20], stops[:20]])
+    order = np.argsort(starts, kind="stable")
+
+    time_idx, interval_idx = _stab(starts, stops, order, max_length, times)
+
+    assert set(zip(time_idx.tolist(), interval_idx.tolist())) == _brute_force(starts, stops, times)
+    assert len(time_idx) == len(set(zip(time_idx.tolist(), interval_idx.tolist())))
+
+
+def test_stab_bounds_are_inclusive() -> None:
+    starts = np.array([10, 20])
+    stops = np.array([15, 20])
+    times = np.array([9, 10, 15, 16, 20])
+    time_idx, interval_idx = _stab(starts, stops, np.argsort(starts), 5, times)
+    assert sorted(zip(time_idx.tolist(), interval_idx.tolist())) == [(1, 0), (2, 0), (4, 1)]
+
+
+def _write_product(dirpath: str, sst: str, oaf: str, validity: tuple[str, str] | None) -> str:
+    filepath = os.path.join(dirpath, f"ECA_EXBA_ATL_EBD_2A_{sst}Z_20250101T120000Z_{oaf}.h5")
+    open(filepath, "w").close()
+    if validity is not None:
+        with open(filepath.removesuffix(".h5") + ".HDR", "w") as f:
+            f.write(
+                "<Earth_Explorer_Header><Fixed_Header><Validity_Period>"
+                f"<Validity_Start>UTC={validity[0]}</Validity_Start>"
+                f"<Validity_Stop>UTC={validity[1]}</Validity_Stop>"
+                "</Validity_Period></Fixed_Header></Earth_Explorer_Header>"
+            )
+    return filepath
+
+
+def test_filter_uses_header_validity(tmp_path) -> None:
+    _validity_index._VALIDITY_CACHE.clear()
+    with_hdr = _write_product(
+        str(tmp_path), "20250101T000000", "01000A", ("2025-01-01T00:02:00", "2025-01-01T00:10:00")
+    )
+    without_hdr = _write_product(str(tmp_path), "20250101T010000", "01000B", None)
+    index = ValidityIndex([with_hdr, without_hdr])
+
+    assert index.filter("2025-01-01T00:01:00") == []  # before the header validity start
+    assert index.filter("2025-01-01T00:05:00") == [with_hdr]
+    assert index.filter("2025-01-01T00:11:00") == []  # after the header validity stop
+    assert index.filter("2025-01-01T01:13:00") == [without_hdr]  # end of the 13 min window
+    assert index.filter("2025-01-01T01:13:01") == []
+
+    time_idx, file_idx = index.lookup(["2025-01-01T01:00:00", "2025-01-01T00:10:00"])
+    assert sorted(zip(time_idx.tolist(), file_idx.tolist())) == [(0, 1), (1, 0)]
+
+
+def test_filter_rereads_changed_headers(tmp_path) -> None:
+    _validity_index._VALIDITY_CACHE.clear()
+    filepath = _write_product(
+        str(tmp_path), "20250101T000000", "01000A", ("2025-01-01T00:00:00", "2025-01-01T00:05:00")
+    )
+    assert ValidityIndex([filepath]).filter("2025-01-01T00:08:00") == []
+
+    _write_product(
+        str(tmp_path), "20250101T000000", "01000A", ("2025-01-01T00:00:00", "2025-01-01T00:10:00")
+    )
+    hdr_filepath = filepath.removesuffix(".h5") + ".HDR"
+    mtime_ns = os.stat(hdr_filepath).st_mtime_ns + 1_000_000_000
+    os.utime(hdr_filepath, ns=(mtime_ns, mtime_ns))
+    assert ValidityIndex([filepath]).filter(pd.Timestamp("2025-01-01T00:08:00")) == [filepath]
+
+
+def test_validity_cache_is_bounded() -> None:
+    cache = _ValidityCache(max_entries=2)
+    cache.update({"a": (0, 1, 2), "b": (0, 3, 4)})
+    assert cache.get("a") == (0, 1, 2)  # "a" becomes the most recently used entry
+    cache.update({"c": (0, 5, 6)})
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("a") is not None and cache.get("c") is not None
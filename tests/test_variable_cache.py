@@ -0,0 +1,114 @@
+"""Tests for the process-wide `VariableCache` shared by `LazyDataset` instances."""
+
+import os
+
+import numpy as np
+import pytest
+from earthcarekit.read.lazy import LazyDataset, VariableCache, get_variable_cache
+
+_VAR = "particle_backscatter_coefficient_355nm"
+
+
+@pytest.fixture
+def cache():
+    cache = get_variable_cache()
+    max_bytes = cache.max_bytes
+    cache.clear()
+    yield cache
+    cache.max_bytes = max_bytes
+    cache.clear()
+
+
+def test_eviction_at_byte_limit() -> None:
+    cache = VariableCache(max_bytes=3 * 800)
+    for key in "abc":
+        assert cache.put(key, ("x",), {}, np.zeros(100))
+    assert cache.stats.current_bytes == 3 * 800
+
+    assert cache.get("a") is not None  # "a" becomes the most recently used entry
+    assert cache.put("d", ("x",), {}, np.zeros(100))
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.stats.evictions == 1
+    assert cache.stats.current_bytes == 3 * 800
+
+    assert not cache.put("e", ("x",), {}, np.zeros(301))  # larger than the cache
+    assert "e" not in cache and len(cache) == 3
+
+    cache.max_bytes = 800
+    assert list(cache._entries) == ["d"]
+    assert cache.stats.current_bytes == 800
+
+
+def test_cached_arrays_are_read_only() -> None:
+    cache = VariableCache()
+    values = np.arange(5.0)
+    cache.put("a", ("x",), {"units": "m"}, values)
+    values[0] = -1.0  # the cache holds its own copy
+
+    stored = cache._entries["a"][2]
+    assert not stored.flags.writeable
+    with pytest.raises(ValueError):
+        stored[0] = -1.0
+
+    entry = cache.get("a")
+    assert entry is not None
+    dims, attrs, returned = entry
+    assert returned.flags.writeable
+    returned[:] = 0.0
+    attrs["units"] = "km"
+    dims, attrs, returned = cache.get("a")  # type: ignore[misc]
+    np.testing.assert_array_equal(returned, np.arange(5.0))
+    assert attrs == {"units": "m"}
+
+
+def test_lazy_dataset_values_do_not_write_through(atl_ebd_2a, cache) -> None:
+    filepath = atl_ebd_2a()
+    with LazyDataset(filepath) as lds:
+        values = lds[_VAR].values
+        values[:] = 0.0
+    with LazyDataset(filepath) as lds:
+        assert np.nanmax(lds[_VAR].values) > 0.0
+    assert cache.stats.hits == 1
+
+
+def test_invalidation_on_file_change(atl_ebd_2a, cache) -> None:
+    filepath = atl_ebd_2a()
+    with LazyDataset(filepath) as lds:
+        old = lds[_VAR].values
+    mtime_ns = os.stat(filepath).st_mtime_ns
+
+    atl_ebd_2a(num_bins=old.shape[1] + 1)  # same name, new content
+    os.utime(filepath, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    with LazyDataset(filepath) as lds:
+        new = lds[_VAR].values
+    assert cache.stats.hits == 0
+    assert new.shape == (old.shape[0], old.shape[1] + 1)
+
+    with LazyDataset(filepath) as lds:
+        np.testing.assert_array_equal(lds[_VAR].values, new)
+    assert cache.stats.hits == 1
+
+
+def test_geoid_corrected_values_on_hit_and_miss(atl_ebd_2a, cache) -> None:
+    filepath = atl_ebd_2a()
+    with LazyDataset(filepath, use_cache=False) as lds:
+        height_hae = lds["height"].values
+    with LazyDataset(filepath, to_geoid=True) as lds:
+        height_miss = lds["height"].values
+        geoid_miss = lds["geoid_offset"].values
+    assert cache.stats.hits == 0
+    with LazyDataset(filepath, to_geoid=True) as lds:
+        height_hit = lds["height"].values
+        assert "geoid_offset" in lds._data  # loaded along with the cached height
+        geoid_hit = lds["geoid_offset"].values
+        attrs_hit = lds["height"].attrs
+    assert cache.stats.hits == 2
+
+    np.testing.assert_array_equal(height_hit, height_miss)
+    np.testing.assert_array_equal(geoid_hit, geoid_miss)
+    np.testing.assert_allclose(height_hit, height_hae - geoid_miss[:, None])
+    assert "EGM96" in attrs_hit["earthcarekit"]
+
+    with LazyDataset(filepath) as lds:  # cached separately from the geoid-corrected heights
+        np.testing.assert_array_equal(lds["height"].values, height_hae)